@@ -1,13 +1,22 @@
 from ev3dev2.button import Button
-from ev3.simple_worker_thread import SimplePeriodicWorkerThread
+from ev3.sensor_scheduler import SensorScheduler
 
-class EV3Buttons(SimplePeriodicWorkerThread):
+class EV3Buttons(object):
+    """
+    The buttons are read by the sensor scheduler, but the listeners are called from the thread that
+    calls notify_listeners - a listener may run for a long time, e.g. solve the whole maze, and the
+    sensors have to be read meanwhile.
+    """
 
-    def __init__(self):
-        super().__init__(thread_name='EV3Buttons')
+    SENSOR_NAME = 'buttons'
+
+    def __init__(self, sensor_scheduler: SensorScheduler, period_sec: float = 0.1):
+        self._sensor_scheduler = sensor_scheduler
         self._buttons = Button()
         self._enter_button_listener = None
         self._esc_button_listener = None
+        self._last_handled_sequence_number = 0
+        self._sensor_scheduler.add_sensor(self.SENSOR_NAME, self.read_buttons, period_sec)
 
     def add_enter_button_listener(self, enter_button_listener: callable):
         self._enter_button_listener = enter_button_listener
@@ -21,8 +30,19 @@ class EV3Buttons(SimplePeriodicWorkerThread):
     def remove_esc_button_listener(self):
         self._esc_button_listener = None
 
-    def perform_cycle(self):
-        if (not (self._enter_button_listener is None)) and self._buttons.enter:
+    def read_buttons(self) -> dict:
+        # Called by the sensor scheduler
+        return {'enter': self._buttons.enter, 'esc': self._buttons.backspace}
+
+    def notify_listeners(self, timeout_sec: float = 1.0):
+        """
+        Waits for the next buttons reading, and calls the listener of the pressed button.
+        """
+        _sample = self._sensor_scheduler.wait_for_sample_after(self.SENSOR_NAME, self._sensor_scheduler.get_time(), timeout_sec)
+        if _sample is None or _sample.sequence_number == self._last_handled_sequence_number:
+            return
+        self._last_handled_sequence_number = _sample.sequence_number
+        if (not (self._enter_button_listener is None)) and _sample.value['enter']:
             self._enter_button_listener()
-        elif (not (self._esc_button_listener is None)) and self._buttons.backspace:
+        elif (not (self._esc_button_listener is None)) and _sample.value['esc']:
             self._esc_button_listener()
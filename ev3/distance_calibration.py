@@ -0,0 +1,72 @@
+import json
+import math
+from array import array
+
+# The EV3 color sensor gives reflected light intensity from 0 to 100
+MAX_INTENSITY = 100
+# Distance for no reflected light at all, i.e. nothing in front of the sensor
+NO_WALL_DISTANCE_CM = 255.0
+# Experimentally found curve: intensity = 105 * 0.555 ^ distance_cm
+DEFAULT_INTENSITY_AT_ZERO_DISTANCE = 105.0
+DEFAULT_INTENSITY_FACTOR_PER_CM = 0.555
+DEFAULT_CALIBRATION_FILE = 'distance_calibration.json'
+# Doubles instead of 4-byte floats: a float would turn e.g. 2.9 cm into 2.9000000953674316 cm,
+# and the readings would no longer match the wall and position thresholds as the rounded values did
+_TABLE_TYPECODE = 'd'
+
+
+def create_distance_table(
+    intensity_at_zero_distance: float = DEFAULT_INTENSITY_AT_ZERO_DISTANCE,
+    intensity_factor_per_cm: float = DEFAULT_INTENSITY_FACTOR_PER_CM
+) -> array:
+    """
+    Returns the distance in centimeters for each intensity from 0 to 100, rounded to 1 mm as before.
+    """
+    _table = array(_TABLE_TYPECODE, [NO_WALL_DISTANCE_CM] * (MAX_INTENSITY + 1))
+    _log_factor = math.log(intensity_factor_per_cm)
+    for _intensity in range(1, MAX_INTENSITY + 1):
+        _distance = math.log(_intensity / intensity_at_zero_distance) / _log_factor
+        _table[_intensity] = max(0.0, round(_distance, 1))
+    return _table
+
+
+def fit_distance_curve(samples: list) -> tuple:
+    """
+    Fits the curve intensity = a * b ^ distance_cm to the (distance_cm, intensity) samples of a wall
+    sweep, with least squares on the logarithm of the intensity, and returns (a, b). Samples with no
+    reflected light are left out, as they only tell that the wall is too far.
+    """
+    _points = [(_distance, math.log(_intensity)) for _distance, _intensity in samples if _intensity > 0]
+    if len(set(_distance for _distance, _ in _points)) < 2:
+        raise ValueError('A wall sweep needs readings at two distances at least')
+    _count = len(_points)
+    _mean_distance = sum(_distance for _distance, _ in _points) / _count
+    _mean_log_intensity = sum(_log_intensity for _, _log_intensity in _points) / _count
+    _covariance = sum((_distance - _mean_distance) * (_log_intensity - _mean_log_intensity) for _distance, _log_intensity in _points)
+    _distance_variance = sum((_distance - _mean_distance) ** 2 for _distance, _ in _points)
+    _slope = _covariance / _distance_variance
+    if _slope >= 0:
+        raise ValueError('The intensity should drop when the wall gets further, check the wall sweep')
+    _intercept = _mean_log_intensity - _slope * _mean_distance
+    return (math.exp(_intercept), math.exp(_slope))
+
+
+def create_distance_table_from_wall_sweep(samples: list) -> array:
+    return create_distance_table(*fit_distance_curve(samples))
+
+
+def save_distance_tables(path: str, distance_tables: dict):
+    """
+    Saves the distance tables of the sensors, by sensor address, into a JSON calibration file.
+    """
+    with open(path, 'w') as _file:
+        json.dump({_address: list(_table) for _address, _table in distance_tables.items()}, _file, indent=1)
+
+
+def load_distance_tables(path: str) -> dict:
+    with open(path, 'r') as _file:
+        _tables = json.load(_file)
+    for _address, _table in _tables.items():
+        if len(_table) != MAX_INTENSITY + 1:
+            raise ValueError('Distance table of {} should have {} entries, got {}'.format(_address, MAX_INTENSITY + 1, len(_table)))
+    return {_address: array(_TABLE_TYPECODE, _table) for _address, _table in _tables.items()}
@@ -1,60 +1,104 @@
+import os
 import time
-import math
 import logging
-from ev3.simple_worker_thread import SimplePeriodicWorkerThread
+from array import array
+from ev3.sensor_scheduler import SensorScheduler
+from ev3.sensor_history import SensorHistory
+from ev3.telemetry import TelemetryRecorder
+from ev3.distance_calibration import DEFAULT_CALIBRATION_FILE, MAX_INTENSITY, create_distance_table, load_distance_tables
 from ev3dev2.sensor.lego import ColorSensor
 
-class EV3DistanceDetectors(SimplePeriodicWorkerThread):
+class EV3DistanceDetectors(object):
 
-    def __init__(self, logger = None):
+    SENSOR_NAME = 'distances'
+
+    def __init__(
+        self, 
+        sensor_scheduler: SensorScheduler, 
+        logger = None, 
+        period_sec: float = 0.05, 
+        fresh_sample_timeout_sec: float = 0.5, 
+        history_size: int = 5,
+        calibration_file: str = DEFAULT_CALIBRATION_FILE,
+        telemetry_recorder: TelemetryRecorder = None
+    ):
         self._logger = logger or logging.getLogger(__name__)
-        super().__init__(thread_name = 'EV3DistanceDetectors')
-        self._sensor_left = LightDistanceSensor(address='in3')
-        self._sensor_front = LightDistanceSensor(address='in1')
-        self._sensor_right = LightDistanceSensor(address='in4')
-        self._distance_left = 255.0
-        self._distance_front = 255.0
-        self._distance_right = 255.0
-        self._last_distances_queue_left = []
-        self._last_distances_queue_right = []
-        self._LAST_DISTANCES_QUEUE_MAX_LENGTH = 25
-
-    def _add_distance_to_queue(self, queue: list, distance: float):
-        queue.append(distance)
-        if len(queue) > self._LAST_DISTANCES_QUEUE_MAX_LENGTH:
-            queue.pop(0)
-
-    def perform_cycle(self):
-        self._distance_left = self._sensor_left.distance_centimeters()
-        self._distance_front = self._sensor_front.distance_centimeters()
-        self._distance_right = self._sensor_right.distance_centimeters()
-        self._logger.debug('left={}, front={}, right={}'.format(
-            self._distance_left, 
-            self._distance_front, 
-            self._distance_right
-        ))
-        self._add_distance_to_queue(self._last_distances_queue_left, self._distance_left)
-        self._add_distance_to_queue(self._last_distances_queue_right, self._distance_right)
-
-    def get_distances(self):
-        # It is ok to read slightly outdated data
-        return {
-            'left': self._distance_left,
-            'front': self._distance_front,
-            'right': self._distance_right
+        self._telemetry_recorder = telemetry_recorder
+        self._sensor_scheduler = sensor_scheduler
+        self._fresh_sample_timeout_sec = fresh_sample_timeout_sec
+        _distance_tables = {}
+        if calibration_file is not None and os.path.exists(calibration_file):
+            _distance_tables = load_distance_tables(calibration_file)
+            self._logger.info('Loaded distance tables of {} from {}'.format(sorted(_distance_tables.keys()), calibration_file))
+        self._sensor_left = LightDistanceSensor(address='in3', distance_table=_distance_tables.get('in3'))
+        self._sensor_front = LightDistanceSensor(address='in1', distance_table=_distance_tables.get('in1'))
+        self._sensor_right = LightDistanceSensor(address='in4', distance_table=_distance_tables.get('in4'))
+        self._no_distances = {'left': 255.0, 'front': 255.0, 'right': 255.0}
+        # The filtered distances are the medians of the last history_size readings
+        self._histories = {
+            'left': SensorHistory(history_size),
+            'front': SensorHistory(history_size),
+            'right': SensorHistory(history_size)
+        }
+        self._sensor_scheduler.add_sensor(self.SENSOR_NAME, self.read_distances, period_sec)
+
+    def read_distances(self) -> tuple:
+        # Called by the sensor scheduler. Returns both raw and filtered distances, so that they
+        # are published together and the histories are only touched by the scheduler thread.
+        _distances = {
+            'left': self._sensor_left.distance_centimeters(),
+            'front': self._sensor_front.distance_centimeters(),
+            'right': self._sensor_right.distance_centimeters()
         }
+        if self._telemetry_recorder is not None:
+            self._telemetry_recorder.record_distances(_distances)
+        # Formatting on every reading is a load for the EV3, so only when it is really logged
+        if self._logger.isEnabledFor(logging.DEBUG):
+            self._logger.debug('left={}, front={}, right={}'.format(
+                _distances['left'], 
+                _distances['front'], 
+                _distances['right']
+            ))
+        _filtered_distances = {}
+        for _direction, _history in self._histories.items():
+            _history.add(_distances[_direction])
+            _filtered_distances[_direction] = _history.median
+        return (_distances, _filtered_distances)
+
+    def get_distances(self, fresh_after: float = None, filtered: bool = False) -> dict:
+        """
+        Returns the latest distances, or with fresh_after the first distances read at or after that
+        time of the sensor scheduler clock, waiting for them if needed. The filtered distances are
+        less noisy, but they lag behind when the robot moves.
+        """
+        if fresh_after is None:
+            _sample = self._sensor_scheduler.get_latest_sample(self.SENSOR_NAME)
+        else:
+            _sample = self._sensor_scheduler.wait_for_sample_after(self.SENSOR_NAME, fresh_after, self._fresh_sample_timeout_sec)
+            if _sample is None:
+                self._logger.warning('No fresh distances in {} seconds, using the latest ones'.format(self._fresh_sample_timeout_sec))
+                _sample = self._sensor_scheduler.get_latest_sample(self.SENSOR_NAME)
+        if _sample is None:
+            return dict(self._no_distances)
+        return _sample.value[1] if filtered else _sample.value[0]
 
 
 class LightDistanceSensor(object):
+    """
+    Converts the reflected light intensity to distance with a table that has the distance for each
+    intensity. Without a calibrated table, the experimentally found logarithmic curve is used.
+    """
 
-    def __init__(self, address: str, logger = None):
+    def __init__(self, address: str, logger = None, distance_table: array = None):
         self._logger = logger or logging.getLogger(__name__)
         self._ev3_color_sensor = ColorSensor(address=address)
+        self._distance_table = distance_table if distance_table is not None else create_distance_table()
+
+    def reflected_light_intensity(self) -> int:
+        return self._ev3_color_sensor.reflected_light_intensity
 
     def distance_centimeters(self) -> float: 
         _reflected_light_intensity = self._ev3_color_sensor.reflected_light_intensity
         if _reflected_light_intensity <= 0:
-            return 255.0
-        else:
-            # Experimentally found logarithmic function for distance: 
-            return round( ( math.log(_reflected_light_intensity / 105)) / ( math.log(0.555) ), 1)
+            return self._distance_table[0]
+        return self._distance_table[min(_reflected_light_intensity, MAX_INTENSITY)]
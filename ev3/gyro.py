@@ -1,31 +1,62 @@
 import time
 import logging
 from ev3dev2.sensor.lego import GyroSensor
-from ev3.simple_worker_thread import SimplePeriodicWorkerThread
+from ev3.sensor_scheduler import SensorScheduler
+from ev3.sensor_history import SensorHistory
 
-class Gyro(SimplePeriodicWorkerThread):
+class Gyro(object):
 
-    def __init__(self, logger=None):
+    SENSOR_NAME = 'gyro'
+
+    def __init__(
+        self, 
+        sensor_scheduler: SensorScheduler, 
+        logger=None, 
+        period_sec: float = 0.02, 
+        fresh_sample_timeout_sec: float = 0.5, 
+        history_size: int = 5
+    ):
         self._logger = logger or logging.getLogger(__name__)
-        super().__init__(thread_name = 'EV3Gyro')
+        self._sensor_scheduler = sensor_scheduler
+        self._fresh_sample_timeout_sec = fresh_sample_timeout_sec
         self._gyro = GyroSensor(address='in2')
         self._gyro.mode = GyroSensor.MODE_GYRO_ANG
         self._gyro.reset()
-        self._angle = 0
+        # The filtered angle is the median of the last history_size readings
+        self._history = SensorHistory(history_size)
+        self._sensor_scheduler.add_sensor(self.SENSOR_NAME, self.read_angle, period_sec)
 
-    def perform_cycle(self):
+    def read_angle(self) -> tuple:
+        # Called by the sensor scheduler, returns both the raw and the filtered angle.
         # Occasionally, the EV3 gyro sensor gives some exeptions. Usually it happens
         # for a few seconds after it is started. Maybe its initialization is not yet 
         # complete. According to experiments, we can ignore this.
         try:
-            self._angle = self._gyro.angle
+            _angle = self._gyro.angle
         except:
             self._logger.warning('Unable to get angle from EV3 gyro sensor')
+            return None
+        self._history.add(_angle)
+        return (_angle, self._history.median)
 
-    def get_orientation(self):
-        # It is ok to read a little outdated data
-        return self._angle
+    def get_orientation(self, fresh_after: float = None, filtered: bool = False) -> float:
+        """
+        Returns the latest angle, or with fresh_after the first angle read at or after that time
+        of the sensor scheduler clock, waiting for it if needed. The filtered angle is less noisy,
+        but it lags behind when the robot turns.
+        """
+        if fresh_after is None:
+            _sample = self._sensor_scheduler.get_latest_sample(self.SENSOR_NAME)
+        else:
+            _sample = self._sensor_scheduler.wait_for_sample_after(self.SENSOR_NAME, fresh_after, self._fresh_sample_timeout_sec)
+            if _sample is None:
+                self._logger.warning('No fresh angle in {} seconds, using the latest one'.format(self._fresh_sample_timeout_sec))
+                _sample = self._sensor_scheduler.get_latest_sample(self.SENSOR_NAME)
+        if _sample is None:
+            return 0
+        return _sample.value[1] if filtered else _sample.value[0]
 
     def reset(self):
+        # The history is not cleared here, as it belongs to the sensor scheduler thread.
+        # The filtered angle catches up within a few readings.
         self._gyro.reset()
-                
\ No newline at end of file
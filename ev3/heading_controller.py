@@ -0,0 +1,66 @@
+class HeadingController(object):
+    """
+    PID controller that keeps the robot on a gyro heading while it moves, by giving the MoveSteering
+    steering value for each new gyro reading. When there is a wall close on both sides, the heading
+    to keep is turned a bit towards the middle between the walls, so the robot also stays centered.
+
+    The EV3 gyro angle grows when turning right, as does the steering value, so a robot that has
+    drifted right gets a negative steering to the left.
+    """
+
+    def __init__(
+        self,
+        proportional_gain: float = 3.0,
+        integral_gain: float = 0.5,
+        derivative_gain: float = 0.2,
+        max_steering: float = 30.0,
+        side_distance_gain_deg_per_cm: float = 2.0,
+        max_side_distance_correction_deg: float = 5.0,
+        max_reliable_side_distance_cm: float = 5.0
+    ):
+        self._proportional_gain = proportional_gain
+        self._integral_gain = integral_gain
+        self._derivative_gain = derivative_gain
+        self._max_steering = max_steering
+        self._side_distance_gain_deg_per_cm = side_distance_gain_deg_per_cm
+        self._max_side_distance_correction_deg = max_side_distance_correction_deg
+        self._max_reliable_side_distance_cm = max_reliable_side_distance_cm
+        self.reset(0)
+
+    @property
+    def target_heading(self) -> float:
+        return self._target_heading
+
+    def reset(self, target_heading: float):
+        self._target_heading = target_heading
+        self._integral = 0.0
+        self._previous_heading = None
+        self._previous_time = None
+
+    def _get_side_distance_correction(self, left_distance_cm: float, right_distance_cm: float) -> float:
+        if left_distance_cm is None or right_distance_cm is None:
+            return 0.0
+        if left_distance_cm > self._max_reliable_side_distance_cm or right_distance_cm > self._max_reliable_side_distance_cm:
+            return 0.0
+        _correction = (right_distance_cm - left_distance_cm) * self._side_distance_gain_deg_per_cm
+        return max(-self._max_side_distance_correction_deg, min(self._max_side_distance_correction_deg, _correction))
+
+    def update(self, heading: float, time_sec: float, left_distance_cm: float = None, right_distance_cm: float = None) -> float:
+        """
+        Returns the steering value for the given gyro heading, read at the given time in seconds.
+        """
+        _error = self._target_heading + self._get_side_distance_correction(left_distance_cm, right_distance_cm) - heading
+        _derivative = 0.0
+        if self._previous_time is not None and time_sec > self._previous_time:
+            _time_step = time_sec - self._previous_time
+            self._integral += _error * _time_step
+            # From the heading and not from the error, so that a new side distance correction gives no kick
+            _derivative = -(heading - self._previous_heading) / _time_step
+        self._previous_heading = heading
+        self._previous_time = time_sec
+        if self._integral_gain > 0:
+            # The integral alone never asks for more than the maximum steering, so it cannot wind up
+            _max_integral = self._max_steering / self._integral_gain
+            self._integral = max(-_max_integral, min(_max_integral, self._integral))
+        _steering = self._proportional_gain * _error + self._integral_gain * self._integral + self._derivative_gain * _derivative
+        return max(-self._max_steering, min(self._max_steering, _steering))
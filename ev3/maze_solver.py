@@ -1,13 +1,49 @@
 import logging
+import os
 from ev3.motors import EV3Motors
 from ev3.wall_detector import EV3WallDetector
 from ev3.distance_detectors import EV3DistanceDetectors
 from ev3.gyro import Gyro
 from ev3.buttons import EV3Buttons
+from ev3.sensor_scheduler import SensorScheduler
+from ev3.motor_command_pipeline import MotorCommandPipeline
+from ev3.telemetry import TelemetryRecorder
 from ev3.simple_worker_thread import SimplePeriodicWorkerThread
 from maze_solver.curious_maze_solver import CuriousMazeSolver
+from maze_solver.flood_fill_maze_solver import FloodFillMazeSolver
+from maze_solver.route_replay_maze_solver import RouteReplayMazeSolver
+from maze_solver.route_planner import RoutePlanner, FORWARD_MOTION_TIME_SECONDS, TURN_MOTION_TIME_SECONDS, BACK_TURN_MOTION_TIME_SECONDS
+from maze_solver.direction import Direction
+from maze_solver.wall_map import save_wall_map, load_wall_map
 from maze_solver.maze_solver import FinishDetector, Outputs, NotificationType
 
+DEFAULT_WALL_MAP_FILE = 'logs/ev3_wall_map.json'
+
+
+def plan_speed_run(wall_map_file: str, center_coordinates: list, logger = None) -> list:
+    """
+    Returns the fastest known route in the wall map saved by an exploration run, to the finish square
+    if it was found or else to the center squares, or None if there is no such route. The EV3 robot has
+    no finish detector yet, so its wall maps have no finish square, and the route goes to the closest
+    center square.
+    """
+    _logger = logger or logging.getLogger(__name__)
+    if not os.path.exists(wall_map_file):
+        _logger.warning('No wall map in {}, exploring instead of the speed run'.format(wall_map_file))
+        return None
+    _wall_map, _finish_square = load_wall_map(wall_map_file)
+    if _finish_square is not None:
+        _goal_squares = [(_finish_square.x, _finish_square.y)]
+    else:
+        _goal_squares = [(_x, _y) for _x in center_coordinates for _y in center_coordinates if _wall_map.is_inside(_x, _y)]
+    _route_planner = RoutePlanner(FORWARD_MOTION_TIME_SECONDS, TURN_MOTION_TIME_SECONDS, BACK_TURN_MOTION_TIME_SECONDS)
+    _route = _route_planner.plan(_wall_map, 1, 1, Direction.NORTH, _goal_squares)
+    if _route is None:
+        _logger.warning('No known route to {} in {}, exploring instead of the speed run'.format(_goal_squares, wall_map_file))
+        return None
+    _logger.info('Speed run of {} moves and turns loaded from {}'.format(len(_route), wall_map_file))
+    return _route
+
 
 class DummyFinishDetector(FinishDetector):
 
@@ -23,25 +59,69 @@ class DummyOutputs(Outputs):
 
 class EV3MazeSolver(SimplePeriodicWorkerThread):
 
-    def __init__(self, logger = None):
+    def __init__(
+        self,
+        logger = None,
+        telemetry_file: str = 'logs/ev3_telemetry.bin',
+        wall_map_file: str = DEFAULT_WALL_MAP_FILE,
+        speed_run: bool = False,
+        learn_walls: bool = False,
+        center_coordinates: list = [8, 9]
+    ):
         self._logger = logger or logging.getLogger(__name__)
-        super().__init__(thread_name = 'EV3MazeSolver')
+        # The buttons are waited for in every cycle, so no extra sleeping is needed
+        super().__init__(thread_name = 'EV3MazeSolver', cycle_length_ms = 0)
         self._max_moves = 30
-        self._ev3_distance_sensors = EV3DistanceDetectors()
-        self._ev3_distance_sensors.start()
-        self._ev3_gyro = Gyro()
-        self._ev3_gyro.start()
-        self._motors = EV3Motors(distance_sensors = self._ev3_distance_sensors, gyro = self._ev3_gyro)
-        self._wall_detector = EV3WallDetector(distance_sensors = self._ev3_distance_sensors)
-        self._maze_solver = CuriousMazeSolver(
-            motors=self._motors, 
-            wall_detector=self._wall_detector, 
-            finish_detector=DummyFinishDetector(), 
-            outputs=DummyOutputs
+        self._wall_map_file = wall_map_file
+        # All sensors are read in the sensor scheduler thread
+        self._sensor_scheduler = SensorScheduler()
+        # Sensor readings, moves and wall decisions are recorded as binary telemetry instead of debug logs
+        self._telemetry_recorder = TelemetryRecorder(telemetry_file, clock = self._sensor_scheduler.get_time)
+        self._ev3_distance_sensors = EV3DistanceDetectors(sensor_scheduler = self._sensor_scheduler, telemetry_recorder = self._telemetry_recorder)
+        self._ev3_gyro = Gyro(sensor_scheduler = self._sensor_scheduler)
+        # The motors move in the pipeline thread, while the maze solver goes on until it needs to see the walls
+        self._motor_command_pipeline = MotorCommandPipeline()
+        self._motors = EV3Motors(
+            distance_sensors = self._ev3_distance_sensors, 
+            gyro = self._ev3_gyro, 
+            sensor_scheduler = self._sensor_scheduler, 
+            motor_command_pipeline = self._motor_command_pipeline,
+            telemetry_recorder = self._telemetry_recorder,
+            heading_control = True
         )
-        self._ev3_buttons = EV3Buttons()
-        self._ev3_buttons.start()
+        self._wall_detector = EV3WallDetector(distance_sensors = self._ev3_distance_sensors, motors = self._motors, telemetry_recorder = self._telemetry_recorder)
+        _route = plan_speed_run(wall_map_file, center_coordinates, self._logger) if speed_run else None
+        if _route is not None:
+            # No walls are looked at on the speed run, the forward moves are made without stopping
+            self._maze_solver = RouteReplayMazeSolver(
+                motors=self._motors,
+                wall_detector=self._wall_detector,
+                finish_detector=DummyFinishDetector(),
+                outputs=DummyOutputs,
+                route=_route,
+                continuous_motion=True
+            )
+        elif learn_walls or speed_run:
+            # Learns the walls, which are saved at the end of the run for the speed run
+            self._maze_solver = FloodFillMazeSolver(
+                motors=self._motors,
+                wall_detector=self._wall_detector,
+                finish_detector=DummyFinishDetector(),
+                outputs=DummyOutputs,
+                center_coordinates=center_coordinates
+            )
+        else:
+            self._maze_solver = CuriousMazeSolver(
+                motors=self._motors, 
+                wall_detector=self._wall_detector, 
+                finish_detector=DummyFinishDetector(), 
+                outputs=DummyOutputs
+            )
+        self._ev3_buttons = EV3Buttons(sensor_scheduler = self._sensor_scheduler)
         self._ev3_buttons.add_enter_button_listener(self.start_maze_solving)
+        self._motor_command_pipeline.start()
+        self._telemetry_recorder.start()
+        self._sensor_scheduler.start()
 
     def solve_maze(self) -> int:
         _move_count = 0
@@ -50,19 +130,25 @@ class EV3MazeSolver(SimplePeriodicWorkerThread):
             self._logger.debug('Move count={}'.format(_move_count))
             _finished_or_cannot_move = self._maze_solver.next_move()
             _move_count += 1
+        self._motors.wait_until_idle()
         if not _finished_or_cannot_move and _move_count >= self._max_moves:
             self._logger.warning('Maximum allowed move count={} reached!'.format(self._max_moves))
+        if isinstance(self._maze_solver, FloodFillMazeSolver):
+            save_wall_map(self._wall_map_file, self._maze_solver.wall_map, self._maze_solver.finish_square)
+            self._logger.info('Wall map saved to {}'.format(self._wall_map_file))
         return _move_count
 
     def run(self):
         super().run()
-        self._ev3_gyro.stop()
-        self._ev3_distance_sensors.stop()
-        self._ev3_buttons.stop()
+        self._motor_command_pipeline.stop()
+        self._sensor_scheduler.stop()
+        self._telemetry_recorder.stop()
+        self._telemetry_recorder.join()
+        self._telemetry_recorder.close()
 
     def perform_cycle(self):
         # Don't do anything, just listen for events.
-        pass
+        self._ev3_buttons.notify_listeners()
 
     def start_maze_solving(self):
         self._logger.debug('Start event received')
@@ -0,0 +1,71 @@
+import logging
+import threading
+from collections import deque
+
+
+class MotorCommandPipeline(threading.Thread):
+    """
+    Runs motor commands one after another in its own thread, so that whoever gives the commands
+    does not have to wait for the motors. E.g. the maze solver can update its map and logs while
+    the robot is still moving, and only waits when it needs to see the walls of the next square.
+
+    A command is any callable, usually a move with the position correction after it. A command that
+    raises an exception is logged, and the commands after it are still run.
+    """
+
+    def __init__(self, logger = None):
+        threading.Thread.__init__(self)
+        self.name = 'EV3MotorCommandPipeline'
+        self.daemon = True
+        self._logger = logger or logging.getLogger(__name__)
+        self._commands = deque()
+        self._pending_count = 0
+        self._condition = threading.Condition()
+        self._stop_command_received = False
+
+    @property
+    def pending_count(self) -> int:
+        with self._condition:
+            return self._pending_count
+
+    def submit(self, command: callable):
+        with self._condition:
+            self._commands.append(command)
+            self._pending_count += 1
+            self._condition.notify_all()
+
+    def wait_until_idle(self, timeout_sec: float = None) -> bool:
+        """
+        Waits until all the submitted commands have been run. Returns False if they were not run within the timeout.
+        """
+        with self._condition:
+            return self._condition.wait_for(lambda: self._pending_count == 0, timeout=timeout_sec)
+
+    def run_next_command(self, timeout_sec: float = None) -> bool:
+        """
+        Runs the next command, waiting for one if there is none yet. Returns False if there was no command to run.
+        """
+        with self._condition:
+            if not self._condition.wait_for(lambda: self._commands or self._stop_command_received, timeout=timeout_sec):
+                return False
+            if not self._commands:
+                return False
+            _command = self._commands.popleft()
+        try:
+            _command()
+        except Exception:
+            self._logger.error('Motor command failed', exc_info=True)
+        finally:
+            with self._condition:
+                self._pending_count -= 1
+                self._condition.notify_all()
+        return True
+
+    def run(self):
+        while not self._stop_command_received:
+            self.run_next_command()
+
+    def stop(self):
+        with self._condition:
+            self._stop_command_received = True
+            self._condition.notify_all()
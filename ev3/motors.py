@@ -1,16 +1,23 @@
 import math
-import time
 import random
 import enum
 import logging
 from ev3dev2.motor import OUTPUT_A, OUTPUT_B, MoveSteering, SpeedRPM
 from ev3.distance_detectors import EV3DistanceDetectors
 from ev3.gyro import Gyro
+from ev3.sensor_scheduler import SensorScheduler
+from ev3.motor_command_pipeline import MotorCommandPipeline
+from ev3.telemetry import TelemetryRecorder
 from ev3.position_corrector import PositionCorrector
-from ev3.steering import Steering
+from ev3.heading_controller import HeadingController
+from ev3.steering import Steering, get_arc_steering
 from maze_solver.maze_solver import Motors
+from maze_solver.route_planner import MotorCommand
 from maze_solver.kwargs_util import KwArgsUtil
 
+# How long ev3dev2 waits for a motor to start running when blocking
+_WAIT_RUNNING_TIMEOUT_MS = 100
+
 
 class EV3Motors(Motors):
 
@@ -18,17 +25,26 @@ class EV3Motors(Motors):
         self, 
         distance_sensors: EV3DistanceDetectors, 
         gyro: Gyro,
+        sensor_scheduler: SensorScheduler,
+        motor_command_pipeline: MotorCommandPipeline = None,
+        telemetry_recorder: TelemetryRecorder = None,
         logger = None,
         **kwargs
     ):
         self._logger = logger or logging.getLogger(__name__)
         self._distance_sensors = distance_sensors
         self._gyro = gyro
+        self._sensor_scheduler = sensor_scheduler
+        # Without a pipeline, the moves are made before returning
+        self._motor_command_pipeline = motor_command_pipeline
+        self._telemetry_recorder = telemetry_recorder
+        self._last_move_end_time = self._sensor_scheduler.get_time()
         self._motor_pair = MoveSteering(OUTPUT_A, OUTPUT_B)
         self._position_corrector = PositionCorrector(self._motor_pair, self._gyro)
         self._maze_square_length_mm = KwArgsUtil.kwarg_or_default(180, 'maze_square_length_mm', **kwargs)
         self._move_forward_speed_rpm = KwArgsUtil.kwarg_or_default(60, 'move_forward_speed_rpm', **kwargs)
         self._motor_pair_polarity_factor = KwArgsUtil.kwarg_or_default(1, 'motor_pair_polarity_factor', **kwargs)
+        self._ideal_side_turn_angle = KwArgsUtil.kwarg_or_default(90, 'ideal_side_turn_angle', **kwargs)
         self._turn_speed_rpm = KwArgsUtil.kwarg_or_default(50, 'turn_speed_rpm', **kwargs)
         self._wheel_diameter_mm = KwArgsUtil.kwarg_or_default(56, 'wheel_diameter_mm', **kwargs)
         self._wheel_circumference_mm = math.pi * self._wheel_diameter_mm
@@ -37,9 +53,31 @@ class EV3Motors(Motors):
         self._angle_corretcion_speed = KwArgsUtil.kwarg_or_default(25, 'angle_corretcion_speed', **kwargs)
         self._angle_correction_move_backward_mm = KwArgsUtil.kwarg_or_default(80.0, 'angle_correction_move_backward_mm', **kwargs)
         self._angle_correction_move_forward_mm = KwArgsUtil.kwarg_or_default(20.0, 'angle_correction_move_forward_mm', **kwargs)
-        self._wait_for_motors_and_gyro_after_move_sec = KwArgsUtil.kwarg_or_default(0.1, 'wait_for_motors_and_gyro_after_move_sec', **kwargs)
+        # Continuous moves through several squares ramp the speed up and down instead of stopping in each square
+        self._continuous_move_speed_rpm = KwArgsUtil.kwarg_or_default(80, 'continuous_move_speed_rpm', **kwargs)
+        self._continuous_move_ramp_ms = KwArgsUtil.kwarg_or_default(400, 'continuous_move_ramp_ms', **kwargs)
+        self._encoder_poll_interval_sec = KwArgsUtil.kwarg_or_default(0.01, 'encoder_poll_interval_sec', **kwargs)
+        self._square_boundary_listener = KwArgsUtil.kwarg_or_default(None, 'square_boundary_listener', **kwargs)
+        # Arc turns follow an arc of half a square, and stop on the gyro angle a bit early as the robot keeps turning
+        self._arc_turn_speed_rpm = KwArgsUtil.kwarg_or_default(40, 'arc_turn_speed_rpm', **kwargs)
+        self._arc_turn_stop_early_deg = KwArgsUtil.kwarg_or_default(5, 'arc_turn_stop_early_deg', **kwargs)
+        self._arc_turn_timeout_sec = KwArgsUtil.kwarg_or_default(3.0, 'arc_turn_timeout_sec', **kwargs)
+        # With heading control, moves and turns steer on every gyro reading instead of being corrected afterwards
+        self._heading_control = KwArgsUtil.kwarg_or_default(False, 'heading_control', **kwargs)
+        self._heading_controller = KwArgsUtil.kwarg_or_default(None, 'heading_controller', **kwargs) or HeadingController()
+        self._turn_slow_down_deg = KwArgsUtil.kwarg_or_default(30, 'turn_slow_down_deg', **kwargs)
+        self._turn_min_speed_rpm = KwArgsUtil.kwarg_or_default(10, 'turn_min_speed_rpm', **kwargs)
+        # The heading to keep, from the heading at the first move plus the side turns made since
+        self._target_heading_deg = None
+        self._controlled_move_timeout_factor = KwArgsUtil.kwarg_or_default(3.0, 'controlled_move_timeout_factor', **kwargs)
+        # The readings after a move are taken at least this long after the move, they are never older
+        self._wait_for_motors_and_gyro_after_move_sec = KwArgsUtil.kwarg_or_default(0.05, 'wait_for_motors_and_gyro_after_move_sec', **kwargs)
 
-    def _log_distances_and_angle(self, phase: str, distances: dict, angle: int):
+    def _log_distances_and_angle(self, phase: str, distances: dict, angle: int, motor_command: MotorCommand):
+        if self._telemetry_recorder is not None:
+            self._telemetry_recorder.record_distances(distances, angle, motor_command.value)
+        if not self._logger.isEnabledFor(logging.DEBUG):
+            return
         self._logger.debug('Distances {}: left={}, right={}, front={}'.format(
             phase,
             distances['left'],
@@ -48,25 +86,189 @@ class EV3Motors(Motors):
         ))
         self._logger.debug('Gyro angle {}={}'.format(phase, angle))
 
-    def _move_forward_mm(self, distance_mm: float, speed_rpm: int):
+    def _move_forward_mm(self, distance_mm: float, speed_rpm: int, brake: bool = True):
+        if self._heading_control:
+            self._drive_straight_mm(distance_mm, speed_rpm, brake=brake)
+            return
         _speed = SpeedRPM(speed_rpm * self._motor_pair_polarity_factor)
         _rotations = distance_mm / self._wheel_circumference_mm
         self._motor_pair.on_for_rotations(
             steering=Steering.STRAIGHT.value, 
             speed=_speed, 
             rotations=_rotations,
-            brake=True, block=True
+            # Already in the pipeline thread, and blocking waits for the motors to start before waiting for them to stop
+            brake=brake, block=True
         )
 
+    def _get_wheel_travel_mm(self, start_positions: tuple) -> float:
+        # Mean of both wheels, from the encoder counts in degrees
+        _left_degrees = abs(self._motor_pair.left_motor.position - start_positions[0])
+        _right_degrees = abs(self._motor_pair.right_motor.position - start_positions[1])
+        return (_left_degrees + _right_degrees) / 2 / 360 * self._wheel_circumference_mm
+
+    def _set_ramps(self, ramp_ms: int):
+        for _motor in (self._motor_pair.left_motor, self._motor_pair.right_motor):
+            _motor.ramp_up_sp = ramp_ms
+            _motor.ramp_down_sp = ramp_ms
+
+    def _wait_until_motors_run(self):
+        # As ev3dev2 does with block=True, so that a motor that has not started yet is not taken as stopped
+        for _motor in (self._motor_pair.left_motor, self._motor_pair.right_motor):
+            _motor.wait_until('running', timeout=_WAIT_RUNNING_TIMEOUT_MS)
+
+    def _wait_until_motors_stop(self, timeout_ms: int) -> bool:
+        # MoveSteering.wait_until_not_moving returns nothing, only the motors tell whether they stopped in time
+        return all(_motor.wait_until_not_moving(timeout=timeout_ms) for _motor in (self._motor_pair.left_motor, self._motor_pair.right_motor))
+
+    def _move_forward_squares_mm(self, square_count: int):
+        _speed = SpeedRPM(self._continuous_move_speed_rpm * self._motor_pair_polarity_factor)
+        _distance_mm = square_count * self._maze_square_length_mm
+        _squares_passed = 0
+
+        def tell_square_boundaries(travel_mm: float):
+            nonlocal _squares_passed
+            _squares_now = int(travel_mm // self._maze_square_length_mm)
+            while _squares_passed < min(_squares_now, square_count):
+                _squares_passed += 1
+                self._logger.debug('Passed square boundary {} of {}'.format(_squares_passed, square_count))
+                if self._square_boundary_listener is not None:
+                    self._square_boundary_listener(_squares_passed)
+
+        self._set_ramps(self._continuous_move_ramp_ms)
+        try:
+            if self._heading_control:
+                self._drive_straight_mm(_distance_mm, self._continuous_move_speed_rpm, travel_listener=tell_square_boundaries)
+                return
+            _start_positions = (self._motor_pair.left_motor.position, self._motor_pair.right_motor.position)
+            self._motor_pair.on_for_rotations(
+                steering=Steering.STRAIGHT.value, 
+                speed=_speed, 
+                rotations=_distance_mm / self._wheel_circumference_mm,
+                brake=True, block=False
+            )
+            self._wait_until_motors_run()
+            # Square boundaries are told by the wheel encoders while moving
+            while not self._wait_until_motors_stop(int(self._encoder_poll_interval_sec * 1000)):
+                tell_square_boundaries(self._get_wheel_travel_mm(_start_positions))
+        finally:
+            self._set_ramps(0)
+
+    def _get_controlled_move_timeout_sec(self, distance_mm: float, speed_rpm: int) -> float:
+        return self._controlled_move_timeout_factor * distance_mm / self._wheel_circumference_mm / (abs(speed_rpm) / 60)
+
+    def _add_side_turn_to_target_heading(self, direction: Steering) -> float:
+        # A whole side turn, whatever the turn really was, so that the errors of the turns do not add up
+        self._target_heading_deg += math.copysign(self._ideal_side_turn_angle, direction.value)
+        return self._target_heading_deg
+
+    def _drive_straight_mm(self, distance_mm: float, speed_rpm: int, brake: bool = True, travel_listener: callable = None):
+        # Runs in the motor command pipeline thread, steering again on every new gyro reading until
+        # the wheel encoders tell that the distance has been travelled
+        _speed = SpeedRPM(speed_rpm * self._motor_pair_polarity_factor)
+        _start_positions = (self._motor_pair.left_motor.position, self._motor_pair.right_motor.position)
+        _give_up_time = self._sensor_scheduler.get_time() + self._get_controlled_move_timeout_sec(distance_mm, speed_rpm)
+        self._heading_controller.reset(self._target_heading_deg)
+        try:
+            while True:
+                _travel_mm = self._get_wheel_travel_mm(_start_positions)
+                if travel_listener is not None:
+                    travel_listener(_travel_mm)
+                if _travel_mm >= distance_mm:
+                    break
+                if self._sensor_scheduler.get_time() > _give_up_time:
+                    self._logger.warning('Did not move {} mm in time, moved {} mm'.format(distance_mm, _travel_mm))
+                    break
+                _angle = self._gyro.get_orientation(fresh_after=self._sensor_scheduler.get_time())
+                _distances = self._distance_sensors.get_distances(filtered=True)
+                _steering = self._heading_controller.update(_angle, self._sensor_scheduler.get_time(), _distances['left'], _distances['right'])
+                # With reversed motors, the sides of the motor pair are swapped too
+                self._motor_pair.on(steering=_steering * self._motor_pair_polarity_factor, speed=_speed)
+        finally:
+            self._motor_pair.off(brake=brake)
+
+    def _turn_on_spot_to_angle(self, direction: Steering, target_heading: float):
+        # Slows down when getting close, so that the turn stops on the gyro angle
+        _sign = math.copysign(1, direction.value)
+        _give_up_time = self._sensor_scheduler.get_time() + self._controlled_move_timeout_factor * self._get_turn_time_sec(self._ideal_side_turn_angle)
+        try:
+            while True:
+                _angle = self._gyro.get_orientation(fresh_after=self._sensor_scheduler.get_time())
+                _remaining_deg = (target_heading - _angle) * _sign
+                if _remaining_deg <= 0:
+                    break
+                if self._sensor_scheduler.get_time() > _give_up_time:
+                    self._logger.warning('Turn did not reach heading {} in time, heading is {}'.format(target_heading, _angle))
+                    break
+                _speed_rpm = max(self._turn_min_speed_rpm, min(self._turn_speed_rpm, self._turn_speed_rpm * _remaining_deg / self._turn_slow_down_deg))
+                self._motor_pair.on(steering=direction.value, speed=SpeedRPM(_speed_rpm))
+        finally:
+            self._motor_pair.off(brake=True)
+
+    def _get_turn_time_sec(self, degrees: int) -> float:
+        _rotations = (self._wheelbase_width_at_centers_mm * degrees) / (self._wheel_diameter_mm * 360)
+        return _rotations / (self._turn_speed_rpm / 60)
+
     def _turn_on_spot_deg(self, direction: Steering, degrees: int):
+        _target_heading = self._add_side_turn_to_target_heading(direction)
+        if self._heading_control:
+            self._turn_on_spot_to_angle(direction, _target_heading)
+            return
         _rotations = (self._wheelbase_width_at_centers_mm * degrees) / (self._wheel_diameter_mm * 360)
         self._motor_pair.on_for_rotations(
             steering=direction.value, 
             speed=SpeedRPM(self._turn_speed_rpm), 
-            rotations=_rotations
+            rotations=_rotations,
+            block=True
         )
 
+    def _turn_along_arc_deg(self, direction: Steering, degrees: int):
+        _steering = get_arc_steering(direction, self._maze_square_length_mm / 2, self._wheelbase_width_at_centers_mm)
+        _angle_before = self._gyro.get_orientation()
+        self._add_side_turn_to_target_heading(direction)
+        _give_up_time = self._sensor_scheduler.get_time() + self._arc_turn_timeout_sec
+        # With reversed motors, the sides of the motor pair are swapped too, as when driving straight
+        self._motor_pair.on(
+            steering=_steering * self._motor_pair_polarity_factor,
+            speed=SpeedRPM(self._arc_turn_speed_rpm * self._motor_pair_polarity_factor)
+        )
+        try:
+            # Turns until the gyro tells that the robot is there, instead of counting wheel rotations
+            while abs(self._gyro.get_orientation(fresh_after=self._sensor_scheduler.get_time()) - _angle_before) < degrees - self._arc_turn_stop_early_deg:
+                if self._sensor_scheduler.get_time() > _give_up_time:
+                    self._logger.warning('Arc turn did not reach {} degrees in {} seconds'.format(degrees, self._arc_turn_timeout_sec))
+                    break
+        finally:
+            self._motor_pair.off(brake=False)
+
+    def _arc_turn(self, direction: Steering):
+        # From the center of the square behind the turn to the center of the square after it:
+        # half a square forward, a quarter circle of half a square, and half a square forward
+        _half_square_mm = self._maze_square_length_mm / 2
+        self._move_forward_mm(distance_mm=_half_square_mm, speed_rpm=self._arc_turn_speed_rpm, brake=False)
+        self._turn_along_arc_deg(direction, degrees=90)
+        self._move_forward_mm(distance_mm=_half_square_mm, speed_rpm=self._arc_turn_speed_rpm)
+
+    def _correct_after_move_forward(self, angle_before: int, distances_after: dict, angle_after: int):
+        if self._heading_control:
+            # The corrector turns by the angle relative to the start of the move, which would fight the
+            # target heading that the next move steers back to
+            self._position_corrector.correct_front_distance_after_move_forward(distances_after)
+            return
+        self._position_corrector.correct_after_move_forward(angle_before, distances_after, angle_after)
+
+    def _correct_after_side_turn(self, direction: Steering, angle_before: int, angle_after: int):
+        if self._heading_control:
+            # The turn already stopped on the target heading
+            return
+        if direction == Steering.LEFT_ON_SPOT:
+            self._position_corrector.correct_after_turn_left(angle_before, angle_after)
+        else:
+            self._position_corrector.correct_after_turn_right(angle_before, angle_after)
+
     def _correct_angle_using_back_wall(self, previous_distance_to_check: float):
+        if self._heading_control:
+            # The gyro keeps the heading, there is no need to back into the wall
+            return
         if self._turns_until_next_angle_corretion <= 0:
             if previous_distance_to_check < 4:
                 self._logger.debug('I am correcting my angle using the back wall...')
@@ -86,16 +288,38 @@ class EV3Motors(Motors):
         else:
             self._turns_until_next_angle_corretion = self._turns_until_next_angle_corretion -1
 
-    def _move(self, move_function, correct_function):
+    def _run(self, command):
+
+        def command_and_end_time():
+            command()
+            self._last_move_end_time = self._sensor_scheduler.get_time()
+
+        if self._motor_command_pipeline is None:
+            command_and_end_time()
+        else:
+            self._motor_command_pipeline.submit(command_and_end_time)
+
+    def wait_until_idle(self) -> float:
+        """
+        Waits until all the moves given so far have been made, including the corrections after them,
+        and returns the sensor scheduler time when the last move ended.
+        """
+        if self._motor_command_pipeline is not None:
+            self._motor_command_pipeline.wait_until_idle()
+        return self._last_move_end_time
+
+    def _move(self, move_function, correct_function, motor_command: MotorCommand):
         _distances_before = self._distance_sensors.get_distances()
         _angle_before = self._gyro.get_orientation()
-        self._log_distances_and_angle('before', _distances_before, _angle_before)
+        if self._target_heading_deg is None:
+            self._target_heading_deg = _angle_before
+        self._log_distances_and_angle('before', _distances_before, _angle_before, motor_command)
         move_function()
-        # Allow some time for motors to stop and gyro to react
-        time.sleep(self._wait_for_motors_and_gyro_after_move_sec)
-        _distances_after = self._distance_sensors.get_distances()
-        _angle_after = self._gyro.get_orientation()
-        self._log_distances_and_angle('after move before correction', _distances_after, _angle_after)
+        # Allow some time for motors to stop and gyro to react, then take the first readings after that
+        _settled_time = self._sensor_scheduler.get_time() + self._wait_for_motors_and_gyro_after_move_sec
+        _distances_after = self._distance_sensors.get_distances(fresh_after=_settled_time)
+        _angle_after = self._gyro.get_orientation(fresh_after=_settled_time)
+        self._log_distances_and_angle('after move before correction', _distances_after, _angle_after, motor_command)
         correct_function(distances_before=_distances_before, angle_before=_angle_before, distances_after=_distances_after, angle_after=_angle_after)
 
 
@@ -105,11 +329,32 @@ class EV3Motors(Motors):
             self._move_forward_mm(distance_mm=self._maze_square_length_mm, speed_rpm=self._move_forward_speed_rpm)
 
         def correct_function(angle_before, distances_after, angle_after, **kwargs):
-            self._position_corrector.correct_after_move_forward(angle_before, distances_after, angle_after)
+            self._correct_after_move_forward(angle_before, distances_after, angle_after)
+
+        def command():
+            self._logger.debug('Move_forward')
+            self._move(move_function, correct_function, MotorCommand.MOVE_FORWARD)
+            self._logger.debug('Move_forward done')
+
+        self._run(command)
+
+    def move_forward_squares(self, square_count: int):
+        """
+        Moves through the given number of squares in one go, correcting the position only at the end.
+        """
+
+        def move_function():
+            self._move_forward_squares_mm(square_count)
+
+        def correct_function(angle_before, distances_after, angle_after, **kwargs):
+            self._correct_after_move_forward(angle_before, distances_after, angle_after)
+
+        def command():
+            self._logger.debug('Move_forward_squares {}'.format(square_count))
+            self._move(move_function, correct_function, MotorCommand.MOVE_FORWARD)
+            self._logger.debug('Move_forward_squares {} done'.format(square_count))
 
-        self._logger.debug('Move_forward')
-        self._move(move_function, correct_function)
-        self._logger.debug('Move_forward done')
+        self._run(command)
 
     def turn_left(self):
 
@@ -117,12 +362,15 @@ class EV3Motors(Motors):
             self._turn_on_spot_deg(direction=Steering.LEFT_ON_SPOT, degrees=74)
 
         def correct_function(distances_before, angle_before, angle_after, **kwargs):
-            self._position_corrector.correct_after_turn_left(angle_before, angle_after)
+            self._correct_after_side_turn(Steering.LEFT_ON_SPOT, angle_before, angle_after)
             self._correct_angle_using_back_wall(distances_before['right'])
 
-        self._logger.debug('turn_left')
-        self._move(move_function, correct_function)
-        self._logger.debug('turn_left done')
+        def command():
+            self._logger.debug('turn_left')
+            self._move(move_function, correct_function, MotorCommand.TURN_LEFT)
+            self._logger.debug('turn_left done')
+
+        self._run(command)
 
     def turn_right(self):
 
@@ -130,12 +378,45 @@ class EV3Motors(Motors):
             self._turn_on_spot_deg(direction=Steering.RIGHT_ON_SPOT, degrees=74)
 
         def correct_function(distances_before, angle_before, angle_after, **kwargs):
-            self._position_corrector.correct_after_turn_right(angle_before, angle_after)
+            self._correct_after_side_turn(Steering.RIGHT_ON_SPOT, angle_before, angle_after)
             self._correct_angle_using_back_wall(distances_before['left'])
 
-        self._logger.debug('turn_right')
-        self._move(move_function, correct_function)
-        self._logger.debug('turn_right done')
+        def command():
+            self._logger.debug('turn_right')
+            self._move(move_function, correct_function, MotorCommand.TURN_RIGHT)
+            self._logger.debug('turn_right done')
+
+        self._run(command)
+
+    def arc_turn_right(self):
+
+        def move_function():
+            self._arc_turn(Steering.RIGHT_ON_SPOT)
+
+        def correct_function(angle_before, angle_after, **kwargs):
+            self._correct_after_side_turn(Steering.RIGHT_ON_SPOT, angle_before, angle_after)
+
+        def command():
+            self._logger.debug('arc_turn_right')
+            self._move(move_function, correct_function, MotorCommand.ARC_TURN_RIGHT)
+            self._logger.debug('arc_turn_right done')
+
+        self._run(command)
+
+    def arc_turn_left(self):
+
+        def move_function():
+            self._arc_turn(Steering.LEFT_ON_SPOT)
+
+        def correct_function(angle_before, angle_after, **kwargs):
+            self._correct_after_side_turn(Steering.LEFT_ON_SPOT, angle_before, angle_after)
+
+        def command():
+            self._logger.debug('arc_turn_left')
+            self._move(move_function, correct_function, MotorCommand.ARC_TURN_LEFT)
+            self._logger.debug('arc_turn_left done')
+
+        self._run(command)
 
     def turn_back(self):
         self._logger.debug('turn_back')
@@ -129,6 +129,16 @@ class PositionCorrector(object):
         else:
             self._logger.debug('No problem, i am fine between the walls.')
 
+    def correct_front_distance_after_move_forward(self, distances_after: dict):
+        """
+        Only moves to the ideal distance from the front wall, without turning. Used with heading control,
+        where the angle corrections would turn the robot away from the heading that it steers to.
+        """
+        _max_reliable_distance_cm = 5
+        if distances_after['front'] <= _max_reliable_distance_cm and distances_after['front'] != self._ideal_distance_cm:
+            self._logger.debug('Bad front distance!')
+            self._correct_front_distance(distances_after['front'])
+
     def correct_after_move_forward(self, 
         angle_before: int, 
         distances_after: dict, 
@@ -141,9 +151,7 @@ class PositionCorrector(object):
             self._logger.debug('Bad gyro angle. I have hit the wall')
             self._recover_from_hitting_wall(angle_before, angle_after, 1)
         else:
-            if distances_after['front'] <= _max_reliable_distance_cm and distances_after['front'] != self._ideal_distance_cm:
-                self._logger.debug('Bad front distance!')
-                self._correct_front_distance(distances_after['front'])
+            self.correct_front_distance_after_move_forward(distances_after)
             if distances_after['left'] <= _max_reliable_distance_cm and distances_after['right'] <= _max_reliable_distance_cm:
                 self._correct_side_distance(distances_after)
         self._logger.debug('correct_after_move_forward done')
@@ -0,0 +1,90 @@
+import bisect
+from array import array
+
+
+class SensorHistory(object):
+    """
+    The last size readings of a sensor in a fixed-size ring buffer, with rolling mean, variance and
+    median. Adding a reading updates the running sums in O(1) and the sorted copy of the readings
+    with a binary search, so the statistics are always ready and never re-computed from scratch.
+    The running sums are re-computed from the buffer once per round, so that rounding errors cannot
+    pile up.
+    """
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    @property
+    def latest(self) -> float:
+        if self._count == 0:
+            return None
+        return self._values[(self._next_index - 1) % self._size]
+
+    @property
+    def mean(self) -> float:
+        if self._count == 0:
+            return None
+        return self._sum / self._count
+
+    @property
+    def variance(self) -> float:
+        if self._count == 0:
+            return None
+        _mean = self._sum / self._count
+        # Rounding can make it slightly negative when all readings are the same
+        return max(0.0, self._sum_of_squares / self._count - _mean * _mean)
+
+    @property
+    def median(self) -> float:
+        if self._count == 0:
+            return None
+        _middle = self._count // 2
+        if self._count % 2 == 1:
+            return self._sorted_values[_middle]
+        return (self._sorted_values[_middle - 1] + self._sorted_values[_middle]) / 2
+
+    def __init__(self, size: int = 5):
+        if size < 1:
+            raise ValueError('Sensor history size must be at least 1, got {}'.format(size))
+        self._size = size
+        self.clear()
+
+    def clear(self):
+        self._values = array('d', [0.0] * self._size)
+        self._sorted_values = []
+        self._next_index = 0
+        self._count = 0
+        self._sum = 0.0
+        self._sum_of_squares = 0.0
+
+    def add(self, value: float):
+        if self._count == self._size:
+            _oldest = self._values[self._next_index]
+            self._sum -= _oldest
+            self._sum_of_squares -= _oldest * _oldest
+            del self._sorted_values[bisect.bisect_left(self._sorted_values, _oldest)]
+        else:
+            self._count += 1
+        self._values[self._next_index] = value
+        self._sum += value
+        self._sum_of_squares += value * value
+        bisect.insort(self._sorted_values, value)
+        self._next_index += 1
+        if self._next_index == self._size:
+            self._next_index = 0
+            if self._count == self._size:
+                self._sum = sum(self._values)
+                self._sum_of_squares = sum(_value * _value for _value in self._values)
+
+    def get_values(self) -> list:
+        """
+        Returns the readings from the oldest to the latest.
+        """
+        if self._count < self._size:
+            return list(self._values[:self._count])
+        return list(self._values[self._next_index:]) + list(self._values[:self._next_index])
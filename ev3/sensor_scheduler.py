@@ -0,0 +1,120 @@
+import time
+import logging
+import threading
+
+
+class SensorSample(object):
+    """
+    A sensor reading with the monotonic clock time when the reading started, and a sequence
+    number that grows by one with every new reading of the same sensor.
+    """
+    __slots__ = ('_value', '_timestamp', '_sequence_number')
+
+    def __init__(self, value, timestamp: float, sequence_number: int):
+        self._value = value
+        self._timestamp = timestamp
+        self._sequence_number = sequence_number
+
+    @property
+    def value(self):
+        return self._value
+
+    @property
+    def timestamp(self) -> float:
+        return self._timestamp
+
+    @property
+    def sequence_number(self) -> int:
+        return self._sequence_number
+
+
+class _ScheduledSensor(object):
+
+    def __init__(self, name: str, read_function: callable, period_sec: float):
+        self.name = name
+        self.read_function = read_function
+        self.period_sec = period_sec
+        self.next_read_time = 0.0
+        self.latest_sample = None
+
+
+class SensorScheduler(threading.Thread):
+    """
+    Reads all sensors in one thread, each at its own rate, and publishes the readings as timestamped
+    samples. Consumers can take the latest sample, or wait for the first sample that was read after
+    a given time - e.g. after the motors have stopped - instead of sleeping and hoping that the data
+    is fresh by then. Times are from the monotonic clock, so changing the system time does no harm.
+
+    A read function that raises an exception is logged and tried again on its next turn, the other
+    sensors keep being read.
+    """
+
+    def __init__(self, clock = time.monotonic, logger = None):
+        threading.Thread.__init__(self)
+        self.name = 'EV3SensorScheduler'
+        self.daemon = True
+        self._logger = logger or logging.getLogger(__name__)
+        self._clock = clock
+        self._sensors = {}
+        self._condition = threading.Condition()
+        self._stop_event = threading.Event()
+
+    def get_time(self) -> float:
+        return self._clock()
+
+    def add_sensor(self, name: str, read_function: callable, period_sec: float):
+        with self._condition:
+            self._sensors[name] = _ScheduledSensor(name, read_function, period_sec)
+
+    def get_latest_sample(self, name: str) -> SensorSample:
+        with self._condition:
+            return self._sensors[name].latest_sample
+
+    def wait_for_sample_after(self, name: str, timestamp: float, timeout_sec: float = None) -> SensorSample:
+        """
+        Returns the first sample of the sensor that was read at or after the given time, waiting for
+        it if needed. Returns None if there is no such sample within the timeout.
+        """
+        _sensor = self._sensors[name]
+
+        def is_fresh() -> bool:
+            return _sensor.latest_sample is not None and _sensor.latest_sample.timestamp >= timestamp
+
+        with self._condition:
+            if self._condition.wait_for(is_fresh, timeout=timeout_sec):
+                return _sensor.latest_sample
+            return None
+
+    def read_due_sensors(self) -> float:
+        """
+        Reads the sensors whose turn it is, and returns the time in seconds until the next reading is due.
+        """
+        _now = self._clock()
+        for _sensor in list(self._sensors.values()):
+            if _sensor.next_read_time > _now:
+                continue
+            _read_time = self._clock()
+            try:
+                _value = _sensor.read_function()
+            except Exception:
+                self._logger.warning('Unable to read sensor {}'.format(_sensor.name), exc_info=True)
+                _value = None
+            # Keeps the rate steady, but does not try to catch up after a long pause
+            _sensor.next_read_time += _sensor.period_sec
+            if _sensor.next_read_time <= _read_time:
+                _sensor.next_read_time = _read_time + _sensor.period_sec
+            if _value is not None:
+                with self._condition:
+                    _sequence_number = _sensor.latest_sample.sequence_number + 1 if _sensor.latest_sample else 1
+                    _sensor.latest_sample = SensorSample(_value, _read_time, _sequence_number)
+                    self._condition.notify_all()
+        if not self._sensors:
+            return 0.1
+        return max(0.0, min(_sensor.next_read_time for _sensor in self._sensors.values()) - self._clock())
+
+    def run(self):
+        while not self._stop_event.is_set():
+            self._stop_event.wait(self.read_due_sensors())
+
+    def stop(self):
+        self._stop_event.set()
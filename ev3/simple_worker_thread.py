@@ -10,7 +10,7 @@ class SimplePeriodicWorkerThread(threading.Thread):
         self._cycle_length_ms = cycle_length_ms
 
     def _get_current_time_milliseconds(self):
-        return int(round(time.time() * 1000))
+        return int(round(time.monotonic() * 1000))
 
     def _wait_until_end_of_cycle_time(self, cycle_start_time):
         _cycle_end_time = self._get_current_time_milliseconds()
@@ -1,7 +1,17 @@
 import enum
+import math
 
 class Steering(enum.Enum):
     STRAIGHT = 0
     LEFT_ON_SPOT = -100
     RIGHT_ON_SPOT = 100
-    
\ No newline at end of file
+
+
+def get_arc_steering(direction: Steering, radius_mm: float, wheelbase_width_mm: float) -> float:
+    """
+    Returns the MoveSteering steering value that turns to the side of the given on-spot steering
+    along an arc of the given radius at the center of the robot. MoveSteering runs the inner wheel
+    at (50 - |steering|) / 50 of the outer wheel speed.
+    """
+    _inner_to_outer_speed = (radius_mm - wheelbase_width_mm / 2) / (radius_mm + wheelbase_width_mm / 2)
+    return math.copysign(50 * (1 - _inner_to_outer_speed), direction.value)
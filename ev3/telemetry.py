@@ -0,0 +1,158 @@
+import logging
+import math
+import mmap
+import struct
+import threading
+import time
+
+# File header: magic, version, record size and the number of records written
+_HEADER = struct.Struct('<4sHHI')
+_MAGIC = b'TLM1'
+_VERSION = 1
+# Record: timestamp, left, front and right distance, gyro angle, motor command and decision.
+# Values that are not known are NaN, the motor command is a MotorCommand value or 0 for none.
+RECORD = struct.Struct('<dffffBB')
+
+NO_MOTOR_COMMAND = 0
+NO_VALUE = math.nan
+
+# Decision bits: the walls that were looked at, and the walls that were found blocked
+LEFT_CHECKED = 1
+FRONT_CHECKED = 2
+RIGHT_CHECKED = 4
+LEFT_BLOCKED = 16
+FRONT_BLOCKED = 32
+RIGHT_BLOCKED = 64
+WALL_DECISION_BITS = {
+    'left': (LEFT_CHECKED, LEFT_BLOCKED),
+    'front': (FRONT_CHECKED, FRONT_BLOCKED),
+    'right': (RIGHT_CHECKED, RIGHT_BLOCKED)
+}
+
+
+def get_wall_decision(direction: str, blocked: bool) -> int:
+    _checked_bit, _blocked_bit = WALL_DECISION_BITS[direction]
+    return _checked_bit | _blocked_bit if blocked else _checked_bit
+
+
+class TelemetryRecorder(threading.Thread):
+    """
+    Records what the robot sees and does as fixed-size binary records, instead of formatting log lines
+    on every sensor reading. A record is packed into a preallocated buffer in memory, which is cheap
+    enough to do on every cycle; the recorder thread copies the buffer into a memory mapped file
+    every flush_interval_sec. The file is preallocated for max_records records, the records after
+    that are dropped and counted. Read the file with read_telemetry or the telemetry_decoder tool.
+    """
+
+    @property
+    def recorded_count(self) -> int:
+        with self._lock:
+            return self._written_count + self._buffered_count
+
+    @property
+    def dropped_count(self) -> int:
+        with self._lock:
+            return self._dropped_count
+
+    def __init__(
+        self,
+        path: str,
+        clock = time.monotonic,
+        max_records: int = 100000,
+        buffer_records: int = 1000,
+        flush_interval_sec: float = 0.5,
+        logger = None
+    ):
+        threading.Thread.__init__(self)
+        self.name = 'EV3TelemetryRecorder'
+        self.daemon = True
+        self._logger = logger or logging.getLogger(__name__)
+        self._clock = clock
+        self._max_records = max_records
+        self._flush_interval_sec = flush_interval_sec
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        # Records go into one buffer while the other one is copied into the file
+        self._buffer = bytearray(buffer_records * RECORD.size)
+        self._spare_buffer = bytearray(buffer_records * RECORD.size)
+        self._buffer_records = buffer_records
+        self._buffered_count = 0
+        self._written_count = 0
+        self._dropped_count = 0
+        self._stop_event = threading.Event()
+        self._file = open(path, 'w+b')
+        self._file.truncate(_HEADER.size + max_records * RECORD.size)
+        self._mmap = mmap.mmap(self._file.fileno(), 0)
+        _HEADER.pack_into(self._mmap, 0, _MAGIC, _VERSION, RECORD.size, 0)
+
+    def get_time(self) -> float:
+        return self._clock()
+
+    def record(
+        self,
+        left: float = NO_VALUE,
+        front: float = NO_VALUE,
+        right: float = NO_VALUE,
+        angle: float = NO_VALUE,
+        motor_command: int = NO_MOTOR_COMMAND,
+        decision: int = 0,
+        timestamp: float = None
+    ):
+        _timestamp = self._clock() if timestamp is None else timestamp
+        with self._lock:
+            if self._written_count + self._buffered_count >= self._max_records or self._buffered_count >= self._buffer_records:
+                self._dropped_count += 1
+                return
+            RECORD.pack_into(self._buffer, self._buffered_count * RECORD.size, _timestamp, left, front, right, angle, motor_command, decision)
+            self._buffered_count += 1
+
+    def record_distances(self, distances: dict, angle: float = NO_VALUE, motor_command: int = NO_MOTOR_COMMAND, decision: int = 0):
+        self.record(distances['left'], distances['front'], distances['right'], angle, motor_command, decision)
+
+    def flush(self):
+        with self._flush_lock:
+            with self._lock:
+                _buffer, _count, _offset = self._buffer, self._buffered_count, self._written_count
+                self._buffer, self._spare_buffer = self._spare_buffer, self._buffer
+                self._buffered_count = 0
+            if _count == 0:
+                return
+            _start = _HEADER.size + _offset * RECORD.size
+            self._mmap[_start:_start + _count * RECORD.size] = _buffer[:_count * RECORD.size]
+            with self._lock:
+                self._written_count += _count
+                # The count is updated last, so a reader never sees records that are not there yet
+                _HEADER.pack_into(self._mmap, 0, _MAGIC, _VERSION, RECORD.size, self._written_count)
+
+    def run(self):
+        while not self._stop_event.wait(self._flush_interval_sec):
+            self.flush()
+
+    def stop(self):
+        self._stop_event.set()
+
+    def close(self):
+        """
+        Writes the rest of the records and closes the file. Call it after the recorder thread has stopped.
+        """
+        self.flush()
+        if self._dropped_count > 0:
+            self._logger.warning('Dropped {} telemetry records, the buffer or the file was full'.format(self._dropped_count))
+        self._mmap.flush()
+        self._mmap.close()
+        self._file.close()
+
+
+def read_telemetry(path: str):
+    """
+    Yields the records of a telemetry file as (timestamp, left, front, right, angle, motor_command, decision) tuples.
+    """
+    with open(path, 'rb') as _file:
+        _data = _file.read()
+    _magic, _version, _record_size, _count = _HEADER.unpack_from(_data, 0)
+    if _magic != _MAGIC:
+        raise ValueError('Not a telemetry file: {}'.format(path))
+    if _version != _VERSION or _record_size != RECORD.size:
+        raise ValueError('Unsupported telemetry file version {} with record size {}'.format(_version, _record_size))
+    for _index in range(_count):
+        yield RECORD.unpack_from(_data, _HEADER.size + _index * RECORD.size)
@@ -0,0 +1,53 @@
+import csv
+import math
+import sys
+from maze_solver.route_planner import MotorCommand
+from ev3.telemetry import read_telemetry, NO_MOTOR_COMMAND, WALL_DECISION_BITS
+
+_COLUMNS = ('timestamp', 'left', 'front', 'right', 'angle', 'motor_command', 'decision')
+
+
+def _format_decision(decision: int) -> str:
+    # E.g. "left=open front=blocked", only the walls that were looked at
+    _walls = []
+    for _direction, (_checked_bit, _blocked_bit) in WALL_DECISION_BITS.items():
+        if decision & _checked_bit:
+            _walls.append('{}={}'.format(_direction, 'blocked' if decision & _blocked_bit else 'open'))
+    return ' '.join(_walls)
+
+
+def decode_telemetry(path: str) -> list:
+    """
+    Returns the records of a telemetry file as dicts, with the motor command as a MotorCommand name
+    and the decision as text. Values that were not recorded are None.
+    """
+    _records = []
+    for _timestamp, _left, _front, _right, _angle, _motor_command, _decision in read_telemetry(path):
+        _records.append({
+            'timestamp': _timestamp,
+            'left': None if math.isnan(_left) else _left,
+            'front': None if math.isnan(_front) else _front,
+            'right': None if math.isnan(_right) else _right,
+            'angle': None if math.isnan(_angle) else _angle,
+            'motor_command': None if _motor_command == NO_MOTOR_COMMAND else MotorCommand(_motor_command).name,
+            'decision': _format_decision(_decision)
+        })
+    return _records
+
+
+def write_telemetry_csv(path: str, output):
+    _writer = csv.DictWriter(output, fieldnames=_COLUMNS)
+    _writer.writeheader()
+    for _record in decode_telemetry(path):
+        _writer.writerow(_record)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) not in (2, 3):
+        print('Usage: python -m ev3.telemetry_decoder TELEMETRY_FILE [CSV_FILE]')
+        sys.exit(1)
+    if len(sys.argv) == 2:
+        write_telemetry_csv(sys.argv[1], sys.stdout)
+    else:
+        with open(sys.argv[2], 'w', newline='') as _output:
+            write_telemetry_csv(sys.argv[1], _output)
@@ -3,27 +3,42 @@ import logging
 from maze_solver.kwargs_util import KwArgsUtil
 from maze_solver.maze_solver import WallDetector
 from ev3.distance_detectors import EV3DistanceDetectors
+from ev3.motors import EV3Motors
+from ev3.telemetry import TelemetryRecorder, get_wall_decision
 
 class EV3WallDetector(WallDetector):
 
     def __init__(
         self, 
         distance_sensors: EV3DistanceDetectors, 
+        motors: EV3Motors = None,
+        telemetry_recorder: TelemetryRecorder = None,
         logger = None, 
         **kwargs
     ):
         self._logger = logger or logging.getLogger(__name__)
         self._distance_sensors = distance_sensors
+        # With motors given, the walls are only looked at after the motors have stopped
+        self._motors = motors
+        self._telemetry_recorder = telemetry_recorder
         self._distance_treshold_to_decide_wall_is_blocked = KwArgsUtil.kwarg_or_default(
             7.0, 
             'distance_treshold_to_decide_wall_is_blocked', 
             **kwargs
         )
+        # The filtered distances ignore a single bad reading, e.g. from a gap between the walls
+        self._use_filtered_distances = KwArgsUtil.kwarg_or_default(True, 'use_filtered_distances', **kwargs)
 
     def _is_direction_blocked(self, direction: str):
-        _distance = self._distance_sensors.get_distances()[direction]
-        self._logger.debug('{} distance = {}'.format(direction, _distance))
-        return _distance < self._distance_treshold_to_decide_wall_is_blocked
+        _fresh_after = self._motors.wait_until_idle() if self._motors is not None else None
+        _distances = self._distance_sensors.get_distances(fresh_after=_fresh_after, filtered=self._use_filtered_distances)
+        _distance = _distances[direction]
+        _blocked = _distance < self._distance_treshold_to_decide_wall_is_blocked
+        if self._telemetry_recorder is not None:
+            self._telemetry_recorder.record_distances(_distances, decision=get_wall_decision(direction, _blocked))
+        if self._logger.isEnabledFor(logging.DEBUG):
+            self._logger.debug('{} distance = {}'.format(direction, _distance))
+        return _blocked
 
     def is_left_blocked(self) -> bool:
         return self._is_direction_blocked('left')
@@ -0,0 +1,32 @@
+#!/usr/bin/python3
+
+import time
+from ev3.distance_detectors import LightDistanceSensor
+from ev3.distance_calibration import DEFAULT_CALIBRATION_FILE, create_distance_table_from_wall_sweep, fit_distance_curve, save_distance_tables
+
+# Distances from the wall for the sweep, and readings averaged at each distance
+_SWEEP_DISTANCES_CM = [0.5, 1.0, 1.5, 2.0, 3.0, 4.0, 5.0, 6.0, 8.0]
+_READINGS_PER_DISTANCE = 10
+_SENSOR_ADDRESSES = {'left': 'in3', 'front': 'in1', 'right': 'in4'}
+
+def sweep_wall(sensor: LightDistanceSensor, sensor_name: str) -> list:
+    _samples = []
+    for _distance in _SWEEP_DISTANCES_CM:
+        input('Put the {} sensor {} cm from a white wall and press Enter'.format(sensor_name, _distance))
+        _intensities = []
+        for _ in range(_READINGS_PER_DISTANCE):
+            _intensities.append(sensor.reflected_light_intensity())
+            time.sleep(0.05)
+        _intensity = sum(_intensities) / len(_intensities)
+        print('Intensity at {} cm = {}'.format(_distance, _intensity))
+        _samples.append((_distance, _intensity))
+    return _samples
+
+if __name__ == "__main__":
+    distance_tables = {}
+    for sensor_name, address in _SENSOR_ADDRESSES.items():
+        samples = sweep_wall(LightDistanceSensor(address = address), sensor_name)
+        print('Curve of {} sensor: intensity = {:.1f} * {:.3f} ^ distance'.format(sensor_name, *fit_distance_curve(samples)))
+        distance_tables[address] = create_distance_table_from_wall_sweep(samples)
+    save_distance_tables(DEFAULT_CALIBRATION_FILE, distance_tables)
+    print('Saved distance tables to {}'.format(DEFAULT_CALIBRATION_FILE))
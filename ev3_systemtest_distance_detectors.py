@@ -2,12 +2,14 @@
 
 import time
 from ev3.distance_detectors import EV3DistanceDetectors
+from ev3.sensor_scheduler import SensorScheduler
 
 if __name__ == "__main__":
-    distance_detectors = EV3DistanceDetectors()
-    distance_detectors.start()
+    sensor_scheduler = SensorScheduler()
+    distance_detectors = EV3DistanceDetectors(sensor_scheduler = sensor_scheduler)
+    sensor_scheduler.start()
     for _ in range(10):
         _distances = distance_detectors.get_distances()
         print('Distances = {}'.format(_distances))
         time.sleep(0.5)
-    distance_detectors.stop()
\ No newline at end of file
+    sensor_scheduler.stop()
\ No newline at end of file
@@ -2,12 +2,14 @@
 
 import time
 from ev3.gyro import Gyro
+from ev3.sensor_scheduler import SensorScheduler
 
 if __name__ == "__main__":
-    gyro = Gyro()
-    gyro.start()
+    sensor_scheduler = SensorScheduler()
+    gyro = Gyro(sensor_scheduler = sensor_scheduler)
+    sensor_scheduler.start()
     for _ in range(10):
         _angle = gyro.get_orientation()
         print('Angle = {}'.format(_angle))
         time.sleep(1)
-    gyro.stop()
+    sensor_scheduler.stop()
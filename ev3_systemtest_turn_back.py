@@ -6,6 +6,7 @@ import sys
 from ev3.motors import EV3Motors
 from ev3.distance_detectors import EV3DistanceDetectors
 from ev3.gyro import Gyro
+from ev3.sensor_scheduler import SensorScheduler
 
 
 def set_up_console_logging():
@@ -16,13 +17,12 @@ def set_up_console_logging():
 
 if __name__ == "__main__":
     set_up_console_logging()
-    distance_sensors = EV3DistanceDetectors()
-    gyro = Gyro()
-    motors = EV3Motors(distance_sensors = distance_sensors, gyro = gyro)
-    distance_sensors.start()
-    gyro.start()
+    sensor_scheduler = SensorScheduler()
+    distance_sensors = EV3DistanceDetectors(sensor_scheduler = sensor_scheduler)
+    gyro = Gyro(sensor_scheduler = sensor_scheduler)
+    motors = EV3Motors(distance_sensors = distance_sensors, gyro = gyro, sensor_scheduler = sensor_scheduler)
+    sensor_scheduler.start()
     for _ in range(6):
         motors.turn_back()
         time.sleep(1)
-    distance_sensors.stop()
-    gyro.stop()
+    sensor_scheduler.stop()
@@ -1,13 +1,34 @@
 import logging
+from maze_solver import headings
 from maze_solver.square import Square
 from maze_solver.direction import Direction
+from maze_solver.square_flags_grid import SquareFlags, SquareFlagsGrid
+from maze_solver.dead_end_filler import DeadEndFiller
+from maze_solver.walked_path import WalkedPath
 from maze_solver.maze_solver import RandomWalkerMazeSolver, Motors, WallDetector, FinishDetector, Outputs
+from maze_solver.decision_table import LEFT, FRONT, RIGHT, TURN_LEFT, TURN_RIGHT, TURN_BACK, get_decision_index, get_decision_table
+
+
+# Bits of the per-square edge flags: the lower 4 bits mark passages that have been walked through,
+# the upper 4 bits mark passages that closed a loop. Indexed by heading.
+_TRAVERSED_EDGE_BITS = (1, 2, 4, 8)
+_LOOP_EDGE_BITS = (16, 32, 64, 128)
 
 
 class CuriousMazeSolver(RandomWalkerMazeSolver):
     """
     Prefers unexplored paths, remembers and avoids dead-ends, prefers turns that get closer to center.
-    Currently lacks cycle detection - therefore can take a long time to get out of more complex cycles.
+    Detects loops: when it walks into a square that is already on its walked path through a passage
+    it has never used, that passage closes a loop. If prefer_no_loops_weight is set, such passages
+    get a lower score, so that it does not keep circling the same loop.
+
+    With fill_dead_ends, the walls seen are kept in a DeadEndFiller, and the squares it finds to be
+    dead-ends are marked right away - whole corridors and branches at once, also the ones it has not
+    walked through - instead of only while walking back out of a dead-end.
+
+    With whole number weights, the turns are looked up from a decision table compiled for the weights,
+    by what is known about the squares around, instead of going through the next_turn_* branches.
+    The decisions are the same either way.
     """
 
     @property
@@ -20,11 +41,11 @@ class CuriousMazeSolver(RandomWalkerMazeSolver):
 
     @property
     def current_direction(self) -> Direction:
-        return self._current_direction
+        return Direction.from_heading(self._heading)
 
     @current_direction.setter
     def current_direction(self, value: Direction):
-        self._current_direction = value
+        self._heading = value.heading
 
     @property
     def prefer_non_dead_ends_weight(self) -> int:
@@ -33,6 +54,7 @@ class CuriousMazeSolver(RandomWalkerMazeSolver):
     @prefer_non_dead_ends_weight.setter
     def prefer_non_dead_ends_weight(self, value: int):
         self._prefer_non_dead_ends_weight = value
+        self._decision_table = None
 
     @property
     def prefer_unvisited_paths_weight(self) -> int:
@@ -41,6 +63,7 @@ class CuriousMazeSolver(RandomWalkerMazeSolver):
     @prefer_unvisited_paths_weight.setter
     def prefer_unvisited_paths_weight(self, value: int):
         self._prefer_unvisited_paths_weight = value
+        self._decision_table = None
 
     @property
     def prefer_closer_to_center_weight(self) -> int:
@@ -49,6 +72,7 @@ class CuriousMazeSolver(RandomWalkerMazeSolver):
     @prefer_closer_to_center_weight.setter
     def prefer_closer_to_center_weight(self, value: int):
         self._prefer_closer_to_center_weight = value
+        self._decision_table = None
 
     @property
     def prefer_no_turns_weight(self) -> int:
@@ -57,6 +81,16 @@ class CuriousMazeSolver(RandomWalkerMazeSolver):
     @prefer_no_turns_weight.setter
     def prefer_no_turns_weight(self, value: int):
         self._prefer_no_turns_weight = value
+        self._decision_table = None
+
+    @property
+    def prefer_no_loops_weight(self) -> int:
+        return self._prefer_no_loops_weight
+
+    @prefer_no_loops_weight.setter
+    def prefer_no_loops_weight(self, value: int):
+        self._prefer_no_loops_weight = value
+        self._decision_table = None
 
     @property
     def center_coordinates(self) -> list:
@@ -65,26 +99,41 @@ class CuriousMazeSolver(RandomWalkerMazeSolver):
     @center_coordinates.setter
     def center_coordinates(self, value: list):
         self._center_coordinates = value
-
-    def get_key_for_square(self, x: int, y: int) -> str:
-        return '{}-{}'.format(x, y)
+        self._axis_distances_from_center = {}
+        if self._dead_end_filler is not None:
+            self._dead_end_filler.excluded_squares = self._get_center_squares()
 
     def is_visited(self, x: int, y: int) -> bool:
-        return self.get_key_for_square(x, y) in self._visited_squares
+        return self._visited_squares.get_flags(x, y) & SquareFlags.VISITED != 0
 
     def is_dead_end(self, x: int, y: int) -> bool:
-        _key = self.get_key_for_square(x, y)
-        if _key not in self._visited_squares:
-            return False
-        else:
-            return self._visited_squares[_key].is_dead_end
+        return self._visited_squares.get_flags(x, y) & SquareFlags.DEAD_END != 0
+
+    def is_loop_edge(self, x: int, y: int, direction: Direction) -> bool:
+        return self._edge_flags.get_flags(x, y) & _LOOP_EDGE_BITS[direction.heading] != 0
+
+    def is_traversed_edge(self, x: int, y: int, direction: Direction) -> bool:
+        return self._edge_flags.get_flags(x, y) & _TRAVERSED_EDGE_BITS[direction.heading] != 0
+
+    def _add_edge_flags(self, x: int, y: int, heading: int, edge_bits: tuple):
+        self._edge_flags.add_flags(x, y, edge_bits[heading])
+        self._edge_flags.add_flags(x + headings.DX[heading], y + headings.DY[heading], edge_bits[headings.BACK_OF[heading]])
+
+    def mark_loop_edge(self, x: int, y: int, direction: Direction):
+        self._add_edge_flags(x, y, direction.heading, _LOOP_EDGE_BITS)
 
     def reset_to_start_and_forget_everything(self):
-        self._visited_squares = {}
+        self._visited_squares = SquareFlagsGrid()
+        self._edge_flags = SquareFlagsGrid()
+        self._walked_path = WalkedPath()
         _start_square = Square(x = 1, y = 1)
         self._current_square = _start_square
-        self._current_direction = Direction.NORTH
+        self._heading = headings.NORTH
         self._last_square_was_dead_end = False
+        self._dead_end_filler = DeadEndFiller(self._get_center_squares()) if self._fill_dead_ends else None
+
+    def _get_center_squares(self) -> set:
+        return set((_x, _y) for _x in self._center_coordinates for _y in self._center_coordinates)
 
     def __init__(
         self, 
@@ -96,56 +145,108 @@ class CuriousMazeSolver(RandomWalkerMazeSolver):
         prefer_unvisited_paths_weight: int = 2,
         prefer_closer_to_center_weight: int = 3,
         prefer_no_turns_weight: int = 1,
+        prefer_no_loops_weight: int = 0,
         # center_coordinates: list = [8, 9],
         center_coordinates: list = [4],
-        logger = None
+        logger = None,
+        random_seed: int = None,
+        use_decision_table: bool = True,
+        fill_dead_ends: bool = False
     ):
-        super().__init__(motors, wall_detector, finish_detector, outputs)
+        super().__init__(motors, wall_detector, finish_detector, outputs, random_seed=random_seed)
         self._logger = logger or logging.getLogger(__name__)
+        self._center_coordinates = center_coordinates
+        self._fill_dead_ends = fill_dead_ends
         self.reset_to_start_and_forget_everything()
         self._prefer_non_dead_ends_weight = prefer_non_dead_ends_weight
         self._prefer_unvisited_paths_weight = prefer_unvisited_paths_weight
         self._prefer_closer_to_center_weight = prefer_closer_to_center_weight
         self._prefer_no_turns_weight = prefer_no_turns_weight
-        self._center_coordinates = center_coordinates
+        self._prefer_no_loops_weight = prefer_no_loops_weight
+        self._axis_distances_from_center = {}
+        self._use_decision_table = use_decision_table
+        self._decision_table = None
 
     def turn_left(self):
         super().turn_left()
-        self._current_direction = self._current_direction.get_left_direction()
-        self._logger.debug('Direction is now {}'.format(self._current_direction))
+        self._heading = headings.LEFT_OF[self._heading]
+        self._logger.debug('Direction is now {}'.format(headings.NAMES[self._heading]))
 
     def turn_right(self):
         super().turn_right()
-        self._current_direction = self._current_direction.get_right_direction()
-        self._logger.debug('Direction is now {}'.format(self._current_direction))
+        self._heading = headings.RIGHT_OF[self._heading]
+        self._logger.debug('Direction is now {}'.format(headings.NAMES[self._heading]))
 
     def turn_back(self):
         super().turn_back()
-        self._current_direction = self._current_direction.get_back_direction()
-        self._logger.debug('Direction is now {}'.format(self._current_direction))
+        self._heading = headings.BACK_OF[self._heading]
+        self._logger.debug('Direction is now {}'.format(headings.NAMES[self._heading]))
 
     def add_square_as_visited(self, square):
-        self._visited_squares[self.get_key_for_square(square.x, square.y)] = square
+        _flags = SquareFlags.VISITED | SquareFlags.DEAD_END if square.is_dead_end else SquareFlags.VISITED
+        if self._dead_end_filler is not None and self._dead_end_filler.is_dead_end(square.x, square.y):
+            # Filled dead-ends stay dead-ends when walked through
+            _flags |= SquareFlags.DEAD_END
+        self._visited_squares.set_flags(square.x, square.y, _flags)
+
+    def _add_filled_dead_ends(self, squares: list):
+        for _x, _y in squares:
+            self._visited_squares.add_flags(_x, _y, SquareFlags.DEAD_END)
+        if squares:
+            self._logger.debug('Filled dead-ends: {}'.format(squares))
+
+    def _learn_walls(self, left_blocked: bool, front_blocked: bool, right_blocked: bool):
+        _x = self._current_square.x
+        _y = self._current_square.y
+        _sensed_walls = (
+            (headings.LEFT_OF[self._heading], left_blocked),
+            (self._heading, front_blocked),
+            (headings.RIGHT_OF[self._heading], right_blocked)
+        )
+        for _heading, _blocked in _sensed_walls:
+            self._add_filled_dead_ends(self._dead_end_filler.set_wall(_x, _y, _heading, _blocked))
+
+    def _detect_loop(self, new_x: int, new_y: int):
+        _loop_start_step = self._walked_path.get_last_step_of_square(new_x, new_y)
+        if _loop_start_step is None:
+            return
+        if self._edge_flags.get_flags(self._current_square.x, self._current_square.y) & _TRAVERSED_EDGE_BITS[self._heading]:
+            # Walking back along a known passage, e.g. out of a dead-end, is not a loop
+            return
+        self._add_edge_flags(self._current_square.x, self._current_square.y, self._heading, _LOOP_EDGE_BITS)
+        self._logger.info('Loop of {} squares detected, closed by passage from x={}, y={} to x={}, y={}'.format(
+            self._walked_path.get_step_count() - _loop_start_step,
+            self._current_square.x,
+            self._current_square.y,
+            new_x,
+            new_y
+        ))
 
     def move_forward_to_next_square(self):
         super().move_forward_to_next_square()
         self.add_square_as_visited(self._current_square)
-        _new_x = self._current_square.x + self._current_direction.value['x']
-        _new_y = self._current_square.y + self._current_direction.value['y']
+        _new_x = self._current_square.x + headings.DX[self._heading]
+        _new_y = self._current_square.y + headings.DY[self._heading]
+        self._walked_path.append(self._current_square)
+        self._detect_loop(_new_x, _new_y)
+        self._add_edge_flags(self._current_square.x, self._current_square.y, self._heading, _TRAVERSED_EDGE_BITS)
+        if self._dead_end_filler is not None:
+            self._add_filled_dead_ends(self._dead_end_filler.set_wall(self._current_square.x, self._current_square.y, self._heading, False))
+            self._add_filled_dead_ends(self._dead_end_filler.set_current_square(_new_x, _new_y))
         self._current_square = Square(x = _new_x, y = _new_y)
-        self._logger.info('Current square is now x={}, y={}, current direction is {}'.format(_new_x, _new_y, self._current_direction))
+        self._logger.info('Current square is now x={}, y={}, current direction is {}'.format(_new_x, _new_y, headings.NAMES[self._heading]))
 
     def is_dead_end_in_direction(self, direction: Direction) -> bool:
-        return self.is_dead_end(
-            self._current_square.x + direction.value['x'],
-            self._current_square.y + direction.value['y']
-        )
+        return self._is_dead_end_towards(direction.heading)
+
+    def _is_dead_end_towards(self, heading: int) -> bool:
+        return self.is_dead_end(self._current_square.x + headings.DX[heading], self._current_square.y + headings.DY[heading])
 
     def is_visited_in_direction(self, direction: Direction) -> bool:
-        return self.is_visited(
-            self._current_square.x + direction.value['x'],
-            self._current_square.y + direction.value['y']
-        )
+        return self._is_visited_towards(direction.heading)
+
+    def _is_visited_towards(self, heading: int) -> bool:
+        return self.is_visited(self._current_square.x + headings.DX[heading], self._current_square.y + headings.DY[heading])
 
     def mark_current_square_as_dead_end(self):
         self._current_square.is_dead_end = True
@@ -154,24 +255,36 @@ class CuriousMazeSolver(RandomWalkerMazeSolver):
             self._current_square.x, 
             self._current_square.y
         ))
+        if self._dead_end_filler is not None:
+            self._add_filled_dead_ends(self._dead_end_filler.mark_dead_end(self._current_square.x, self._current_square.y))
 
     def is_left_dead_end(self) -> bool:
-        return self.is_dead_end_in_direction(self._current_direction.get_left_direction())
+        return self._is_dead_end_towards(headings.LEFT_OF[self._heading])
 
     def is_right_dead_end(self) -> bool:
-        return self.is_dead_end_in_direction(self._current_direction.get_right_direction())
+        return self._is_dead_end_towards(headings.RIGHT_OF[self._heading])
 
     def is_front_dead_end(self) -> bool:
-        return self.is_dead_end_in_direction(self._current_direction)
+        return self._is_dead_end_towards(self._heading)
 
     def is_left_visited(self) -> bool:
-        return self.is_visited_in_direction(self._current_direction.get_left_direction())
+        return self._is_visited_towards(headings.LEFT_OF[self._heading])
 
     def is_right_visited(self) -> bool:
-        return self.is_visited_in_direction(self._current_direction.get_right_direction())
+        return self._is_visited_towards(headings.RIGHT_OF[self._heading])
 
     def is_front_visited(self) -> bool:
-        return self.is_visited_in_direction(self._current_direction)
+        return self._is_visited_towards(self._heading)
+
+    def is_loop_edge_in_direction(self, direction: Direction) -> bool:
+        return self.is_loop_edge(self._current_square.x, self._current_square.y, direction)
+
+    def get_no_loops_score_in_direction(self, direction: Direction) -> int:
+        return self._get_no_loops_score_towards(direction.heading)
+
+    def _get_no_loops_score_towards(self, heading: int) -> int:
+        _is_loop_edge = self._edge_flags.get_flags(self._current_square.x, self._current_square.y) & _LOOP_EDGE_BITS[heading]
+        return -self._prefer_no_loops_weight if _is_loop_edge else 0
 
     def get_distance_from_center(self, x: int, y: int) -> int:
         def _get_min_distance(x_or_y: int):
@@ -184,20 +297,27 @@ class CuriousMazeSolver(RandomWalkerMazeSolver):
         _min_y = _get_min_distance(y)
         return max(_min_x, _min_y)
 
+    def _get_axis_distance_from_center(self, x_or_y: int) -> int:
+        _distance = self._axis_distances_from_center.get(x_or_y)
+        if _distance is None:
+            _distance = min(abs(x_or_y - _coordinate) for _coordinate in self._center_coordinates)
+            self._axis_distances_from_center[x_or_y] = _distance
+        return _distance
+
     def get_distance_from_center_in_direction(self, direction: Direction) -> int:
-        return self.get_distance_from_center(
-            self._current_square.x + direction.value['x'],
-            self._current_square.y + direction.value['y']
-        )
+        return self._get_distance_from_center_towards(direction.heading)
+
+    def _get_distance_from_center_towards(self, heading: int) -> int:
+        return self.get_distance_from_center(self._current_square.x + headings.DX[heading], self._current_square.y + headings.DY[heading])
 
     def get_distance_from_center_in_left(self) -> int:
-        return self.get_distance_from_center_in_direction(self._current_direction.get_left_direction())
+        return self._get_distance_from_center_towards(headings.LEFT_OF[self._heading])
 
     def get_distance_from_center_in_right(self) -> int:
-        return self.get_distance_from_center_in_direction(self._current_direction.get_right_direction())
+        return self._get_distance_from_center_towards(headings.RIGHT_OF[self._heading])
 
     def get_distance_from_center_in_front(self) -> int:
-        return self.get_distance_from_center_in_direction(self._current_direction)
+        return self._get_distance_from_center_towards(self._heading)
 
     def get_score_left(self) -> int:
         _no_dead_end_score = self._prefer_non_dead_ends_weight if not self.is_left_dead_end() else 0
@@ -205,7 +325,8 @@ class CuriousMazeSolver(RandomWalkerMazeSolver):
         _closeness_to_center = 8 - self.get_distance_from_center_in_left()
         _closeness_to_center_score = self._prefer_closer_to_center_weight * (_closeness_to_center / 8)
         _no_turns_score = 0
-        return _no_dead_end_score + _unvisited_score + _closeness_to_center_score + _no_turns_score
+        _no_loops_score = self._get_no_loops_score_towards(headings.LEFT_OF[self._heading])
+        return _no_dead_end_score + _unvisited_score + _closeness_to_center_score + _no_turns_score + _no_loops_score
 
     def get_score_right(self) -> int:
         _no_dead_end_score = self._prefer_non_dead_ends_weight if not self.is_right_dead_end() else 0
@@ -213,7 +334,8 @@ class CuriousMazeSolver(RandomWalkerMazeSolver):
         _closeness_to_center = 8 - self.get_distance_from_center_in_right()
         _closeness_to_center_score = self._prefer_closer_to_center_weight * (_closeness_to_center / 8)
         _no_turns_score = 0
-        return _no_dead_end_score + _unvisited_score + _closeness_to_center_score + _no_turns_score
+        _no_loops_score = self._get_no_loops_score_towards(headings.RIGHT_OF[self._heading])
+        return _no_dead_end_score + _unvisited_score + _closeness_to_center_score + _no_turns_score + _no_loops_score
 
     def get_score_front(self) -> int:
         _no_dead_end_score = self._prefer_non_dead_ends_weight if not self.is_front_dead_end() else 0
@@ -221,7 +343,8 @@ class CuriousMazeSolver(RandomWalkerMazeSolver):
         _closeness_to_center = 8 - self.get_distance_from_center_in_front()
         _closeness_to_center_score = self._prefer_closer_to_center_weight * (_closeness_to_center / 8)
         _no_turns_score = self._prefer_no_turns_weight
-        return _no_dead_end_score + _unvisited_score + _closeness_to_center_score + _no_turns_score
+        _no_loops_score = self._get_no_loops_score_towards(self._heading)
+        return _no_dead_end_score + _unvisited_score + _closeness_to_center_score + _no_turns_score + _no_loops_score
 
     def next_turn_none_unblocked(self):
         self.mark_current_square_as_dead_end()
@@ -337,3 +460,84 @@ class CuriousMazeSolver(RandomWalkerMazeSolver):
         else:
             self._last_square_was_dead_end = False
             self.next_turn_based_on_scores_between_all_directions()
+
+    def _get_decision_table(self) -> tuple:
+        if self._decision_table is None and self._use_decision_table:
+            _weights = (
+                self._prefer_non_dead_ends_weight,
+                self._prefer_unvisited_paths_weight,
+                self._prefer_closer_to_center_weight,
+                self._prefer_no_turns_weight,
+                self._prefer_no_loops_weight
+            )
+            # Other weights may round differently depending on the distance to center, so they are not compiled
+            if all(isinstance(_weight, int) for _weight in _weights):
+                self._decision_table = get_decision_table(_weights)
+        return self._decision_table
+
+    def _get_decision_index(self, left_blocked: bool, front_blocked: bool, right_blocked: bool) -> int:
+        _x = self._current_square.x
+        _y = self._current_square.y
+        _distance = max(self._get_axis_distance_from_center(_x), self._get_axis_distance_from_center(_y))
+        _edge_flags = self._edge_flags.get_flags(_x, _y) if self._prefer_no_loops_weight != 0 else 0
+        _blocked = 0
+        _dead_ends = 0
+        _visited = 0
+        _loop_edges = 0
+        _distance_changes = {LEFT: 0, FRONT: 0, RIGHT: 0}
+        _headings = (
+            (LEFT, left_blocked, headings.LEFT_OF[self._heading]),
+            (FRONT, front_blocked, self._heading),
+            (RIGHT, right_blocked, headings.RIGHT_OF[self._heading])
+        )
+        for _bit, _is_blocked, _heading in _headings:
+            if _is_blocked:
+                _blocked |= _bit
+                continue
+            _next_x = _x + headings.DX[_heading]
+            _next_y = _y + headings.DY[_heading]
+            _flags = self._visited_squares.get_flags(_next_x, _next_y)
+            if _flags & SquareFlags.DEAD_END:
+                _dead_ends |= _bit
+            if _flags & SquareFlags.VISITED:
+                _visited |= _bit
+            if _edge_flags & _LOOP_EDGE_BITS[_heading]:
+                _loop_edges |= _bit
+            _next_distance = max(self._get_axis_distance_from_center(_next_x), self._get_axis_distance_from_center(_next_y))
+            _distance_changes[_bit] = _next_distance - _distance
+        return get_decision_index(
+            _blocked,
+            self._last_square_was_dead_end,
+            _dead_ends,
+            _visited,
+            _loop_edges,
+            _distance_changes[LEFT],
+            _distance_changes[FRONT],
+            _distance_changes[RIGHT]
+        )
+
+    def _get_turn_function(self, turn: int):
+        if turn == TURN_LEFT:
+            return self.turn_left
+        elif turn == TURN_RIGHT:
+            return self.turn_right
+        elif turn == TURN_BACK:
+            return self.turn_back
+        return self._motors.no_turn
+
+    def next_turn(self, left_blocked: bool, front_blocked: bool, right_blocked: bool):
+        if self._dead_end_filler is not None:
+            self._learn_walls(left_blocked, front_blocked, right_blocked)
+        _decision_table = self._get_decision_table()
+        if _decision_table is None:
+            super().next_turn(left_blocked, front_blocked, right_blocked)
+            return
+        _mark_dead_end, _forget_last_dead_end, _turns = _decision_table[self._get_decision_index(left_blocked, front_blocked, right_blocked)]
+        if _mark_dead_end:
+            self.mark_current_square_as_dead_end()
+        if _forget_last_dead_end:
+            self._last_square_was_dead_end = False
+        if len(_turns) == 1:
+            self._get_turn_function(_turns[0])()
+        else:
+            self.call_one_in_random([self._get_turn_function(_turn) for _turn in _turns])
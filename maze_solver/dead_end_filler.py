@@ -0,0 +1,117 @@
+from maze_solver import headings
+from maze_solver.square_flags_grid import SquareFlagsGrid
+
+# Bits of the per-square wall flags: the lower 4 bits mark the walls that are known,
+# the upper 4 bits mark the known walls that are blocked. Indexed by heading.
+_KNOWN_WALL_BITS = (1, 2, 4, 8)
+_BLOCKED_WALL_BITS = (16, 32, 64, 128)
+_ALL_WALLS_KNOWN = 15
+
+_DEAD_END = 1
+
+
+class DeadEndFiller(object):
+    """
+    Keeps the walls learned so far, and fills the dead-ends of the maze as soon as they follow from the
+    walls: a square is a dead-end when all of its walls are known, and at most one of its open neighbours
+    is not a dead-end. Every new wall or dead-end mark is propagated right away, so that a whole corridor
+    or a whole branch is filled at once, also through the squares that have not been walked through, as
+    long as their walls have been seen from the squares around. The maze size does not have to be known.
+
+    The excluded squares, e.g. the center squares where the finish may be, are never filled. Neither is
+    the current square of the robot, and it counts as a way out for the squares around it, so that the
+    way back from a dead-end stays open until the robot has walked it - else, inside a branch that is all
+    dead-ends, the way out would look the same as the ways further in.
+    """
+
+    @property
+    def excluded_squares(self) -> set:
+        return self._excluded_squares
+
+    @excluded_squares.setter
+    def excluded_squares(self, value: set):
+        self._excluded_squares = set(value)
+
+    @property
+    def current_square(self) -> tuple:
+        return self._current_square
+
+    def __init__(self, excluded_squares: set = frozenset(), current_square: tuple = (1, 1)):
+        self._walls = SquareFlagsGrid()
+        self._dead_ends = SquareFlagsGrid()
+        self._excluded_squares = set(excluded_squares)
+        self._current_square = current_square
+
+    def is_dead_end(self, x: int, y: int) -> bool:
+        return self._dead_ends.get_flags(x, y) & _DEAD_END != 0
+
+    def is_wall_known(self, x: int, y: int, heading: int) -> bool:
+        return self._walls.get_flags(x, y) & _KNOWN_WALL_BITS[heading] != 0
+
+    def set_wall(self, x: int, y: int, heading: int, blocked: bool) -> list:
+        """
+        Sets the wall on both sides, and returns the (x, y) of the squares that became dead-ends.
+        """
+        _neighbour_x = x + headings.DX[heading]
+        _neighbour_y = y + headings.DY[heading]
+        _back_heading = headings.BACK_OF[heading]
+        self._set_wall_flags(x, y, heading, blocked)
+        self._set_wall_flags(_neighbour_x, _neighbour_y, _back_heading, blocked)
+        return self._fill([(x, y), (_neighbour_x, _neighbour_y)])
+
+    def _set_wall_flags(self, x: int, y: int, heading: int, blocked: bool):
+        _flags = self._walls.get_flags(x, y) | _KNOWN_WALL_BITS[heading]
+        if blocked:
+            _flags |= _BLOCKED_WALL_BITS[heading]
+        else:
+            _flags &= ~_BLOCKED_WALL_BITS[heading]
+        self._walls.set_flags(x, y, _flags)
+
+    def set_current_square(self, x: int, y: int) -> list:
+        """
+        Moves the robot to the given square, and returns the (x, y) of the squares that became dead-ends
+        now that the robot has left the previous square.
+        """
+        _previous_x, _previous_y = self._current_square
+        self._current_square = (x, y)
+        return self._fill([(_previous_x, _previous_y)] + self._get_open_neighbours(_previous_x, _previous_y))
+
+    def mark_dead_end(self, x: int, y: int) -> list:
+        """
+        Marks a square that is known to be a dead-end by other means, e.g. by walking out of a dead-end,
+        and returns the (x, y) of the squares that became dead-ends, including this one.
+        """
+        if self.is_dead_end(x, y) or (x, y) in self._excluded_squares:
+            return []
+        self._dead_ends.set_flags(x, y, _DEAD_END)
+        return [(x, y)] + self._fill(self._get_open_neighbours(x, y))
+
+    def _get_open_neighbours(self, x: int, y: int) -> list:
+        _flags = self._walls.get_flags(x, y)
+        return [
+            (x + headings.DX[_heading], y + headings.DY[_heading])
+            for _heading in headings.HEADINGS
+            if _flags & _KNOWN_WALL_BITS[_heading] and not _flags & _BLOCKED_WALL_BITS[_heading]
+        ]
+
+    def _is_filled(self, x: int, y: int) -> bool:
+        if self._walls.get_flags(x, y) & _ALL_WALLS_KNOWN != _ALL_WALLS_KNOWN:
+            return False
+        _way_out_count = 0
+        for _neighbour in self._get_open_neighbours(x, y):
+            if _neighbour == self._current_square or not self.is_dead_end(*_neighbour):
+                _way_out_count += 1
+        return _way_out_count <= 1
+
+    def _fill(self, squares: list) -> list:
+        _filled_squares = []
+        _stack = list(squares)
+        while _stack:
+            _square = _stack.pop()
+            _x, _y = _square
+            if self.is_dead_end(_x, _y) or _square in self._excluded_squares or _square == self._current_square or not self._is_filled(_x, _y):
+                continue
+            self._dead_ends.set_flags(_x, _y, _DEAD_END)
+            _filled_squares.append((_x, _y))
+            _stack.extend(self._get_open_neighbours(_x, _y))
+        return _filled_squares
@@ -0,0 +1,158 @@
+import functools
+
+# Bits of the direction masks of a decision: left, front and right of the robot
+LEFT = 1
+FRONT = 2
+RIGHT = 4
+
+# Turns of a decision
+NO_TURN = 0
+TURN_LEFT = 1
+TURN_RIGHT = 2
+TURN_BACK = 3
+
+# Distance to center in a direction minus the distance to center of the current square: -1, 0 or 1,
+# as the squares next to each other are never more than one square apart from the center
+_DISTANCE_CHANGE_COUNT = 3
+_DISTANCE_CHANGE_CODES = _DISTANCE_CHANGE_COUNT ** 3
+
+
+def get_decision_index(
+    blocked: int,
+    last_square_was_dead_end: bool,
+    dead_ends: int,
+    visited: int,
+    loop_edges: int,
+    left_distance_change: int,
+    front_distance_change: int,
+    right_distance_change: int
+) -> int:
+    """
+    Returns the index of the decision in the decision table. The masks are made of the LEFT, FRONT
+    and RIGHT bits, the distance changes are -1, 0 or 1.
+    """
+    _distance_code = (left_distance_change + 1) + (front_distance_change + 1) * 3 + (right_distance_change + 1) * 9
+    _state = (((loop_edges * 8 + visited) * 8 + dead_ends) * 8 + blocked) * 2 + (1 if last_square_was_dead_end else 0)
+    return _state * _DISTANCE_CHANGE_CODES + _distance_code
+
+
+def _decide(weights: tuple, blocked: int, last_square_was_dead_end: bool, dead_ends: int, visited: int, loop_edges: int, distance_changes: dict) -> tuple:
+    # The same decisions as the branches of CuriousMazeSolver.next_turn, with the closeness to center
+    # told relative to the current square. With whole number weights, the scores are exact, so they
+    # compare the same way whatever the distance of the current square is.
+    _non_dead_ends_weight, _unvisited_paths_weight, _closer_to_center_weight, _no_turns_weight, _no_loops_weight = weights
+    _unblocked = ~blocked & (LEFT | FRONT | RIGHT)
+
+    def get_score(direction: int) -> float:
+        _no_dead_end_score = _non_dead_ends_weight if not dead_ends & direction else 0
+        _unvisited_score = _unvisited_paths_weight if not visited & direction else 0
+        _closeness_to_center = 8 - distance_changes[direction]
+        _closeness_to_center_score = _closer_to_center_weight * (_closeness_to_center / 8)
+        _no_turns_score = _no_turns_weight if direction == FRONT else 0
+        _no_loops_score = -_no_loops_weight if loop_edges & direction else 0
+        return _no_dead_end_score + _unvisited_score + _closeness_to_center_score + _no_turns_score + _no_loops_score
+
+    def only(turn: int) -> tuple:
+        # A single way to go: a square after a dead-end is a dead-end too
+        return (last_square_was_dead_end, False, (turn,))
+
+    def between_two(first: int, first_turn: int, second: int, second_turn: int, tie_turns: tuple) -> tuple:
+        _first_score = get_score(first)
+        _second_score = get_score(second)
+        if _first_score > _second_score:
+            return (False, True, (first_turn,))
+        elif _first_score < _second_score:
+            return (False, True, (second_turn,))
+        return (False, True, tie_turns)
+
+    def between_all() -> tuple:
+        _front_score = get_score(FRONT)
+        _left_score = get_score(LEFT)
+        _right_score = get_score(RIGHT)
+        if _front_score > _right_score and _front_score > _left_score:
+            return (False, True, (NO_TURN,))
+        elif _left_score > _right_score and _left_score > _front_score:
+            return (False, True, (TURN_LEFT,))
+        elif _right_score > _left_score and _right_score > _front_score:
+            return (False, True, (TURN_RIGHT,))
+        elif _front_score == _left_score and _front_score > _right_score:
+            return (False, True, (TURN_LEFT, NO_TURN))
+        elif _left_score == _right_score and _left_score > _front_score:
+            return (False, True, (TURN_LEFT, TURN_RIGHT))
+        elif _front_score == _right_score and _front_score > _left_score:
+            return (False, True, (TURN_RIGHT, NO_TURN))
+        return (False, True, (TURN_LEFT, TURN_RIGHT, NO_TURN))
+
+    def left_or_right() -> tuple:
+        return between_two(LEFT, TURN_LEFT, RIGHT, TURN_RIGHT, (TURN_LEFT, TURN_RIGHT))
+
+    def front_or_right() -> tuple:
+        return between_two(FRONT, NO_TURN, RIGHT, TURN_RIGHT, (TURN_RIGHT, NO_TURN))
+
+    def front_or_left() -> tuple:
+        return between_two(FRONT, NO_TURN, LEFT, TURN_LEFT, (TURN_LEFT, NO_TURN))
+
+    if _unblocked == 0:
+        return (True, False, (TURN_BACK,))
+    if _unblocked == FRONT:
+        return only(NO_TURN)
+    if _unblocked == LEFT:
+        return only(TURN_LEFT)
+    if _unblocked == RIGHT:
+        return only(TURN_RIGHT)
+    _dead_ends = dead_ends & _unblocked
+    if _unblocked == LEFT | RIGHT:
+        if _dead_ends == LEFT:
+            return only(TURN_RIGHT)
+        if _dead_ends == RIGHT:
+            return only(TURN_LEFT)
+        return left_or_right()
+    if _unblocked == FRONT | RIGHT:
+        if _dead_ends == FRONT:
+            return only(TURN_RIGHT)
+        if _dead_ends == RIGHT:
+            return only(NO_TURN)
+        return front_or_right()
+    if _unblocked == FRONT | LEFT:
+        if _dead_ends == FRONT:
+            return only(TURN_LEFT)
+        if _dead_ends == LEFT:
+            return only(NO_TURN)
+        return front_or_left()
+    if _dead_ends == FRONT | RIGHT:
+        return only(TURN_LEFT)
+    if _dead_ends == LEFT | FRONT:
+        return only(TURN_RIGHT)
+    if _dead_ends == LEFT | RIGHT:
+        return only(NO_TURN)
+    if _dead_ends == LEFT:
+        return front_or_right()
+    if _dead_ends == FRONT:
+        return left_or_right()
+    if _dead_ends == RIGHT:
+        return front_or_left()
+    return between_all()
+
+
+@functools.lru_cache(maxsize=16)
+def get_decision_table(weights: tuple) -> tuple:
+    """
+    Returns the decisions of CuriousMazeSolver for the given whole number weights - non-dead-ends,
+    unvisited paths, closer to center, no turns and no loops - by get_decision_index. A decision is
+    (mark current square as dead-end, forget that the last square was a dead-end, turns), and one of
+    the turns is taken at random. Without the no loops weight, the loop edges are left out of the table.
+    """
+    _loop_edge_masks = range(8) if weights[4] != 0 else range(1)
+    _distance_changes = [(_left, _front, _right) for _right in (-1, 0, 1) for _front in (-1, 0, 1) for _left in (-1, 0, 1)]
+    _table = []
+    for _loop_edges in _loop_edge_masks:
+        for _visited in range(8):
+            for _dead_ends in range(8):
+                for _blocked in range(8):
+                    for _last_square_was_dead_end in (False, True):
+                        for _left, _front, _right in _distance_changes:
+                            _table.append(_decide(
+                                weights, _blocked, _last_square_was_dead_end, _dead_ends, _visited, _loop_edges,
+                                {LEFT: _left, FRONT: _front, RIGHT: _right}
+                            ))
+    return tuple(_table)
@@ -1,43 +1,35 @@
 from enum import Enum
+from maze_solver import headings
+
 
 class Direction(Enum):
+    """
+    Direction of the maze, kept for the public interfaces of the maze solvers and the simulator.
+    The movement code works with the whole number headings of maze_solver.headings instead.
+    """
+
     NORTH = {'x': 0, 'y': 1}
     EAST = {'x': 1, 'y': 0}
     SOUTH = {'x': 0, 'y': -1}
     WEST = {'x': -1, 'y': 0}
 
+    @property
+    def heading(self) -> int:
+        return _HEADINGS[self]
+
+    @staticmethod
+    def from_heading(heading: int) -> 'Direction':
+        return _DIRECTIONS[heading]
+
     def get_left_direction(self):
-        if self.NORTH == self:
-            return self.WEST
-        elif self.EAST == self:
-            return self.NORTH
-        elif self.SOUTH == self:
-            return self.EAST
-        elif self.WEST == self:
-            return self.SOUTH
-        else:
-            return None
+        return _DIRECTIONS[headings.LEFT_OF[_HEADINGS[self]]]
 
     def get_right_direction(self):
-        if self.NORTH == self:
-            return self.EAST
-        elif self.EAST == self:
-            return self.SOUTH
-        elif self.SOUTH == self:
-            return self.WEST
-        elif self.WEST == self:
-            return self.NORTH
-        else:
-            return None
+        return _DIRECTIONS[headings.RIGHT_OF[_HEADINGS[self]]]
 
     def get_back_direction(self):
-        if self.NORTH == self:
-            return self.SOUTH
-        elif self.EAST == self:
-            return self.WEST
-        elif self.SOUTH == self:
-            return self.NORTH
-        elif self.WEST == self:
-            return self.EAST
-        else:
-            return None
+        return _DIRECTIONS[headings.BACK_OF[_HEADINGS[self]]]
+
+
+_DIRECTIONS = (Direction.NORTH, Direction.EAST, Direction.SOUTH, Direction.WEST)
+_HEADINGS = {_direction: _heading for _heading, _direction in enumerate(_DIRECTIONS)}
@@ -0,0 +1,241 @@
+import logging
+from array import array
+from collections import deque
+from maze_solver import headings
+from maze_solver.square import Square
+from maze_solver.direction import Direction
+from maze_solver.wall_map import WallMap
+from maze_solver.route_planner import RoutePlanner
+from maze_solver.maze_solver import MazeSolver, Motors, WallDetector, FinishDetector, Outputs
+
+
+class FloodFillMazeSolver(MazeSolver):
+    """
+    Learns the walls of the maze from the wall detector readings and keeps a table of the walking
+    distances from each square to the center, as if all walls not seen yet were open. Always moves
+    to the open neighbour square that is closest to the center, preferring to go straight.
+
+    When new walls are seen, only the distances that depend on them are updated: squares around the
+    changed walls are re-checked, and a square whose distance changes puts its neighbours up for
+    re-checking too. So a move usually touches just a few squares instead of re-flooding the whole maze.
+    A center square that turns out not to be the finish square is removed from the goal squares.
+
+    The learned walls and the finish square are kept by reset_to_start, so that after an exploration
+    run the fastest known route can be planned with plan_speed_run and replayed on the next run.
+
+    Overrides next_turn instead of the next_turn_* methods, as all the cases are handled the same way.
+    """
+
+    @property
+    def current_square(self) -> Square:
+        return self._current_square
+
+    @current_square.setter
+    def current_square(self, value: Square):
+        self._current_square = value
+
+    @property
+    def current_direction(self) -> Direction:
+        return Direction.from_heading(self._heading)
+
+    @current_direction.setter
+    def current_direction(self, value: Direction):
+        self._heading = value.heading
+
+    @property
+    def wall_map(self) -> WallMap:
+        return self._wall_map
+
+    @property
+    def center_coordinates(self) -> list:
+        return self._center_coordinates
+
+    @property
+    def finish_square(self) -> Square:
+        return self._finish_square
+
+    def __init__(
+        self,
+        motors: Motors,
+        wall_detector: WallDetector,
+        finish_detector: FinishDetector,
+        outputs: Outputs,
+        maze_width: int = 16,
+        maze_height: int = 16,
+        center_coordinates: list = [8, 9],
+        logger = None,
+        random_seed: int = None
+    ):
+        super().__init__(motors, wall_detector, finish_detector, outputs, random_seed=random_seed)
+        self._logger = logger or logging.getLogger(__name__)
+        self._maze_width = maze_width
+        self._maze_height = maze_height
+        self._center_coordinates = center_coordinates
+        self.reset_to_start_and_forget_everything()
+
+    def reset_to_start_and_forget_everything(self):
+        self._wall_map = WallMap(self._maze_width, self._maze_height)
+        self._unreachable_distance = self._wall_map.square_count
+        self._goal = bytearray(self._wall_map.square_count)
+        for _x in self._center_coordinates:
+            for _y in self._center_coordinates:
+                if self._wall_map.is_inside(_x, _y):
+                    self._goal[self._wall_map.get_index(_x, _y)] = 1
+        self._distances = array('H', [self._unreachable_distance] * self._wall_map.square_count)
+        self.flood_all()
+        self._finish_square = None
+        self.reset_to_start()
+
+    def reset_to_start(self):
+        self._current_square = Square(x = 1, y = 1)
+        self._heading = headings.NORTH
+
+    def plan_speed_run(self, forward_motion_time: float, turn_motion_time: float, back_turn_motion_time: float) -> list:
+        """
+        Returns the fastest route from start to the finish square through the explored squares, as a list
+        of MotorCommands for RouteReplayMazeSolver, or None if the finish square has not been found yet.
+        """
+        if self._finish_square is None:
+            return None
+        _route_planner = RoutePlanner(forward_motion_time, turn_motion_time, back_turn_motion_time)
+        return _route_planner.plan(
+            self._wall_map,
+            1, 1, Direction.NORTH,
+            [(self._finish_square.x, self._finish_square.y)]
+        )
+
+    def get_distance(self, x: int, y: int) -> int:
+        return self._distances[self._wall_map.get_index(x, y)]
+
+    def flood_all(self):
+        """
+        Computes all distances from scratch with breadth-first search from the goal squares.
+        """
+        _distances = self._distances
+        _queue = deque()
+        for _index in range(self._wall_map.square_count):
+            if self._goal[_index]:
+                _distances[_index] = 0
+                _queue.append(_index)
+            else:
+                _distances[_index] = self._unreachable_distance
+        while _queue:
+            _index = _queue.popleft()
+            _next_distance = _distances[_index] + 1
+            for _neighbour in self._wall_map.get_open_neighbours(_index):
+                if _distances[_neighbour] > _next_distance:
+                    _distances[_neighbour] = _next_distance
+                    _queue.append(_neighbour)
+
+    def update_distances(self, changed_squares: list) -> int:
+        """
+        Updates the distances after the walls around the given squares have changed, and returns the
+        number of squares that were re-checked.
+        """
+        _distances = self._distances
+        _unreachable_distance = self._unreachable_distance
+        _stack = list(changed_squares)
+        _checked_count = 0
+        while _stack:
+            _index = _stack.pop()
+            _checked_count += 1
+            if self._goal[_index]:
+                continue
+            _open_neighbours = self._wall_map.get_open_neighbours(_index)
+            _distance = _unreachable_distance
+            for _neighbour in _open_neighbours:
+                if _distances[_neighbour] < _distance:
+                    _distance = _distances[_neighbour]
+            _distance = min(_distance + 1, _unreachable_distance)
+            if _distances[_index] != _distance:
+                _distances[_index] = _distance
+                _stack.extend(_open_neighbours)
+        return _checked_count
+
+    def _get_neighbour_index(self, heading: int) -> int:
+        return self._wall_map.get_index(self._current_square.x + headings.DX[heading], self._current_square.y + headings.DY[heading])
+
+    def learn_walls(self, left_blocked: bool, front_blocked: bool, right_blocked: bool):
+        _x = self._current_square.x
+        _y = self._current_square.y
+        _index = self._wall_map.get_index(_x, _y)
+        _changed_squares = []
+        _sensed_walls = [
+            (headings.LEFT_OF[self._heading], left_blocked),
+            (self._heading, front_blocked),
+            (headings.RIGHT_OF[self._heading], right_blocked)
+        ]
+        for _heading, _blocked in _sensed_walls:
+            if self._wall_map.set_blocked_towards(_x, _y, _heading, _blocked):
+                _changed_squares.append(self._get_neighbour_index(_heading))
+        if self._goal[_index]:
+            # Had it been the finish square, the finish detector would have noticed
+            self._goal[_index] = 0
+            if not any(self._goal):
+                self._logger.warning('All center squares visited, but finish not found!')
+            _changed_squares.append(_index)
+        elif _changed_squares:
+            _changed_squares.append(_index)
+        self._wall_map.set_explored(_x, _y)
+        if not any(self._goal):
+            return
+        if _changed_squares:
+            _checked_count = self.update_distances(_changed_squares)
+            self._logger.debug('Re-checked distances of {} squares'.format(_checked_count))
+
+    def next_move(self) -> bool:
+        _finished_or_cannot_move = super().next_move()
+        if _finished_or_cannot_move and self._finish_detector.is_finish():
+            self._finish_square = Square(x = self._current_square.x, y = self._current_square.y)
+        return _finished_or_cannot_move
+
+    def next_turn(self, left_blocked: bool, front_blocked: bool, right_blocked: bool):
+        self.learn_walls(left_blocked, front_blocked, right_blocked)
+        if left_blocked and front_blocked and right_blocked:
+            self.turn_back()
+            return
+        _best_distance = None
+        _best_turns = []
+        _options = [
+            (front_blocked, self._heading, self._motors.no_turn),
+            (left_blocked, headings.LEFT_OF[self._heading], self.turn_left),
+            (right_blocked, headings.RIGHT_OF[self._heading], self.turn_right)
+        ]
+        for _blocked, _heading, _turn in _options:
+            if _blocked:
+                continue
+            _distance = self._distances[self._get_neighbour_index(_heading)]
+            if _best_distance is None or _distance < _best_distance:
+                _best_distance = _distance
+                _best_turns = [_turn]
+            elif _distance == _best_distance:
+                _best_turns.append(_turn)
+        _back_heading = headings.BACK_OF[self._heading]
+        if not self._wall_map.is_blocked_towards(self._current_square.x, self._current_square.y, _back_heading):
+            if self._distances[self._get_neighbour_index(_back_heading)] < _best_distance:
+                self.turn_back()
+                return
+        if self._motors.no_turn in _best_turns:
+            # Going straight is the fastest
+            self._motors.no_turn()
+        else:
+            self.call_one_in_random(_best_turns)
+
+    def turn_left(self):
+        super().turn_left()
+        self._heading = headings.LEFT_OF[self._heading]
+
+    def turn_right(self):
+        super().turn_right()
+        self._heading = headings.RIGHT_OF[self._heading]
+
+    def turn_back(self):
+        super().turn_back()
+        self._heading = headings.BACK_OF[self._heading]
+
+    def move_forward_to_next_square(self):
+        super().move_forward_to_next_square()
+        _new_x = self._current_square.x + headings.DX[self._heading]
+        _new_y = self._current_square.y + headings.DY[self._heading]
+        self._current_square = Square(x = _new_x, y = _new_y)
+        self._logger.info('Current square is now x={}, y={}, current direction is {}'.format(_new_x, _new_y, headings.NAMES[self._heading]))
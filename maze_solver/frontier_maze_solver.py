@@ -0,0 +1,195 @@
+import logging
+from collections import deque
+from maze_solver import headings
+from maze_solver.square import Square
+from maze_solver.direction import Direction
+from maze_solver.wall_map import WallMap
+from maze_solver.dead_end_filler import DeadEndFiller
+from maze_solver.route_planner import MotorCommand, RoutePlanner, FORWARD_MOTION_TIME_SECONDS, TURN_MOTION_TIME_SECONDS, BACK_TURN_MOTION_TIME_SECONDS
+from maze_solver.maze_solver import MazeSolver, Motors, WallDetector, FinishDetector, Outputs
+
+
+class FrontierMazeSolver(MazeSolver):
+    """
+    Explores the maze by its frontier: the squares that have not been visited yet, but are known to be
+    reachable through an open passage of a visited square. In every new square, picks the frontier square
+    with the least motion time to get there plus the estimated time to get on from there to the center,
+    plans the fastest route there through the visited squares with RoutePlanner, and follows the route
+    without deciding again on the way. So when all the squares around have been visited, it goes straight
+    to the most promising unexplored part of the maze instead of wandering around.
+
+    The estimated time from a frontier square is the forward motion time of the squares to the closest
+    unvisited center square, as if there were no walls, times goal_heuristic_weight. With 0, it always
+    goes to the nearest frontier square. The motion times are those of the route planner, by default the
+    same as in the simulator.
+
+    Overrides next_turn instead of the next_turn_* methods, as all the cases are handled the same way.
+    """
+
+    @property
+    def current_square(self) -> Square:
+        return self._current_square
+
+    @current_square.setter
+    def current_square(self, value: Square):
+        self._current_square = value
+
+    @property
+    def current_direction(self) -> Direction:
+        return Direction.from_heading(self._heading)
+
+    @current_direction.setter
+    def current_direction(self, value: Direction):
+        self._heading = value.heading
+
+    @property
+    def wall_map(self) -> WallMap:
+        return self._wall_map
+
+    @property
+    def remaining_route_command_count(self) -> int:
+        return len(self._route)
+
+    def __init__(
+        self,
+        motors: Motors,
+        wall_detector: WallDetector,
+        finish_detector: FinishDetector,
+        outputs: Outputs,
+        maze_width: int = 16,
+        maze_height: int = 16,
+        center_coordinates: list = [8, 9],
+        forward_motion_time: float = FORWARD_MOTION_TIME_SECONDS,
+        turn_motion_time: float = TURN_MOTION_TIME_SECONDS,
+        back_turn_motion_time: float = BACK_TURN_MOTION_TIME_SECONDS,
+        goal_heuristic_weight: float = 1.5,
+        fill_dead_ends: bool = True,
+        logger = None,
+        random_seed: int = None
+    ):
+        super().__init__(motors, wall_detector, finish_detector, outputs, random_seed=random_seed)
+        self._logger = logger or logging.getLogger(__name__)
+        self._maze_width = maze_width
+        self._maze_height = maze_height
+        self._center_coordinates = center_coordinates
+        self._forward_motion_time = forward_motion_time
+        self._goal_heuristic_weight = goal_heuristic_weight
+        self._fill_dead_ends = fill_dead_ends
+        self._route_planner = RoutePlanner(forward_motion_time, turn_motion_time, back_turn_motion_time)
+        self._turn_functions = {
+            MotorCommand.TURN_LEFT: self.turn_left,
+            MotorCommand.TURN_RIGHT: self.turn_right,
+            MotorCommand.TURN_BACK: self.turn_back
+        }
+        self.reset_to_start_and_forget_everything()
+
+    def reset_to_start_and_forget_everything(self):
+        self._wall_map = WallMap(self._maze_width, self._maze_height)
+        self._frontier = set()
+        self._center_squares = set()
+        for _x in self._center_coordinates:
+            for _y in self._center_coordinates:
+                if self._wall_map.is_inside(_x, _y):
+                    self._center_squares.add((_x, _y))
+        self._dead_end_filler = DeadEndFiller(self._center_squares) if self._fill_dead_ends else None
+        self._route = deque()
+        self._current_square = Square(x = 1, y = 1)
+        self._heading = headings.NORTH
+
+    def get_frontier_squares(self) -> list:
+        return sorted(self._wall_map.get_coordinates(_index) for _index in self._frontier)
+
+    def learn_walls(self, left_blocked: bool, front_blocked: bool, right_blocked: bool) -> bool:
+        """
+        Learns the walls of the current square, updates the frontier, and returns True if any wall changed.
+        """
+        _x = self._current_square.x
+        _y = self._current_square.y
+        _changed = False
+        _sensed_walls = (
+            (headings.LEFT_OF[self._heading], left_blocked),
+            (self._heading, front_blocked),
+            (headings.RIGHT_OF[self._heading], right_blocked)
+        )
+        for _heading, _blocked in _sensed_walls:
+            if self._wall_map.set_blocked_towards(_x, _y, _heading, _blocked):
+                _changed = True
+            if self._dead_end_filler is not None:
+                self._dead_end_filler.set_wall(_x, _y, _heading, _blocked)
+        _index = self._wall_map.get_index(_x, _y)
+        self._wall_map.set_explored(_x, _y)
+        self._frontier.discard(_index)
+        self._center_squares.discard((_x, _y))
+        for _neighbour in self._wall_map.get_open_neighbours(_index):
+            if not self._wall_map.is_explored_at(_neighbour):
+                self._frontier.add(_neighbour)
+        return _changed
+
+    def _get_estimated_time_to_center(self, x: int, y: int) -> float:
+        if not self._center_squares:
+            return 0.0
+        _square_count = min(abs(x - _center_x) + abs(y - _center_y) for _center_x, _center_y in self._center_squares)
+        return self._goal_heuristic_weight * self._forward_motion_time * _square_count
+
+    def plan_route_to_frontier(self) -> list:
+        """
+        Returns the MotorCommands of the route to the most promising frontier square, or None if there is none.
+        """
+        _goal_extra_times = {}
+        for _index in self._frontier:
+            _x, _y = self._wall_map.get_coordinates(_index)
+            if self._dead_end_filler is not None and self._dead_end_filler.is_dead_end(_x, _y):
+                continue
+            _goal_extra_times[(_x, _y)] = self._get_estimated_time_to_center(_x, _y)
+        if not _goal_extra_times:
+            return None
+        return self._route_planner.plan(
+            self._wall_map,
+            self._current_square.x,
+            self._current_square.y,
+            Direction.from_heading(self._heading),
+            list(_goal_extra_times.keys()),
+            goal_extra_times=_goal_extra_times
+        )
+
+    def next_turn(self, left_blocked: bool, front_blocked: bool, right_blocked: bool):
+        if self.learn_walls(left_blocked, front_blocked, right_blocked):
+            # The route was planned with the walls known then
+            self._route.clear()
+        if not self._route:
+            _route = self.plan_route_to_frontier()
+            if _route is None:
+                self._logger.warning('No unexplored squares left, but finish not found!')
+                self.turn_back()
+                return
+            self._logger.debug('Planned route of {} commands to frontier'.format(len(_route)))
+            self._route.extend(_route)
+        _turned = False
+        while self._route[0] != MotorCommand.MOVE_FORWARD:
+            self._turn_functions[self._route.popleft()]()
+            _turned = True
+        self._route.popleft()
+        if not _turned:
+            self._motors.no_turn()
+
+    def turn_left(self):
+        super().turn_left()
+        self._heading = headings.LEFT_OF[self._heading]
+
+    def turn_right(self):
+        super().turn_right()
+        self._heading = headings.RIGHT_OF[self._heading]
+
+    def turn_back(self):
+        super().turn_back()
+        self._heading = headings.BACK_OF[self._heading]
+
+    def move_forward_to_next_square(self):
+        super().move_forward_to_next_square()
+        _new_x = self._current_square.x + headings.DX[self._heading]
+        _new_y = self._current_square.y + headings.DY[self._heading]
+        if self._dead_end_filler is not None:
+            self._dead_end_filler.set_wall(self._current_square.x, self._current_square.y, self._heading, False)
+            self._dead_end_filler.set_current_square(_new_x, _new_y)
+        self._current_square = Square(x = _new_x, y = _new_y)
+        self._logger.info('Current square is now x={}, y={}, current direction is {}'.format(_new_x, _new_y, headings.NAMES[self._heading]))
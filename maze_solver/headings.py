@@ -0,0 +1,19 @@
+# Headings are the directions of the maze as whole numbers 0 to 3, clockwise from north. The wall
+# bit of a heading is 1 << heading, as in WallMap and the micromouse maze files.
+NORTH = 0
+EAST = 1
+SOUTH = 2
+WEST = 3
+
+HEADINGS = (NORTH, EAST, SOUTH, WEST)
+
+# Change of x and y when moving one square towards each heading
+DX = (0, 1, 0, -1)
+DY = (1, 0, -1, 0)
+
+# Heading after turning left, right or back from each heading
+LEFT_OF = (WEST, NORTH, EAST, SOUTH)
+RIGHT_OF = (EAST, SOUTH, WEST, NORTH)
+BACK_OF = (SOUTH, WEST, NORTH, EAST)
+
+NAMES = ('NORTH', 'EAST', 'SOUTH', 'WEST')
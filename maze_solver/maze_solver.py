@@ -11,6 +11,14 @@ class Motors(object):
     def move_forward(self):
         raise NotImplementedError( "Please implement this" )
 
+    def move_forward_squares(self, square_count: int):
+        """
+        Moves forward through several squares. Override it to make it one continuous move, by default
+        it stops in every square.
+        """
+        for _ in range(square_count):
+            self.move_forward()
+
     def turn_right(self):
         raise NotImplementedError( "Please implement this" )
 
@@ -20,6 +28,21 @@ class Motors(object):
     def turn_back(self):
         raise NotImplementedError( "Please implement this" )
 
+    def arc_turn_right(self):
+        """
+        Goes from the square behind a right turn to the square on the right of it, i.e. moves forward,
+        turns right and moves forward. Override it to turn along an arc while moving, by default it
+        stops and turns on the spot.
+        """
+        self.move_forward()
+        self.turn_right()
+        self.move_forward()
+
+    def arc_turn_left(self):
+        self.move_forward()
+        self.turn_left()
+        self.move_forward()
+
     def no_turn(self):
         raise NotImplementedError( "Please implement this" )
 
@@ -77,17 +100,20 @@ class MazeSolver(object):
         wall_detector: WallDetector, 
         finish_detector: FinishDetector, 
         outputs: Outputs, 
-        logger = None
+        logger = None,
+        random_seed: int = None
     ):
         self._logger = logger or logging.getLogger(__name__)
         self._motors = motors
         self._wall_detector = wall_detector
         self._finish_detector = finish_detector
         self._outputs = outputs
-        random.seed()
+        # Each solver has its own random generator, so that a run can be repeated
+        # exactly by giving the same seed. No seed means seeding from system entropy.
+        self._random = random.Random(random_seed)
 
     def call_one_in_random(self, call_list):
-        random.choice(call_list)()
+        self._random.choice(call_list)()
 
     def turn_right(self):
         self._motors.turn_right()
@@ -0,0 +1,155 @@
+import heapq
+from enum import Enum
+from maze_solver.direction import Direction
+from maze_solver.wall_map import WallMap
+
+# These are the supposed average times it would take to move,
+# if it was a real physical thing.
+FORWARD_MOTION_TIME_SECONDS = 1.1
+TURN_MOTION_TIME_SECONDS = 0.9
+BACK_TURN_MOTION_TIME_SECONDS = 1.7
+
+
+class MotorCommand(Enum):
+    MOVE_FORWARD = 1
+    TURN_LEFT = 2
+    TURN_RIGHT = 3
+    TURN_BACK = 4
+    # Forward, side turn and forward in one move, only made by RoutePlanner.merge_arc_turns
+    ARC_TURN_LEFT = 5
+    ARC_TURN_RIGHT = 6
+
+
+class RoutePlanner(object):
+    """
+    Finds the route that takes the least motion time from a start square and direction to any of the
+    goal squares, using Dijkstra's algorithm over (square, heading) states. Moving forward, turning to
+    a side and turning back each cost their own motion time, so a route with fewer turns wins over a
+    route with fewer squares if it is faster. With explored_only, the route only goes through squares
+    whose walls have actually been seen, so that it is safe to replay without looking at the walls.
+    """
+
+    def __init__(self, forward_motion_time: float, turn_motion_time: float, back_turn_motion_time: float):
+        self._forward_motion_time = forward_motion_time
+        self._turn_motion_time = turn_motion_time
+        self._back_turn_motion_time = back_turn_motion_time
+
+    def _is_allowed(self, wall_map: WallMap, index: int, goal_indexes: set, explored_only: bool) -> bool:
+        return not explored_only or wall_map.is_explored_at(index) or index in goal_indexes
+
+    def plan(
+        self,
+        wall_map: WallMap,
+        start_x: int,
+        start_y: int,
+        start_direction: Direction,
+        goal_squares: list,
+        explored_only: bool = True,
+        goal_extra_times: dict = None
+    ) -> list:
+        """
+        Returns the list of MotorCommands of the fastest route, or None if no goal square can be reached.
+        The goal_extra_times can add a time to reaching a goal square, keyed by (x, y), e.g. an estimate
+        of the time it takes to get on from there. Then the route goes to the goal square with the least
+        time to get there plus its extra time.
+        """
+        _goal_indexes = set(wall_map.get_index(_x, _y) for _x, _y in goal_squares)
+        _extra_times = {}
+        if goal_extra_times is not None:
+            _extra_times = {wall_map.get_index(_x, _y): _time for (_x, _y), _time in goal_extra_times.items()}
+        _start_state = wall_map.get_index(start_x, start_y) * 4 + start_direction.heading
+        _turns = (
+            (3, self._turn_motion_time, MotorCommand.TURN_LEFT),
+            (1, self._turn_motion_time, MotorCommand.TURN_RIGHT),
+            (2, self._back_turn_motion_time, MotorCommand.TURN_BACK)
+        )
+        _times = {_start_state: 0.0}
+        _previous = {}
+        _queue = [(0.0, _start_state)]
+        _goal_state = None
+        while _queue:
+            _time, _state = heapq.heappop(_queue)
+            if _state < 0:
+                # Arrived in a goal square, with its extra time added
+                _goal_state = ~_state
+                break
+            if _time > _times[_state]:
+                continue
+            _index = _state >> 2
+            _heading = _state & 3
+            if _index in _goal_indexes:
+                heapq.heappush(_queue, (_time + _extra_times.get(_index, 0.0), ~_state))
+                continue
+            _next_states = []
+            for _heading_change, _turn_time, _command in _turns:
+                _next_states.append((_index * 4 + ((_heading + _heading_change) & 3), _turn_time, _command))
+            if not wall_map.get_walls_at(_index) & (1 << _heading):
+                _neighbour = wall_map.get_neighbour_index(_index, 1 << _heading)
+                if self._is_allowed(wall_map, _neighbour, _goal_indexes, explored_only):
+                    _next_states.append((_neighbour * 4 + _heading, self._forward_motion_time, MotorCommand.MOVE_FORWARD))
+            for _next_state, _step_time, _command in _next_states:
+                _next_time = _time + _step_time
+                if _next_time < _times.get(_next_state, float('inf')):
+                    _times[_next_state] = _next_time
+                    _previous[_next_state] = (_state, _command)
+                    heapq.heappush(_queue, (_next_time, _next_state))
+        if _goal_state is None:
+            return None
+        _commands = []
+        _state = _goal_state
+        while _state != _start_state:
+            _state, _command = _previous[_state]
+            _commands.append(_command)
+        _commands.reverse()
+        return _commands
+
+    def get_motion_time(self, commands: list) -> float:
+        _motion_time = 0.0
+        for _command in commands:
+            if _command == MotorCommand.MOVE_FORWARD:
+                _motion_time += self._forward_motion_time
+            elif _command == MotorCommand.TURN_BACK:
+                _motion_time += self._back_turn_motion_time
+            else:
+                _motion_time += self._turn_motion_time
+        return _motion_time
+
+    @staticmethod
+    def merge_forward_moves(commands: list) -> list:
+        """
+        Returns the commands as (MotorCommand, count) tuples, where consecutive forward moves are
+        merged into one and the count is the number of squares; turns always have count 1.
+        """
+        _merged_commands = []
+        for _command in commands:
+            if _command == MotorCommand.MOVE_FORWARD and _merged_commands and _merged_commands[-1][0] == MotorCommand.MOVE_FORWARD:
+                _merged_commands[-1] = (MotorCommand.MOVE_FORWARD, _merged_commands[-1][1] + 1)
+            else:
+                _merged_commands.append((_command, 1))
+        return _merged_commands
+
+    @staticmethod
+    def merge_arc_turns(merged_commands: list) -> list:
+        """
+        Takes (MotorCommand, count) tuples, and merges each side turn between two forward moves
+        into an arc turn, which takes one square from the forward move before and after it.
+        """
+        _arc_turns = {MotorCommand.TURN_LEFT: MotorCommand.ARC_TURN_LEFT, MotorCommand.TURN_RIGHT: MotorCommand.ARC_TURN_RIGHT}
+        _commands = list(merged_commands)
+        _result = []
+        for _index, (_command, _count) in enumerate(_commands):
+            if _count == 0:
+                continue
+            if (
+                _command in _arc_turns
+                and _result and _result[-1][0] == MotorCommand.MOVE_FORWARD
+                and _index + 1 < len(_commands) and _commands[_index + 1][0] == MotorCommand.MOVE_FORWARD
+            ):
+                _previous_command, _previous_count = _result.pop()
+                if _previous_count > 1:
+                    _result.append((_previous_command, _previous_count - 1))
+                _result.append((_arc_turns[_command], 1))
+                _commands[_index + 1] = (MotorCommand.MOVE_FORWARD, _commands[_index + 1][1] - 1)
+            else:
+                _result.append((_command, _count))
+        return _result
@@ -0,0 +1,76 @@
+import logging
+from maze_solver.route_planner import MotorCommand, RoutePlanner
+from maze_solver.maze_solver import MazeSolver, Motors, WallDetector, FinishDetector, Outputs, NotificationType
+
+
+class RouteReplayMazeSolver(MazeSolver):
+    """
+    Replays a precomputed route, e.g. one planned by RoutePlanner after an exploration run, without
+    looking at the walls and without any decision logic. Each move executes the commands up to and
+    including the next forward move. With continuous_motion, the forward moves through consecutive
+    squares are merged into one move_forward_squares call, so the robot does not stop in every square.
+    With arc_turns, a side turn between two forward moves is made as one arc turn while moving.
+    """
+
+    @property
+    def remaining_command_count(self) -> int:
+        return len(self._route) - self._next_command_index
+
+    def __init__(
+        self,
+        motors: Motors,
+        wall_detector: WallDetector,
+        finish_detector: FinishDetector,
+        outputs: Outputs,
+        route: list = [],
+        continuous_motion: bool = False,
+        arc_turns: bool = False,
+        logger = None,
+        random_seed: int = None
+    ):
+        super().__init__(motors, wall_detector, finish_detector, outputs, random_seed=random_seed)
+        self._logger = logger or logging.getLogger(__name__)
+        # Commands as (MotorCommand, count) tuples
+        if continuous_motion:
+            self._route = RoutePlanner.merge_forward_moves(route)
+        else:
+            self._route = [(_command, 1) for _command in route]
+        if arc_turns:
+            self._route = RoutePlanner.merge_arc_turns(self._route)
+        self._next_command_index = 0
+        self._turn_functions = {
+            MotorCommand.TURN_LEFT: self._motors.turn_left,
+            MotorCommand.TURN_RIGHT: self._motors.turn_right,
+            MotorCommand.TURN_BACK: self._motors.turn_back
+        }
+        self._arc_turn_functions = {
+            MotorCommand.ARC_TURN_LEFT: self._motors.arc_turn_left,
+            MotorCommand.ARC_TURN_RIGHT: self._motors.arc_turn_right
+        }
+
+    def _move_forward(self, square_count: int = 1):
+        if square_count == 1:
+            self._motors.move_forward()
+        else:
+            self._motors.move_forward_squares(square_count)
+
+    def next_move(self) -> bool:
+        if self._finish_detector.is_finish():
+            self._logger.info('Finised successfully in finish square!')
+            self._outputs.notify(NotificationType.INFO, 'Finised successfully in finish square!')
+            return True
+        if self._next_command_index >= len(self._route):
+            self._logger.error('Route replayed to the end, but not in finish square!')
+            self._outputs.notify(NotificationType.ERROR, 'Route replayed to the end, but not in finish square!')
+            return True
+        while self._next_command_index < len(self._route):
+            _command, _count = self._route[self._next_command_index]
+            self._next_command_index += 1
+            if _command == MotorCommand.MOVE_FORWARD:
+                self._move_forward(_count)
+                break
+            if _command in self._arc_turn_functions:
+                self._arc_turn_functions[_command]()
+                break
+            self._turn_functions[_command]()
+        return False
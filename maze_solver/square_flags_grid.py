@@ -0,0 +1,74 @@
+class SquareFlags(object):
+    """
+    Bit flags that can be stored per square in SquareFlagsGrid.
+    """
+    VISITED = 1
+    DEAD_END = 2
+
+
+class SquareFlagsGrid(object):
+    """
+    Stores a byte of bit flags per square in a flat bytearray, addressed by column * height + row.
+    The maze size does not have to be known in advance - the grid grows when a square outside of it
+    is written. Reading a square outside of the grid just returns no flags.
+    """
+
+    @property
+    def width(self) -> int:
+        return self._width
+
+    @property
+    def height(self) -> int:
+        return self._height
+
+    def __init__(self, width: int = 18, height: int = 18, min_x: int = 0, min_y: int = 0):
+        self._width = width
+        self._height = height
+        self._min_x = min_x
+        self._min_y = min_y
+        self._flags = bytearray(width * height)
+
+    def clear(self):
+        self._flags = bytearray(self._width * self._height)
+
+    def _is_inside(self, x: int, y: int) -> bool:
+        return 0 <= x - self._min_x < self._width and 0 <= y - self._min_y < self._height
+
+    def _grow_to_include(self, x: int, y: int):
+        # Doubling the size in the direction of growth keeps the number of reallocations logarithmic.
+        _new_min_x = min(self._min_x, x - self._width if x < self._min_x else self._min_x)
+        _new_min_y = min(self._min_y, y - self._height if y < self._min_y else self._min_y)
+        _max_x = self._min_x + self._width - 1
+        _max_y = self._min_y + self._height - 1
+        _new_max_x = max(_max_x, x + self._width if x > _max_x else _max_x)
+        _new_max_y = max(_max_y, y + self._height if y > _max_y else _max_y)
+        _new_width = _new_max_x - _new_min_x + 1
+        _new_height = _new_max_y - _new_min_y + 1
+        _new_flags = bytearray(_new_width * _new_height)
+        for _column in range(self._width):
+            _old_start = _column * self._height
+            _new_start = (_column + self._min_x - _new_min_x) * _new_height + (self._min_y - _new_min_y)
+            _new_flags[_new_start:_new_start + self._height] = self._flags[_old_start:_old_start + self._height]
+        self._flags = _new_flags
+        self._width = _new_width
+        self._height = _new_height
+        self._min_x = _new_min_x
+        self._min_y = _new_min_y
+
+    def get_flags(self, x: int, y: int) -> int:
+        _column = x - self._min_x
+        _row = y - self._min_y
+        if 0 <= _column < self._width and 0 <= _row < self._height:
+            return self._flags[_column * self._height + _row]
+        return 0
+
+    def has_flags(self, x: int, y: int, flags: int) -> bool:
+        return self.get_flags(x, y) & flags == flags
+
+    def set_flags(self, x: int, y: int, flags: int):
+        if not self._is_inside(x, y):
+            self._grow_to_include(x, y)
+        self._flags[(x - self._min_x) * self._height + (y - self._min_y)] = flags
+
+    def add_flags(self, x: int, y: int, flags: int):
+        self.set_flags(x, y, self.get_flags(x, y) | flags)
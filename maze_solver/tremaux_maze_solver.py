@@ -0,0 +1,253 @@
+import logging
+from collections import deque
+from maze_solver import headings
+from maze_solver.square import Square
+from maze_solver.direction import Direction
+from maze_solver.square_flags_grid import SquareFlagsGrid
+from maze_solver.wall_map import WallMap
+from maze_solver.route_planner import MotorCommand, RoutePlanner, FORWARD_MOTION_TIME_SECONDS, TURN_MOTION_TIME_SECONDS, BACK_TURN_MOTION_TIME_SECONDS
+from maze_solver.maze_solver import MazeSolver, Motors, WallDetector, FinishDetector, Outputs
+
+
+# Bits of the per-square passage marks: the lower 4 bits mark passages walked once, the upper 4 bits
+# passages walked twice. Indexed by heading.
+_ONCE_BITS = (1, 2, 4, 8)
+_TWICE_BITS = (16, 32, 64, 128)
+
+
+class TremauxMazeSolver(MazeSolver):
+    """
+    Solves the maze with Trémaux's algorithm: every passage is marked each time it is walked through,
+    and no passage is ever walked more than twice, so the maze is solved in at most twice as many moves
+    as there are passages between the squares - unlike the random walkers, it has no long tail.
+
+    In a square it has not been to before, it takes any passage it has not walked yet, or turns back if
+    there is none. When it gets to a square it has been to before through a new passage, it turns back
+    along that passage. When it gets there through a passage walked before, it takes a passage it has
+    not walked yet, or else one walked once. The passages to choose from are scored like in
+    CuriousMazeSolver, by closeness to center and by not turning, and the ties are broken randomly.
+
+    The walls are taken as sensed. A passage walked before that looks blocked from the other side counts
+    as walked twice, so it is not taken again. If that leaves no passage walked less than twice, which
+    only happens when the walls look different from each side, it plans the fastest route over the sensed
+    walls with RoutePlanner to the closest square that still has an open passage walked less than twice,
+    and follows it without deciding again on the way, like FrontierMazeSolver.
+
+    Overrides next_turn instead of the next_turn_* methods, as all the cases are handled the same way.
+    """
+
+    @property
+    def current_square(self) -> Square:
+        return self._current_square
+
+    @current_square.setter
+    def current_square(self, value: Square):
+        self._current_square = value
+
+    @property
+    def current_direction(self) -> Direction:
+        return Direction.from_heading(self._heading)
+
+    @current_direction.setter
+    def current_direction(self, value: Direction):
+        self._heading = value.heading
+
+    def __init__(
+        self,
+        motors: Motors,
+        wall_detector: WallDetector,
+        finish_detector: FinishDetector,
+        outputs: Outputs,
+        prefer_closer_to_center_weight: int = 3,
+        prefer_no_turns_weight: int = 1,
+        center_coordinates: list = [8, 9],
+        maze_width: int = 16,
+        maze_height: int = 16,
+        forward_motion_time: float = FORWARD_MOTION_TIME_SECONDS,
+        turn_motion_time: float = TURN_MOTION_TIME_SECONDS,
+        back_turn_motion_time: float = BACK_TURN_MOTION_TIME_SECONDS,
+        logger = None,
+        random_seed: int = None
+    ):
+        super().__init__(motors, wall_detector, finish_detector, outputs, random_seed=random_seed)
+        self._logger = logger or logging.getLogger(__name__)
+        self._prefer_closer_to_center_weight = prefer_closer_to_center_weight
+        self._prefer_no_turns_weight = prefer_no_turns_weight
+        self._center_coordinates = center_coordinates
+        self._maze_width = maze_width
+        self._maze_height = maze_height
+        self._route_planner = RoutePlanner(forward_motion_time, turn_motion_time, back_turn_motion_time)
+        self._turn_functions = {
+            MotorCommand.TURN_LEFT: self.turn_left,
+            MotorCommand.TURN_RIGHT: self.turn_right,
+            MotorCommand.TURN_BACK: self.turn_back
+        }
+        self.reset_to_start_and_forget_everything()
+
+    def reset_to_start_and_forget_everything(self):
+        self._passage_marks = SquareFlagsGrid()
+        # The walls as last sensed, only for planning routes when no passage walked less than twice is left
+        self._wall_map = WallMap(self._maze_width, self._maze_height)
+        self._route = deque()
+        self._arrived_by_route = False
+        self._current_square = Square(x = 1, y = 1)
+        self._heading = headings.NORTH
+
+    def get_mark_count(self, x: int, y: int, direction: Direction) -> int:
+        """
+        Returns how many times the passage from the square towards the direction has been walked, 0 to 2.
+        """
+        return self._get_mark_count(self._passage_marks.get_flags(x, y), direction.heading)
+
+    @staticmethod
+    def _get_mark_count(flags: int, heading: int) -> int:
+        if flags & _TWICE_BITS[heading]:
+            return 2
+        return 1 if flags & _ONCE_BITS[heading] else 0
+
+    def _set_walked_twice(self, x: int, y: int, heading: int):
+        self._passage_marks.add_flags(x, y, _ONCE_BITS[heading] | _TWICE_BITS[heading])
+        _back_heading = headings.BACK_OF[heading]
+        self._passage_marks.add_flags(x + headings.DX[heading], y + headings.DY[heading], _ONCE_BITS[_back_heading] | _TWICE_BITS[_back_heading])
+
+    def _add_mark(self, x: int, y: int, heading: int):
+        _flags = self._passage_marks.get_flags(x, y)
+        if _flags & _ONCE_BITS[heading]:
+            _flags |= _TWICE_BITS[heading]
+        self._passage_marks.set_flags(x, y, _flags | _ONCE_BITS[heading])
+
+    def get_distance_from_center(self, x: int, y: int) -> int:
+        _min_x = min(abs(x - _coordinate) for _coordinate in self._center_coordinates)
+        _min_y = min(abs(y - _coordinate) for _coordinate in self._center_coordinates)
+        return max(_min_x, _min_y)
+
+    def _get_score_towards(self, heading: int) -> float:
+        _closeness_to_center = 8 - self.get_distance_from_center(
+            self._current_square.x + headings.DX[heading],
+            self._current_square.y + headings.DY[heading]
+        )
+        _closeness_to_center_score = self._prefer_closer_to_center_weight * (_closeness_to_center / 8)
+        _no_turns_score = self._prefer_no_turns_weight if heading == self._heading else 0
+        return _closeness_to_center_score + _no_turns_score
+
+    def _get_turn_function(self, heading: int):
+        if heading == headings.LEFT_OF[self._heading]:
+            return self.turn_left
+        elif heading == headings.RIGHT_OF[self._heading]:
+            return self.turn_right
+        elif heading == headings.BACK_OF[self._heading]:
+            return self.turn_back
+        return self._motors.no_turn
+
+    def _choose_passage(self, passages: list) -> int:
+        _scores = [self._get_score_towards(_heading) for _heading in passages]
+        _best_score = max(_scores)
+        _best_passages = [_heading for _heading, _score in zip(passages, _scores) if _score == _best_score]
+        return _best_passages[0] if len(_best_passages) == 1 else self._random.choice(_best_passages)
+
+    def _plan_route_to_passage_walked_less_than_twice(self) -> list:
+        """
+        Returns the MotorCommands of the fastest route over the sensed walls to a square with an open
+        passage walked less than twice, or None if there is none.
+        """
+        _goal_squares = []
+        for _index in range(self._wall_map.square_count):
+            if not self._wall_map.is_explored_at(_index):
+                continue
+            _x, _y = self._wall_map.get_coordinates(_index)
+            _flags = self._passage_marks.get_flags(_x, _y)
+            _walls = self._wall_map.get_walls_at(_index)
+            if any(not _walls & (1 << _heading) and self._get_mark_count(_flags, _heading) < 2 for _heading in range(4)):
+                _goal_squares.append((_x, _y))
+        if not _goal_squares:
+            return None
+        return self._route_planner.plan(
+            self._wall_map,
+            self._current_square.x,
+            self._current_square.y,
+            Direction.from_heading(self._heading),
+            _goal_squares
+        )
+
+    def _follow_route(self):
+        _turned = False
+        while self._route[0] != MotorCommand.MOVE_FORWARD:
+            self._turn_functions[self._route.popleft()]()
+            _turned = True
+        self._route.popleft()
+        if not _turned:
+            self._motors.no_turn()
+        self._arrived_by_route = not self._route
+
+    def next_turn(self, left_blocked: bool, front_blocked: bool, right_blocked: bool):
+        _x = self._current_square.x
+        _y = self._current_square.y
+        _sensed_passages = (
+            (headings.LEFT_OF[self._heading], left_blocked),
+            (self._heading, front_blocked),
+            (headings.RIGHT_OF[self._heading], right_blocked)
+        )
+        _walls_changed = False
+        for _heading, _blocked in _sensed_passages:
+            if self._wall_map.set_blocked_towards(_x, _y, _heading, _blocked):
+                _walls_changed = True
+            if _blocked and self._get_mark_count(self._passage_marks.get_flags(_x, _y), _heading) == 1:
+                # Walked before, but the wall looks blocked from this side: it is not taken again
+                self._set_walked_twice(_x, _y, _heading)
+        self._wall_map.set_explored(_x, _y)
+        if self._route:
+            if not _walls_changed:
+                self._follow_route()
+                return
+            # The route was planned with the walls known then
+            self._route.clear()
+        # A route ends in a square with a passage walked less than twice, it is not turned back from
+        _arrived_by_route = self._arrived_by_route
+        self._arrived_by_route = False
+        _flags = self._passage_marks.get_flags(_x, _y)
+        _back_heading = headings.BACK_OF[self._heading]
+        _entry_mark_count = self._get_mark_count(_flags, _back_heading)
+        _is_new_square = _flags & ~(_ONCE_BITS[_back_heading] | _TWICE_BITS[_back_heading]) == 0
+        if not _is_new_square and _entry_mark_count == 1 and not _arrived_by_route:
+            self._logger.debug('Square x={}, y={} reached through a new passage, going back'.format(_x, _y))
+            self.turn_back()
+            return
+        _open_passages = [_heading for _heading, _blocked in _sensed_passages if not _blocked]
+        for _mark_count in (0, 1):
+            _passages = [_heading for _heading in _open_passages if self._get_mark_count(_flags, _heading) == _mark_count]
+            if _passages:
+                self._get_turn_function(self._choose_passage(_passages))()
+                return
+        if _entry_mark_count < 2:
+            self.turn_back()
+            return
+        # Only when the walls look different from each side, or when the whole maze has been walked
+        _route = self._plan_route_to_passage_walked_less_than_twice()
+        if _route is None:
+            self._logger.warning('No passage walked less than twice left, but finish not found!')
+            self.turn_back()
+            return
+        self._logger.debug('Planned route of {} commands to a passage walked less than twice'.format(len(_route)))
+        self._route.extend(_route)
+        self._follow_route()
+
+    def turn_left(self):
+        super().turn_left()
+        self._heading = headings.LEFT_OF[self._heading]
+
+    def turn_right(self):
+        super().turn_right()
+        self._heading = headings.RIGHT_OF[self._heading]
+
+    def turn_back(self):
+        super().turn_back()
+        self._heading = headings.BACK_OF[self._heading]
+
+    def move_forward_to_next_square(self):
+        super().move_forward_to_next_square()
+        _new_x = self._current_square.x + headings.DX[self._heading]
+        _new_y = self._current_square.y + headings.DY[self._heading]
+        self._add_mark(self._current_square.x, self._current_square.y, self._heading)
+        self._add_mark(_new_x, _new_y, headings.BACK_OF[self._heading])
+        self._current_square = Square(x = _new_x, y = _new_y)
+        self._logger.info('Current square is now x={}, y={}, current direction is {}'.format(_new_x, _new_y, headings.NAMES[self._heading]))
@@ -5,6 +5,8 @@ class WalkedPath(object):
 
     def __init__(self):
         self._visited_squares = deque()
+        # Last step number of each square on the path, so that repeated squares are found in O(1)
+        self._last_step_by_square = {}
 
     def get_last_square(self) -> Square:
         if len(self._visited_squares) == 0:
@@ -15,5 +17,12 @@ class WalkedPath(object):
     def get_square_steps_back(self, no_of_steps: int = 0) -> Square:
         return self._visited_squares[-1 - no_of_steps]
 
+    def get_step_count(self) -> int:
+        return len(self._visited_squares)
+
+    def get_last_step_of_square(self, x: int, y: int) -> int:
+        return self._last_step_by_square.get((x, y))
+
     def append(self, square: Square):
+        self._last_step_by_square[(square.x, square.y)] = len(self._visited_squares)
         self._visited_squares.append(square)
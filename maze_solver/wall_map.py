@@ -0,0 +1,140 @@
+import json
+from maze_solver import headings
+from maze_solver.square import Square
+from maze_solver.direction import Direction
+
+
+class WallMap(object):
+    """
+    Walls of a maze of known size, as learned from the wall detector readings. Walls that have not
+    been seen yet are assumed to be open, except the outer walls of the maze. Squares are numbered
+    from 1 and indexed by (x - 1) * height + (y - 1), walls are stored as 4-bit masks in a bytearray.
+    """
+
+    @property
+    def width(self) -> int:
+        return self._width
+
+    @property
+    def height(self) -> int:
+        return self._height
+
+    @property
+    def square_count(self) -> int:
+        return self._width * self._height
+
+    def __init__(self, width: int = 16, height: int = 16):
+        self._width = width
+        self._height = height
+        # Index offset of the neighbour square behind each wall bit
+        self._neighbour_offsets = {1: 1, 2: height, 4: -1, 8: -height}
+        self._wall_bits_and_neighbour_offsets = tuple(self._neighbour_offsets.items())
+        self._walls = bytearray(width * height)
+        self._explored = bytearray(width * height)
+        for _x in range(1, width + 1):
+            self._walls[self.get_index(_x, 1)] |= 1 << headings.SOUTH
+            self._walls[self.get_index(_x, height)] |= 1 << headings.NORTH
+        for _y in range(1, height + 1):
+            self._walls[self.get_index(1, _y)] |= 1 << headings.WEST
+            self._walls[self.get_index(width, _y)] |= 1 << headings.EAST
+
+    def is_inside(self, x: int, y: int) -> bool:
+        return 1 <= x <= self._width and 1 <= y <= self._height
+
+    def get_index(self, x: int, y: int) -> int:
+        return (x - 1) * self._height + (y - 1)
+
+    def get_coordinates(self, index: int) -> tuple:
+        return (index // self._height + 1, index % self._height + 1)
+
+    def get_walls_at(self, index: int) -> int:
+        return self._walls[index]
+
+    def get_neighbour_index(self, index: int, wall_bit: int) -> int:
+        return index + self._neighbour_offsets[wall_bit]
+
+    def get_open_neighbours(self, index: int) -> list:
+        _walls = self._walls[index]
+        return [index + _offset for _bit, _offset in self._wall_bits_and_neighbour_offsets if not _walls & _bit]
+
+    def is_blocked(self, x: int, y: int, direction: Direction) -> bool:
+        return self.is_blocked_towards(x, y, direction.heading)
+
+    def is_blocked_towards(self, x: int, y: int, heading: int) -> bool:
+        return self._walls[self.get_index(x, y)] & (1 << heading) != 0
+
+    def set_blocked(self, x: int, y: int, direction: Direction, blocked: bool) -> bool:
+        return self.set_blocked_towards(x, y, direction.heading, blocked)
+
+    def set_blocked_towards(self, x: int, y: int, heading: int, blocked: bool) -> bool:
+        """
+        Sets the wall on both sides and returns True if the wall map changed.
+        """
+        _index = self.get_index(x, y)
+        _bit = 1 << heading
+        if (self._walls[_index] & _bit != 0) == blocked:
+            return False
+        _neighbour_x = x + headings.DX[heading]
+        _neighbour_y = y + headings.DY[heading]
+        _back_bit = 1 << headings.BACK_OF[heading]
+        if blocked:
+            self._walls[_index] |= _bit
+            if self.is_inside(_neighbour_x, _neighbour_y):
+                self._walls[self.get_index(_neighbour_x, _neighbour_y)] |= _back_bit
+        elif self.is_inside(_neighbour_x, _neighbour_y):
+            # The outer walls of the maze are never opened
+            self._walls[_index] &= ~_bit
+            self._walls[self.get_index(_neighbour_x, _neighbour_y)] &= ~_back_bit
+        else:
+            return False
+        return True
+
+    def is_explored(self, x: int, y: int) -> bool:
+        return self._explored[self.get_index(x, y)] != 0
+
+    def is_explored_at(self, index: int) -> bool:
+        return self._explored[index] != 0
+
+    def set_explored(self, x: int, y: int):
+        self._explored[self.get_index(x, y)] = 1
+
+    def to_dict(self) -> dict:
+        return {
+            'width': self._width,
+            'height': self._height,
+            'walls': list(self._walls),
+            'explored': list(self._explored)
+        }
+
+    @classmethod
+    def from_dict(cls, values: dict) -> 'WallMap':
+        _wall_map = cls(values['width'], values['height'])
+        for _field in ('walls', 'explored'):
+            if len(values[_field]) != _wall_map.square_count:
+                raise ValueError('Wall map {} should have {} entries, got {}'.format(_field, _wall_map.square_count, len(values[_field])))
+        _wall_map._walls = bytearray(values['walls'])
+        _wall_map._explored = bytearray(values['explored'])
+        return _wall_map
+
+
+def save_wall_map(path: str, wall_map: WallMap, finish_square: Square = None):
+    """
+    Saves the wall map and the finish square, if it has been found, into a JSON file, so that the
+    fastest known route can be planned on the next run.
+    """
+    _values = wall_map.to_dict()
+    _values['finish_square'] = None if finish_square is None else [finish_square.x, finish_square.y]
+    with open(path, 'w') as _file:
+        json.dump(_values, _file)
+
+
+def load_wall_map(path: str) -> tuple:
+    """
+    Returns the wall map and the finish square, or None as the finish square if it was not found.
+    """
+    with open(path, 'r') as _file:
+        _values = json.load(_file)
+    _finish_square = _values.get('finish_square')
+    if _finish_square is not None:
+        _finish_square = Square(x = _finish_square[0], y = _finish_square[1])
+    return (WallMap.from_dict(_values), _finish_square)
@@ -20,8 +20,9 @@ def set_up_async_file_logging() -> list:
     console_log_message_queue_listener = logging.handlers.QueueListener(console_log_message_queue, console_handler)
     file_log_message_queue_listener = logging.handlers.QueueListener(file_log_message_queue, file_handler)
     logging.basicConfig(level=logging.INFO, handlers=[console_queue_handler, file_queue_handler])
+    # Only a few lines per move, used for fitting the simulator motion model. The sensor readings
+    # and wall decisions are in the binary telemetry file.
     logging.getLogger('ev3.position_corrector').setLevel(logging.DEBUG)
-    logging.getLogger('ev3.wall_detector').setLevel(logging.DEBUG)
     logging.getLogger('ev3.motors').setLevel(logging.DEBUG)
     return [console_log_message_queue_listener, file_log_message_queue_listener]
 
@@ -31,7 +32,12 @@ if __name__ == "__main__":
     for listener in log_message_queue_listeners:
         listener.start()
     logging.info('maze_solver_ev3_app: starting')
-    maze_solver = EV3MazeSolver()
+    # With --learn-walls, explores with a solver that learns the walls and saves them at the end of the run.
+    # With --speed-run, replays the fastest known route in the wall map saved by a previous run.
+    maze_solver = EV3MazeSolver(
+        speed_run = '--speed-run' in sys.argv[1:],
+        learn_walls = '--learn-walls' in sys.argv[1:]
+    )
     try:
         maze_solver.start()
     except KeyboardInterrupt:
@@ -0,0 +1,62 @@
+import sys
+import cProfile
+import pstats
+import logging
+from simulator.maze_factory import create_a_real_16_to_16_beast
+from simulator.ev3_world import SimulatedEV3World, TelemetrySensorStream
+from simulator.ev3_session import EV3SimulationSession
+
+# TODO: make these parameters
+_SESSION_COUNT = 10
+_MAX_MOVES_PER_SESSION = 999
+_HEADING_CONTROL = True
+_DISTANCE_NOISE_CM = 0.3
+_GYRO_DRIFT_DEG_PER_SEC = 0.05
+
+def set_up_console_logging():
+    console_handler = logging.StreamHandler(sys.stdout)
+    console_handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+    logging.basicConfig(level=logging.INFO, handlers=[console_handler])
+    # The EV3 code logs every move at info level, which is too much for many sessions
+    logging.getLogger('maze_solver').setLevel(logging.WARNING)
+
+def run_session(random_seed: int, sensor_stream: TelemetrySensorStream = None) -> EV3SimulationSession:
+    world = SimulatedEV3World(
+        create_a_real_16_to_16_beast(),
+        distance_noise_cm=_DISTANCE_NOISE_CM,
+        gyro_drift_deg_per_sec=_GYRO_DRIFT_DEG_PER_SEC,
+        sensor_stream=sensor_stream,
+        random_seed=random_seed
+    )
+    session = EV3SimulationSession(
+        world,
+        max_moves=_MAX_MOVES_PER_SESSION,
+        random_seed=random_seed,
+        motors_kwargs={'heading_control': _HEADING_CONTROL}
+    )
+    session.start()
+    return session
+
+if __name__ == "__main__":
+    set_up_console_logging()
+    arguments = sys.argv[1:]
+    profile = '--profile' in arguments
+    sensor_stream = None
+    if '--telemetry' in arguments:
+        sensor_stream = TelemetrySensorStream(arguments[arguments.index('--telemetry') + 1])
+    profiler = cProfile.Profile() if profile else None
+    if profiler is not None:
+        profiler.enable()
+    sessions = [run_session(random_seed, sensor_stream) for random_seed in range(_SESSION_COUNT)]
+    if profiler is not None:
+        profiler.disable()
+        pstats.Stats(profiler).sort_stats('cumulative').print_stats(30)
+    for random_seed, session in enumerate(sessions):
+        logging.info('Session {}: finished={}, moves={}, motion time={:.1f} s, real time={:.1f} s, wall hits={}'.format(
+            random_seed,
+            session.world.is_finish(),
+            session.move_count,
+            session.motion_time_in_seconds,
+            session.real_time_in_seconds,
+            session.world.wall_hit_count
+        ))
@@ -0,0 +1,31 @@
+import sys
+import logging
+from simulator.motion_model import read_logged_moves, fit_motion_model, save_motion_model
+
+_DEFAULT_MOTION_MODEL_FILE = 'motion_model.json'
+
+def set_up_console_logging():
+    console_handler = logging.StreamHandler(sys.stdout)
+    console_handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+    logging.basicConfig(level=logging.INFO, handlers=[console_handler])
+
+if __name__ == "__main__":
+    set_up_console_logging()
+    if len(sys.argv) < 2:
+        print('Usage: python {} <ev3 log file>... [--output {}]'.format(sys.argv[0], _DEFAULT_MOTION_MODEL_FILE))
+        sys.exit(1)
+    arguments = sys.argv[1:]
+    output_file = _DEFAULT_MOTION_MODEL_FILE
+    if '--output' in arguments:
+        output_index = arguments.index('--output')
+        output_file = arguments[output_index + 1]
+        del arguments[output_index:output_index + 2]
+    logged_moves = []
+    for log_file in arguments:
+        with open(log_file, 'r') as file:
+            logged_moves.extend(read_logged_moves(file))
+    logging.info('Found {} moves in {} log files'.format(len(logged_moves), len(arguments)))
+    motion_model = fit_motion_model(logged_moves)
+    for name, value in motion_model.to_dict().items():
+        print('{}={}'.format(name, value))
+    save_motion_model(output_file, motion_model)
@@ -0,0 +1,61 @@
+import os
+import sys
+import logging
+from simulator.maze_factory import create_a_real_16_to_16_beast
+from simulator.maze_generator import MazeGenerator
+from simulator.weight_tuner import WeightTuner, TuningObjective
+from simulator.motion_model import load_motion_model
+
+# TODO: make these parameters
+_SAMPLE_SIZE = 1000
+_MIN_SAMPLE_SIZE = 30
+_TIME_LIMIT_SEC = 300
+_GENERATED_MAZE_COUNT = 8
+# None means one worker process per CPU core
+_WORKERS = None
+_RANDOM_SEED = 1
+# Fitted from EV3 logs with maze_solver_motion_model_fitting_app.py, the fixed motion times are used without it
+_MOTION_MODEL_FILE = 'motion_model.json'
+_WEIGHT_VALUES = {
+    'prefer_non_dead_ends_weight': [5, 10, 20],
+    'prefer_unvisited_paths_weight': [1, 3, 6],
+    'prefer_closer_to_center_weight': [2, 5, 10],
+    'prefer_no_turns_weight': [0, 1, 3]
+}
+
+def set_up_console_logging():
+    console_handler = logging.StreamHandler(sys.stdout)
+    console_handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+    logging.basicConfig(level=logging.INFO, handlers=[console_handler])
+
+def create_mazes() -> list:
+    # The Robotex Cyprus 2017 maze is left out, CuriousMazeSolver never finishes it with any of these weights
+    # The generated mazes keep the weights from overfitting to the real maze
+    _mazes = [(create_a_real_16_to_16_beast(), [8, 9])]
+    _maze_generator = MazeGenerator(loop_ratio=0.1, random_seed=_RANDOM_SEED)
+    _mazes.extend((_maze, [8, 9]) for _maze in _maze_generator.generate_many(_GENERATED_MAZE_COUNT))
+    return _mazes
+
+def create_fixed_session_kwargs() -> dict:
+    _fixed_session_kwargs = {'prefer_no_loops_weight': 4}
+    if os.path.exists(_MOTION_MODEL_FILE):
+        _fixed_session_kwargs['motion_model'] = load_motion_model(_MOTION_MODEL_FILE)
+    return _fixed_session_kwargs
+
+if __name__ == "__main__":
+    set_up_console_logging()
+    with WeightTuner(
+        create_mazes(),
+        objective=TuningObjective.PROBABILITY_OF_SOLVING_WITHIN_TIME_LIMIT,
+        sample_size=_SAMPLE_SIZE,
+        time_limit_sec=_TIME_LIMIT_SEC,
+        workers=_WORKERS,
+        random_seed=_RANDOM_SEED,
+        fixed_session_kwargs=create_fixed_session_kwargs()
+    ) as weight_tuner:
+        results = weight_tuner.successive_halving(
+            weight_tuner.get_grid_configurations(_WEIGHT_VALUES), 
+            min_sample_size=_MIN_SAMPLE_SIZE
+        )
+    for result in results[:5]:
+        print('score={} weights={}'.format(result['score'], result['weights']))
@@ -0,0 +1,344 @@
+import logging
+import random
+from simulator.maze import Maze, FlatMaze
+from maze_solver.route_planner import MotorCommand
+from maze_solver.dead_end_filler import DeadEndFiller
+from simulator.motion_model import MotionModel
+
+# Headings are 0 = north, 1 = east, 2 = south, 3 = west. The FlatMaze passage bit of a heading is
+# 1 << heading, turning right adds 1 and turning left adds 3, modulo 4.
+_NO_TURN = 0
+_TURN_LEFT = 1
+_TURN_RIGHT = 2
+_TURN_BACK = 3
+
+_VISITED = 1
+_DEAD_END = 2
+
+# Edge flags per square, same as in CuriousMazeSolver: bit 1 << heading marks a passage that has been
+# walked through, bit 16 << heading marks a passage that closed a loop.
+_TRAVERSED_EDGE = 1
+_LOOP_EDGE = 16
+
+# Random tie-breaking choices, in the same order as CuriousMazeSolver passes them to call_one_in_random,
+# so that a lane makes exactly the same random choices as a CuriousMazeSolver with the same seed.
+_LEFT_OR_RIGHT = (_TURN_LEFT, _TURN_RIGHT)
+_RIGHT_OR_NO_TURN = (_TURN_RIGHT, _NO_TURN)
+_LEFT_OR_NO_TURN = (_TURN_LEFT, _NO_TURN)
+_ANY_TURN = (_TURN_LEFT, _TURN_RIGHT, _NO_TURN)
+
+
+class BatchSimulator(object):
+    """
+    Simulates many CuriousMazeSolver sessions on the same maze in lockstep, advancing every unfinished
+    session (lane) by one move per step. The state of all lanes is kept in flat per-lane lists and one
+    bytearray of visited and dead-end flags, and the CuriousMazeSolver decision rules are inlined, so
+    there are no solver, motor and wall detector objects and no callbacks per move. Each lane has its
+    own random generator, and a lane gives exactly the same move count and motion time as a
+    SimulatorMazeSolvingSession with the same seed.
+
+    With fill_dead_ends, each lane also has its own DeadEndFiller, fed at the same points as in
+    CuriousMazeSolver, and the squares it fills are marked as dead-ends in the lane flags.
+    """
+
+    @property
+    def lane_count(self) -> int:
+        return self._lane_count
+
+    @property
+    def active_lane_count(self) -> int:
+        return len(self._active_lanes)
+
+    def __init__(
+        self,
+        maze,
+        random_seeds: list,
+        prefer_non_dead_ends_weight: int = 10,
+        prefer_unvisited_paths_weight: int = 2,
+        prefer_closer_to_center_weight: int = 3,
+        prefer_no_turns_weight: int = 1,
+        prefer_no_loops_weight: int = 0,
+        max_moves: int = 999,
+        center_coordinates: list = [8, 9],
+        motion_model: MotionModel = None,
+        logger = None,
+        fill_dead_ends: bool = False
+    ):
+        self._logger = logger or logging.getLogger(__name__)
+        _motion_model = motion_model or MotionModel()
+        # The lanes only make single forward moves and turns, so their times can be taken once
+        self._forward_motion_time = _motion_model.get_forward_time(1)
+        self._turn_left_motion_time = _motion_model.get_turn_time(MotorCommand.TURN_LEFT)
+        self._turn_right_motion_time = _motion_model.get_turn_time(MotorCommand.TURN_RIGHT)
+        self._back_turn_motion_time = _motion_model.get_turn_time(MotorCommand.TURN_BACK)
+        self._maze = maze if isinstance(maze, FlatMaze) else FlatMaze.from_maze(maze)
+        self._prefer_non_dead_ends_weight = prefer_non_dead_ends_weight
+        self._prefer_unvisited_paths_weight = prefer_unvisited_paths_weight
+        self._prefer_no_turns_weight = prefer_no_turns_weight
+        self._prefer_no_loops_weight = prefer_no_loops_weight
+        self._max_moves = max_moves
+        # Squares are indexed by x * height + y, with a border of one square around the maze. Border squares
+        # have no passages and are never visited, but some mazes have passages to nowhere, and the scores of
+        # the border squares and the failure when moving there must be the same as in the scalar simulator.
+        self._height = self._maze.height + 2
+        self._cell_count = (self._maze.width + 2) * self._height
+        self._neighbour_offsets = (1, self._height, -1, -self._height)
+        self._inside_maze = [self._is_inside_maze(_index // self._height, _index % self._height) for _index in range(self._cell_count)]
+        self._passages = [
+            self._maze.get_passages(_index // self._height, _index % self._height) if self._inside_maze[_index] else 0
+            for _index in range(self._cell_count)
+        ]
+        self._finish = [
+            self._inside_maze[_index] and self._maze.is_finish(_index // self._height, _index % self._height)
+            for _index in range(self._cell_count)
+        ]
+        self._closeness_to_center_scores = [
+            self._get_closeness_to_center_score(_index // self._height, _index % self._height, prefer_closer_to_center_weight, center_coordinates)
+            for _index in range(self._cell_count)
+        ]
+        self._lane_count = len(random_seeds)
+        _start_cell = self._maze.start_x * self._height + self._maze.start_y
+        self._randoms = [random.Random(_random_seed) for _random_seed in random_seeds]
+        self._cells = [_start_cell] * self._lane_count
+        self._headings = [0] * self._lane_count
+        self._current_is_dead_end = [False] * self._lane_count
+        self._last_square_was_dead_end = [False] * self._lane_count
+        self._move_counts = [0] * self._lane_count
+        self._motion_times = [0] * self._lane_count
+        self._flags = bytearray(self._lane_count * self._cell_count)
+        self._edge_flags = bytearray(self._lane_count * self._cell_count)
+        self._active_lanes = list(range(self._lane_count))
+        _center_squares = set((_x, _y) for _x in center_coordinates for _y in center_coordinates)
+        self._dead_end_fillers = [DeadEndFiller(_center_squares) for _ in range(self._lane_count)] if fill_dead_ends else None
+
+    def _is_inside_maze(self, x: int, y: int) -> bool:
+        return 1 <= x <= self._maze.width and 1 <= y <= self._maze.height
+
+    def _get_closeness_to_center_score(self, x: int, y: int, prefer_closer_to_center_weight: int, center_coordinates: list) -> float:
+        # Same formula as CuriousMazeSolver.get_score_*, so that the scores are equal to the last bit.
+        _min_x = min(abs(x - _coordinate) for _coordinate in center_coordinates)
+        _min_y = min(abs(y - _coordinate) for _coordinate in center_coordinates)
+        _closeness_to_center = 8 - max(_min_x, _min_y)
+        return prefer_closer_to_center_weight * (_closeness_to_center / 8)
+
+    def _get_score(self, flags: int, cell: int, no_turns_score: int, edge_flags: int, heading: int) -> float:
+        _no_dead_end_score = self._prefer_non_dead_ends_weight if not flags & _DEAD_END else 0
+        _unvisited_score = self._prefer_unvisited_paths_weight if not flags & _VISITED else 0
+        _no_loops_score = -self._prefer_no_loops_weight if edge_flags & (_LOOP_EDGE << heading) else 0
+        return _no_dead_end_score + _unvisited_score + self._closeness_to_center_scores[cell] + no_turns_score + _no_loops_score
+
+    def _choose_between_two(self, lane: int, first_score: float, second_score: float, first_turn: int, second_turn: int, tie_choices: tuple) -> int:
+        if first_score > second_score:
+            return first_turn
+        elif first_score < second_score:
+            return second_turn
+        return self._randoms[lane].choice(tie_choices)
+
+    def _choose_between_all(self, lane: int, front_score: float, left_score: float, right_score: float) -> int:
+        if front_score > right_score and front_score > left_score:
+            return _NO_TURN
+        elif left_score > right_score and left_score > front_score:
+            return _TURN_LEFT
+        elif right_score > left_score and right_score > front_score:
+            return _TURN_RIGHT
+        elif front_score == left_score and front_score > right_score:
+            return self._randoms[lane].choice(_LEFT_OR_NO_TURN)
+        elif left_score == right_score and left_score > front_score:
+            return self._randoms[lane].choice(_LEFT_OR_RIGHT)
+        elif front_score == right_score and front_score > left_score:
+            return self._randoms[lane].choice(_RIGHT_OR_NO_TURN)
+        return self._randoms[lane].choice(_ANY_TURN)
+
+    def _add_filled_dead_ends(self, lane: int, squares: list):
+        _lane_offset = lane * self._cell_count
+        for _x, _y in squares:
+            self._flags[_lane_offset + _x * self._height + _y] |= _DEAD_END
+
+    def _learn_walls(self, lane: int, cell: int, heading: int):
+        _dead_end_filler = self._dead_end_fillers[lane]
+        _x = cell // self._height
+        _y = cell % self._height
+        _passages = self._passages[cell]
+        for _heading in ((heading + 3) & 3, heading, (heading + 1) & 3):
+            self._add_filled_dead_ends(lane, _dead_end_filler.set_wall(_x, _y, _heading, _passages & (1 << _heading) == 0))
+
+    def _mark_current_as_dead_end(self, lane: int):
+        self._current_is_dead_end[lane] = True
+        if self._dead_end_fillers is not None:
+            _cell = self._cells[lane]
+            self._add_filled_dead_ends(lane, self._dead_end_fillers[lane].mark_dead_end(_cell // self._height, _cell % self._height))
+
+    def _mark_as_dead_end_if_came_from_dead_end(self, lane: int):
+        if self._last_square_was_dead_end[lane]:
+            self._mark_current_as_dead_end(lane)
+
+    def _decide_turn(self, lane: int, cell: int, heading: int) -> int:
+        _passages = self._passages[cell]
+        _left_heading = (heading + 3) & 3
+        _right_heading = (heading + 1) & 3
+        _left_open = _passages & (1 << _left_heading) != 0
+        _front_open = _passages & (1 << heading) != 0
+        _right_open = _passages & (1 << _right_heading) != 0
+        if not _left_open and not _front_open and not _right_open:
+            self._mark_current_as_dead_end(lane)
+            self._last_square_was_dead_end[lane] = True
+            return _TURN_BACK
+        _lane_offset = lane * self._cell_count
+        _left_cell = cell + self._neighbour_offsets[_left_heading]
+        _front_cell = cell + self._neighbour_offsets[heading]
+        _right_cell = cell + self._neighbour_offsets[_right_heading]
+        _left_flags = self._flags[_lane_offset + _left_cell] if _left_open else 0
+        _front_flags = self._flags[_lane_offset + _front_cell] if _front_open else 0
+        _right_flags = self._flags[_lane_offset + _right_cell] if _right_open else 0
+        _left_dead_end = _left_flags & _DEAD_END != 0
+        _front_dead_end = _front_flags & _DEAD_END != 0
+        _right_dead_end = _right_flags & _DEAD_END != 0
+        _edge_flags = self._edge_flags[_lane_offset + cell]
+
+        if _front_open and not _left_open and not _right_open:
+            self._mark_as_dead_end_if_came_from_dead_end(lane)
+            return _NO_TURN
+        elif _right_open and not _left_open and not _front_open:
+            self._mark_as_dead_end_if_came_from_dead_end(lane)
+            return _TURN_RIGHT
+        elif _left_open and not _front_open and not _right_open:
+            self._mark_as_dead_end_if_came_from_dead_end(lane)
+            return _TURN_LEFT
+
+        if not _front_open:
+            if not _right_dead_end and _left_dead_end:
+                self._mark_as_dead_end_if_came_from_dead_end(lane)
+                return _TURN_RIGHT
+            elif _right_dead_end and not _left_dead_end:
+                self._mark_as_dead_end_if_came_from_dead_end(lane)
+                return _TURN_LEFT
+            self._last_square_was_dead_end[lane] = False
+            return self._choose_between_two(
+                lane,
+                self._get_score(_left_flags, _left_cell, 0, _edge_flags, _left_heading),
+                self._get_score(_right_flags, _right_cell, 0, _edge_flags, _right_heading),
+                _TURN_LEFT, _TURN_RIGHT, _LEFT_OR_RIGHT
+            )
+        elif not _left_open:
+            if not _right_dead_end and _front_dead_end:
+                self._mark_as_dead_end_if_came_from_dead_end(lane)
+                return _TURN_RIGHT
+            elif _right_dead_end and not _front_dead_end:
+                self._mark_as_dead_end_if_came_from_dead_end(lane)
+                return _NO_TURN
+            self._last_square_was_dead_end[lane] = False
+            return self._choose_between_two(
+                lane,
+                self._get_score(_front_flags, _front_cell, self._prefer_no_turns_weight, _edge_flags, heading),
+                self._get_score(_right_flags, _right_cell, 0, _edge_flags, _right_heading),
+                _NO_TURN, _TURN_RIGHT, _RIGHT_OR_NO_TURN
+            )
+        elif not _right_open:
+            if not _left_dead_end and _front_dead_end:
+                self._mark_as_dead_end_if_came_from_dead_end(lane)
+                return _TURN_LEFT
+            elif _left_dead_end and not _front_dead_end:
+                self._mark_as_dead_end_if_came_from_dead_end(lane)
+                return _NO_TURN
+            self._last_square_was_dead_end[lane] = False
+            return self._choose_between_two(
+                lane,
+                self._get_score(_front_flags, _front_cell, self._prefer_no_turns_weight, _edge_flags, heading),
+                self._get_score(_left_flags, _left_cell, 0, _edge_flags, _left_heading),
+                _NO_TURN, _TURN_LEFT, _LEFT_OR_NO_TURN
+            )
+
+        if not _left_dead_end and _front_dead_end and _right_dead_end:
+            self._mark_as_dead_end_if_came_from_dead_end(lane)
+            return _TURN_LEFT
+        elif _left_dead_end and _front_dead_end and not _right_dead_end:
+            self._mark_as_dead_end_if_came_from_dead_end(lane)
+            return _TURN_RIGHT
+        elif _left_dead_end and not _front_dead_end and _right_dead_end:
+            self._mark_as_dead_end_if_came_from_dead_end(lane)
+            return _NO_TURN
+        self._last_square_was_dead_end[lane] = False
+        _front_score = self._get_score(_front_flags, _front_cell, self._prefer_no_turns_weight, _edge_flags, heading)
+        _left_score = self._get_score(_left_flags, _left_cell, 0, _edge_flags, _left_heading)
+        _right_score = self._get_score(_right_flags, _right_cell, 0, _edge_flags, _right_heading)
+        if _left_dead_end and not _front_dead_end and not _right_dead_end:
+            return self._choose_between_two(lane, _front_score, _right_score, _NO_TURN, _TURN_RIGHT, _RIGHT_OR_NO_TURN)
+        elif not _left_dead_end and _front_dead_end and not _right_dead_end:
+            return self._choose_between_two(lane, _left_score, _right_score, _TURN_LEFT, _TURN_RIGHT, _LEFT_OR_RIGHT)
+        elif not _left_dead_end and not _front_dead_end and _right_dead_end:
+            return self._choose_between_two(lane, _front_score, _left_score, _NO_TURN, _TURN_LEFT, _LEFT_OR_NO_TURN)
+        return self._choose_between_all(lane, _front_score, _left_score, _right_score)
+
+    def _move_dead_end_filler(self, lane: int, cell: int, heading: int, next_cell: int):
+        _dead_end_filler = self._dead_end_fillers[lane]
+        _x = cell // self._height
+        _y = cell % self._height
+        if _dead_end_filler.is_dead_end(_x, _y):
+            # Filled dead-ends stay dead-ends when walked through
+            self._flags[lane * self._cell_count + cell] |= _DEAD_END
+        self._add_filled_dead_ends(lane, _dead_end_filler.set_wall(_x, _y, heading, False))
+        self._add_filled_dead_ends(lane, _dead_end_filler.set_current_square(next_cell // self._height, next_cell % self._height))
+
+    def step(self) -> int:
+        """
+        Advances every active lane by one move and returns the number of lanes that are still active.
+        """
+        _still_active_lanes = []
+        for _lane in self._active_lanes:
+            _cell = self._cells[_lane]
+            self._move_counts[_lane] += 1
+            if self._finish[_cell]:
+                continue
+            _heading = self._headings[_lane]
+            if self._dead_end_fillers is not None:
+                self._learn_walls(_lane, _cell, _heading)
+            _turn = self._decide_turn(_lane, _cell, _heading)
+            if _turn == _TURN_LEFT:
+                _heading = (_heading + 3) & 3
+                self._motion_times[_lane] += self._turn_left_motion_time
+            elif _turn == _TURN_RIGHT:
+                _heading = (_heading + 1) & 3
+                self._motion_times[_lane] += self._turn_right_motion_time
+            elif _turn == _TURN_BACK:
+                _heading = (_heading + 2) & 3
+                self._motion_times[_lane] += self._back_turn_motion_time
+            _next_cell = _cell + self._neighbour_offsets[_heading]
+            if not self._inside_maze[_next_cell]:
+                self._maze.get_index(_next_cell // self._height, _next_cell % self._height)
+            self._motion_times[_lane] += self._forward_motion_time
+            _lane_offset = _lane * self._cell_count
+            self._flags[_lane_offset + _cell] = _VISITED | _DEAD_END if self._current_is_dead_end[_lane] else _VISITED
+            # A square is on the walked path exactly when it is visited, so entering a visited square
+            # through a passage that has never been walked closes a loop.
+            _back_heading = (_heading + 2) & 3
+            _edge_bits = _TRAVERSED_EDGE
+            if self._flags[_lane_offset + _next_cell] & _VISITED and not self._edge_flags[_lane_offset + _cell] & (_TRAVERSED_EDGE << _heading):
+                _edge_bits |= _LOOP_EDGE
+            self._edge_flags[_lane_offset + _cell] |= _edge_bits << _heading
+            self._edge_flags[_lane_offset + _next_cell] |= _edge_bits << _back_heading
+            self._current_is_dead_end[_lane] = False
+            if self._dead_end_fillers is not None:
+                self._move_dead_end_filler(_lane, _cell, _heading, _next_cell)
+            self._cells[_lane] = _next_cell
+            self._headings[_lane] = _heading
+            if self._move_counts[_lane] < self._max_moves:
+                _still_active_lanes.append(_lane)
+        self._active_lanes = _still_active_lanes
+        return len(self._active_lanes)
+
+    def run(self) -> list:
+        """
+        Runs all lanes until they have finished or run out of moves, and returns a list of
+        (move_count, motion_time) tuples in lane order.
+        """
+        while self.step() > 0:
+            pass
+        self._logger.info('Simulated {} sessions in lockstep'.format(self._lane_count))
+        return list(zip(self._move_counts, self._motion_times))
+
+
+def run_batch_simulator_sessions(maze: Maze, random_seeds: list, session_kwargs: dict) -> list:
+    """
+    Drop-in replacement of experiment_runner.run_simulator_sessions that runs the sessions on a BatchSimulator.
+    """
+    return BatchSimulator(maze, random_seeds, **session_kwargs).run()
@@ -0,0 +1,119 @@
+import logging
+import time
+from ev3.sensor_scheduler import SensorScheduler, SensorSample
+from maze_solver.curious_maze_solver import CuriousMazeSolver
+from simulator.simulator import SimulatorFinishDetector, SimulatorOutputs
+from simulator.ev3_world import SimulatedEV3World, simulated_ev3dev2
+
+
+class SimulatedSensorScheduler(SensorScheduler):
+    """
+    Reads the sensors on the virtual clock of the world, whenever the world moves on. Waiting for a
+    fresh sample moves the world on instead of waiting for the scheduler thread, which is not started.
+    """
+
+    def __init__(self, world: SimulatedEV3World, logger = None):
+        super().__init__(clock=world.get_time, logger=logger)
+        self._world = world
+        self._world.add_step_listener(self.read_due_sensors)
+
+    def wait_for_sample_after(self, name: str, timestamp: float, timeout_sec: float = None) -> SensorSample:
+        # Without a timeout, gives up after a minute of virtual time instead of never returning
+        _give_up_time = self.get_time() + (60.0 if timeout_sec is None else timeout_sec)
+        if timestamp >= self.get_time():
+            # A real reading from now on would come a bit later, so a sample from this very moment does not do
+            self._world.advance(self._world.time_step_sec)
+        while True:
+            self.read_due_sensors()
+            _sample = self.get_latest_sample(name)
+            if _sample is not None and _sample.timestamp >= timestamp:
+                return _sample
+            if self.get_time() >= _give_up_time:
+                return None
+            self._world.advance(self._world.time_step_sec)
+
+
+class EV3SimulationSession(object):
+    """
+    Runs the EV3 code - motors, position corrections, sensors and wall detection - in a simulated
+    EV3 world, with the moves made one by one in the calling thread. A CuriousMazeSolver solves the
+    maze by default, any other maze solver can be given with a maze_solver_factory as in
+    SimulatorMazeSolvingSession. The motors_kwargs and wall_detector_kwargs are given to
+    EV3Motors and EV3WallDetector, e.g. to tune the wall hit recovery.
+    """
+
+    @property
+    def world(self) -> SimulatedEV3World:
+        return self._world
+
+    @property
+    def move_count(self) -> int:
+        return self._move_count
+
+    @property
+    def motion_time_in_seconds(self) -> float:
+        return self._world.get_time()
+
+    @property
+    def real_time_in_seconds(self) -> float:
+        return self._real_time_in_seconds
+
+    def __init__(
+        self,
+        world: SimulatedEV3World,
+        maze_solver_factory = None,
+        max_moves: int = 999,
+        center_coordinates: list = [8, 9],
+        random_seed: int = None,
+        motors_kwargs: dict = None,
+        wall_detector_kwargs: dict = None,
+        logger = None
+    ):
+        self._logger = logger or logging.getLogger(__name__)
+        self._world = world
+        self._maze_solver_factory = maze_solver_factory
+        self._max_moves = max_moves
+        self._center_coordinates = center_coordinates
+        self._random_seed = random_seed
+        self._motors_kwargs = motors_kwargs or {}
+        self._wall_detector_kwargs = wall_detector_kwargs or {}
+        self._move_count = 0
+        self._real_time_in_seconds = 0.0
+
+    def _create_maze_solver(self, interfaces: dict):
+        if self._maze_solver_factory is None:
+            return CuriousMazeSolver(center_coordinates=self._center_coordinates, random_seed=self._random_seed, **interfaces)
+        return self._maze_solver_factory(random_seed=self._random_seed, **interfaces)
+
+    def start(self) -> int:
+        _start_time = time.perf_counter()
+        with simulated_ev3dev2(self._world):
+            # Imported here, so that the ev3 modules are loaded with the simulated ev3dev2 modules
+            from ev3.distance_detectors import EV3DistanceDetectors
+            from ev3.gyro import Gyro
+            from ev3.motors import EV3Motors
+            from ev3.wall_detector import EV3WallDetector
+            _sensor_scheduler = SimulatedSensorScheduler(self._world)
+            _distance_sensors = EV3DistanceDetectors(sensor_scheduler=_sensor_scheduler, calibration_file=None)
+            _gyro = Gyro(sensor_scheduler=_sensor_scheduler)
+            _motors = EV3Motors(distance_sensors=_distance_sensors, gyro=_gyro, sensor_scheduler=_sensor_scheduler, **self._motors_kwargs)
+            _wall_detector = EV3WallDetector(distance_sensors=_distance_sensors, motors=_motors, **self._wall_detector_kwargs)
+            _maze_solver = self._create_maze_solver({
+                'motors': _motors,
+                'wall_detector': _wall_detector,
+                'finish_detector': SimulatorFinishDetector(is_finish_callback=self._world.is_finish),
+                'outputs': SimulatorOutputs(notify_callback=lambda type, message: None)
+            })
+            _finished_or_cannot_move = False
+            while not _finished_or_cannot_move and self._move_count < self._max_moves:
+                self._logger.debug('Move count={}'.format(self._move_count))
+                _finished_or_cannot_move = _maze_solver.next_move()
+                self._move_count += 1
+        self._real_time_in_seconds = time.perf_counter() - _start_time
+        self._logger.info('{} moves, {:.1f} seconds of motion in {:.1f} seconds, {} wall hits'.format(
+            self._move_count,
+            self.motion_time_in_seconds,
+            self._real_time_in_seconds,
+            self._world.wall_hit_count
+        ))
+        return self._move_count
@@ -0,0 +1,480 @@
+import bisect
+import contextlib
+import math
+import random
+import sys
+import types
+from simulator.maze import FlatMaze, MazePassages
+from ev3.distance_calibration import DEFAULT_INTENSITY_AT_ZERO_DISTANCE, DEFAULT_INTENSITY_FACTOR_PER_CM, MAX_INTENSITY, NO_WALL_DISTANCE_CM
+from ev3.telemetry import read_telemetry
+
+# Directions of the light sensors from the heading of the robot, by port as in EV3DistanceDetectors
+_SENSOR_DIRECTIONS_DEG = {'in1': 0, 'in3': -90, 'in4': 90}
+# Square offset and the passage back, by passage
+_NEIGHBOURS = {
+    MazePassages.Y_PLUS: (0, 1, MazePassages.Y_MINUS),
+    MazePassages.X_PLUS: (1, 0, MazePassages.X_MINUS),
+    MazePassages.Y_MINUS: (0, -1, MazePassages.Y_PLUS),
+    MazePassages.X_MINUS: (-1, 0, MazePassages.X_PLUS)
+}
+# Speed of a large EV3 motor at 100%
+_MAX_RPM = 175
+
+
+class TelemetrySensorStream(object):
+    """
+    Sensor readings recorded on a real run with TelemetryRecorder, to be served by the simulated
+    sensors instead of the readings from the maze walls. The recorded times are taken from the
+    first record, so the stream starts when the simulation starts.
+    """
+
+    def __init__(self, path: str):
+        self._distance_times = []
+        self._distances = []
+        self._angle_times = []
+        self._angles = []
+        _start_time = None
+        for _timestamp, _left, _front, _right, _angle, _, _ in read_telemetry(path):
+            _start_time = _timestamp if _start_time is None else _start_time
+            if not math.isnan(_left) and not math.isnan(_front) and not math.isnan(_right):
+                self._distance_times.append(_timestamp - _start_time)
+                self._distances.append({'left': _left, 'front': _front, 'right': _right})
+            if not math.isnan(_angle):
+                self._angle_times.append(_timestamp - _start_time)
+                self._angles.append(_angle)
+
+    def _get_latest(self, times: list, values: list, time_sec: float):
+        # None before the first reading
+        _index = bisect.bisect_right(times, time_sec) - 1
+        return values[_index] if _index >= 0 else None
+
+    def get_distances(self, time_sec: float) -> dict:
+        return self._get_latest(self._distance_times, self._distances, time_sec)
+
+    def get_angle(self, time_sec: float) -> float:
+        return self._get_latest(self._angle_times, self._angles, time_sec)
+
+
+class SimulatedEV3World(object):
+    """
+    The EV3 robot in a maze, for running the EV3 code on a PC through the simulated ev3dev2 modules
+    of simulated_ev3dev2. Time is virtual: it only goes on when the code waits for the motors or the
+    sensors, so a run takes a fraction of the real time.
+
+    The robot starts in the center of the start square, facing north (y grows), with x and y in
+    millimeters. The wheels move it as a differential drive. A move into a wall or a corner post
+    slides along it, or stops there while the wheels slip. Without a sensor stream, the light
+    sensors see the walls of the maze along their direction, and the gyro tells the heading.
+    """
+
+    @property
+    def x_mm(self) -> float:
+        return self._x_mm
+
+    @property
+    def y_mm(self) -> float:
+        return self._y_mm
+
+    @property
+    def heading_deg(self) -> float:
+        return self._heading_deg
+
+    @property
+    def wall_hit_count(self) -> int:
+        return self._wall_hit_count
+
+    @property
+    def time_step_sec(self) -> float:
+        return self._time_step_sec
+
+    def __init__(
+        self,
+        maze,
+        square_length_mm: float = 180.0,
+        wall_thickness_mm: float = 12.0,
+        wheel_diameter_mm: float = 56.0,
+        wheelbase_width_mm: float = 97.5,
+        robot_radius_mm: float = 60.0,
+        sensor_offset_mm: float = 64.0,
+        on_spot_turn_factor: float = 90 / 74,
+        distance_noise_cm: float = 0.0,
+        gyro_drift_deg_per_sec: float = 0.0,
+        time_step_sec: float = 0.01,
+        sensor_stream: TelemetrySensorStream = None,
+        random_seed: int = None
+    ):
+        self._maze = maze if isinstance(maze, FlatMaze) else FlatMaze.from_maze(maze)
+        self._square_length_mm = square_length_mm
+        self._wall_thickness_mm = wall_thickness_mm
+        self._wheel_circumference_mm = math.pi * wheel_diameter_mm
+        self._wheelbase_width_mm = wheelbase_width_mm
+        self._robot_radius_mm = robot_radius_mm
+        self._sensor_offset_mm = sensor_offset_mm
+        # The real robot turns more than its wheels tell when turning on the spot, which is why
+        # EV3Motors turns 74 degrees by the wheels for a 90 degree turn
+        self._on_spot_turn_factor = on_spot_turn_factor
+        self._distance_noise_cm = distance_noise_cm
+        self._gyro_drift_deg_per_sec = gyro_drift_deg_per_sec
+        self._time_step_sec = time_step_sec
+        self._sensor_stream = sensor_stream
+        self._random = random.Random(random_seed)
+        self._time_sec = 0.0
+        self._x_mm = (self._maze.start_x - 0.5) * square_length_mm
+        self._y_mm = (self._maze.start_y - 0.5) * square_length_mm
+        self._heading_deg = 0.0
+        self._gyro_reset_angle = 0.0
+        self._in_wall = False
+        self._wall_hit_count = 0
+        self._wheel_positions_deg = [0.0, 0.0]
+        self._wheel_speeds_dps = [0.0, 0.0]
+        # None for running until stopped
+        self._remaining_move_sec = 0.0
+        self._step_listeners = []
+
+    def get_time(self) -> float:
+        return self._time_sec
+
+    def add_step_listener(self, step_listener: callable):
+        self._step_listeners.append(step_listener)
+
+    def get_square(self) -> tuple:
+        return (int(self._x_mm // self._square_length_mm) + 1, int(self._y_mm // self._square_length_mm) + 1)
+
+    def is_finish(self) -> bool:
+        _x, _y = self.get_square()
+        try:
+            return self._maze.is_finish(_x, _y)
+        except KeyError:
+            return False
+
+    def is_moving(self) -> bool:
+        return self._remaining_move_sec is None or self._remaining_move_sec > 0
+
+    def get_wheel_position_deg(self, wheel: int) -> int:
+        return int(round(self._wheel_positions_deg[wheel]))
+
+    def run_wheels(self, left_speed_dps: float, right_speed_dps: float, duration_sec: float = None):
+        self._wheel_speeds_dps = [left_speed_dps, right_speed_dps]
+        self._remaining_move_sec = duration_sec
+
+    def stop_wheels(self):
+        self._wheel_speeds_dps = [0.0, 0.0]
+        self._remaining_move_sec = 0.0
+
+    def advance(self, duration_sec: float):
+        """
+        Moves the time on, in steps of time_step_sec, and calls the step listeners after every step.
+        """
+        _end_time = self._time_sec + duration_sec
+        while self._time_sec < _end_time - 1e-9:
+            _step = min(self._time_step_sec, _end_time - self._time_sec)
+            if self._remaining_move_sec is not None and self._remaining_move_sec > 0:
+                _step = min(_step, self._remaining_move_sec)
+            if self.is_moving():
+                self._move_robot(_step)
+                if self._remaining_move_sec is not None:
+                    self._remaining_move_sec -= _step
+                    if self._remaining_move_sec <= 1e-9:
+                        self.stop_wheels()
+            self._time_sec += _step
+            for _step_listener in self._step_listeners:
+                _step_listener()
+
+    def advance_until_stopped(self, timeout_sec: float = None) -> bool:
+        """
+        Moves the time on until the wheels stop, or the timeout is over. Returns True if the wheels stopped.
+        """
+        _end_time = None if timeout_sec is None else self._time_sec + timeout_sec
+        while self.is_moving():
+            if _end_time is not None and self._time_sec >= _end_time - 1e-9:
+                return False
+            if self._remaining_move_sec is None and _end_time is None:
+                # Running until stopped, it would never end
+                return False
+            _step = self._time_step_sec if _end_time is None else min(self._time_step_sec, _end_time - self._time_sec)
+            self.advance(_step)
+        return True
+
+    def _move_robot(self, step_sec: float):
+        _left_mm, _right_mm = [_speed * step_sec / 360 * self._wheel_circumference_mm for _speed in self._wheel_speeds_dps]
+        for _wheel in (0, 1):
+            self._wheel_positions_deg[_wheel] += self._wheel_speeds_dps[_wheel] * step_sec
+        _turn_deg = math.degrees((_left_mm - _right_mm) / self._wheelbase_width_mm)
+        if _left_mm * _right_mm < 0:
+            _turn_deg *= self._on_spot_turn_factor
+        _distance_mm = (_left_mm + _right_mm) / 2
+        _middle_heading = math.radians(self._heading_deg + _turn_deg / 2)
+        _x_mm = self._x_mm + _distance_mm * math.sin(_middle_heading)
+        _y_mm = self._y_mm + _distance_mm * math.cos(_middle_heading)
+        self._heading_deg += _turn_deg
+        if not self._collides(_x_mm, _y_mm):
+            self._x_mm, self._y_mm = _x_mm, _y_mm
+            self._in_wall = False
+            return
+        if not self._in_wall:
+            self._wall_hit_count += 1
+        self._in_wall = True
+        # Slides along the wall or around the post: pushed out of it the way it came in. In a corner,
+        # it may be pushed into a second wall after that.
+        for _ in range(2):
+            _normal_x, _normal_y, _depth_mm = self._get_contact(_x_mm, _y_mm)
+            _x_mm, _y_mm = _x_mm + _depth_mm * _normal_x, _y_mm + _depth_mm * _normal_y
+            if not self._collides(_x_mm, _y_mm):
+                self._x_mm, self._y_mm = _x_mm, _y_mm
+                return
+
+    def _is_open(self, x: int, y: int, passage: int) -> bool:
+        try:
+            return bool(self._maze.get_passages(x, y) & passage)
+        except KeyError:
+            return False
+
+    def _is_passable(self, x: int, y: int, passage: int) -> bool:
+        # A wall that can be passed in one direction only does not stop the robot on its way through
+        _dx, _dy, _opposite = _NEIGHBOURS[passage]
+        return self._is_open(x, y, passage) or self._is_open(x + _dx, y + _dy, _opposite)
+
+    def _collides(self, x_mm: float, y_mm: float) -> bool:
+        return self._get_contact(x_mm, y_mm) is not None
+
+    def _get_contact(self, x_mm: float, y_mm: float) -> tuple:
+        # Returns the direction from the wall or post that the robot would touch towards the robot, and
+        # how deep into it the robot would be, or None when the robot touches nothing
+        _length = self._square_length_mm
+        _square_x = int(x_mm // _length) + 1
+        _square_y = int(y_mm // _length) + 1
+        if _square_x < 1 or _square_x > self._maze.width or _square_y < 1 or _square_y > self._maze.height:
+            return (0.0, 0.0, 0.0)
+        _reach = self._robot_radius_mm + self._wall_thickness_mm / 2
+        _left_x, _bottom_y = (_square_x - 1) * _length, (_square_y - 1) * _length
+        # A tiny bit more than the depth, so that a robot pushed out does not touch the wall any more
+        _margin = 1e-6
+        if x_mm + _reach > _left_x + _length and not self._is_passable(_square_x, _square_y, MazePassages.X_PLUS):
+            return (-1.0, 0.0, x_mm + _reach - _left_x - _length + _margin)
+        if x_mm - _reach < _left_x and not self._is_passable(_square_x, _square_y, MazePassages.X_MINUS):
+            return (1.0, 0.0, _left_x - x_mm + _reach + _margin)
+        if y_mm + _reach > _bottom_y + _length and not self._is_passable(_square_x, _square_y, MazePassages.Y_PLUS):
+            return (0.0, -1.0, y_mm + _reach - _bottom_y - _length + _margin)
+        if y_mm - _reach < _bottom_y and not self._is_passable(_square_x, _square_y, MazePassages.Y_MINUS):
+            return (0.0, 1.0, _bottom_y - y_mm + _reach + _margin)
+        # The posts in the corners are always there
+        for _corner_x in (_left_x, _left_x + _length):
+            for _corner_y in (_bottom_y, _bottom_y + _length):
+                _distance = math.hypot(x_mm - _corner_x, y_mm - _corner_y)
+                if _distance < _reach:
+                    return ((x_mm - _corner_x) / _distance, (y_mm - _corner_y) / _distance, _reach - _distance + _margin)
+        return None
+
+    def _get_wall_distance_mm(self, x_mm: float, y_mm: float, direction_deg: float, max_distance_mm: float) -> float:
+        # Walks along the ray from square boundary to square boundary until there is a wall
+        _length = self._square_length_mm
+        _dx, _dy = math.sin(math.radians(direction_deg)), math.cos(math.radians(direction_deg))
+        _square_x, _square_y = int(x_mm // _length) + 1, int(y_mm // _length) + 1
+        _travelled_mm = 0.0
+        while _travelled_mm < max_distance_mm:
+            _to_x = ((_square_x * _length if _dx > 0 else (_square_x - 1) * _length) - x_mm) / _dx if abs(_dx) > 1e-9 else math.inf
+            _to_y = ((_square_y * _length if _dy > 0 else (_square_y - 1) * _length) - y_mm) / _dy if abs(_dy) > 1e-9 else math.inf
+            if _to_x < _to_y:
+                _passage = MazePassages.X_PLUS if _dx > 0 else MazePassages.X_MINUS
+                if not self._is_open(_square_x, _square_y, _passage):
+                    return max(0.0, _to_x - self._wall_thickness_mm / 2 / abs(_dx))
+                _square_x += 1 if _dx > 0 else -1
+                _travelled_mm = _to_x
+            else:
+                _passage = MazePassages.Y_PLUS if _dy > 0 else MazePassages.Y_MINUS
+                if not self._is_open(_square_x, _square_y, _passage):
+                    return max(0.0, _to_y - self._wall_thickness_mm / 2 / abs(_dy))
+                _square_y += 1 if _dy > 0 else -1
+                _travelled_mm = _to_y
+        return max_distance_mm
+
+    def get_distance_cm(self, address: str) -> float:
+        if address not in _SENSOR_DIRECTIONS_DEG:
+            raise ValueError('No light sensor on port {}'.format(address))
+        if self._sensor_stream is not None:
+            _distances = self._sensor_stream.get_distances(self._time_sec)
+            if _distances is None:
+                return NO_WALL_DISTANCE_CM
+            return _distances[{'in1': 'front', 'in3': 'left', 'in4': 'right'}[address]]
+        _direction_deg = self._heading_deg + _SENSOR_DIRECTIONS_DEG[address]
+        _sensor_x = self._x_mm + self._sensor_offset_mm * math.sin(math.radians(_direction_deg))
+        _sensor_y = self._y_mm + self._sensor_offset_mm * math.cos(math.radians(_direction_deg))
+        _distance_cm = self._get_wall_distance_mm(_sensor_x, _sensor_y, _direction_deg, NO_WALL_DISTANCE_CM * 10) / 10
+        if self._distance_noise_cm > 0:
+            _distance_cm = max(0.0, self._random.gauss(_distance_cm, self._distance_noise_cm))
+        return _distance_cm
+
+    def get_reflected_light_intensity(self, address: str) -> int:
+        # The inverse of the default distance curve of ev3.distance_calibration
+        _distance_cm = self.get_distance_cm(address)
+        if _distance_cm >= NO_WALL_DISTANCE_CM:
+            return 0
+        _intensity = DEFAULT_INTENSITY_AT_ZERO_DISTANCE * DEFAULT_INTENSITY_FACTOR_PER_CM ** _distance_cm
+        return max(0, min(MAX_INTENSITY, int(round(_intensity))))
+
+    def get_gyro_angle(self) -> int:
+        if self._sensor_stream is not None:
+            _angle = self._sensor_stream.get_angle(self._time_sec)
+            return int(round(_angle - self._gyro_reset_angle)) if _angle is not None else 0
+        _angle = self._heading_deg + self._gyro_drift_deg_per_sec * self._time_sec
+        return int(round(_angle - self._gyro_reset_angle))
+
+    def reset_gyro(self):
+        self._gyro_reset_angle += self.get_gyro_angle()
+
+
+def _get_speed_rpm(speed) -> float:
+    # SpeedRPM, or a plain number as percent of the maximum speed
+    if isinstance(speed, (int, float)):
+        return speed * _MAX_RPM / 100
+    return speed.rpm
+
+
+def _get_wheel_speeds_rpm(steering: float, speed_rpm: float) -> tuple:
+    # As ev3dev2 MoveSteering: the inner wheel runs at (50 - |steering|) / 50 of the outer wheel speed
+    _inner_speed_rpm = speed_rpm * (50 - abs(steering)) / 50
+    if steering >= 0:
+        return (speed_rpm, _inner_speed_rpm)
+    return (_inner_speed_rpm, speed_rpm)
+
+
+def create_simulated_ev3dev2_modules(world: SimulatedEV3World) -> dict:
+    """
+    Returns the ev3dev2 modules used by the ev3 package, by module name, with the motors, sensors
+    and buttons of the given world.
+    """
+
+    class SpeedRPM(object):
+
+        def __init__(self, rpm: float):
+            self.rpm = rpm
+
+    class SimulatedMotor(object):
+
+        def __init__(self, wheel: int):
+            self._wheel = wheel
+            self.ramp_up_sp = 0
+            self.ramp_down_sp = 0
+
+        @property
+        def position(self) -> int:
+            return world.get_wheel_position_deg(self._wheel)
+
+        @property
+        def is_running(self) -> bool:
+            return world.is_moving()
+
+        def wait_until(self, state: str, timeout = None) -> bool:
+            # The simulated wheels start at once when told to run, so there is no waiting for that
+            if state != 'running':
+                raise ValueError('Waiting for motor state {} is not simulated'.format(state))
+            return world.is_moving()
+
+        def wait_until_not_moving(self, timeout = None) -> bool:
+            return world.advance_until_stopped(None if timeout is None else timeout / 1000)
+
+    class MoveSteering(object):
+
+        def __init__(self, left_motor_port: str, right_motor_port: str):
+            self.left_motor = SimulatedMotor(0)
+            self.right_motor = SimulatedMotor(1)
+
+        def on_for_degrees(self, steering, speed, degrees, brake = True, block = True):
+            _left_rpm, _right_rpm = _get_wheel_speeds_rpm(steering, _get_speed_rpm(speed))
+            if degrees < 0:
+                _left_rpm, _right_rpm = -_left_rpm, -_right_rpm
+            _fastest_dps = max(abs(_left_rpm), abs(_right_rpm)) * 6
+            if _fastest_dps == 0:
+                return
+            world.run_wheels(_left_rpm * 6, _right_rpm * 6, abs(degrees) / _fastest_dps)
+            if block:
+                world.advance_until_stopped()
+
+        def on_for_rotations(self, steering, speed, rotations, brake = True, block = True):
+            self.on_for_degrees(steering, speed, rotations * 360, brake=brake, block=block)
+
+        def on(self, steering, speed):
+            _left_rpm, _right_rpm = _get_wheel_speeds_rpm(steering, _get_speed_rpm(speed))
+            world.run_wheels(_left_rpm * 6, _right_rpm * 6)
+
+        def off(self, brake = True):
+            world.stop_wheels()
+
+        def wait_until_not_moving(self, timeout = None):
+            # As in ev3dev2, waits for both motors and does not tell whether they stopped in time
+            self.left_motor.wait_until_not_moving(timeout)
+            self.right_motor.wait_until_not_moving(timeout)
+
+    class ColorSensor(object):
+
+        def __init__(self, address: str):
+            self._address = address
+
+        @property
+        def reflected_light_intensity(self) -> int:
+            return world.get_reflected_light_intensity(self._address)
+
+    class GyroSensor(object):
+        MODE_GYRO_ANG = 'GYRO-ANG'
+
+        def __init__(self, address: str):
+            self.mode = self.MODE_GYRO_ANG
+
+        @property
+        def angle(self) -> int:
+            return world.get_gyro_angle()
+
+        def reset(self):
+            world.reset_gyro()
+
+    class Button(object):
+        # Never pressed, the simulated runs are started by code
+        enter = False
+        backspace = False
+
+    _ev3dev2 = types.ModuleType('ev3dev2')
+    _motor = types.ModuleType('ev3dev2.motor')
+    _motor.OUTPUT_A, _motor.OUTPUT_B = 'outA', 'outB'
+    _motor.MoveSteering, _motor.SpeedRPM = MoveSteering, SpeedRPM
+    _sensor = types.ModuleType('ev3dev2.sensor')
+    _lego = types.ModuleType('ev3dev2.sensor.lego')
+    _lego.ColorSensor, _lego.GyroSensor = ColorSensor, GyroSensor
+    _button = types.ModuleType('ev3dev2.button')
+    _button.Button = Button
+    return {'ev3dev2': _ev3dev2, 'ev3dev2.motor': _motor, 'ev3dev2.sensor': _sensor, 'ev3dev2.sensor.lego': _lego, 'ev3dev2.button': _button}
+
+
+@contextlib.contextmanager
+def simulated_ev3dev2(world: SimulatedEV3World):
+    """
+    Serves the simulated ev3dev2 modules of the world to the ev3 package within the with block. The ev3
+    modules that have already been imported get the simulated classes too, until the block ends, and
+    the ones imported within the block are forgotten when it ends.
+    """
+    _modules = create_simulated_ev3dev2_modules(world)
+    _names = {}
+    for _module in _modules.values():
+        _names.update({_name: _value for _name, _value in vars(_module).items() if not _name.startswith('__')})
+    _original_modules = {_name: sys.modules.get(_name) for _name in _modules}
+    _original_values = []
+    _ev3_module_names = set(_name for _name in sys.modules if _name == 'ev3' or _name.startswith('ev3.'))
+    sys.modules.update(_modules)
+    for _module_name in _ev3_module_names:
+        _module = sys.modules[_module_name]
+        for _name, _value in _names.items():
+            if _name in vars(_module):
+                _original_values.append((_module, _name, getattr(_module, _name)))
+                setattr(_module, _name, _value)
+    try:
+        yield _modules
+    finally:
+        for _module, _name, _value in _original_values:
+            setattr(_module, _name, _value)
+        # The ev3 modules imported within the block are imported again with the real ev3dev2 modules next time
+        for _module_name in [_name for _name in sys.modules if _name.startswith('ev3.') and _name not in _ev3_module_names]:
+            del sys.modules[_module_name]
+        for _name, _module in _original_modules.items():
+            if _module is None:
+                del sys.modules[_name]
+            else:
+                sys.modules[_name] = _module
@@ -0,0 +1,142 @@
+import logging
+import os
+import random
+import statistics
+from concurrent.futures import ProcessPoolExecutor
+from simulator.maze import Maze
+from simulator.maze_solving_session import SimulatorMazeSolvingSession
+
+
+def run_simulator_sessions(maze: Maze, random_seeds: list, session_kwargs: dict) -> list:
+    """
+    Runs one simulator session per given seed, one after another, and returns a list of
+    (move_count, motion_time) tuples in the same order as the seeds. This is what each
+    worker process executes, so it has to stay a picklable module level function.
+    """
+    _results = []
+    for _random_seed in random_seeds:
+        _session = SimulatorMazeSolvingSession(maze, random_seed=_random_seed, **session_kwargs)
+        _session_results = _session.start()
+        _results.append((_session_results['move_count'], _session_results['motion_time']))
+    return _results
+
+
+def summarize_session_results(maze_name: str, move_counts: list, motion_times: list, time_limit_sec: float) -> dict:
+    _below_max_time_count = 0
+    for _motion_time in motion_times:
+        if _motion_time < time_limit_sec:
+            _below_max_time_count += 1
+    _probability_of_solving_within_time_limit = _below_max_time_count * 100 / len(motion_times)
+    return {
+        'maze_name': maze_name,
+        'move_count_mean': statistics.mean(move_counts),
+        'move_count_median': statistics.median(move_counts),
+        'move_count_stdev': statistics.stdev(move_counts),
+        'move_count_min': min(move_counts),
+        'move_count_max': max(move_counts),
+        'motion_time_mean': statistics.mean(motion_times),
+        'motion_time_median': statistics.median(motion_times),
+        'motion_time_stdev': statistics.stdev(motion_times),
+        'motion_time_min': min(motion_times),
+        'motion_time_max': max(motion_times),
+        'probability_of_solving_within_time_limit': _probability_of_solving_within_time_limit
+    }
+
+
+class ExperimentRunner(object):
+    """
+    Runs a series of simulator sessions on a maze and summarizes the move counts and motion times.
+    Sessions are spread over a process pool in chunks. Every session gets its own seed, derived
+    from the experiment seed and the session index, and the results are merged back in session
+    order - so the statistics do not depend on the number of workers, and a run with workers=1
+    gives exactly the same results as a parallel run with the same seed.
+
+    The process pool is created on the first parallel run and reused by all the following runs,
+    until close() is called. The runner can also be used as a context manager.
+    """
+
+    @property
+    def sample_size(self) -> int:
+        return self._sample_size
+
+    @property
+    def time_limit_sec(self) -> float:
+        return self._time_limit_sec
+
+    @property
+    def workers(self) -> int:
+        return self._workers
+
+    def __init__(
+        self,
+        sample_size: int = 1000,
+        time_limit_sec: float = 300,
+        max_moves_per_session: int = 999,
+        workers: int = None,
+        random_seed: int = None,
+        session_runner = run_simulator_sessions,
+        executor: ProcessPoolExecutor = None,
+        logger = None
+    ):
+        self._logger = logger or logging.getLogger(__name__)
+        self._sample_size = sample_size
+        self._time_limit_sec = time_limit_sec
+        self._max_moves_per_session = max_moves_per_session
+        self._workers = workers or os.cpu_count() or 1
+        self._random_seed = random_seed if random_seed is not None else random.SystemRandom().getrandbits(32)
+        # Any picklable function with the same signature as run_simulator_sessions, 
+        # e.g. batch_simulator.run_batch_simulator_sessions.
+        self._session_runner = session_runner
+        # A given executor is shared with its owner, e.g. WeightTuner, and is not shut down on close()
+        self._executor = executor
+        self._owns_executor = executor is None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        if self._owns_executor and self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self._workers)
+        return self._executor
+
+    def get_session_seeds(self) -> list:
+        return [self._random_seed + _index for _index in range(self._sample_size)]
+
+    def _split_to_chunks(self, random_seeds: list) -> list:
+        # A few chunks per worker keeps all workers busy even if some mazes take longer.
+        _chunk_count = min(len(random_seeds), self._workers * 4)
+        _chunk_size = -(-len(random_seeds) // _chunk_count)
+        return [random_seeds[_i:_i + _chunk_size] for _i in range(0, len(random_seeds), _chunk_size)]
+
+    def run_sessions(self, maze: Maze, **session_kwargs) -> list:
+        _session_kwargs = dict(session_kwargs)
+        _session_kwargs.setdefault('max_moves', self._max_moves_per_session)
+        _random_seeds = self.get_session_seeds()
+        if self._workers <= 1:
+            return self._session_runner(maze, _random_seeds, _session_kwargs)
+        _chunks = self._split_to_chunks(_random_seeds)
+        _executor = self._get_executor()
+        _futures = [_executor.submit(self._session_runner, maze, _chunk, _session_kwargs) for _chunk in _chunks]
+        _results = []
+        for _future in _futures:
+            _results.extend(_future.result())
+        return _results
+
+    def perform_experiment(self, maze: Maze, center_coordinates: list, **session_kwargs) -> dict:
+        self._logger.info('Starting experiment on maze "{}" with {} sessions and {} workers'.format(
+            maze.name,
+            self._sample_size,
+            self._workers
+        ))
+        _results = self.run_sessions(maze, center_coordinates=center_coordinates, **session_kwargs)
+        _move_counts = [_move_count for _move_count, _ in _results]
+        _motion_times = [_motion_time for _, _motion_time in _results]
+        return summarize_session_results(maze.name, _move_counts, _motion_times, self._time_limit_sec)
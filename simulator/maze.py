@@ -49,6 +49,10 @@ class Maze(object):
     def name(self) -> str:
         return self._name
 
+    @property
+    def squares(self) -> list:
+        return self._squares
+
     def get_start_square(self) -> MazeSquare:
         return self._start_square
 
@@ -68,3 +72,203 @@ class Maze(object):
     def get_square(self, x: int, y: int) -> MazeSquare:
         _key = self.get_key_for_square(x, y)
         return self._squares_dict[_key]
+
+
+class MazePassages(object):
+    """
+    Bits of the 4-bit passage mask that FlatMaze stores per square. A set bit means that the square
+    is open in that direction. The bit order is north, east, south, west - same as in the micromouse
+    maze files, just that those store walls instead of passages.
+    """
+    Y_PLUS = 1
+    X_PLUS = 2
+    Y_MINUS = 4
+    X_MINUS = 8
+
+
+class FlatMazeSquare(object):
+    """
+    Lightweight read-only view of a FlatMaze square, with the same properties as MazeSquare.
+    It is created only when a square is asked for, the maze itself does not keep any square objects.
+    """
+    __slots__ = ('_x', '_y', '_passages', '_is_start', '_is_finish')
+
+    def __init__(self, x: int, y: int, passages: int, is_start: bool, is_finish: bool):
+        self._x = x
+        self._y = y
+        self._passages = passages
+        self._is_start = is_start
+        self._is_finish = is_finish
+
+    @property
+    def x(self) -> int:
+        return self._x
+
+    @property
+    def y(self) -> int:
+        return self._y
+
+    @property
+    def passages(self) -> int:
+        return self._passages
+
+    @property
+    def x_plus(self) -> bool:
+        return self._passages & MazePassages.X_PLUS != 0
+
+    @property
+    def x_minus(self) -> bool:
+        return self._passages & MazePassages.X_MINUS != 0
+
+    @property
+    def y_plus(self) -> bool:
+        return self._passages & MazePassages.Y_PLUS != 0
+
+    @property
+    def y_minus(self) -> bool:
+        return self._passages & MazePassages.Y_MINUS != 0
+
+    @property
+    def is_start(self) -> bool:
+        return self._is_start
+
+    @property
+    def is_finish(self) -> bool:
+        return self._is_finish
+
+
+class FlatMaze(object):
+    """
+    Maze that stores the passages of all squares as 4-bit masks packed two per byte into a bytearray,
+    indexed by (x - 1) * height + (y - 1). Squares are numbered from 1, like in Maze. It can be used
+    everywhere instead of Maze, but it takes a fraction of the memory and has no string keys, so
+    large mazes can be simulated in bulk.
+    """
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def width(self) -> int:
+        return self._width
+
+    @property
+    def height(self) -> int:
+        return self._height
+
+    @property
+    def start_x(self) -> int:
+        return self._start_x
+
+    @property
+    def start_y(self) -> int:
+        return self._start_y
+
+    @property
+    def squares(self) -> list:
+        return [self.get_square(_x, _y) for _x in range(1, self._width + 1) for _y in range(1, self._height + 1)]
+
+    def __init__(self, width: int, height: int, name: str = '', start_x: int = 1, start_y: int = 1, finish_squares: list = []):
+        self._width = width
+        self._height = height
+        self._name = name
+        self._start_x = start_x
+        self._start_y = start_y
+        self._passages = bytearray((width * height + 1) // 2)
+        self._finish_indexes = set()
+        for _x, _y in finish_squares:
+            self.set_finish(_x, _y)
+
+    @staticmethod
+    def from_maze(maze: Maze) -> 'FlatMaze':
+        return FlatMaze.from_squares(maze.squares, name=maze.name)
+
+    @staticmethod
+    def from_squares(squares: list, name: str = '') -> 'FlatMaze':
+        _width = max(_square.x for _square in squares)
+        _height = max(_square.y for _square in squares)
+        _flat_maze = FlatMaze(_width, _height, name=name)
+        for _square in squares:
+            _passages = 0
+            if _square.y_plus:
+                _passages |= MazePassages.Y_PLUS
+            if _square.x_plus:
+                _passages |= MazePassages.X_PLUS
+            if _square.y_minus:
+                _passages |= MazePassages.Y_MINUS
+            if _square.x_minus:
+                _passages |= MazePassages.X_MINUS
+            _flat_maze.set_passages(_square.x, _square.y, _passages)
+            if _square.is_start:
+                _flat_maze.set_start(_square.x, _square.y)
+            if _square.is_finish:
+                _flat_maze.set_finish(_square.x, _square.y)
+        return _flat_maze
+
+    @staticmethod
+    def from_passages(width: int, height: int, passages: bytes, name: str = '', start_x: int = 1, start_y: int = 1, finish_squares: list = []) -> 'FlatMaze':
+        """
+        Creates the maze from one passage mask per square, in index order.
+        """
+        if len(passages) != width * height:
+            raise ValueError('Expected {} passage masks, got {}'.format(width * height, len(passages)))
+        _flat_maze = FlatMaze(width, height, name=name, start_x=start_x, start_y=start_y, finish_squares=finish_squares)
+        _low = passages[0::2]
+        _high = passages[1::2]
+        _packed = bytes((_low[_i] & 0x0F) | ((_high[_i] & 0x0F) << 4) for _i in range(len(_high)))
+        if len(_low) > len(_high):
+            _packed += bytes([_low[-1] & 0x0F])
+        _flat_maze._passages[:] = _packed
+        return _flat_maze
+
+    def get_all_passages(self) -> bytes:
+        """
+        Returns one passage mask per square, in index order.
+        """
+        _unpacked = bytearray(len(self._passages) * 2)
+        _unpacked[0::2] = bytes(_byte & 0x0F for _byte in self._passages)
+        _unpacked[1::2] = bytes(_byte >> 4 for _byte in self._passages)
+        return bytes(_unpacked[:self._width * self._height])
+
+    def get_index(self, x: int, y: int) -> int:
+        if x < 1 or x > self._width or y < 1 or y > self._height:
+            raise KeyError('Square x={}, y={} is outside of the maze'.format(x, y))
+        return (x - 1) * self._height + (y - 1)
+
+    def get_passages(self, x: int, y: int) -> int:
+        _index = self.get_index(x, y)
+        return (self._passages[_index >> 1] >> ((_index & 1) << 2)) & 0x0F
+
+    def set_passages(self, x: int, y: int, passages: int):
+        _index = self.get_index(x, y)
+        _shift = (_index & 1) << 2
+        _byte = self._passages[_index >> 1] & ~(0x0F << _shift)
+        self._passages[_index >> 1] = _byte | ((passages & 0x0F) << _shift)
+
+    def set_start(self, x: int, y: int):
+        self.get_index(x, y)
+        self._start_x = x
+        self._start_y = y
+
+    def set_finish(self, x: int, y: int):
+        self._finish_indexes.add(self.get_index(x, y))
+
+    def is_finish(self, x: int, y: int) -> bool:
+        return self.get_index(x, y) in self._finish_indexes
+
+    def get_finish_squares(self) -> list:
+        return [(_index // self._height + 1, _index % self._height + 1) for _index in sorted(self._finish_indexes)]
+
+    def get_start_square(self) -> FlatMazeSquare:
+        return self.get_square(self._start_x, self._start_y)
+
+    def get_square(self, x: int, y: int) -> FlatMazeSquare:
+        _index = self.get_index(x, y)
+        return FlatMazeSquare(
+            x, 
+            y, 
+            (self._passages[_index >> 1] >> ((_index & 1) << 2)) & 0x0F,
+            x == self._start_x and y == self._start_y,
+            _index in self._finish_indexes
+        )
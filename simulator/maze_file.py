@@ -0,0 +1,253 @@
+import struct
+from simulator.maze import FlatMaze, MazePassages
+
+# Binary maze record: header, finish squares as (x, y) byte pairs, utf-8 name, and one wall mask per
+# square in the micromouse .maz layout - column by column from x=1, each column from y=1 upwards,
+# walls as bits north=1, east=2, south=4, west=8. A corpus file is just records one after another.
+BINARY_MAGIC = b'MAZ1'
+_BINARY_HEADER = struct.Struct('<4sBBBBBH')
+# Walls and passages use the same bits, so one table converts both ways
+_INVERT_NIBBLE = bytes((~_byte) & 0x0F for _byte in range(256))
+
+# ASCII art maze: rows from top (y=height) to bottom, a square is 4 characters wide and a row of
+# squares is drawn between two wall lines, e.g.
+#
+# # name: Minimal 2-to-2
+# +---+---+
+# |   | F |
+# +   +   +
+# | S     |
+# +---+---+
+#
+# A wall that can be passed in one direction only is drawn as an arrow: '>' or '<' between two
+# squares in a row, '^' or 'v' in the middle of a wall line. A passage out of the maze is drawn the
+# same way in the outer wall. 'S' and 'F' inside a square mark the start and finish squares.
+# Lines starting with '#' are comments, except '# name: ...' that names the maze that follows.
+# Several mazes can be put into one file.
+_NAME_PREFIX = '# name:'
+
+
+def format_ascii_maze(maze: FlatMaze) -> str:
+    _width = maze.width
+    _height = maze.height
+    _finish_squares = set(maze.get_finish_squares())
+    _lines = []
+    if maze.name:
+        _lines.append('{} {}'.format(_NAME_PREFIX, maze.name))
+
+    def _format_wall_line(y_below: int) -> str:
+        # Wall line above the row y_below, y_below = 0 and y_below = height mean the outer walls
+        _line = '+'
+        for _x in range(1, _width + 1):
+            _up = y_below >= 1 and maze.get_passages(_x, y_below) & MazePassages.Y_PLUS != 0
+            _down = y_below < _height and maze.get_passages(_x, y_below + 1) & MazePassages.Y_MINUS != 0
+            if _up and _down and 1 <= y_below < _height:
+                _line += '   '
+            elif _up:
+                _line += ' ^ '
+            elif _down:
+                _line += ' v '
+            else:
+                _line += '---'
+            _line += '+'
+        return _line
+
+    _lines.append(_format_wall_line(_height))
+    for _y in range(_height, 0, -1):
+        _line = ''
+        for _x in range(0, _width + 1):
+            _right = _x >= 1 and maze.get_passages(_x, _y) & MazePassages.X_PLUS != 0
+            _left = _x < _width and maze.get_passages(_x + 1, _y) & MazePassages.X_MINUS != 0
+            if _right and _left and 1 <= _x < _width:
+                _line += ' '
+            elif _right:
+                _line += '>'
+            elif _left:
+                _line += '<'
+            else:
+                _line += '|'
+            if _x < _width:
+                _is_start = _x + 1 == maze.start_x and _y == maze.start_y
+                _is_finish = (_x + 1, _y) in _finish_squares
+                _line += 'S F' if _is_start and _is_finish else ' S ' if _is_start else ' F ' if _is_finish else '   '
+        _lines.append(_line)
+        _lines.append(_format_wall_line(_y - 1))
+    return '\n'.join(_lines) + '\n'
+
+
+def _parse_ascii_maze(name: str, lines: list, first_line_number: int) -> FlatMaze:
+    _width = (len(lines[0]) - 1) // 4
+    _height = (len(lines) - 1) // 2
+    if _width < 1 or _height < 1 or len(lines) != _height * 2 + 1:
+        raise ValueError('Maze at line {} is not complete'.format(first_line_number))
+    _line_length = _width * 4 + 1
+    _lines = [_line.ljust(_line_length) for _line in lines]
+    for _line_offset, _line in enumerate(_lines):
+        if len(_line) != _line_length:
+            raise ValueError('Line {} should be {} characters long'.format(first_line_number + _line_offset, _line_length))
+    _passages = bytearray(_width * _height)
+    _start = (1, 1)
+    _finish_squares = []
+    for _row in range(_height):
+        _y = _height - _row
+        _above = _lines[_row * 2]
+        _squares = _lines[_row * 2 + 1]
+        _below = _lines[_row * 2 + 2]
+        for _x in range(1, _width + 1):
+            _column = (_x - 1) * 4
+            _mask = 0
+            if _above[_column + 2] in ' ^':
+                _mask |= MazePassages.Y_PLUS
+            if _below[_column + 2] in ' v':
+                _mask |= MazePassages.Y_MINUS
+            if _squares[_column] in ' <':
+                _mask |= MazePassages.X_MINUS
+            if _squares[_column + 4] in ' >':
+                _mask |= MazePassages.X_PLUS
+            _passages[(_x - 1) * _height + (_y - 1)] = _mask
+            _content = _squares[_column + 1:_column + 4]
+            if 'S' in _content:
+                _start = (_x, _y)
+            if 'F' in _content:
+                _finish_squares.append((_x, _y))
+    return FlatMaze.from_passages(
+        _width,
+        _height,
+        bytes(_passages),
+        name=name,
+        start_x=_start[0],
+        start_y=_start[1],
+        finish_squares=_finish_squares
+    )
+
+
+def read_ascii_mazes(lines):
+    """
+    Reads mazes from any iterable of text lines, e.g. an open file, and yields them one by one as
+    FlatMazes. Mazes are separated by empty or comment lines.
+    """
+    _name = ''
+    _maze_lines = []
+    _first_line_number = 0
+    for _line_number, _line in enumerate(lines, start=1):
+        _line = _line.rstrip('\r\n')
+        if _line.strip() == '' or _line.startswith('#'):
+            if _maze_lines:
+                yield _parse_ascii_maze(_name, _maze_lines, _first_line_number)
+                _name = ''
+                _maze_lines = []
+            if _line.startswith(_NAME_PREFIX):
+                _name = _line[len(_NAME_PREFIX):].strip()
+            continue
+        if not _maze_lines:
+            _first_line_number = _line_number
+        _maze_lines.append(_line.rstrip())
+    if _maze_lines:
+        yield _parse_ascii_maze(_name, _maze_lines, _first_line_number)
+
+
+def format_binary_maze(maze: FlatMaze) -> bytes:
+    _name = maze.name.encode('utf-8')
+    _finish_squares = maze.get_finish_squares()
+    _record = bytearray(_BINARY_HEADER.pack(
+        BINARY_MAGIC,
+        maze.width,
+        maze.height,
+        maze.start_x,
+        maze.start_y,
+        len(_finish_squares),
+        len(_name)
+    ))
+    for _x, _y in _finish_squares:
+        _record += bytes((_x, _y))
+    _record += _name
+    _record += maze.get_all_passages().translate(_INVERT_NIBBLE)
+    return bytes(_record)
+
+
+def _read_exactly(stream, size: int) -> bytes:
+    _data = stream.read(size)
+    if len(_data) != size:
+        raise ValueError('Unexpected end of maze file')
+    return _data
+
+
+def read_binary_mazes(stream):
+    """
+    Reads maze records from a binary stream and yields them one by one as FlatMazes.
+    """
+    while True:
+        _header = stream.read(_BINARY_HEADER.size)
+        if not _header:
+            return
+        if len(_header) != _BINARY_HEADER.size:
+            raise ValueError('Unexpected end of maze file')
+        _magic, _width, _height, _start_x, _start_y, _finish_count, _name_length = _BINARY_HEADER.unpack(_header)
+        if _magic != BINARY_MAGIC:
+            raise ValueError('Not a maze record: {}'.format(_magic))
+        _finish_bytes = _read_exactly(stream, _finish_count * 2)
+        _name = _read_exactly(stream, _name_length).decode('utf-8')
+        _walls = _read_exactly(stream, _width * _height)
+        yield FlatMaze.from_passages(
+            _width,
+            _height,
+            _walls.translate(_INVERT_NIBBLE),
+            name=_name,
+            start_x=_start_x,
+            start_y=_start_y,
+            finish_squares=list(zip(_finish_bytes[0::2], _finish_bytes[1::2]))
+        )
+
+
+def parse_micromouse_maze(data: bytes, name: str = '') -> FlatMaze:
+    """
+    Parses a plain micromouse .maz file, that has only the walls of a square maze. The start square
+    is the bottom left corner and the finish squares are the center squares, as in the competitions.
+    """
+    _size = int(round(len(data) ** 0.5))
+    if _size * _size != len(data) or _size < 2:
+        raise ValueError('A .maz file of {} bytes is not a square maze'.format(len(data)))
+    _center = [_size // 2, _size // 2 + 1] if _size % 2 == 0 else [_size // 2 + 1]
+    return FlatMaze.from_passages(
+        _size,
+        _size,
+        data.translate(_INVERT_NIBBLE),
+        name=name,
+        finish_squares=[(_x, _y) for _x in _center for _y in _center]
+    )
+
+
+def load_mazes(path: str) -> list:
+    """
+    Loads all mazes from a file: ASCII art from a .txt file, otherwise binary maze records or a plain
+    micromouse .maz file.
+    """
+    if path.endswith('.txt'):
+        with open(path, 'r', encoding='utf-8') as _file:
+            return list(read_ascii_mazes(_file))
+    with open(path, 'rb') as _file:
+        if _file.read(len(BINARY_MAGIC)) != BINARY_MAGIC:
+            _file.seek(0)
+            return [parse_micromouse_maze(_file.read())]
+        _file.seek(0)
+        return list(read_binary_mazes(_file))
+
+
+def load_maze(path: str) -> FlatMaze:
+    _mazes = load_mazes(path)
+    if len(_mazes) != 1:
+        raise ValueError('Expected one maze in {}, found {}'.format(path, len(_mazes)))
+    return _mazes[0]
+
+
+def save_mazes(path: str, mazes: list):
+    """
+    Saves the mazes as ASCII art if the path ends with .txt, otherwise as binary maze records.
+    """
+    if path.endswith('.txt'):
+        with open(path, 'w', encoding='utf-8') as _file:
+            _file.write('\n'.join(format_ascii_maze(_maze) for _maze in mazes))
+    else:
+        with open(path, 'wb') as _file:
+            for _maze in mazes:
+                _file.write(format_binary_maze(_maze))
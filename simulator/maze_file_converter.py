@@ -0,0 +1,22 @@
+import sys
+from simulator.maze_file import load_mazes, save_mazes
+
+
+def convert_maze_files(input_paths: list, output_path: str) -> int:
+    """
+    Loads all mazes from the input files and saves them into one output file, the formats are
+    chosen by file name as in load_mazes and save_mazes. Returns the number of mazes converted.
+    """
+    _mazes = []
+    for _input_path in input_paths:
+        _mazes.extend(load_mazes(_input_path))
+    save_mazes(output_path, _mazes)
+    return len(_mazes)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 3:
+        print('Usage: python -m simulator.maze_file_converter INPUT_FILE... OUTPUT_FILE')
+        sys.exit(1)
+    _count = convert_maze_files(sys.argv[1:-1], sys.argv[-1])
+    print('Converted {} mazes to {}'.format(_count, sys.argv[-1]))
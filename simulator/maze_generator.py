@@ -0,0 +1,216 @@
+import random
+from simulator.maze import FlatMaze, MazePassages
+
+
+class MazeGeneratorAlgorithm(object):
+    RECURSIVE_BACKTRACKER = 'recursive_backtracker'
+    KRUSKAL = 'kruskal'
+    WILSON = 'wilson'
+
+
+class MazeGenerator(object):
+    """
+    Generates random mazes of any size as FlatMazes, for building benchmark sets of mazes on the fly.
+    The center squares, given as center_coordinates like for the maze solvers, form an open goal
+    region that has exactly one entrance, as in Robotex mazes, and they are the finish squares.
+    The start square is (1, 1).
+
+    The mazes are perfect - there is exactly one path between any two squares - unless loop_ratio is
+    given: then that share of the remaining inner walls outside the goal region is removed at random,
+    which creates loops. All passages are open from both sides.
+
+    The same random_seed gives the same sequence of mazes.
+    """
+
+    @property
+    def width(self) -> int:
+        return self._width
+
+    @property
+    def height(self) -> int:
+        return self._height
+
+    @property
+    def algorithm(self) -> str:
+        return self._algorithm
+
+    @property
+    def loop_ratio(self) -> float:
+        return self._loop_ratio
+
+    def __init__(
+        self,
+        width: int = 16,
+        height: int = 16,
+        center_coordinates: list = [8, 9],
+        algorithm: str = MazeGeneratorAlgorithm.RECURSIVE_BACKTRACKER,
+        loop_ratio: float = 0.0,
+        random_seed: int = None
+    ):
+        self._generate_functions = {
+            MazeGeneratorAlgorithm.RECURSIVE_BACKTRACKER: self._carve_recursive_backtracker,
+            MazeGeneratorAlgorithm.KRUSKAL: self._carve_kruskal,
+            MazeGeneratorAlgorithm.WILSON: self._carve_wilson
+        }
+        if algorithm not in self._generate_functions:
+            raise ValueError('Unknown maze generator algorithm: {}'.format(algorithm))
+        if not 0.0 <= loop_ratio <= 1.0:
+            raise ValueError('Loop ratio must be between 0 and 1, got {}'.format(loop_ratio))
+        self._width = width
+        self._height = height
+        self._algorithm = algorithm
+        self._loop_ratio = loop_ratio
+        self._random = random.Random(random_seed)
+        self._generated_count = 0
+        self._goal_squares = [
+            (_x, _y) for _x in center_coordinates for _y in center_coordinates
+            if 1 <= _x <= width and 1 <= _y <= height
+        ]
+        self._goal_indexes = set(self._get_index(_x, _y) for _x, _y in self._goal_squares)
+        if len(self._goal_indexes) >= width * height - 1:
+            raise ValueError('Maze of {}x{} is too small for center {}'.format(width, height, center_coordinates))
+        self._create_neighbour_tables()
+
+    def _get_index(self, x: int, y: int) -> int:
+        return (x - 1) * self._height + (y - 1)
+
+    def _create_neighbour_tables(self):
+        # Neighbour tables are the same for every maze, so they are created only once
+        _height = self._height
+        _square_count = self._width * _height
+        self._neighbours = [[] for _ in range(_square_count)]
+        # Inner walls as (index, neighbour index, passage bit, back passage bit), each wall once
+        self._inner_walls = []
+        for _x in range(1, self._width + 1):
+            for _y in range(1, _height + 1):
+                _index = self._get_index(_x, _y)
+                if _y < _height:
+                    self._inner_walls.append((_index, _index + 1, MazePassages.Y_PLUS, MazePassages.Y_MINUS))
+                if _x < self._width:
+                    self._inner_walls.append((_index, _index + _height, MazePassages.X_PLUS, MazePassages.X_MINUS))
+        self._goal_walls = [
+            _wall for _wall in self._inner_walls
+            if _wall[0] in self._goal_indexes and _wall[1] in self._goal_indexes
+        ]
+        self._entrance_walls = [
+            _wall for _wall in self._inner_walls
+            if (_wall[0] in self._goal_indexes) != (_wall[1] in self._goal_indexes)
+        ]
+        self._other_walls = [
+            _wall for _wall in self._inner_walls
+            if _wall[0] not in self._goal_indexes and _wall[1] not in self._goal_indexes
+        ]
+        for _index, _neighbour, _bit, _back_bit in self._other_walls:
+            self._neighbours[_index].append((_neighbour, _bit, _back_bit))
+            self._neighbours[_neighbour].append((_index, _back_bit, _bit))
+        self._neighbours = [tuple(_neighbours) for _neighbours in self._neighbours]
+        self._other_indexes = [_index for _index in range(_square_count) if _index not in self._goal_indexes]
+
+    def _shuffle(self, items: list):
+        # Fisher-Yates with random() is about twice as fast as Random.shuffle, that draws random bits
+        _random = self._random.random
+        for _i in range(len(items) - 1, 0, -1):
+            _j = int(_random() * (_i + 1))
+            items[_i], items[_j] = items[_j], items[_i]
+
+    def _carve_recursive_backtracker(self, passages: bytearray):
+        _random = self._random.random
+        _neighbours = self._neighbours
+        _visited = bytearray(len(passages))
+        for _index in self._goal_indexes:
+            _visited[_index] = 1
+        _start = self._other_indexes[int(_random() * len(self._other_indexes))]
+        _visited[_start] = 1
+        _stack = [_start]
+        while _stack:
+            _index = _stack[-1]
+            _options = [_neighbour for _neighbour in _neighbours[_index] if not _visited[_neighbour[0]]]
+            if not _options:
+                _stack.pop()
+                continue
+            _neighbour, _bit, _back_bit = _options[int(_random() * len(_options))]
+            passages[_index] |= _bit
+            passages[_neighbour] |= _back_bit
+            _visited[_neighbour] = 1
+            _stack.append(_neighbour)
+
+    def _carve_kruskal(self, passages: bytearray):
+        _parents = list(range(len(passages)))
+        _walls = list(self._other_walls)
+        self._shuffle(_walls)
+        _remaining_joins = len(self._other_indexes) - 1
+        for _index, _neighbour, _bit, _back_bit in _walls:
+            _root = _index
+            while _parents[_root] != _root:
+                _parents[_root] = _parents[_parents[_root]]
+                _root = _parents[_root]
+            _neighbour_root = _neighbour
+            while _parents[_neighbour_root] != _neighbour_root:
+                _parents[_neighbour_root] = _parents[_parents[_neighbour_root]]
+                _neighbour_root = _parents[_neighbour_root]
+            if _root == _neighbour_root:
+                continue
+            _parents[_root] = _neighbour_root
+            passages[_index] |= _bit
+            passages[_neighbour] |= _back_bit
+            _remaining_joins -= 1
+            if _remaining_joins == 0:
+                return
+
+    def _carve_wilson(self, passages: bytearray):
+        # Loop-erased random walks: the walk remembers only the last exit from each square,
+        # which erases the loops, and is carved into the maze when it hits the maze so far
+        _random = self._random.random
+        _neighbours = self._neighbours
+        _in_maze = bytearray(len(passages))
+        _exits = [None] * len(passages)
+        _other_indexes = list(self._other_indexes)
+        self._shuffle(_other_indexes)
+        _in_maze[_other_indexes[0]] = 1
+        for _walk_start in _other_indexes[1:]:
+            if _in_maze[_walk_start]:
+                continue
+            _index = _walk_start
+            while not _in_maze[_index]:
+                _options = _neighbours[_index]
+                _exit = _options[int(_random() * len(_options))]
+                _exits[_index] = _exit
+                _index = _exit[0]
+            _index = _walk_start
+            while not _in_maze[_index]:
+                _neighbour, _bit, _back_bit = _exits[_index]
+                passages[_index] |= _bit
+                passages[_neighbour] |= _back_bit
+                _in_maze[_index] = 1
+                _index = _neighbour
+
+    def _add_loops(self, passages: bytearray):
+        _closed_walls = [_wall for _wall in self._other_walls if not passages[_wall[0]] & _wall[2]]
+        _loop_count = int(round(len(_closed_walls) * self._loop_ratio))
+        for _index, _neighbour, _bit, _back_bit in self._random.sample(_closed_walls, _loop_count):
+            passages[_index] |= _bit
+            passages[_neighbour] |= _back_bit
+
+    def generate(self, name: str = None) -> FlatMaze:
+        _passages = bytearray(self._width * self._height)
+        self._generate_functions[self._algorithm](_passages)
+        for _index, _neighbour, _bit, _back_bit in self._goal_walls:
+            _passages[_index] |= _bit
+            _passages[_neighbour] |= _back_bit
+        if self._entrance_walls:
+            _index, _neighbour, _bit, _back_bit = self._entrance_walls[int(self._random.random() * len(self._entrance_walls))]
+            _passages[_index] |= _bit
+            _passages[_neighbour] |= _back_bit
+        if self._loop_ratio > 0:
+            self._add_loops(_passages)
+        self._generated_count += 1
+        if name is None:
+            name = 'Generated {}x{} {} #{}'.format(self._width, self._height, self._algorithm, self._generated_count)
+        return FlatMaze.from_passages(self._width, self._height, bytes(_passages), name=name, finish_squares=self._goal_squares)
+
+    def generate_many(self, count: int):
+        """
+        Yields the given number of new mazes, one at a time.
+        """
+        for _ in range(count):
+            yield self.generate()
@@ -1,9 +1,16 @@
 import logging
+from operator import attrgetter
+from maze_solver import headings
 from maze_solver.direction import Direction
 from maze_solver.maze_solver import MazeSolver, NotificationType
 from maze_solver.curious_maze_solver import CuriousMazeSolver
 from simulator.maze import Maze, MazeSquare
+from maze_solver.route_planner import MotorCommand
 from simulator.simulator import SimulatorMotors, SimulatorFinishDetector, SimulatorWallDetector, SimulatorOutputs
+from simulator.motion_model import MotionModel
+
+# Whether a maze square is open towards each heading
+_PASSAGE_GETTERS = (attrgetter('y_plus'), attrgetter('x_plus'), attrgetter('y_minus'), attrgetter('x_minus'))
 
 
 class MazeSolvingSession(object):
@@ -14,19 +21,23 @@ class MazeSolvingSession(object):
 
     @property
     def current_direction(self) -> Direction:
-        return self._current_direction
+        return Direction.from_heading(self._heading)
 
     @property
     def move_count(self) -> int:
         return self._move_count
 
+    @property
+    def maze_solver(self) -> MazeSolver:
+        return self._maze_solver
+
     def __init__(self, maze: Maze, maze_solver: MazeSolver, max_moves: int = 9999, logger = None):
         self._logger = logger or logging.getLogger(__name__)
         self._maze = maze
         self._maze_solver = maze_solver
         self._max_moves = max_moves
         self._current_square = self._maze.get_start_square()
-        self._current_direction = Direction.NORTH
+        self._heading = headings.NORTH
         self._move_count = 0
 
     def start(self) -> int:
@@ -39,21 +50,25 @@ class MazeSolvingSession(object):
 
 
 class SimulatorMazeSolvingSession(MazeSolvingSession):
+    """
+    Simulates a CuriousMazeSolver session by default. Any other maze solver can be simulated by giving a
+    maze_solver_factory: a callable that takes the motors, wall_detector, finish_detector, outputs and
+    random_seed keyword arguments and returns a MazeSolver, e.g. a functools.partial of the solver class.
+    Then the CuriousMazeSolver weights, center_coordinates and fill_dead_ends are not used.
 
-    def create_simulator_maze_solver(
-        self,
-        prefer_non_dead_ends_weight,
-        prefer_unvisited_paths_weight,
-        prefer_closer_to_center_weight,
-        prefer_no_turns_weight,
-        center_coordinates,
-    ):
+    The motion time is told by the motion_model, by default a MotionModel with a fixed time per move.
+    """
+
+    def create_simulator_interfaces(self) -> dict:
         _motors = SimulatorMotors(
             move_forward_callback=self.move_forward, 
             turn_right_callback=self.turn_right, 
             turn_left_callback=self.turn_left, 
             turn_back_callback=self.turn_back, 
-            no_turn_callback=self.no_turn
+            no_turn_callback=self.no_turn,
+            move_forward_squares_callback=self.move_forward_squares,
+            arc_turn_right_callback=self.arc_turn_right,
+            arc_turn_left_callback=self.arc_turn_left
         )
         _wall_detector = SimulatorWallDetector(
             is_left_blocked_callback=self.is_left_blocked, 
@@ -62,16 +77,34 @@ class SimulatorMazeSolvingSession(MazeSolvingSession):
         )
         _finish_detector = SimulatorFinishDetector(is_finish_callback=self.is_finish)
         _outputs = SimulatorOutputs(notify_callback=self.notify)
+        return {
+            'motors': _motors,
+            'wall_detector': _wall_detector,
+            'finish_detector': _finish_detector,
+            'outputs': _outputs
+        }
+
+    def create_simulator_maze_solver(
+        self,
+        prefer_non_dead_ends_weight,
+        prefer_unvisited_paths_weight,
+        prefer_closer_to_center_weight,
+        prefer_no_turns_weight,
+        center_coordinates,
+        random_seed = None,
+        prefer_no_loops_weight = 0,
+        fill_dead_ends = False
+    ):
         return CuriousMazeSolver(
-            motors=_motors, 
-            wall_detector=_wall_detector, 
-            finish_detector=_finish_detector, 
-            outputs=_outputs,
+            **self.create_simulator_interfaces(),
             prefer_non_dead_ends_weight=prefer_non_dead_ends_weight,
             prefer_unvisited_paths_weight=prefer_unvisited_paths_weight,
             prefer_closer_to_center_weight=prefer_closer_to_center_weight,
             prefer_no_turns_weight=prefer_no_turns_weight,
-            center_coordinates=center_coordinates
+            prefer_no_loops_weight=prefer_no_loops_weight,
+            center_coordinates=center_coordinates,
+            random_seed=random_seed,
+            fill_dead_ends=fill_dead_ends
         )
 
     # TODO: make the parameters kwargs
@@ -82,72 +115,91 @@ class SimulatorMazeSolvingSession(MazeSolvingSession):
         prefer_unvisited_paths_weight: int = 2,
         prefer_closer_to_center_weight: int = 3,
         prefer_no_turns_weight: int = 1,
+        prefer_no_loops_weight: int = 0,
         max_moves: int = 999,
         center_coordinates: list = [8, 9],
-        logger=None
+        random_seed: int = None,
+        maze_solver_factory = None,
+        motion_model: MotionModel = None,
+        logger=None,
+        fill_dead_ends: bool = False
     ):
         self._logger = logger or logging.getLogger(__name__)
-        # These are the supposed average times it would take to move, 
-        # if it was a real physical thing.
-        # TODO: make these parameters
-        self._FORWARD_MOTION_TIME_SECONDS = 1.1
-        self._TURN_MOTION_TIME_SECONDS = 0.9
-        self._BACK_TURN_MOTION_TIME_SECONDS = 1.7
-
-        _simulator_maze_solver = self.create_simulator_maze_solver(
-            prefer_non_dead_ends_weight,
-            prefer_unvisited_paths_weight,
-            prefer_closer_to_center_weight,
-            prefer_no_turns_weight,
-            center_coordinates
-        )
+        self._motion_model = motion_model or MotionModel()
+
+        if maze_solver_factory is None:
+            _simulator_maze_solver = self.create_simulator_maze_solver(
+                prefer_non_dead_ends_weight,
+                prefer_unvisited_paths_weight,
+                prefer_closer_to_center_weight,
+                prefer_no_turns_weight,
+                center_coordinates,
+                random_seed,
+                prefer_no_loops_weight,
+                fill_dead_ends
+            )
+        else:
+            _simulator_maze_solver = maze_solver_factory(random_seed=random_seed, **self.create_simulator_interfaces())
         self._motion_time_in_seconds = 0
         super().__init__(maze, _simulator_maze_solver, max_moves=max_moves)
 
     def is_direction_from_current_square_blocked(self, direction: Direction) -> bool:
-        if direction.value['x'] == 1:
-            return not self._current_square.x_plus
-        elif direction.value['x'] == -1:
-            return not self._current_square.x_minus
-        elif direction.value['y'] == 1:
-            return not self._current_square.y_plus
-        elif direction.value['y'] == -1:
-            return not self._current_square.y_minus
-        return True
+        return self._is_blocked_towards(direction.heading)
 
-    def move_forward(self):
-        _next_x = self._current_square.x + self._current_direction.value['x']
-        _next_y = self._current_square.y + self._current_direction.value['y']
+    def _is_blocked_towards(self, heading: int) -> bool:
+        return not _PASSAGE_GETTERS[heading](self._current_square)
+
+    def _move_to_next_square(self):
+        _next_x = self._current_square.x + headings.DX[self._heading]
+        _next_y = self._current_square.y + headings.DY[self._heading]
         self._current_square = self._maze.get_square(x = _next_x, y = _next_y)
-        self._motion_time_in_seconds += self._FORWARD_MOTION_TIME_SECONDS
         self._logger.debug('Maze solver moving to square x={}, y={}'.format(_next_x, _next_y))
 
+    def move_forward(self):
+        self._move_to_next_square()
+        self._motion_time_in_seconds += self._motion_model.get_forward_time(1)
+
+    def move_forward_squares(self, square_count: int):
+        for _ in range(square_count):
+            self._move_to_next_square()
+        self._motion_time_in_seconds += self._motion_model.get_forward_time(square_count)
+
     def turn_right(self):
-        self._current_direction = self._current_direction.get_right_direction()
-        self._motion_time_in_seconds += self._TURN_MOTION_TIME_SECONDS
+        self._heading = headings.RIGHT_OF[self._heading]
+        self._motion_time_in_seconds += self._motion_model.get_turn_time(MotorCommand.TURN_RIGHT)
 
     def turn_left(self):
-        self._current_direction = self._current_direction.get_left_direction()
-        self._motion_time_in_seconds += self._TURN_MOTION_TIME_SECONDS
+        self._heading = headings.LEFT_OF[self._heading]
+        self._motion_time_in_seconds += self._motion_model.get_turn_time(MotorCommand.TURN_LEFT)
 
     def turn_back(self):
-        self._current_direction = self._current_direction.get_back_direction()
-        self._motion_time_in_seconds += self._BACK_TURN_MOTION_TIME_SECONDS
+        self._heading = headings.BACK_OF[self._heading]
+        self._motion_time_in_seconds += self._motion_model.get_turn_time(MotorCommand.TURN_BACK)
+
+    def arc_turn_right(self):
+        self._move_to_next_square()
+        self._heading = headings.RIGHT_OF[self._heading]
+        self._move_to_next_square()
+        self._motion_time_in_seconds += self._motion_model.get_turn_time(MotorCommand.ARC_TURN_RIGHT)
+
+    def arc_turn_left(self):
+        self._move_to_next_square()
+        self._heading = headings.LEFT_OF[self._heading]
+        self._move_to_next_square()
+        self._motion_time_in_seconds += self._motion_model.get_turn_time(MotorCommand.ARC_TURN_LEFT)
 
     def no_turn(self):
         # Don't do anything
         pass
 
     def is_left_blocked(self) -> bool:
-        _direction = self._current_direction.get_left_direction()
-        return self.is_direction_from_current_square_blocked(_direction)
+        return self._is_blocked_towards(headings.LEFT_OF[self._heading])
     
     def is_front_blocked(self) -> bool:
-        return self.is_direction_from_current_square_blocked(self._current_direction)
+        return self._is_blocked_towards(self._heading)
     
     def is_right_blocked(self) -> bool:
-        _direction = self._current_direction.get_right_direction()
-        return self.is_direction_from_current_square_blocked(_direction)
+        return self._is_blocked_towards(headings.RIGHT_OF[self._heading])
 
     def is_finish(self) -> bool:
         return self._current_square.is_finish
@@ -0,0 +1,295 @@
+import datetime
+import json
+import math
+import re
+import statistics
+from maze_solver.route_planner import MotorCommand, FORWARD_MOTION_TIME_SECONDS, TURN_MOTION_TIME_SECONDS, BACK_TURN_MOTION_TIME_SECONDS
+
+
+class MotionModel(object):
+    """
+    Tells the simulator how long the moves of the robot take. This one has a fixed time per square
+    and per turn, any other model can be plugged into the simulator by overriding the methods.
+    An arc turn takes as long as the forward move, turn and forward move that it replaces.
+    """
+
+    def __init__(
+        self,
+        forward_motion_time: float = FORWARD_MOTION_TIME_SECONDS,
+        turn_motion_time: float = TURN_MOTION_TIME_SECONDS,
+        back_turn_motion_time: float = BACK_TURN_MOTION_TIME_SECONDS
+    ):
+        self._forward_motion_time = forward_motion_time
+        self._turn_motion_time = turn_motion_time
+        self._back_turn_motion_time = back_turn_motion_time
+
+    def get_forward_time(self, square_count: int = 1) -> float:
+        return square_count * self._forward_motion_time
+
+    def get_turn_time(self, command: MotorCommand) -> float:
+        if command == MotorCommand.TURN_BACK:
+            return self._back_turn_motion_time
+        if command in (MotorCommand.ARC_TURN_LEFT, MotorCommand.ARC_TURN_RIGHT):
+            return 2 * self._forward_motion_time + self._turn_motion_time
+        return self._turn_motion_time
+
+    def get_side_turn_time(self) -> float:
+        """
+        Returns the mean time of a left and a right turn, e.g. for RoutePlanner that does not tell them apart.
+        """
+        return (self.get_turn_time(MotorCommand.TURN_LEFT) + self.get_turn_time(MotorCommand.TURN_RIGHT)) / 2
+
+
+def get_profile_time(distance_mm: float, max_speed_mm_per_sec: float, acceleration_mm_per_sec2: float) -> float:
+    """
+    Returns the time to move the distance from standstill to standstill, accelerating and braking at
+    the given rate. Short moves never reach the maximum speed.
+    """
+    if distance_mm <= 0:
+        return 0.0
+    _ramp_distance_mm = max_speed_mm_per_sec * max_speed_mm_per_sec / acceleration_mm_per_sec2
+    if distance_mm < _ramp_distance_mm:
+        return 2 * math.sqrt(distance_mm / acceleration_mm_per_sec2)
+    return distance_mm / max_speed_mm_per_sec + max_speed_mm_per_sec / acceleration_mm_per_sec2
+
+
+class ProfiledMotionModel(MotionModel):
+    """
+    Motion times of the EV3 robot, as can be fitted from its log files with fit_motion_model. Forward
+    moves accelerate and brake, so merged straights take less time per square than single moves,
+    and every move ends with a stop time for the motors and sensors to settle. Left, right and arc
+    turns have their own times; a back turn is two side turns to the same random side.
+
+    The position corrections and the recoveries from hitting a wall are added as expected values,
+    i.e. their probability times their time, so the motion time of a session stays deterministic
+    and equal in SimulatorMazeSolvingSession and BatchSimulator.
+    """
+
+    _FIELDS = (
+        'square_length_mm', 'max_speed_mm_per_sec', 'acceleration_mm_per_sec2', 'stop_time_sec',
+        'turn_left_time_sec', 'turn_right_time_sec', 'arc_turn_time_sec',
+        'forward_correction_probability', 'forward_correction_time_sec',
+        'turn_correction_probability', 'turn_correction_time_sec',
+        'hit_wall_probability_per_square', 'hit_wall_recovery_time_sec'
+    )
+
+    def __init__(
+        self,
+        square_length_mm: float = 180.0,
+        max_speed_mm_per_sec: float = 176.0,
+        acceleration_mm_per_sec2: float = 600.0,
+        stop_time_sec: float = 0.1,
+        turn_left_time_sec: float = 0.8,
+        turn_right_time_sec: float = 0.8,
+        arc_turn_time_sec: float = None,
+        forward_correction_probability: float = 0.0,
+        forward_correction_time_sec: float = 0.0,
+        turn_correction_probability: float = 0.0,
+        turn_correction_time_sec: float = 0.0,
+        hit_wall_probability_per_square: float = 0.0,
+        hit_wall_recovery_time_sec: float = 0.0
+    ):
+        self.square_length_mm = square_length_mm
+        self.max_speed_mm_per_sec = max_speed_mm_per_sec
+        self.acceleration_mm_per_sec2 = acceleration_mm_per_sec2
+        self.stop_time_sec = stop_time_sec
+        self.turn_left_time_sec = turn_left_time_sec
+        self.turn_right_time_sec = turn_right_time_sec
+        # None means that arc turns are not known, they are made as forward, turn and forward moves
+        self.arc_turn_time_sec = arc_turn_time_sec
+        self.forward_correction_probability = forward_correction_probability
+        self.forward_correction_time_sec = forward_correction_time_sec
+        self.turn_correction_probability = turn_correction_probability
+        self.turn_correction_time_sec = turn_correction_time_sec
+        self.hit_wall_probability_per_square = hit_wall_probability_per_square
+        self.hit_wall_recovery_time_sec = hit_wall_recovery_time_sec
+
+    def get_forward_time(self, square_count: int = 1) -> float:
+        return (
+            get_profile_time(square_count * self.square_length_mm, self.max_speed_mm_per_sec, self.acceleration_mm_per_sec2)
+            + self.stop_time_sec
+            + self.forward_correction_probability * self.forward_correction_time_sec
+            + square_count * self.hit_wall_probability_per_square * self.hit_wall_recovery_time_sec
+        )
+
+    def _get_side_turn_time(self, turn_time_sec: float) -> float:
+        return turn_time_sec + self.turn_correction_probability * self.turn_correction_time_sec
+
+    def get_turn_time(self, command: MotorCommand) -> float:
+        _left_time = self._get_side_turn_time(self.turn_left_time_sec)
+        _right_time = self._get_side_turn_time(self.turn_right_time_sec)
+        if command == MotorCommand.TURN_LEFT:
+            return _left_time
+        if command == MotorCommand.TURN_RIGHT:
+            return _right_time
+        if command == MotorCommand.TURN_BACK:
+            return _left_time + _right_time
+        _side_time = _left_time if command == MotorCommand.ARC_TURN_LEFT else _right_time
+        if self.arc_turn_time_sec is None:
+            return 2 * self.get_forward_time() + _side_time
+        return (
+            self._get_side_turn_time(self.arc_turn_time_sec)
+            + 2 * self.hit_wall_probability_per_square * self.hit_wall_recovery_time_sec
+        )
+
+    def to_dict(self) -> dict:
+        return {_field: getattr(self, _field) for _field in self._FIELDS}
+
+    @classmethod
+    def from_dict(cls, values: dict) -> 'ProfiledMotionModel':
+        return cls(**{_field: values[_field] for _field in cls._FIELDS if _field in values})
+
+
+def save_motion_model(path: str, motion_model: ProfiledMotionModel):
+    with open(path, 'w') as _file:
+        json.dump(motion_model.to_dict(), _file, indent=1)
+
+
+def load_motion_model(path: str) -> ProfiledMotionModel:
+    with open(path, 'r') as _file:
+        return ProfiledMotionModel.from_dict(json.load(_file))
+
+
+# Log lines as written by the EV3 apps, with or without the thread name
+_LOG_LINE = re.compile(r'^(\d{4}-\d\d-\d\d \d\d:\d\d:\d\d,\d{3}) - ([\w.]+) - \w+ - (?:\[[^\]]*\] - )?(.*)$')
+_MOVE_START = re.compile(r'^(Move_forward|Move_forward_squares (\d+)|turn_left|turn_right|arc_turn_left|arc_turn_right)$')
+_HIT_WALL_MESSAGES = ('Bad gyro angle. I have hit the wall',)
+_CORRECTION_MESSAGES = (
+    'Bad front distance!',
+    'Bad gyro angle - too little!',
+    'Bad gyro angle - too big!',
+    'I am too close to left wall. Correcting angle a bit..',
+    'I am too close to right wall. Correcting angle a bit..'
+)
+# Logged by ev3.motors, not by the position corrector
+_BACK_WALL_CORRECTION_MESSAGES = ('I am correcting my angle using the back wall...',)
+
+
+class LoggedMove(object):
+    """
+    A move found in an EV3 log: the move name, the number of squares for forward moves, the time it
+    took in seconds, and whether the position was corrected or the robot recovered from hitting a wall.
+    """
+
+    def __init__(self, name: str, square_count: int, duration_sec: float, corrected: bool, hit_wall: bool):
+        self.name = name
+        self.square_count = square_count
+        self.duration_sec = duration_sec
+        self.corrected = corrected
+        self.hit_wall = hit_wall
+
+    @property
+    def is_forward(self) -> bool:
+        return self.name.startswith('Move_forward')
+
+
+def read_logged_moves(lines) -> list:
+    """
+    Returns the moves of the EV3 motors in the given log lines, as LoggedMove objects. The ev3.motors
+    and ev3.position_corrector loggers must have been at debug level.
+    """
+    _moves = []
+    _current = None
+    for _line in lines:
+        _match = _LOG_LINE.match(_line.rstrip('\n'))
+        if _match is None:
+            continue
+        _time = datetime.datetime.strptime(_match.group(1), '%Y-%m-%d %H:%M:%S,%f')
+        _logger_name, _message = _match.group(2), _match.group(3)
+        if _logger_name == 'ev3.motors':
+            _start_match = _MOVE_START.match(_message)
+            if _start_match is not None:
+                _square_count = int(_start_match.group(2)) if _start_match.group(2) else 1
+                _name = _message.split(' ')[0]
+                _current = {'name': _name, 'message': _message, 'square_count': _square_count, 'start': _time, 'corrected': False, 'hit_wall': False}
+            elif _current is not None and _message in _BACK_WALL_CORRECTION_MESSAGES:
+                _current['corrected'] = True
+            elif _current is not None and _message == _current['message'] + ' done':
+                _duration = (_time - _current['start']).total_seconds()
+                _moves.append(LoggedMove(_current['name'], _current['square_count'], _duration, _current['corrected'], _current['hit_wall']))
+                _current = None
+        elif _logger_name == 'ev3.position_corrector' and _current is not None:
+            if _message in _HIT_WALL_MESSAGES:
+                _current['hit_wall'] = True
+            elif _message in _CORRECTION_MESSAGES:
+                _current['corrected'] = True
+    return _moves
+
+
+def _fit_speed_and_acceleration(points: list, defaults: ProfiledMotionModel) -> tuple:
+    # Points are (distance_mm, time_sec) of forward moves without the stop time. With two or more
+    # distances a line time = ramp_time + distance / speed is fitted, where ramp_time = speed / acceleration.
+    _distances = set(_distance for _distance, _ in points)
+    if len(_distances) >= 2:
+        _mean_distance = statistics.mean(_distance for _distance, _ in points)
+        _mean_time = statistics.mean(_time for _, _time in points)
+        _slope = (
+            sum((_distance - _mean_distance) * (_time - _mean_time) for _distance, _time in points)
+            / sum((_distance - _mean_distance) ** 2 for _distance, _ in points)
+        )
+        _ramp_time = _mean_time - _slope * _mean_distance
+        if _slope > 0 and _ramp_time > 0:
+            _speed = 1 / _slope
+            return (_speed, _speed / _ramp_time)
+    # One distance only, keep the speed and find the acceleration that gives the mean time
+    _distance = statistics.mean(_distance for _distance, _ in points)
+    _time = statistics.mean(_time for _, _time in points)
+    _speed = defaults.max_speed_mm_per_sec
+    if _time <= 0:
+        return (_speed, defaults.acceleration_mm_per_sec2)
+    if _time > _distance / _speed and _speed * (_time - _distance / _speed) <= _distance:
+        return (_speed, _speed / (_time - _distance / _speed))
+    # Never reaches the speed
+    return (_speed, 4 * _distance / (_time * _time))
+
+
+def fit_motion_model(logged_moves: list, defaults: ProfiledMotionModel = None) -> ProfiledMotionModel:
+    """
+    Fits a ProfiledMotionModel to the moves read from EV3 logs with read_logged_moves. The times of the
+    moves without corrections give the acceleration profile and the turn times, and the corrected
+    moves give the probability and the extra time of the corrections. Whatever the logs do not tell,
+    e.g. arc turns when none were made, is taken from the defaults.
+    """
+    _defaults = defaults or ProfiledMotionModel()
+    _model = ProfiledMotionModel.from_dict(_defaults.to_dict())
+    _clean_moves = [_move for _move in logged_moves if not _move.corrected and not _move.hit_wall]
+    _forward_points = [
+        (_move.square_count * _model.square_length_mm, _move.duration_sec - _model.stop_time_sec)
+        for _move in _clean_moves if _move.is_forward
+    ]
+    if _forward_points:
+        _model.max_speed_mm_per_sec, _model.acceleration_mm_per_sec2 = _fit_speed_and_acceleration(_forward_points, _defaults)
+    for _name, _field in (('turn_left', 'turn_left_time_sec'), ('turn_right', 'turn_right_time_sec')):
+        _durations = [_move.duration_sec for _move in _clean_moves if _move.name == _name]
+        if _durations:
+            setattr(_model, _field, statistics.median(_durations))
+    _arc_durations = [_move.duration_sec for _move in _clean_moves if _move.name.startswith('arc_turn')]
+    if _arc_durations:
+        _model.arc_turn_time_sec = statistics.median(_arc_durations)
+
+    def get_base_time(move: LoggedMove) -> float:
+        if move.is_forward:
+            return get_profile_time(move.square_count * _model.square_length_mm, _model.max_speed_mm_per_sec, _model.acceleration_mm_per_sec2) + _model.stop_time_sec
+        if move.name == 'turn_left':
+            return _model.turn_left_time_sec
+        if move.name == 'turn_right':
+            return _model.turn_right_time_sec
+        return _model.arc_turn_time_sec if _model.arc_turn_time_sec is not None else move.duration_sec
+
+    _forward_moves = [_move for _move in logged_moves if _move.is_forward]
+    _turn_moves = [_move for _move in logged_moves if not _move.is_forward]
+    _corrected_forward_moves = [_move for _move in _forward_moves if _move.corrected and not _move.hit_wall]
+    _corrected_turn_moves = [_move for _move in _turn_moves if _move.corrected]
+    _hit_wall_moves = [_move for _move in _forward_moves if _move.hit_wall]
+    if _forward_moves:
+        _model.forward_correction_probability = len(_corrected_forward_moves) / len(_forward_moves)
+        _model.hit_wall_probability_per_square = len(_hit_wall_moves) / sum(_move.square_count for _move in _forward_moves)
+    if _turn_moves:
+        _model.turn_correction_probability = len(_corrected_turn_moves) / len(_turn_moves)
+    if _corrected_forward_moves:
+        _model.forward_correction_time_sec = max(0.0, statistics.mean(_move.duration_sec - get_base_time(_move) for _move in _corrected_forward_moves))
+    if _corrected_turn_moves:
+        _model.turn_correction_time_sec = max(0.0, statistics.mean(_move.duration_sec - get_base_time(_move) for _move in _corrected_turn_moves))
+    if _hit_wall_moves:
+        _model.hit_wall_recovery_time_sec = max(0.0, statistics.mean(_move.duration_sec - get_base_time(_move) for _move in _hit_wall_moves))
+    return _model
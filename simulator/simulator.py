@@ -2,8 +2,22 @@ from maze_solver.maze_solver import Motors, FinishDetector, WallDetector, Output
 
 class SimulatorMotors(Motors):
     
-    def __init__(self, move_forward_callback, turn_right_callback, turn_left_callback, turn_back_callback, no_turn_callback):
+    def __init__(
+        self, 
+        move_forward_callback, 
+        turn_right_callback, 
+        turn_left_callback, 
+        turn_back_callback, 
+        no_turn_callback, 
+        move_forward_squares_callback = None, 
+        arc_turn_right_callback = None, 
+        arc_turn_left_callback = None
+    ):
         self._move_forward_callback = move_forward_callback
+        # Without these callbacks, the moves are made one by one as in Motors
+        self._move_forward_squares_callback = move_forward_squares_callback
+        self._arc_turn_right_callback = arc_turn_right_callback
+        self._arc_turn_left_callback = arc_turn_left_callback
         self._turn_right_callback = turn_right_callback
         self._turn_left_callback = turn_left_callback
         self._turn_back_callback = turn_back_callback
@@ -12,6 +26,12 @@ class SimulatorMotors(Motors):
     def move_forward(self):
         self._move_forward_callback()
 
+    def move_forward_squares(self, square_count: int):
+        if self._move_forward_squares_callback is None:
+            super().move_forward_squares(square_count)
+        else:
+            self._move_forward_squares_callback(square_count)
+
     def turn_right(self):
         self._turn_right_callback()
 
@@ -21,6 +41,18 @@ class SimulatorMotors(Motors):
     def turn_back(self):
         self._turn_back_callback()
 
+    def arc_turn_right(self):
+        if self._arc_turn_right_callback is None:
+            super().arc_turn_right()
+        else:
+            self._arc_turn_right_callback()
+
+    def arc_turn_left(self):
+        if self._arc_turn_left_callback is None:
+            super().arc_turn_left()
+        else:
+            self._arc_turn_left_callback()
+
     def no_turn(self):
         self._no_turn_callback()
 
@@ -0,0 +1,54 @@
+import functools
+import logging
+from maze_solver.flood_fill_maze_solver import FloodFillMazeSolver
+from maze_solver.route_replay_maze_solver import RouteReplayMazeSolver
+from maze_solver.route_planner import MotorCommand
+from simulator.maze_solving_session import SimulatorMazeSolvingSession
+from simulator.motion_model import MotionModel
+
+
+def simulate_exploration_and_speed_run(
+    maze, 
+    maze_width: int, 
+    maze_height: int, 
+    center_coordinates: list, 
+    max_moves: int = 999, 
+    random_seed: int = None,
+    motion_model: MotionModel = None,
+    logger = None
+) -> dict:
+    """
+    Explores the maze with a FloodFillMazeSolver, plans the fastest known route to the finish square
+    using the times of the motion model, and replays it on a second run with a RouteReplayMazeSolver.
+    Returns the results of both runs; the speed run results are None if the finish was not found.
+    """
+    _logger = logger or logging.getLogger(__name__)
+    _motion_model = motion_model or MotionModel()
+    _exploration_session = SimulatorMazeSolvingSession(
+        maze,
+        max_moves=max_moves,
+        random_seed=random_seed,
+        motion_model=_motion_model,
+        maze_solver_factory=functools.partial(
+            FloodFillMazeSolver, 
+            maze_width=maze_width, 
+            maze_height=maze_height, 
+            center_coordinates=center_coordinates
+        )
+    )
+    _exploration_results = _exploration_session.start()
+    _route = _exploration_session.maze_solver.plan_speed_run(
+        _motion_model.get_forward_time(1), 
+        _motion_model.get_side_turn_time(), 
+        _motion_model.get_turn_time(MotorCommand.TURN_BACK)
+    )
+    if _route is None:
+        _logger.warning('Finish not found on exploration run, no speed run possible')
+        return {'exploration': _exploration_results, 'speed_run': None}
+    _speed_run_session = SimulatorMazeSolvingSession(
+        maze,
+        max_moves=max_moves,
+        motion_model=_motion_model,
+        maze_solver_factory=functools.partial(RouteReplayMazeSolver, route=_route)
+    )
+    return {'exploration': _exploration_results, 'speed_run': _speed_run_session.start()}
@@ -0,0 +1,194 @@
+import itertools
+import logging
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+from simulator.experiment_runner import ExperimentRunner, summarize_session_results
+from simulator.batch_simulator import run_batch_simulator_sessions
+
+
+class TuningObjective(object):
+    PROBABILITY_OF_SOLVING_WITHIN_TIME_LIMIT = 'probability_of_solving_within_time_limit'
+    MOTION_TIME_MEAN = 'motion_time_mean'
+
+
+# Upper limit of the probability objective, used to tell if a configuration can still win
+_MAX_PROBABILITY = 100.0
+
+
+class WeightTuner(object):
+    """
+    Searches for the CuriousMazeSolver weights that do best on a set of mazes, given as a list of
+    (maze, center_coordinates) tuples. The objective is either the mean probability of solving the
+    mazes within the time limit (higher is better) or the mean motion time (lower is better); the
+    scores are always "higher is better", so the motion time scores are negative.
+
+    All configurations are evaluated with the same session seeds, so that they are compared on the
+    same random choices. The sessions of each maze are spread over worker processes by ExperimentRunner,
+    all evaluations share one process pool, which is shut down by close() or at the end of a with block.
+
+    A configuration is stopped early, as soon as it cannot beat the best score so far even if it
+    did perfectly on the rest of the mazes. Successive halving goes further: it evaluates all the
+    configurations on a small number of sessions and keeps only the best part of them for the next
+    round with more sessions, so most of the sessions are spent on the promising configurations.
+    """
+
+    @property
+    def objective(self) -> str:
+        return self._objective
+
+    def __init__(
+        self,
+        mazes: list,
+        objective: str = TuningObjective.PROBABILITY_OF_SOLVING_WITHIN_TIME_LIMIT,
+        sample_size: int = 1000,
+        time_limit_sec: float = 300,
+        max_moves_per_session: int = 999,
+        workers: int = None,
+        random_seed: int = None,
+        session_runner = run_batch_simulator_sessions,
+        fixed_session_kwargs: dict = {},
+        logger = None
+    ):
+        if objective not in (TuningObjective.PROBABILITY_OF_SOLVING_WITHIN_TIME_LIMIT, TuningObjective.MOTION_TIME_MEAN):
+            raise ValueError('Unknown tuning objective: {}'.format(objective))
+        self._logger = logger or logging.getLogger(__name__)
+        self._mazes = mazes
+        self._objective = objective
+        self._sample_size = sample_size
+        self._time_limit_sec = time_limit_sec
+        self._max_moves_per_session = max_moves_per_session
+        self._workers = workers or os.cpu_count() or 1
+        self._random_seed = random_seed if random_seed is not None else random.SystemRandom().getrandbits(32)
+        self._random = random.Random(self._random_seed)
+        self._session_runner = session_runner
+        # Session arguments that are not tuned, e.g. prefer_no_loops_weight
+        self._fixed_session_kwargs = fixed_session_kwargs
+        self._executor = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None and self._workers > 1:
+            self._executor = ProcessPoolExecutor(max_workers=self._workers)
+        return self._executor
+
+    def _create_experiment_runner(self, sample_size: int) -> ExperimentRunner:
+        return ExperimentRunner(
+            sample_size=sample_size,
+            time_limit_sec=self._time_limit_sec,
+            max_moves_per_session=self._max_moves_per_session,
+            workers=self._workers,
+            random_seed=self._random_seed,
+            session_runner=self._session_runner,
+            executor=self._get_executor(),
+            logger=self._logger
+        )
+
+    def _get_maze_score(self, maze_result: dict) -> float:
+        if self._objective == TuningObjective.MOTION_TIME_MEAN:
+            return -maze_result['motion_time_mean']
+        return maze_result['probability_of_solving_within_time_limit']
+
+    def _get_best_possible_maze_score(self) -> float:
+        if self._objective == TuningObjective.MOTION_TIME_MEAN:
+            return 0.0
+        return _MAX_PROBABILITY
+
+    def evaluate(self, weights: dict, sample_size: int = None, score_to_beat: float = None) -> dict:
+        """
+        Runs the sessions on all mazes with the given weights and returns the score with the results
+        of each maze. If score_to_beat is given, the evaluation stops as soon as it cannot be beaten.
+        """
+        _sample_size = sample_size or self._sample_size
+        _experiment_runner = self._create_experiment_runner(_sample_size)
+        _session_kwargs = dict(self._fixed_session_kwargs)
+        _session_kwargs.update(weights)
+        _maze_results = []
+        _score_sum = 0.0
+        for _maze_number, (_maze, _center_coordinates) in enumerate(self._mazes, start=1):
+            _results = _experiment_runner.run_sessions(_maze, center_coordinates=_center_coordinates, **_session_kwargs)
+            _maze_result = summarize_session_results(
+                _maze.name,
+                [_move_count for _move_count, _ in _results],
+                [_motion_time for _, _motion_time in _results],
+                self._time_limit_sec
+            )
+            _maze_results.append(_maze_result)
+            _score_sum += self._get_maze_score(_maze_result)
+            _remaining_maze_count = len(self._mazes) - _maze_number
+            _best_possible_score = (_score_sum + _remaining_maze_count * self._get_best_possible_maze_score()) / len(self._mazes)
+            if score_to_beat is not None and _remaining_maze_count > 0 and _best_possible_score <= score_to_beat:
+                self._logger.info('Stopped evaluating {} early, it cannot beat score {}'.format(weights, score_to_beat))
+                return {'weights': weights, 'score': None, 'sample_size': _sample_size, 'stopped_early': True, 'maze_results': _maze_results}
+        _score = _score_sum / len(self._mazes)
+        self._logger.info('Weights {} scored {} with {} sessions per maze'.format(weights, _score, _sample_size))
+        return {'weights': weights, 'score': _score, 'sample_size': _sample_size, 'stopped_early': False, 'maze_results': _maze_results}
+
+    def _sort_results(self, results: list) -> list:
+        _completed_results = [_result for _result in results if not _result['stopped_early']]
+        _stopped_results = [_result for _result in results if _result['stopped_early']]
+        return sorted(_completed_results, key=lambda _result: -_result['score']) + _stopped_results
+
+    def search(self, weight_configurations: list) -> list:
+        """
+        Evaluates all given weight configurations, and returns the results best first. The
+        configurations that were stopped early come last, without a score.
+        """
+        _results = []
+        _best_score = None
+        for _weights in weight_configurations:
+            _result = self.evaluate(_weights, score_to_beat=_best_score)
+            _results.append(_result)
+            if not _result['stopped_early'] and (_best_score is None or _result['score'] > _best_score):
+                _best_score = _result['score']
+        return self._sort_results(_results)
+
+    def get_grid_configurations(self, weight_values: dict) -> list:
+        """
+        Returns all combinations of the given values, e.g. {'prefer_no_turns_weight': [0, 1, 2]}.
+        """
+        _names = list(weight_values.keys())
+        return [dict(zip(_names, _values)) for _values in itertools.product(*[weight_values[_name] for _name in _names])]
+
+    def get_random_configurations(self, weight_values: dict, count: int) -> list:
+        """
+        Returns the given number of configurations with values picked at random from the given values.
+        """
+        return [
+            {_name: self._random.choice(_values) for _name, _values in weight_values.items()}
+            for _ in range(count)
+        ]
+
+    def grid_search(self, weight_values: dict) -> list:
+        return self.search(self.get_grid_configurations(weight_values))
+
+    def random_search(self, weight_values: dict, count: int) -> list:
+        return self.search(self.get_random_configurations(weight_values, count))
+
+    def successive_halving(self, weight_configurations: list, min_sample_size: int = 50, reduction_factor: int = 3) -> list:
+        """
+        Evaluates the configurations in rounds, starting with min_sample_size sessions per maze. After
+        each round only the best 1 / reduction_factor of the configurations are kept, and the next round
+        has reduction_factor times more sessions, up to the sample size of the tuner. Returns the results
+        of the last round, best first.
+        """
+        _configurations = list(weight_configurations)
+        _sample_size = min(min_sample_size, self._sample_size)
+        while True:
+            self._logger.info('Evaluating {} configurations with {} sessions per maze'.format(len(_configurations), _sample_size))
+            _results = self._sort_results([self.evaluate(_weights, sample_size=_sample_size) for _weights in _configurations])
+            if len(_configurations) <= 1 or _sample_size >= self._sample_size:
+                return _results
+            _keep_count = max(1, len(_configurations) // reduction_factor)
+            _configurations = [_result['weights'] for _result in _results[:_keep_count]]
+            _sample_size = min(_sample_size * reduction_factor, self._sample_size)
@@ -10,3 +10,4 @@ class Ev3devTestUtil(object):
         sys.modules["ev3dev2.motor"] = MagicMock()
         sys.modules["ev3dev2.sensor"] = MagicMock()
         sys.modules["ev3dev2.sensor.lego"] = MagicMock()
+        sys.modules["ev3dev2.button"] = MagicMock()
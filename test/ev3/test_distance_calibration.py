@@ -0,0 +1,42 @@
+import math
+import os
+import tempfile
+import unittest
+from ev3.distance_calibration import create_distance_table, fit_distance_curve, create_distance_table_from_wall_sweep, save_distance_tables, load_distance_tables
+
+
+class DistanceCalibrationTests(unittest.TestCase):
+
+    def test_should_give_same_distances_as_experimental_formula_by_default(self):
+        _table = create_distance_table()
+        self.assertEqual(101, len(_table))
+        self.assertEqual(255.0, _table[0])
+        for _intensity in range(1, 101):
+            self.assertEqual(round(math.log(_intensity / 105) / math.log(0.555), 1), _table[_intensity])
+
+    def test_should_fit_curve_of_wall_sweep(self):
+        _samples = [(_distance, 90 * 0.6 ** _distance) for _distance in [0.5, 1, 2, 3, 5]]
+        _intensity_at_zero_distance, _intensity_factor_per_cm = fit_distance_curve(_samples)
+        self.assertAlmostEqual(90, _intensity_at_zero_distance)
+        self.assertAlmostEqual(0.6, _intensity_factor_per_cm)
+
+    def test_should_ignore_readings_without_reflected_light(self):
+        _samples = [(1, 54.0), (2, 32.4), (20, 0)]
+        self.assertAlmostEqual(0.6, fit_distance_curve(_samples)[1])
+
+    def test_should_not_give_negative_distances(self):
+        _table = create_distance_table_from_wall_sweep([(1, 60.0), (2, 36.0)])
+        self.assertEqual(0.0, _table[100])
+
+    def test_should_raise_value_error_when_intensity_does_not_drop(self):
+        with self.assertRaises(ValueError):
+            fit_distance_curve([(1, 30), (2, 40)])
+        with self.assertRaises(ValueError):
+            fit_distance_curve([(1, 30), (1, 31)])
+
+    def test_should_load_saved_tables(self):
+        _tables = {'in1': create_distance_table(), 'in3': create_distance_table(100, 0.5)}
+        with tempfile.TemporaryDirectory() as _dir:
+            _path = os.path.join(_dir, 'calibration.json')
+            save_distance_tables(_path, _tables)
+            self.assertEqual(_tables, load_distance_tables(_path))
@@ -0,0 +1,48 @@
+import unittest
+from ev3.heading_controller import HeadingController
+
+
+class HeadingControllerTests(unittest.TestCase):
+
+    def setUp(self):
+        self._heading_controller = HeadingController(proportional_gain = 2.0, integral_gain = 1.0, derivative_gain = 0.5, max_steering = 30)
+        self._heading_controller.reset(100)
+
+    def test_should_go_straight_on_target_heading(self):
+        self.assertEqual(0, self._heading_controller.update(100, 0.0))
+        self.assertEqual(0, self._heading_controller.update(100, 0.1))
+
+    def test_should_steer_left_when_drifted_right(self):
+        self.assertEqual(-10, self._heading_controller.update(105, 0.0))
+
+    def test_should_steer_right_when_drifted_left(self):
+        self.assertEqual(10, self._heading_controller.update(95, 0.0))
+
+    def test_should_steer_more_when_error_stays(self):
+        _first_steering = self._heading_controller.update(95, 0.0)
+        _second_steering = self._heading_controller.update(95, 1.0)
+        self.assertAlmostEqual(_first_steering + 5.0, _second_steering)
+
+    def test_should_steer_against_turning(self):
+        self._heading_controller.update(100, 0.0)
+        # Turning right at 10 degrees per second
+        self.assertAlmostEqual(-2.0 * 1 - 1.0 * 0.1 - 0.5 * 10, self._heading_controller.update(101, 0.1))
+
+    def test_should_limit_steering(self):
+        self.assertEqual(-30, self._heading_controller.update(190, 0.0))
+        self.assertEqual(30, self._heading_controller.update(10, 1.0))
+
+    def test_should_not_wind_up(self):
+        for _time in range(100):
+            self._heading_controller.update(50, float(_time))
+        self._heading_controller.update(100, 100.0)
+        # Steers left soon after overshooting, even after a long time on the left
+        self.assertLess(self._heading_controller.update(110, 101.0), 0)
+
+    def test_should_steer_towards_middle_between_close_side_walls(self):
+        self.assertLess(self._heading_controller.update(100, 0.0, left_distance_cm = 4.0, right_distance_cm = 1.0), 0)
+        self._heading_controller.reset(100)
+        self.assertGreater(self._heading_controller.update(100, 0.0, left_distance_cm = 1.0, right_distance_cm = 4.0), 0)
+
+    def test_should_ignore_side_distances_without_wall_on_both_sides(self):
+        self.assertEqual(0, self._heading_controller.update(100, 0.0, left_distance_cm = 255.0, right_distance_cm = 1.0))
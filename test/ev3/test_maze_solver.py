@@ -0,0 +1,46 @@
+import os
+import tempfile
+import unittest
+from test.ev3.ev3dev_test_util import Ev3devTestUtil
+Ev3devTestUtil.create_fake_ev3dev2_module()
+from ev3.maze_solver import plan_speed_run
+from maze_solver.direction import Direction
+from maze_solver.route_planner import MotorCommand
+from maze_solver.square import Square
+from maze_solver.wall_map import WallMap, save_wall_map
+
+
+class PlanSpeedRunTests(unittest.TestCase):
+
+    def setUp(self):
+        # 1,1 -> 1,2 -> 2,2, with the passage from 1,1 to 2,1 blocked
+        self._wall_map = WallMap(width = 3, height = 3)
+        self._wall_map.set_blocked(1, 1, Direction.EAST, True)
+        for _x, _y in ((1, 1), (1, 2), (2, 2)):
+            self._wall_map.set_explored(_x, _y)
+        self._directory = tempfile.TemporaryDirectory()
+        self._path = os.path.join(self._directory.name, 'wall_map.json')
+
+    def tearDown(self):
+        self._directory.cleanup()
+
+    def test_should_plan_route_to_saved_finish_square(self):
+        save_wall_map(self._path, self._wall_map, Square(x = 2, y = 2))
+        self.assertEqual(
+            [MotorCommand.MOVE_FORWARD, MotorCommand.TURN_RIGHT, MotorCommand.MOVE_FORWARD],
+            plan_speed_run(self._path, [3])
+        )
+
+    def test_should_plan_route_to_center_squares_when_finish_square_was_not_found(self):
+        save_wall_map(self._path, self._wall_map)
+        self.assertEqual(
+            [MotorCommand.MOVE_FORWARD, MotorCommand.TURN_RIGHT, MotorCommand.MOVE_FORWARD],
+            plan_speed_run(self._path, [2])
+        )
+
+    def test_should_not_plan_route_without_wall_map(self):
+        self.assertIsNone(plan_speed_run(self._path, [2]))
+
+    def test_should_not_plan_route_through_unexplored_squares(self):
+        save_wall_map(self._path, self._wall_map, Square(x = 3, y = 3))
+        self.assertIsNone(plan_speed_run(self._path, [2]))
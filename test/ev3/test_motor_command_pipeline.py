@@ -0,0 +1,85 @@
+import threading
+import unittest
+from unittest.mock import MagicMock, call
+from test.ev3.ev3dev_test_util import Ev3devTestUtil
+Ev3devTestUtil.create_fake_ev3dev2_module()
+from ev3.motor_command_pipeline import MotorCommandPipeline
+from ev3.motors import EV3Motors
+from ev3.wall_detector import EV3WallDetector
+
+
+class MotorCommandPipelineTests(unittest.TestCase):
+
+    def setUp(self):
+        self._pipeline = MotorCommandPipeline()
+
+    def test_should_not_run_commands_when_submitted(self):
+        _command = MagicMock()
+        self._pipeline.submit(_command)
+        _command.assert_not_called()
+        self.assertEqual(1, self._pipeline.pending_count)
+
+    def test_should_run_commands_in_submitted_order(self):
+        _commands = MagicMock()
+        self._pipeline.submit(_commands.first)
+        self._pipeline.submit(_commands.second)
+        self.assertTrue(self._pipeline.run_next_command())
+        self.assertTrue(self._pipeline.run_next_command())
+        self.assertEqual([call.first(), call.second()], _commands.mock_calls)
+        self.assertTrue(self._pipeline.wait_until_idle(timeout_sec = 0))
+
+    def test_should_return_false_when_there_is_no_command(self):
+        self.assertFalse(self._pipeline.run_next_command(timeout_sec = 0))
+
+    def test_should_go_on_after_failed_command(self):
+        _command = MagicMock()
+        self._pipeline.submit(MagicMock(side_effect = IOError('motor unplugged')))
+        self._pipeline.submit(_command)
+        self._pipeline.run_next_command()
+        self._pipeline.run_next_command()
+        _command.assert_called_once()
+        self.assertEqual(0, self._pipeline.pending_count)
+
+    def test_should_not_be_idle_until_commands_have_been_run(self):
+        self._pipeline.submit(MagicMock())
+        self.assertFalse(self._pipeline.wait_until_idle(timeout_sec = 0.01))
+
+    def test_should_run_commands_in_own_thread_until_stopped(self):
+        _command_thread_names = []
+        self._pipeline.start()
+        self._pipeline.submit(lambda: _command_thread_names.append(threading.current_thread().name))
+        self.assertTrue(self._pipeline.wait_until_idle(timeout_sec = 5))
+        self._pipeline.stop()
+        self._pipeline.join(timeout = 5)
+        self.assertFalse(self._pipeline.is_alive())
+        self.assertEqual(['EV3MotorCommandPipeline'], _command_thread_names)
+
+
+class EV3MotorsWithPipelineTests(unittest.TestCase):
+
+    def setUp(self):
+        self._pipeline = MotorCommandPipeline()
+        self._distance_sensors = MagicMock()
+        self._distance_sensors.get_distances.return_value = {'left': 2.0, 'front': 2.0, 'right': 2.0}
+        self._gyro = MagicMock()
+        self._gyro.get_orientation.return_value = 0
+        self._sensor_scheduler = MagicMock()
+        self._sensor_scheduler.get_time.side_effect = [10.0, 11.0, 12.0]
+        self._motors = EV3Motors(self._distance_sensors, self._gyro, self._sensor_scheduler, motor_command_pipeline = self._pipeline)
+        self._motors._motor_pair = MagicMock()
+
+    def test_should_return_before_moving(self):
+        self._motors.move_forward()
+        self._motors._motor_pair.on_for_rotations.assert_not_called()
+
+    def test_should_block_in_pipeline_thread_until_motors_stop(self):
+        self._motors.move_forward()
+        self._pipeline.run_next_command()
+        self.assertTrue(self._motors._motor_pair.on_for_rotations.call_args.kwargs['block'])
+
+    def test_should_take_walls_from_readings_after_moves(self):
+        _wall_detector = EV3WallDetector(self._distance_sensors, motors = self._motors)
+        self._motors.move_forward()
+        self._pipeline.run_next_command()
+        _wall_detector.is_front_blocked()
+        self._distance_sensors.get_distances.assert_called_with(fresh_after = 12.0, filtered = True)
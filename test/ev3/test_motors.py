@@ -0,0 +1,134 @@
+import unittest
+from unittest.mock import MagicMock
+from test.ev3.ev3dev_test_util import Ev3devTestUtil
+Ev3devTestUtil.create_fake_ev3dev2_module()
+from ev3.motors import EV3Motors
+
+
+class EV3MotorsTests(unittest.TestCase):
+
+    def setUp(self):
+        self._distance_sensors = MagicMock()
+        self._distance_sensors.get_distances.return_value = {'left': 2.0, 'front': 2.0, 'right': 2.0}
+        self._gyro = MagicMock()
+        self._gyro.get_orientation.return_value = 0
+        self._sensor_scheduler = MagicMock()
+        self._sensor_scheduler.get_time.return_value = 0.0
+
+    def _create_motors(self, **kwargs) -> EV3Motors:
+        _motors = EV3Motors(self._distance_sensors, self._gyro, self._sensor_scheduler, **kwargs)
+        _motors._motor_pair = MagicMock()
+        return _motors
+
+    def test_should_move_through_several_squares_in_one_move_and_tell_square_boundaries(self):
+        _square_boundaries = []
+        _motors = self._create_motors(
+            wheel_diameter_mm = 360 / 3.141592653589793,
+            maze_square_length_mm = 180,
+            square_boundary_listener = _square_boundaries.append
+        )
+        # The encoders give 1 mm per degree with this wheel
+        _motors._motor_pair.left_motor.position = 0
+        _motors._motor_pair.right_motor.position = 0
+        _encoder_positions = [100, 200, 370, 540]
+
+        def wait_until_not_moving(timeout):
+            if not _encoder_positions:
+                return True
+            _position = _encoder_positions.pop(0)
+            _motors._motor_pair.left_motor.position = _position
+            _motors._motor_pair.right_motor.position = _position
+            return False
+
+        _motors._motor_pair.left_motor.wait_until_not_moving.side_effect = wait_until_not_moving
+        _motors._motor_pair.right_motor.wait_until_not_moving.return_value = True
+        _motors.move_forward_squares(3)
+        _motors._motor_pair.left_motor.wait_until.assert_called_with('running', timeout = 100)
+        _motors._motor_pair.wait_until_not_moving.assert_not_called()
+        self.assertEqual(1, _motors._motor_pair.on_for_rotations.call_count)
+        self.assertAlmostEqual(3 * 180 / 360, _motors._motor_pair.on_for_rotations.call_args.kwargs['rotations'])
+        self.assertEqual([1, 2, 3], _square_boundaries)
+        self.assertEqual(0, _motors._motor_pair.left_motor.ramp_up_sp)
+
+    def test_should_turn_along_arc_until_gyro_angle_is_reached(self):
+        _angles = [0, 0, 30, 60, 86, 90]
+        self._gyro.get_orientation.side_effect = lambda **kwargs: _angles.pop(0) if len(_angles) > 1 else _angles[0]
+        _motors = self._create_motors()
+        _motors.arc_turn_left()
+        self.assertEqual(2, _motors._motor_pair.on_for_rotations.call_count)
+        _motors._motor_pair.on.assert_called_once()
+        self.assertLess(_motors._motor_pair.on.call_args.kwargs['steering'], 0)
+        _motors._motor_pair.off.assert_called_once()
+        self.assertEqual([90], _angles)
+
+    def test_should_give_up_arc_turn_when_gyro_angle_is_not_reached_in_time(self):
+        _motors = self._create_motors(arc_turn_timeout_sec = 1.0)
+        self._sensor_scheduler.get_time.side_effect = [0.0, 0.5, 1.5, 2.0, 2.0]
+        _motors.arc_turn_right()
+        self.assertGreater(_motors._motor_pair.on.call_args.kwargs['steering'], 0)
+        _motors._motor_pair.off.assert_called_once()
+
+    def test_should_swap_arc_turn_steering_with_reversed_motors(self):
+        _motors = self._create_motors(arc_turn_timeout_sec = 1.0, motor_pair_polarity_factor = -1)
+        self._sensor_scheduler.get_time.side_effect = [0.0, 0.5, 1.5, 2.0, 2.0]
+        _motors.arc_turn_right()
+        self.assertLess(_motors._motor_pair.on.call_args.kwargs['steering'], 0)
+
+    def test_should_steer_on_every_gyro_reading_with_heading_control(self):
+        _motors = self._create_motors(wheel_diameter_mm = 360 / 3.141592653589793, heading_control = True)
+        _motors._motor_pair.left_motor.position = 0
+        _motors._motor_pair.right_motor.position = 0
+        # The robot drifts right while moving, 1 mm per degree of the wheels
+        _angles = [0, 2, 4, 4]
+
+        def on(**kwargs):
+            _motors._motor_pair.left_motor.position += 60
+            _motors._motor_pair.right_motor.position += 60
+
+        _motors._motor_pair.on.side_effect = on
+        self._gyro.get_orientation.side_effect = lambda **kwargs: _angles.pop(0) if len(_angles) > 1 else _angles[0]
+        _motors.move_forward()
+        _motors._motor_pair.on_for_rotations.assert_not_called()
+        _steerings = [_call.kwargs['steering'] for _call in _motors._motor_pair.on.call_args_list]
+        self.assertEqual(3, len(_steerings))
+        self.assertTrue(all(_steering < 0 for _steering in _steerings))
+        _motors._motor_pair.off.assert_called_once_with(brake = True)
+
+    def test_should_turn_until_gyro_angle_with_heading_control(self):
+        _motors = self._create_motors(heading_control = True)
+        _angles = [0, 40, 80, 90, 90]
+        self._gyro.get_orientation.side_effect = lambda **kwargs: _angles.pop(0) if len(_angles) > 1 else _angles[0]
+        _motors.turn_right()
+        _speeds = [_call.kwargs['speed'] for _call in _motors._motor_pair.on.call_args_list]
+        self.assertEqual(2, len(_speeds))
+        _motors._motor_pair.off.assert_called_once_with(brake = True)
+
+    def test_should_keep_heading_of_whole_turns_instead_of_heading_after_last_turn(self):
+        _motors = self._create_motors(wheel_diameter_mm = 360 / 3.141592653589793, heading_control = True)
+        _motors._motor_pair.left_motor.position = 0
+        _motors._motor_pair.right_motor.position = 0
+        # The turn right overshoots by 3 degrees
+        _angles = [0, 50, 93]
+
+        def on(**kwargs):
+            _motors._motor_pair.left_motor.position += 60
+            _motors._motor_pair.right_motor.position += 60
+
+        _motors._motor_pair.on.side_effect = on
+        self._gyro.get_orientation.side_effect = lambda **kwargs: _angles.pop(0) if len(_angles) > 1 else _angles[0]
+        _motors.turn_right()
+        _motors._motor_pair.on.reset_mock()
+        _motors.move_forward()
+        self.assertEqual(90, _motors._heading_controller.target_heading)
+        self.assertLess(_motors._motor_pair.on.call_args_list[0].kwargs['steering'], 0)
+
+    def test_should_only_correct_front_distance_with_heading_control(self):
+        _motors = self._create_motors(heading_control = True)
+        _motors._drive_straight_mm = MagicMock()
+        _motors._turn_on_spot_to_angle = MagicMock()
+        _motors._position_corrector = MagicMock()
+        _motors.move_forward()
+        _motors.turn_left()
+        _motors._position_corrector.correct_front_distance_after_move_forward.assert_called_once()
+        _motors._position_corrector.correct_after_move_forward.assert_not_called()
+        _motors._position_corrector.correct_after_turn_left.assert_not_called()
@@ -69,6 +69,13 @@ class MoveForwardCorrectionTests(PositionCorrectorTests):
         _expected_rotations = -(1.0 / (self._test_wheel_diameter_mm / 10 * math.pi))
         self.assertAlmostEqual(_expected_rotations, kwargs.get('rotations'), places=3)
 
+    def test_should_only_move_straight_when_correcting_front_distance_only(self):
+        _distances_after = {'left': 1.0, 'right': 2.0, 'front': 5.0}
+        self._position_corrector.correct_front_distance_after_move_forward(_distances_after)
+        self._ev3_motor_pair.on_for_rotations.assert_called_once()
+        self.assertEqual(Steering.STRAIGHT.value, self._ev3_motor_pair.on_for_rotations.call_args.kwargs['steering'])
+        self._ev3_motor_pair.on_for_degrees.assert_not_called()
+
     def test_should_move_back_and_correct_turn_back_to_right_when_has_hit_left_wall(self):
         _distances_after = {'left': 2.0, 'right': 2.0, 'front': 15.0}
         self._gyro.get_orientation.side_effect = [0, 0]
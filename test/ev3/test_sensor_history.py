@@ -0,0 +1,51 @@
+import random
+import statistics
+import unittest
+from ev3.sensor_history import SensorHistory
+
+
+class SensorHistoryTests(unittest.TestCase):
+
+    def setUp(self):
+        self._history = SensorHistory(size = 4)
+
+    def test_should_have_no_statistics_when_empty(self):
+        self.assertIsNone(self._history.mean)
+        self.assertIsNone(self._history.median)
+        self.assertIsNone(self._history.variance)
+        self.assertIsNone(self._history.latest)
+
+    def test_should_keep_only_last_readings(self):
+        for _value in [1.0, 2.0, 3.0, 4.0, 5.0, 6.0]:
+            self._history.add(_value)
+        self.assertEqual([3.0, 4.0, 5.0, 6.0], self._history.get_values())
+        self.assertEqual(4, self._history.count)
+        self.assertEqual(6.0, self._history.latest)
+
+    def test_should_calculate_statistics_of_partly_filled_history(self):
+        for _value in [2.0, 255.0, 4.0]:
+            self._history.add(_value)
+        self.assertEqual(4.0, self._history.median)
+        self.assertAlmostEqual(87.0, self._history.mean)
+        self.assertAlmostEqual(statistics.pvariance([2.0, 255.0, 4.0]), self._history.variance)
+
+    def test_should_match_statistics_of_same_readings_while_rolling(self):
+        _random = random.Random(1)
+        _history = SensorHistory(size = 5)
+        _readings = [round(_random.uniform(0, 30), 1) for _ in range(100)]
+        for _index, _reading in enumerate(_readings):
+            _history.add(_reading)
+            _window = _readings[max(0, _index - 4):_index + 1]
+            self.assertAlmostEqual(statistics.mean(_window), _history.mean)
+            self.assertAlmostEqual(statistics.median(_window), _history.median)
+            self.assertAlmostEqual(statistics.pvariance(_window), _history.variance, places = 6)
+
+    def test_should_forget_readings_when_cleared(self):
+        self._history.add(1.0)
+        self._history.clear()
+        self.assertEqual(0, self._history.count)
+        self.assertEqual([], self._history.get_values())
+
+    def test_should_raise_value_error_when_size_is_zero(self):
+        with self.assertRaises(ValueError):
+            SensorHistory(size = 0)
@@ -0,0 +1,129 @@
+import threading
+import unittest
+from unittest.mock import MagicMock
+from test.ev3.ev3dev_test_util import Ev3devTestUtil
+Ev3devTestUtil.create_fake_ev3dev2_module()
+from ev3.sensor_scheduler import SensorScheduler
+from ev3.gyro import Gyro
+from ev3.distance_detectors import EV3DistanceDetectors
+from ev3.buttons import EV3Buttons
+
+
+class FakeClock(object):
+
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class SensorSchedulerTests(unittest.TestCase):
+
+    def setUp(self):
+        self._clock = FakeClock()
+        self._sensor_scheduler = SensorScheduler(clock = self._clock)
+        self._fast_sensor = MagicMock(side_effect = [1, 2, 3, 4, 5, 6])
+        self._slow_sensor = MagicMock(side_effect = ['a', 'b'])
+        self._sensor_scheduler.add_sensor('fast', self._fast_sensor, 0.02)
+        self._sensor_scheduler.add_sensor('slow', self._slow_sensor, 0.1)
+
+    def test_should_read_each_sensor_at_its_own_rate(self):
+        for _ in range(5):
+            self._sensor_scheduler.read_due_sensors()
+            self._clock.now += 0.02
+        self.assertEqual(5, self._fast_sensor.call_count)
+        self.assertEqual(1, self._slow_sensor.call_count)
+
+    def test_should_return_time_until_next_reading(self):
+        self.assertAlmostEqual(0.02, self._sensor_scheduler.read_due_sensors())
+        self._clock.now += 0.015
+        self.assertAlmostEqual(0.005, self._sensor_scheduler.read_due_sensors())
+
+    def test_should_publish_timestamped_samples(self):
+        self._sensor_scheduler.read_due_sensors()
+        self._clock.now += 0.02
+        self._sensor_scheduler.read_due_sensors()
+        _sample = self._sensor_scheduler.get_latest_sample('fast')
+        self.assertEqual(2, _sample.value)
+        self.assertEqual(100.02, _sample.timestamp)
+        self.assertEqual(2, _sample.sequence_number)
+        self.assertEqual('a', self._sensor_scheduler.get_latest_sample('slow').value)
+
+    def test_should_keep_reading_other_sensors_when_one_fails(self):
+        self._sensor_scheduler.add_sensor('broken', MagicMock(side_effect = IOError('sensor unplugged')), 0.02)
+        self._sensor_scheduler.read_due_sensors()
+        self.assertIsNone(self._sensor_scheduler.get_latest_sample('broken'))
+        self.assertEqual(1, self._sensor_scheduler.get_latest_sample('fast').value)
+
+    def test_should_return_fresh_sample_without_waiting_when_there_is_one(self):
+        self._sensor_scheduler.read_due_sensors()
+        _sample = self._sensor_scheduler.wait_for_sample_after('fast', 100.0, timeout_sec = 0)
+        self.assertEqual(1, _sample.value)
+
+    def test_should_return_none_when_no_fresh_sample_within_timeout(self):
+        self._sensor_scheduler.read_due_sensors()
+        self.assertIsNone(self._sensor_scheduler.wait_for_sample_after('fast', 100.01, timeout_sec = 0.01))
+
+    def test_should_wake_up_waiting_consumer_when_fresh_sample_is_read(self):
+        self._sensor_scheduler.read_due_sensors()
+        _samples = []
+        _consumer = threading.Thread(target = lambda: _samples.append(self._sensor_scheduler.wait_for_sample_after('fast', 100.01, timeout_sec = 5)))
+        _consumer.start()
+        self._clock.now += 0.02
+        self._sensor_scheduler.read_due_sensors()
+        _consumer.join()
+        self.assertEqual(2, _samples[0].value)
+
+
+class SensorSchedulerThreadTests(unittest.TestCase):
+
+    def test_should_read_sensors_in_own_thread_until_stopped(self):
+        _sensor_scheduler = SensorScheduler()
+        _sensor_scheduler.add_sensor('counter', MagicMock(return_value = 1), 0.001)
+        _sensor_scheduler.start()
+        _sample = _sensor_scheduler.wait_for_sample_after('counter', _sensor_scheduler.get_time() + 0.01, timeout_sec = 5)
+        _sensor_scheduler.stop()
+        _sensor_scheduler.join(timeout = 5)
+        self.assertFalse(_sensor_scheduler.is_alive())
+        self.assertTrue(_sample.sequence_number > 1)
+
+
+class ScheduledSensorsTests(unittest.TestCase):
+
+    def setUp(self):
+        self._clock = FakeClock()
+        self._sensor_scheduler = SensorScheduler(clock = self._clock)
+
+    def test_should_return_fresh_gyro_angle(self):
+        _gyro = Gyro(sensor_scheduler = self._sensor_scheduler)
+        _gyro._gyro = MagicMock()
+        _gyro._gyro.angle = 5
+        self._sensor_scheduler.read_due_sensors()
+        _gyro._gyro.angle = 7
+        self._clock.now += 0.02
+        self._sensor_scheduler.read_due_sensors()
+        self.assertEqual(7, _gyro.get_orientation(fresh_after = 100.01))
+
+    def test_should_call_button_listener_once_per_reading(self):
+        _buttons = EV3Buttons(sensor_scheduler = self._sensor_scheduler)
+        _buttons._buttons = MagicMock(enter = True, backspace = False)
+        _listener = MagicMock()
+        _buttons.add_enter_button_listener(_listener)
+        self._sensor_scheduler.read_due_sensors()
+        _buttons.notify_listeners(timeout_sec = 0)
+        _buttons.notify_listeners(timeout_sec = 0)
+        _listener.assert_called_once()
+
+    def test_should_return_median_of_last_distances_when_filtered(self):
+        _distance_detectors = EV3DistanceDetectors(sensor_scheduler = self._sensor_scheduler, history_size = 3)
+        _readings = {'left': [2.0, 2.2, 255.0], 'front': [9.0, 9.0, 9.0], 'right': [3.0, 1.0, 2.0]}
+        for _sensor_name in _readings.keys():
+            _sensor = MagicMock()
+            _sensor.distance_centimeters.side_effect = _readings[_sensor_name]
+            setattr(_distance_detectors, '_sensor_' + _sensor_name, _sensor)
+        for _ in range(3):
+            self._sensor_scheduler.read_due_sensors()
+            self._clock.now += 0.05
+        self.assertEqual({'left': 255.0, 'front': 9.0, 'right': 2.0}, _distance_detectors.get_distances())
+        self.assertEqual({'left': 2.2, 'front': 9.0, 'right': 2.0}, _distance_detectors.get_distances(filtered = True))
@@ -0,0 +1,87 @@
+import io
+import math
+import os
+import tempfile
+import unittest
+from unittest.mock import MagicMock
+from test.ev3.ev3dev_test_util import Ev3devTestUtil
+Ev3devTestUtil.create_fake_ev3dev2_module()
+from maze_solver.route_planner import MotorCommand
+from ev3.telemetry import TelemetryRecorder, read_telemetry, get_wall_decision, LEFT_CHECKED, FRONT_CHECKED, FRONT_BLOCKED
+from ev3.telemetry_decoder import decode_telemetry, write_telemetry_csv
+from ev3.wall_detector import EV3WallDetector
+
+
+class TelemetryRecorderTests(unittest.TestCase):
+
+    def setUp(self):
+        self._directory = tempfile.TemporaryDirectory()
+        self._path = os.path.join(self._directory.name, 'telemetry.bin')
+        self._clock = MagicMock(side_effect = [float(_time) for _time in range(100)])
+
+    def tearDown(self):
+        self._directory.cleanup()
+
+    def _create_recorder(self, **kwargs) -> TelemetryRecorder:
+        return TelemetryRecorder(self._path, clock = self._clock, **kwargs)
+
+    def test_should_write_records_to_file_on_flush(self):
+        _recorder = self._create_recorder()
+        _recorder.record_distances({'left': 1.5, 'front': 7.0, 'right': 255.0}, angle = 90.0, motor_command = MotorCommand.TURN_LEFT.value)
+        self.assertEqual([], list(read_telemetry(self._path)))
+        _recorder.flush()
+        _recorder.record(front = 3.0, decision = FRONT_CHECKED | FRONT_BLOCKED)
+        _recorder.close()
+        _records = list(read_telemetry(self._path))
+        self.assertEqual((0.0, 1.5, 7.0, 255.0, 90.0, MotorCommand.TURN_LEFT.value, 0), _records[0])
+        self.assertEqual(1.0, _records[1][0])
+        self.assertTrue(math.isnan(_records[1][1]))
+        self.assertEqual((3.0, FRONT_CHECKED | FRONT_BLOCKED), (_records[1][2], _records[1][6]))
+
+    def test_should_drop_records_when_file_is_full(self):
+        _recorder = self._create_recorder(max_records = 3, buffer_records = 2)
+        for _ in range(2):
+            _recorder.record(left = 1.0)
+        _recorder.flush()
+        for _ in range(3):
+            _recorder.record(left = 2.0)
+        _recorder.close()
+        self.assertEqual(3, len(list(read_telemetry(self._path))))
+        self.assertEqual(2, _recorder.dropped_count)
+
+    def test_should_flush_in_own_thread_until_stopped(self):
+        _recorder = TelemetryRecorder(self._path, flush_interval_sec = 0.01)
+        _recorder.start()
+        _recorder.record(left = 1.0)
+        _recorder.stop()
+        _recorder.join(timeout = 5)
+        self.assertFalse(_recorder.is_alive())
+        _recorder.close()
+        self.assertEqual(1, len(list(read_telemetry(self._path))))
+
+    def test_should_decode_motor_commands_and_decisions(self):
+        _recorder = self._create_recorder()
+        _recorder.record(left = 2.0, angle = 3.0, motor_command = MotorCommand.MOVE_FORWARD.value)
+        _recorder.record(decision = get_wall_decision('left', False) | get_wall_decision('front', True))
+        _recorder.close()
+        _records = decode_telemetry(self._path)
+        self.assertEqual('MOVE_FORWARD', _records[0]['motor_command'])
+        self.assertIsNone(_records[0]['front'])
+        self.assertEqual('left=open front=blocked', _records[1]['decision'])
+        _output = io.StringIO()
+        write_telemetry_csv(self._path, _output)
+        self.assertEqual(3, len(_output.getvalue().splitlines()))
+
+    def test_should_not_read_other_files(self):
+        with open(self._path, 'wb') as _file:
+            _file.write(b'MAZ1' + bytes(20))
+        with self.assertRaises(ValueError):
+            list(read_telemetry(self._path))
+
+    def test_should_record_wall_decisions(self):
+        _recorder = MagicMock()
+        _distance_sensors = MagicMock()
+        _distance_sensors.get_distances.return_value = {'left': 20.0, 'front': 2.0, 'right': 3.0}
+        _wall_detector = EV3WallDetector(_distance_sensors, telemetry_recorder = _recorder)
+        self.assertFalse(_wall_detector.is_left_blocked())
+        _recorder.record_distances.assert_called_once_with({'left': 20.0, 'front': 2.0, 'right': 3.0}, decision = LEFT_CHECKED)
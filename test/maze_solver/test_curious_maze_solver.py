@@ -1,8 +1,11 @@
+import functools
 import unittest
 from unittest.mock import call, MagicMock, Mock
 from maze_solver.maze_solver import Motors, NotificationType
 from maze_solver.direction import Direction
 from maze_solver.curious_maze_solver import CuriousMazeSolver, Square
+from simulator.maze_factory import create_robotex_cyprus_2017_maze
+from simulator.maze_solving_session import SimulatorMazeSolvingSession
 from test.maze_solver.test_maze_solver import BaseMazeResolverTest, MotorsCallCounter
 
 
@@ -634,5 +637,90 @@ class PreferCloserToFinishWithNoneBlockedTest(InSquareNoneBlockedTest, PreferClo
         self.assert_only_turn_right_called()
 
 
+class LoopDetectionTest(CuriousMazeSolverTest):
+
+    def walk_around_2_to_2_loop(self):
+        self._wall_detector.is_front_blocked.side_effect = [False, True, True, True]
+        self._wall_detector.is_left_blocked.side_effect = [True, True, True, True]
+        self._wall_detector.is_right_blocked.side_effect = [True, False, False, False]
+        for _ in range(4):
+            self._maze_solver.next_move()
+
+    def test_should_mark_passage_as_loop_edge_when_it_leads_back_to_walked_square(self):
+        self.walk_around_2_to_2_loop()
+        self.assertTrue(self._maze_solver.is_loop_edge(x = 2, y = 1, direction = Direction.WEST))
+        self.assertTrue(self._maze_solver.is_loop_edge(x = 1, y = 1, direction = Direction.EAST))
+
+    def test_should_not_mark_other_passages_of_loop_as_loop_edges(self):
+        self.walk_around_2_to_2_loop()
+        self.assertFalse(self._maze_solver.is_loop_edge(x = 1, y = 1, direction = Direction.NORTH))
+        self.assertFalse(self._maze_solver.is_loop_edge(x = 1, y = 2, direction = Direction.EAST))
+        self.assertFalse(self._maze_solver.is_loop_edge(x = 2, y = 2, direction = Direction.SOUTH))
+
+    def test_should_not_mark_passage_as_loop_edge_when_walking_back_from_dead_end(self):
+        self._wall_detector.is_front_blocked.side_effect = [False, False, True, False]
+        self._wall_detector.is_left_blocked.side_effect = [True, True, True, True]
+        self._wall_detector.is_right_blocked.side_effect = [True, True, True, True]
+        for _ in range(4):
+            self._maze_solver.next_move()
+        self.assertFalse(self._maze_solver.is_loop_edge(x = 1, y = 3, direction = Direction.SOUTH))
+        self.assertFalse(self._maze_solver.is_loop_edge(x = 1, y = 2, direction = Direction.SOUTH))
+
+    def test_should_avoid_loop_edge_when_prefer_no_loops_weight_is_set(self):
+        self.prepare_mock_wall_detector(front_blocked = False, right_blocked = False)
+        self._maze_solver.prefer_closer_to_center_weight = 0
+        self._maze_solver.prefer_no_turns_weight = 0
+        self._maze_solver.prefer_no_loops_weight = 5
+        self._maze_solver.mark_loop_edge(x = 1, y = 1, direction = Direction.NORTH)
+        self._maze_solver.next_move()
+        self.assert_only_turn_right_called()
+
+
+class DecisionTableTest(CuriousMazeSolverTest):
+
+    def solve_robotex_maze(self, **kwargs) -> dict:
+        return SimulatorMazeSolvingSession(
+            create_robotex_cyprus_2017_maze(),
+            maze_solver_factory=functools.partial(CuriousMazeSolver, center_coordinates=[8, 9], **kwargs),
+            random_seed=1
+        ).start()
+
+    def test_should_make_the_same_moves_with_and_without_decision_table(self):
+        self.assertEqual(
+            self.solve_robotex_maze(prefer_no_loops_weight = 2),
+            self.solve_robotex_maze(prefer_no_loops_weight = 2, use_decision_table = False)
+        )
+
+    def test_should_use_decision_table_when_weights_are_whole_numbers(self):
+        self.assertIsNotNone(self._maze_solver._get_decision_table())
+
+    def test_should_use_branches_when_weights_are_not_whole_numbers(self):
+        self._maze_solver.prefer_no_turns_weight = 0.5
+        self.assertIsNone(self._maze_solver._get_decision_table())
+
+    def test_should_compile_new_decision_table_when_weight_changes(self):
+        _decision_table = self._maze_solver._get_decision_table()
+        self._maze_solver.prefer_no_loops_weight = 3
+        self.assertIsNot(_decision_table, self._maze_solver._get_decision_table())
+
+
+class DeadEndFillingTest(CuriousMazeSolverTest):
+
+    def get_unvisited_dead_ends_after_solving_robotex_maze(self, fill_dead_ends: bool) -> list:
+        _session = SimulatorMazeSolvingSession(create_robotex_cyprus_2017_maze(), random_seed=1, fill_dead_ends=fill_dead_ends)
+        _session.start()
+        _maze_solver = _session.maze_solver
+        return [
+            (_x, _y) for _x in range(1, 17) for _y in range(1, 17)
+            if _maze_solver.is_dead_end(_x, _y) and not _maze_solver.is_visited(_x, _y)
+        ]
+
+    def test_should_mark_dead_ends_without_walking_through_them_when_filling_dead_ends(self):
+        self.assertGreater(len(self.get_unvisited_dead_ends_after_solving_robotex_maze(fill_dead_ends = True)), 0)
+
+    def test_should_mark_only_walked_dead_ends_by_default(self):
+        self.assertEqual([], self.get_unvisited_dead_ends_after_solving_robotex_maze(fill_dead_ends = False))
+
+
 if __name__ == '__main__':
     unittest.main()
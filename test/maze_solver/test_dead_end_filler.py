@@ -0,0 +1,59 @@
+import unittest
+from maze_solver import headings
+from maze_solver.dead_end_filler import DeadEndFiller
+
+
+class DeadEndFillerTest(unittest.TestCase):
+
+    def setUp(self):
+        self._filler = DeadEndFiller(excluded_squares = {(5, 5)}, current_square = (1, 1))
+
+    def set_walls(self, x: int, y: int, open_headings: tuple) -> list:
+        _filled_squares = []
+        for _heading in headings.HEADINGS:
+            _filled_squares.extend(self._filler.set_wall(x, y, _heading, _heading not in open_headings))
+        return _filled_squares
+
+    def set_up_corridor_from_junction(self) -> list:
+        # Junction at 3,1 and a corridor from it up to a dead-end at 3,3
+        self.set_walls(3, 1, (headings.NORTH, headings.EAST, headings.WEST))
+        self.set_walls(3, 2, (headings.NORTH, headings.SOUTH))
+        return self.set_walls(3, 3, (headings.SOUTH,))
+
+    def test_should_not_fill_square_with_unknown_walls(self):
+        self._filler.set_wall(3, 3, headings.NORTH, True)
+        self._filler.set_wall(3, 3, headings.EAST, True)
+        self.assertFalse(self._filler.is_dead_end(3, 3))
+
+    def test_should_fill_whole_corridor_as_soon_as_its_end_is_known(self):
+        self.assertEqual([(3, 3), (3, 2)], self.set_up_corridor_from_junction())
+        self.assertTrue(self._filler.is_dead_end(3, 2))
+
+    def test_should_stop_filling_at_junction(self):
+        self.set_up_corridor_from_junction()
+        self.assertFalse(self._filler.is_dead_end(3, 1))
+
+    def test_should_fill_junction_when_all_but_one_of_its_ways_are_dead_ends(self):
+        self.set_up_corridor_from_junction()
+        _filled_squares = self.set_walls(4, 1, (headings.WEST,))
+        self.assertEqual([(4, 1), (3, 1)], _filled_squares)
+
+    def test_should_never_fill_excluded_square(self):
+        self.set_walls(5, 5, (headings.SOUTH,))
+        self.assertFalse(self._filler.is_dead_end(5, 5))
+
+    def test_should_keep_way_out_open_until_robot_has_left(self):
+        self._filler.set_current_square(3, 2)
+        self.set_up_corridor_from_junction()
+        self.assertTrue(self._filler.is_dead_end(3, 3))
+        self.assertFalse(self._filler.is_dead_end(3, 2))
+        self.assertEqual([(3, 2)], self._filler.set_current_square(3, 1))
+
+    def test_should_propagate_dead_end_marked_by_other_means(self):
+        self.set_walls(3, 1, (headings.NORTH, headings.EAST, headings.WEST))
+        self.set_walls(3, 2, (headings.NORTH, headings.SOUTH))
+        self.assertEqual([(3, 3), (3, 2)], self._filler.mark_dead_end(3, 3))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,34 @@
+import unittest
+from maze_solver import headings
+from maze_solver.direction import Direction
+
+
+class DirectionTest(unittest.TestCase):
+
+    def test_should_turn_clockwise_to_the_right(self):
+        self.assertEqual(Direction.EAST, Direction.NORTH.get_right_direction())
+        self.assertEqual(Direction.NORTH, Direction.WEST.get_right_direction())
+
+    def test_should_turn_counterclockwise_to_the_left(self):
+        self.assertEqual(Direction.WEST, Direction.NORTH.get_left_direction())
+        self.assertEqual(Direction.SOUTH, Direction.WEST.get_left_direction())
+
+    def test_should_turn_back_to_the_opposite_direction(self):
+        self.assertEqual(Direction.SOUTH, Direction.NORTH.get_back_direction())
+        self.assertEqual(Direction.EAST, Direction.WEST.get_back_direction())
+
+    def test_should_convert_to_and_from_heading(self):
+        for _direction in Direction:
+            self.assertIs(_direction, Direction.from_heading(_direction.heading))
+
+    def test_should_move_the_same_way_by_heading_as_by_direction(self):
+        for _direction in Direction:
+            self.assertEqual(_direction.value['x'], headings.DX[_direction.heading])
+            self.assertEqual(_direction.value['y'], headings.DY[_direction.heading])
+            self.assertEqual(_direction.get_left_direction().heading, headings.LEFT_OF[_direction.heading])
+            self.assertEqual(_direction.get_right_direction().heading, headings.RIGHT_OF[_direction.heading])
+            self.assertEqual(_direction.get_back_direction().heading, headings.BACK_OF[_direction.heading])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,82 @@
+import random
+import unittest
+from maze_solver.direction import Direction
+from maze_solver.square import Square
+from maze_solver.flood_fill_maze_solver import FloodFillMazeSolver
+from test.maze_solver.test_maze_solver import BaseMazeResolverTest
+
+
+class FloodFillMazeSolverTest(BaseMazeResolverTest):
+
+    def setUp(self):
+        self.create_mocks()
+        self._maze_solver = FloodFillMazeSolver(
+            self._motors, 
+            self._wall_detector, 
+            self._finish_detector, 
+            self._outputs,
+            maze_width = 6,
+            maze_height = 6,
+            center_coordinates = [4]
+        )
+
+    def test_should_start_with_walking_distances_of_empty_maze(self):
+        self.assertEqual(6, self._maze_solver.get_distance(1, 1))
+        self.assertEqual(0, self._maze_solver.get_distance(4, 4))
+        self.assertEqual(4, self._maze_solver.get_distance(6, 6))
+
+    def test_should_make_no_turn_when_front_and_right_are_equally_close(self):
+        self.prepare_mock_wall_detector(front_blocked = False, right_blocked = False)
+        self._maze_solver.next_move()
+        self.assert_only_turn_called('no_turn')
+
+    def test_should_turn_right_when_right_is_closer(self):
+        self._maze_solver.current_square = Square(x = 1, y = 4)
+        self.prepare_mock_wall_detector(front_blocked = False, right_blocked = False)
+        self._maze_solver.next_move()
+        self.assert_only_turn_called('turn_right')
+
+    def test_should_turn_back_when_all_blocked(self):
+        self.prepare_mock_wall_detector()
+        self._maze_solver.next_move()
+        self.assert_only_turn_called('turn_back')
+
+    def test_should_learn_walls_and_update_distances(self):
+        self.prepare_mock_wall_detector(front_blocked = True, right_blocked = False)
+        self._maze_solver.next_move()
+        self.assertTrue(self._maze_solver.wall_map.is_blocked(1, 1, Direction.NORTH))
+        self.assertTrue(self._maze_solver.wall_map.is_explored(1, 1))
+        self.assertEqual(6, self._maze_solver.get_distance(1, 1))
+        self.assertEqual(Direction.EAST, self._maze_solver.current_direction)
+        self.assertEqual(2, self._maze_solver.current_square.x)
+
+    def test_should_not_aim_for_center_square_anymore_when_it_was_not_finish(self):
+        self._maze_solver = FloodFillMazeSolver(
+            self._motors, self._wall_detector, self._finish_detector, self._outputs,
+            maze_width = 6, maze_height = 6, center_coordinates = [3, 4]
+        )
+        self._maze_solver.current_square = Square(x = 4, y = 4)
+        self.prepare_mock_wall_detector(front_blocked = False, right_blocked = False, left_blocked = False)
+        self._maze_solver.next_move()
+        self.assertEqual(1, self._maze_solver.get_distance(4, 4))
+        self.assertEqual(0, self._maze_solver.get_distance(3, 4))
+
+    def test_should_have_same_distances_after_incremental_updates_as_after_full_flood(self):
+        _random = random.Random(1)
+        _wall_map = self._maze_solver.wall_map
+        for _ in range(40):
+            _x = _random.randint(1, 6)
+            _y = _random.randint(1, 6)
+            _direction = _random.choice(list(Direction))
+            if _wall_map.set_blocked(_x, _y, _direction, _random.random() < 0.8):
+                _index = _wall_map.get_index(_x, _y)
+                _neighbour_index = _wall_map.get_index(_x + _direction.value['x'], _y + _direction.value['y'])
+                self._maze_solver.update_distances([_index, _neighbour_index])
+            _incremental_distances = [self._maze_solver.get_distance(_i // 6 + 1, _i % 6 + 1) for _i in range(36)]
+            self._maze_solver.flood_all()
+            _full_flood_distances = [self._maze_solver.get_distance(_i // 6 + 1, _i % 6 + 1) for _i in range(36)]
+            self.assertEqual(_full_flood_distances, _incremental_distances)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,103 @@
+import functools
+import unittest
+from maze_solver.direction import Direction
+from maze_solver.square import Square
+from maze_solver.frontier_maze_solver import FrontierMazeSolver
+from simulator.maze_factory import create_kasemetsaresortspa_test_maze
+from simulator.maze_solving_session import SimulatorMazeSolvingSession
+from test.maze_solver.test_maze_solver import BaseMazeResolverTest
+
+
+class FrontierMazeSolverTest(BaseMazeResolverTest):
+
+    def setUp(self):
+        self.create_mocks()
+        self._maze_solver = FrontierMazeSolver(
+            self._motors,
+            self._wall_detector,
+            self._finish_detector,
+            self._outputs,
+            maze_width = 6,
+            maze_height = 6,
+            center_coordinates = [4]
+        )
+
+    def test_should_add_open_unvisited_neighbours_to_frontier(self):
+        self.prepare_mock_wall_detector(front_blocked = False, right_blocked = False)
+        self._maze_solver.next_move()
+        self.assertEqual([(1, 2), (2, 1)], self._maze_solver.get_frontier_squares())
+        self.assertTrue(self._maze_solver.wall_map.is_explored(1, 1))
+
+    def test_should_remove_visited_square_from_frontier(self):
+        self.prepare_mock_wall_detector(front_blocked = False, right_blocked = False)
+        self._maze_solver.next_move()
+        self._maze_solver.next_move()
+        self.assertNotIn((1, 2), self._maze_solver.get_frontier_squares())
+        self.assertIn((2, 1), self._maze_solver.get_frontier_squares())
+
+    def test_should_go_towards_frontier_square_closer_to_center(self):
+        self._maze_solver.current_square = Square(x = 1, y = 4)
+        self.prepare_mock_wall_detector(front_blocked = False, right_blocked = False)
+        self._maze_solver.next_move()
+        self.assert_only_turn_called('turn_right')
+
+    def test_should_go_to_nearest_frontier_square_without_goal_heuristic(self):
+        self._maze_solver = FrontierMazeSolver(
+            self._motors, self._wall_detector, self._finish_detector, self._outputs,
+            maze_width = 6, maze_height = 6, center_coordinates = [4], goal_heuristic_weight = 0
+        )
+        self._maze_solver.current_square = Square(x = 1, y = 4)
+        self.prepare_mock_wall_detector(front_blocked = False, right_blocked = False)
+        self._maze_solver.next_move()
+        self.assert_only_turn_called('no_turn')
+
+    def test_should_follow_planned_route_back_to_frontier_after_dead_end(self):
+        # Goes up a dead-end corridor from 1,1 to 1,3, and leaves 2,1 on the right unvisited
+        self._wall_detector.is_left_blocked.side_effect = [True, True, True, True, False]
+        self._wall_detector.is_front_blocked.side_effect = [False, False, True, False, True]
+        self._wall_detector.is_right_blocked.side_effect = [False, True, True, True, True]
+        self._maze_solver = FrontierMazeSolver(
+            self._motors, self._wall_detector, self._finish_detector, self._outputs,
+            maze_width = 6, maze_height = 6, center_coordinates = [4], goal_heuristic_weight = 0
+        )
+        for _ in range(3):
+            self._maze_solver.next_move()
+        self._motors.turn_back.assert_called_once()
+        self.assertEqual(Direction.SOUTH, self._maze_solver.current_direction)
+        self.assertGreater(self._maze_solver.remaining_route_command_count, 0)
+        for _ in range(2):
+            self._maze_solver.next_move()
+        self._motors.turn_left.assert_called_once()
+        self.assertEqual(2, self._maze_solver.current_square.x)
+        self.assertEqual(1, self._maze_solver.current_square.y)
+
+    def test_should_turn_back_when_no_frontier_square_is_left(self):
+        self.prepare_mock_wall_detector()
+        self._maze_solver.current_square = Square(x = 2, y = 2)
+        self._maze_solver.wall_map.set_explored(2, 1)
+        self._maze_solver.next_move()
+        self.assert_only_turn_called('turn_back')
+
+    def test_should_solve_maze_in_simulator(self):
+        _session = SimulatorMazeSolvingSession(
+            create_kasemetsaresortspa_test_maze(),
+            maze_solver_factory=functools.partial(FrontierMazeSolver, maze_width=6, maze_height=6, center_coordinates=[4])
+        )
+        _results = _session.start()
+        self.assertTrue(_session.current_square.is_finish)
+        self.assertLess(_results['move_count'], 40)
+
+
+    def test_should_solve_maze_in_simulator_without_filling_dead_ends(self):
+        _session = SimulatorMazeSolvingSession(
+            create_kasemetsaresortspa_test_maze(),
+            maze_solver_factory=functools.partial(
+                FrontierMazeSolver, maze_width=6, maze_height=6, center_coordinates=[4], fill_dead_ends=False
+            )
+        )
+        _session.start()
+        self.assertTrue(_session.current_square.is_finish)
+
+
+if __name__ == '__main__':
+    unittest.main()
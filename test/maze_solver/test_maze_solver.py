@@ -49,6 +49,13 @@ class BaseMazeResolverTest(unittest.TestCase):
             'Call {} is not one of the expected calls!'.format(actual_call)
         )
 
+    def assert_only_turn_called(self, expected_turn: str):
+        for _turn in ['no_turn', 'turn_left', 'turn_right', 'turn_back']:
+            if _turn == expected_turn:
+                getattr(self._motors, _turn).assert_called()
+            else:
+                getattr(self._motors, _turn).assert_not_called()
+
     def prepare_mock_wall_detector(self, left_blocked: bool = True, front_blocked: bool = True, right_blocked: bool = True):
         self._wall_detector.is_left_blocked.return_value = left_blocked
         self._wall_detector.is_front_blocked.return_value = front_blocked
@@ -0,0 +1,64 @@
+import unittest
+from maze_solver.direction import Direction
+from maze_solver.wall_map import WallMap
+from maze_solver.route_planner import RoutePlanner, MotorCommand
+
+
+class RoutePlannerTest(unittest.TestCase):
+
+    def setUp(self):
+        self._wall_map = WallMap(width = 3, height = 3)
+        for _x in range(1, 4):
+            for _y in range(1, 4):
+                self._wall_map.set_explored(_x, _y)
+        self._route_planner = RoutePlanner(forward_motion_time = 1.1, turn_motion_time = 0.9, back_turn_motion_time = 1.7)
+
+    def test_should_go_straight_when_goal_is_straight_ahead(self):
+        _route = self._route_planner.plan(self._wall_map, 1, 1, Direction.NORTH, [(1, 3)])
+        self.assertEqual([MotorCommand.MOVE_FORWARD, MotorCommand.MOVE_FORWARD], _route)
+
+    def test_should_prefer_route_with_less_turns_when_it_is_faster(self):
+        _route = self._route_planner.plan(self._wall_map, 1, 1, Direction.NORTH, [(3, 3)])
+        self.assertEqual(1, _route.count(MotorCommand.TURN_RIGHT) + _route.count(MotorCommand.TURN_LEFT))
+        self.assertAlmostEqual(4 * 1.1 + 0.9, self._route_planner.get_motion_time(_route))
+
+    def test_should_turn_back_when_goal_is_behind(self):
+        _route = self._route_planner.plan(self._wall_map, 1, 3, Direction.NORTH, [(1, 1)])
+        self.assertEqual([MotorCommand.TURN_BACK, MotorCommand.MOVE_FORWARD, MotorCommand.MOVE_FORWARD], _route)
+
+    def test_should_go_around_walls(self):
+        self._wall_map.set_blocked(1, 1, Direction.NORTH, True)
+        self._wall_map.set_blocked(2, 1, Direction.NORTH, True)
+        _route = self._route_planner.plan(self._wall_map, 1, 1, Direction.NORTH, [(1, 2)])
+        self.assertEqual(round(5 * 1.1 + 3 * 0.9, 6), round(self._route_planner.get_motion_time(_route), 6))
+
+    def test_should_not_go_through_unexplored_squares(self):
+        _wall_map = WallMap(width = 3, height = 3)
+        _wall_map.set_explored(1, 1)
+        self.assertIsNone(self._route_planner.plan(_wall_map, 1, 1, Direction.NORTH, [(1, 3)]))
+        self.assertIsNotNone(self._route_planner.plan(_wall_map, 1, 1, Direction.NORTH, [(1, 3)], explored_only = False))
+
+    def test_should_go_to_goal_square_with_least_time_including_its_extra_time(self):
+        _goal_extra_times = {(1, 2): 3.0, (2, 1): 0.0}
+        _route = self._route_planner.plan(self._wall_map, 1, 1, Direction.NORTH, [(1, 2), (2, 1)], goal_extra_times = _goal_extra_times)
+        self.assertEqual([MotorCommand.TURN_RIGHT, MotorCommand.MOVE_FORWARD], _route)
+
+    def test_should_merge_consecutive_forward_moves(self):
+        _commands = [MotorCommand.MOVE_FORWARD, MotorCommand.MOVE_FORWARD, MotorCommand.TURN_RIGHT, MotorCommand.MOVE_FORWARD]
+        self.assertEqual(
+            [(MotorCommand.MOVE_FORWARD, 2), (MotorCommand.TURN_RIGHT, 1), (MotorCommand.MOVE_FORWARD, 1)],
+            RoutePlanner.merge_forward_moves(_commands)
+        )
+
+    def test_should_merge_side_turns_between_forward_moves_into_arc_turns(self):
+        _commands = [
+            MotorCommand.TURN_LEFT, MotorCommand.MOVE_FORWARD, MotorCommand.MOVE_FORWARD, MotorCommand.TURN_RIGHT, MotorCommand.MOVE_FORWARD,
+            MotorCommand.TURN_BACK, MotorCommand.MOVE_FORWARD, MotorCommand.TURN_LEFT, MotorCommand.MOVE_FORWARD, MotorCommand.MOVE_FORWARD
+        ]
+        self.assertEqual(
+            [
+                (MotorCommand.TURN_LEFT, 1), (MotorCommand.MOVE_FORWARD, 1), (MotorCommand.ARC_TURN_RIGHT, 1),
+                (MotorCommand.TURN_BACK, 1), (MotorCommand.ARC_TURN_LEFT, 1), (MotorCommand.MOVE_FORWARD, 1)
+            ],
+            RoutePlanner.merge_arc_turns(RoutePlanner.merge_forward_moves(_commands))
+        )
@@ -0,0 +1,42 @@
+from unittest.mock import call
+from maze_solver.route_planner import MotorCommand
+from maze_solver.route_replay_maze_solver import RouteReplayMazeSolver
+from test.maze_solver.test_maze_solver import BaseMazeResolverTest
+
+
+class RouteReplayMazeSolverTest(BaseMazeResolverTest):
+
+    def setUp(self):
+        self.create_mocks()
+        self._route = [MotorCommand.MOVE_FORWARD, MotorCommand.TURN_RIGHT, MotorCommand.MOVE_FORWARD, MotorCommand.TURN_BACK, MotorCommand.MOVE_FORWARD]
+        self._maze_solver = RouteReplayMazeSolver(self._motors, self._wall_detector, self._finish_detector, self._outputs, route = self._route)
+
+    def test_should_execute_commands_up_to_next_forward_move_on_each_move(self):
+        self.assertFalse(self._maze_solver.next_move())
+        self.assertFalse(self._maze_solver.next_move())
+        self.assertEqual([call.move_forward(), call.turn_right(), call.move_forward()], self._motors.mock_calls)
+
+    def test_should_not_look_at_walls(self):
+        self._maze_solver.next_move()
+        self.assertEqual([], self._wall_detector.mock_calls)
+
+    def test_should_stop_and_notify_error_when_route_ends_before_finish(self):
+        for _ in range(3):
+            self.assertFalse(self._maze_solver.next_move())
+        self.assertTrue(self._maze_solver.next_move())
+        self._outputs.notify.assert_called()
+
+    def test_should_merge_straight_moves_on_continuous_motion(self):
+        _route = [MotorCommand.MOVE_FORWARD, MotorCommand.MOVE_FORWARD, MotorCommand.TURN_LEFT, MotorCommand.MOVE_FORWARD, MotorCommand.MOVE_FORWARD, MotorCommand.MOVE_FORWARD]
+        _maze_solver = RouteReplayMazeSolver(self._motors, self._wall_detector, self._finish_detector, self._outputs, route = _route, continuous_motion = True)
+        self.assertFalse(_maze_solver.next_move())
+        self.assertFalse(_maze_solver.next_move())
+        self.assertEqual([call.move_forward_squares(2), call.turn_left(), call.move_forward_squares(3)], self._motors.mock_calls)
+
+    def test_should_make_side_turns_between_forward_moves_as_arc_turns(self):
+        _route = [MotorCommand.MOVE_FORWARD, MotorCommand.MOVE_FORWARD, MotorCommand.TURN_LEFT, MotorCommand.MOVE_FORWARD]
+        _maze_solver = RouteReplayMazeSolver(self._motors, self._wall_detector, self._finish_detector, self._outputs, route = _route, arc_turns = True)
+        self.assertFalse(_maze_solver.next_move())
+        self.assertFalse(_maze_solver.next_move())
+        self.assertEqual(0, _maze_solver.remaining_command_count)
+        self.assertEqual([call.move_forward(), call.arc_turn_left()], self._motors.mock_calls)
@@ -0,0 +1,46 @@
+import unittest
+from maze_solver.square_flags_grid import SquareFlags, SquareFlagsGrid
+
+
+class SquareFlagsGridTest(unittest.TestCase):
+
+    def setUp(self):
+        self._grid = SquareFlagsGrid(width=4, height=4)
+
+    def test_should_return_no_flags_for_unset_square(self):
+        self.assertEqual(0, self._grid.get_flags(1, 1))
+
+    def test_should_return_no_flags_for_square_outside_of_grid(self):
+        self.assertEqual(0, self._grid.get_flags(100, -100))
+
+    def test_should_return_flags_that_were_set(self):
+        self._grid.set_flags(2, 3, SquareFlags.VISITED)
+        self.assertTrue(self._grid.has_flags(2, 3, SquareFlags.VISITED))
+        self.assertFalse(self._grid.has_flags(2, 3, SquareFlags.DEAD_END))
+        self.assertEqual(0, self._grid.get_flags(3, 2))
+
+    def test_should_combine_flags_when_added(self):
+        self._grid.add_flags(1, 1, SquareFlags.VISITED)
+        self._grid.add_flags(1, 1, SquareFlags.DEAD_END)
+        self.assertEqual(SquareFlags.VISITED | SquareFlags.DEAD_END, self._grid.get_flags(1, 1))
+
+    def test_should_overwrite_flags_when_set(self):
+        self._grid.set_flags(1, 1, SquareFlags.VISITED | SquareFlags.DEAD_END)
+        self._grid.set_flags(1, 1, SquareFlags.VISITED)
+        self.assertEqual(SquareFlags.VISITED, self._grid.get_flags(1, 1))
+
+    def test_should_grow_and_keep_existing_flags_when_square_outside_of_grid_is_set(self):
+        self._grid.set_flags(0, 0, SquareFlags.VISITED)
+        self._grid.set_flags(3, 2, SquareFlags.DEAD_END)
+        self._grid.set_flags(17, -5, SquareFlags.VISITED)
+        self._grid.set_flags(-3, 9, SquareFlags.DEAD_END)
+        self.assertEqual(SquareFlags.VISITED, self._grid.get_flags(0, 0))
+        self.assertEqual(SquareFlags.DEAD_END, self._grid.get_flags(3, 2))
+        self.assertEqual(SquareFlags.VISITED, self._grid.get_flags(17, -5))
+        self.assertEqual(SquareFlags.DEAD_END, self._grid.get_flags(-3, 9))
+        self.assertEqual(0, self._grid.get_flags(1, 1))
+
+    def test_should_forget_all_flags_when_cleared(self):
+        self._grid.set_flags(1, 1, SquareFlags.VISITED)
+        self._grid.clear()
+        self.assertEqual(0, self._grid.get_flags(1, 1))
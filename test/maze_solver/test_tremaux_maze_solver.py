@@ -0,0 +1,109 @@
+import functools
+import unittest
+from maze_solver.direction import Direction
+from maze_solver.square import Square
+from maze_solver.tremaux_maze_solver import TremauxMazeSolver
+from simulator.maze_factory import create_robotex_cyprus_2017_maze
+from simulator.maze_generator import MazeGenerator, MazeGeneratorAlgorithm
+from simulator.maze_solving_session import SimulatorMazeSolvingSession
+from test.maze_solver.test_maze_solver import BaseMazeResolverTest
+
+
+class TremauxMazeSolverTest(BaseMazeResolverTest):
+
+    def setUp(self):
+        self.create_mocks()
+        self._maze_solver = TremauxMazeSolver(
+            self._motors,
+            self._wall_detector,
+            self._finish_detector,
+            self._outputs,
+            center_coordinates = [4]
+        )
+
+    def walk_around_loop_back_to_start(self):
+        # Loop of 1,1 -> 1,2 -> 2,2 -> 2,1 -> 1,1, closed by the passage from 2,1 back to 1,1
+        self._wall_detector.is_left_blocked.side_effect = [True, True, True, True, True, False]
+        self._wall_detector.is_front_blocked.side_effect = [False, True, True, True, True, True]
+        self._wall_detector.is_right_blocked.side_effect = [False, False, False, False, False, True]
+        for _ in range(5):
+            self._maze_solver.next_move()
+
+    def test_should_mark_passage_on_both_sides(self):
+        self.prepare_mock_wall_detector(front_blocked = False)
+        self._maze_solver.next_move()
+        self.assertEqual(1, self._maze_solver.get_mark_count(1, 1, Direction.NORTH))
+        self.assertEqual(1, self._maze_solver.get_mark_count(1, 2, Direction.SOUTH))
+        self.assertEqual(0, self._maze_solver.get_mark_count(1, 2, Direction.NORTH))
+
+    def test_should_turn_back_in_dead_end(self):
+        self.prepare_mock_wall_detector()
+        self._maze_solver.next_move()
+        self.assert_only_turn_called('turn_back')
+
+    def test_should_go_straight_when_equally_close_to_center(self):
+        self.prepare_mock_wall_detector(front_blocked = False, right_blocked = False)
+        self._maze_solver.next_move()
+        self.assert_only_turn_called('no_turn')
+
+    def test_should_turn_to_the_side_closer_to_center(self):
+        self._maze_solver.current_square = Square(x = 2, y = 4)
+        self.prepare_mock_wall_detector(left_blocked = False, right_blocked = False)
+        self._maze_solver.next_move()
+        self.assert_only_turn_called('turn_right')
+
+    def test_should_turn_back_when_new_passage_leads_to_visited_square(self):
+        self.walk_around_loop_back_to_start()
+        self._motors.turn_back.assert_called_once()
+        self.assertEqual(3, self._motors.turn_right.call_count)
+        self.assertEqual(2, self._maze_solver.current_square.x)
+        self.assertEqual(1, self._maze_solver.current_square.y)
+        self.assertEqual(2, self._maze_solver.get_mark_count(2, 1, Direction.WEST))
+
+    def test_should_take_passage_walked_once_when_no_new_passage_is_left(self):
+        self.walk_around_loop_back_to_start()
+        self._maze_solver.next_move()
+        self._motors.turn_left.assert_called_once()
+        self.assertEqual(2, self._maze_solver.get_mark_count(2, 1, Direction.NORTH))
+
+    def test_should_count_walked_passage_that_looks_blocked_from_other_side_as_walked_twice(self):
+        # 1,1 -> 2,1 -> 2,2 dead end -> back to 2,1, where the passage back to 1,1 now looks blocked
+        self._wall_detector.is_left_blocked.side_effect = [True, False, True, True]
+        self._wall_detector.is_front_blocked.side_effect = [True, True, True, True]
+        self._wall_detector.is_right_blocked.side_effect = [False, True, True, True]
+        for _ in range(4):
+            self._maze_solver.next_move()
+        self.assertEqual(2, self._maze_solver.get_mark_count(2, 1, Direction.WEST))
+        self.assertEqual(2, self._maze_solver.get_mark_count(1, 1, Direction.EAST))
+        self._motors.turn_right.assert_called_once()
+        self.assertEqual(2, self._motors.turn_back.call_count)
+
+    def test_should_walk_no_passage_more_than_twice_in_mazes_with_loops(self):
+        _maze_generator = MazeGenerator(algorithm=MazeGeneratorAlgorithm.WILSON, loop_ratio=0.1, random_seed=1)
+        for _maze in _maze_generator.generate_many(5):
+            _passage_count = sum(_square.x_plus + _square.y_plus for _square in _maze.squares)
+            _session = SimulatorMazeSolvingSession(
+                _maze,
+                random_seed=1,
+                maze_solver_factory=functools.partial(TremauxMazeSolver, center_coordinates=[8, 9])
+            )
+            _results = _session.start()
+            self.assertTrue(_session.current_square.is_finish)
+            self.assertLessEqual(_results['move_count'], 2 * _passage_count + 1)
+
+    def test_should_solve_maze_with_walls_that_look_different_from_each_side_in_bounded_moves(self):
+        _maze = create_robotex_cyprus_2017_maze()
+        _passage_count = sum(_square.x_plus + _square.y_plus for _square in _maze.squares)
+        for _random_seed in range(10):
+            _session = SimulatorMazeSolvingSession(
+                create_robotex_cyprus_2017_maze(),
+                random_seed=_random_seed,
+                maze_solver_factory=functools.partial(TremauxMazeSolver, center_coordinates=[8, 9])
+            )
+            _results = _session.start()
+            self.assertTrue(_session.current_square.is_finish)
+            self.assertLessEqual(_results['move_count'], 2 * _passage_count + 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
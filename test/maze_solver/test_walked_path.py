@@ -43,3 +43,18 @@ class WalkedPathTest(unittest.TestCase):
         _actual_last_square = self._walked_path.get_square_steps_back(4)
         self.assertEquals(_actual_last_square.x, 11)
         self.assertEquals(_actual_last_square.y, 12)
+
+    def test_should_return_none_as_step_of_square_that_has_not_been_walked(self):
+        self._walked_path.append(Square(x=1, y=1))
+        self.assertIsNone(self._walked_path.get_last_step_of_square(1, 2))
+
+    def test_should_return_last_step_of_square_when_square_walked_multiple_times(self):
+        self._walked_path.append(Square(x=1, y=1))
+        self._walked_path.append(Square(x=1, y=2))
+        self._walked_path.append(Square(x=2, y=2))
+        self._walked_path.append(Square(x=2, y=1))
+        self._walked_path.append(Square(x=1, y=1))
+        self._walked_path.append(Square(x=1, y=2))
+        self.assertEqual(4, self._walked_path.get_last_step_of_square(1, 1))
+        self.assertEqual(5, self._walked_path.get_last_step_of_square(1, 2))
+        self.assertEqual(6, self._walked_path.get_step_count())
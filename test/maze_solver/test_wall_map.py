@@ -0,0 +1,65 @@
+import os
+import tempfile
+import unittest
+from maze_solver.direction import Direction
+from maze_solver.square import Square
+from maze_solver.wall_map import WallMap, save_wall_map, load_wall_map
+
+
+class WallMapTest(unittest.TestCase):
+
+    def setUp(self):
+        self._wall_map = WallMap(width = 4, height = 3)
+
+    def test_should_have_outer_walls_blocked(self):
+        self.assertTrue(self._wall_map.is_blocked(1, 1, Direction.SOUTH))
+        self.assertTrue(self._wall_map.is_blocked(1, 1, Direction.WEST))
+        self.assertTrue(self._wall_map.is_blocked(4, 3, Direction.NORTH))
+        self.assertTrue(self._wall_map.is_blocked(4, 3, Direction.EAST))
+
+    def test_should_assume_inner_walls_open(self):
+        self.assertFalse(self._wall_map.is_blocked(2, 2, Direction.NORTH))
+        self.assertFalse(self._wall_map.is_blocked(2, 2, Direction.WEST))
+
+    def test_should_block_wall_from_both_sides(self):
+        self.assertTrue(self._wall_map.set_blocked(2, 2, Direction.EAST, True))
+        self.assertTrue(self._wall_map.is_blocked(3, 2, Direction.WEST))
+        self.assertEqual(3, len(self._wall_map.get_open_neighbours(self._wall_map.get_index(3, 2))))
+
+    def test_should_not_report_change_when_wall_was_already_known(self):
+        self._wall_map.set_blocked(2, 2, Direction.EAST, True)
+        self.assertFalse(self._wall_map.set_blocked(3, 2, Direction.WEST, True))
+
+    def test_should_never_open_outer_walls(self):
+        self.assertFalse(self._wall_map.set_blocked(1, 1, Direction.WEST, False))
+        self.assertTrue(self._wall_map.is_blocked(1, 1, Direction.WEST))
+
+    def test_should_convert_between_index_and_coordinates(self):
+        self.assertEqual((3, 2), self._wall_map.get_coordinates(self._wall_map.get_index(3, 2)))
+
+    def test_should_save_and_load_walls_explored_squares_and_finish_square(self):
+        self._wall_map.set_blocked(2, 2, Direction.EAST, True)
+        self._wall_map.set_explored(2, 2)
+        with tempfile.TemporaryDirectory() as _directory:
+            _path = os.path.join(_directory, 'wall_map.json')
+            save_wall_map(_path, self._wall_map, Square(x = 3, y = 2))
+            _wall_map, _finish_square = load_wall_map(_path)
+        self.assertEqual(self._wall_map.to_dict(), _wall_map.to_dict())
+        self.assertTrue(_wall_map.is_blocked(3, 2, Direction.WEST))
+        self.assertTrue(_wall_map.is_explored(2, 2))
+        self.assertEqual((3, 2), (_finish_square.x, _finish_square.y))
+
+    def test_should_load_wall_map_without_finish_square(self):
+        with tempfile.TemporaryDirectory() as _directory:
+            _path = os.path.join(_directory, 'wall_map.json')
+            save_wall_map(_path, self._wall_map)
+            _wall_map, _finish_square = load_wall_map(_path)
+        self.assertEqual(4, _wall_map.width)
+        self.assertEqual(3, _wall_map.height)
+        self.assertIsNone(_finish_square)
+
+    def test_should_not_load_wall_map_of_wrong_size(self):
+        _values = self._wall_map.to_dict()
+        _values['walls'] = _values['walls'][:-1]
+        with self.assertRaises(ValueError):
+            WallMap.from_dict(_values)
@@ -0,0 +1,60 @@
+import unittest
+from simulator.batch_simulator import BatchSimulator
+from simulator.experiment_runner import run_simulator_sessions
+from simulator.maze import FlatMaze, MazePassages
+from simulator.maze_factory import create_6_to_6_maze, create_robotex_cyprus_2017_maze, create_simple_3_to_3_maze
+from simulator.motion_model import ProfiledMotionModel
+
+
+class BatchSimulatorTests(unittest.TestCase):
+
+    def setUp(self):
+        self._session_kwargs = {
+            'prefer_non_dead_ends_weight': 10,
+            'prefer_unvisited_paths_weight': 3,
+            'prefer_closer_to_center_weight': 5,
+            'prefer_no_turns_weight': 1,
+            'max_moves': 300
+        }
+
+    def _assert_same_results_as_simulator_sessions(self, maze, center_coordinates: list, **session_kwargs):
+        _session_kwargs = dict(self._session_kwargs, center_coordinates=center_coordinates, **session_kwargs)
+        _random_seeds = list(range(30))
+        _expected_results = run_simulator_sessions(maze, _random_seeds, _session_kwargs)
+        _actual_results = BatchSimulator(maze, _random_seeds, **_session_kwargs).run()
+        self.assertEqual(_expected_results, _actual_results)
+
+    def test_should_give_same_results_as_simulator_sessions_with_same_seeds_in_small_maze(self):
+        self._assert_same_results_as_simulator_sessions(create_6_to_6_maze(), [4])
+
+    def test_should_give_same_results_as_simulator_sessions_with_same_seeds_in_16_to_16_maze(self):
+        self._assert_same_results_as_simulator_sessions(FlatMaze.from_maze(create_robotex_cyprus_2017_maze()), [8, 9], prefer_no_turns_weight=0)
+
+    def test_should_give_same_results_as_simulator_sessions_with_same_seeds_when_avoiding_loops(self):
+        self._assert_same_results_as_simulator_sessions(create_robotex_cyprus_2017_maze(), [8, 9], prefer_no_turns_weight=0, prefer_no_loops_weight=4)
+
+    def test_should_give_same_results_as_simulator_sessions_with_same_motion_model(self):
+        _motion_model = ProfiledMotionModel(turn_left_time_sec = 0.7, turn_right_time_sec = 0.9, forward_correction_probability = 0.2, forward_correction_time_sec = 1.5)
+        self._assert_same_results_as_simulator_sessions(create_6_to_6_maze(), [4], motion_model=_motion_model)
+
+    def test_should_give_same_results_as_simulator_sessions_with_same_seeds_when_filling_dead_ends(self):
+        self._assert_same_results_as_simulator_sessions(create_robotex_cyprus_2017_maze(), [8, 9], fill_dead_ends=True)
+        self._assert_same_results_as_simulator_sessions(create_6_to_6_maze(), [4], fill_dead_ends=True)
+
+    def test_should_not_make_more_moves_than_max_moves(self):
+        _batch_simulator = BatchSimulator(create_robotex_cyprus_2017_maze(), list(range(10)), max_moves=5)
+        for _move_count, _ in _batch_simulator.run():
+            self.assertEqual(5, _move_count)
+
+    def test_should_have_no_active_lanes_after_run(self):
+        _batch_simulator = BatchSimulator(create_simple_3_to_3_maze(), list(range(10)), center_coordinates=[3])
+        self.assertEqual(10, _batch_simulator.active_lane_count)
+        _batch_simulator.run()
+        self.assertEqual(0, _batch_simulator.active_lane_count)
+
+    def test_should_raise_key_error_when_moving_out_of_maze_through_a_passage_to_nowhere(self):
+        _maze = FlatMaze(1, 2)
+        _maze.set_passages(1, 1, MazePassages.Y_PLUS)
+        _maze.set_passages(1, 2, MazePassages.Y_PLUS | MazePassages.Y_MINUS)
+        with self.assertRaises(KeyError):
+            BatchSimulator(_maze, [1]).run()
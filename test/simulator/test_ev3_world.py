@@ -0,0 +1,114 @@
+import math
+import os
+import sys
+import tempfile
+import unittest
+from ev3.telemetry import TelemetryRecorder
+from simulator.maze_factory import create_simple_3_to_3_maze, create_a_real_16_to_16_beast
+from simulator.ev3_world import SimulatedEV3World, TelemetrySensorStream, simulated_ev3dev2
+from simulator.ev3_session import EV3SimulationSession
+
+
+class SimulatedEV3WorldTests(unittest.TestCase):
+
+    def setUp(self):
+        # 3-to-3 maze, starting at 1,1 with walls on the left and in front, and the next wall on the right 20 cm away
+        self._world = SimulatedEV3World(create_simple_3_to_3_maze(), on_spot_turn_factor = 1.0)
+
+    def _create_motor_pair(self, modules: dict):
+        return modules['ev3dev2.motor'].MoveSteering('outA', 'outB')
+
+    def test_should_see_walls_of_the_start_square(self):
+        self.assertAlmostEqual(2.0, self._world.get_distance_cm('in1'))
+        self.assertAlmostEqual(2.0, self._world.get_distance_cm('in3'))
+        self.assertAlmostEqual(20.0, self._world.get_distance_cm('in4'))
+        with simulated_ev3dev2(self._world) as _modules:
+            self.assertEqual(round(105 * 0.555 ** 2), _modules['ev3dev2.sensor.lego'].ColorSensor('in1').reflected_light_intensity)
+            self.assertEqual(0, _modules['ev3dev2.sensor.lego'].ColorSensor('in4').reflected_light_intensity)
+
+    def test_should_move_by_wheel_rotations_in_virtual_time(self):
+        with simulated_ev3dev2(self._world) as _modules:
+            _motor_pair = self._create_motor_pair(_modules)
+            _speed = _modules['ev3dev2.motor'].SpeedRPM(60)
+            _motor_pair.on_for_rotations(steering = 100, speed = _speed, rotations = 97.5 * 90 / (56 * 360))
+            _motor_pair.on_for_rotations(steering = 0, speed = _speed, rotations = 180 / (math.pi * 56))
+            self.assertEqual(90, _modules['ev3dev2.sensor.lego'].GyroSensor('in2').angle)
+            self.assertEqual((2, 1), self._world.get_square())
+            self.assertAlmostEqual(270.0, self._world.x_mm)
+            self.assertAlmostEqual(90.0, self._world.y_mm)
+            self.assertEqual(0, self._world.wall_hit_count)
+            self.assertLess(self._world.get_time(), 2.0)
+
+    def test_should_stop_at_wall_while_wheels_turn(self):
+        with simulated_ev3dev2(self._world) as _modules:
+            _motor_pair = self._create_motor_pair(_modules)
+            _motor_pair.on(steering = 0, speed = _modules['ev3dev2.motor'].SpeedRPM(60))
+            self.assertTrue(_motor_pair.left_motor.wait_until('running'))
+            self.assertFalse(_motor_pair.left_motor.wait_until_not_moving(timeout = 500))
+            _motor_pair.off()
+            self.assertTrue(_motor_pair.right_motor.wait_until_not_moving(timeout = 500))
+            self.assertFalse(_motor_pair.left_motor.is_running)
+            self.assertEqual(1, self._world.wall_hit_count)
+            self.assertLess(self._world.y_mm, 120.0)
+            self.assertGreater(_motor_pair.left_motor.position, 170)
+
+    def test_should_tell_nothing_when_waiting_for_motor_pair_as_ev3dev2(self):
+        with simulated_ev3dev2(self._world) as _modules:
+            _motor_pair = self._create_motor_pair(_modules)
+            _motor_pair.on_for_rotations(steering = 0, speed = _modules['ev3dev2.motor'].SpeedRPM(60), rotations = 0.5, block = False)
+            self.assertIsNone(_motor_pair.wait_until_not_moving())
+            self.assertFalse(_motor_pair.left_motor.is_running)
+
+    def test_should_slide_along_wall_at_angle(self):
+        self._world = SimulatedEV3World(create_simple_3_to_3_maze(), on_spot_turn_factor = 1.0)
+        with simulated_ev3dev2(self._world) as _modules:
+            _motor_pair = self._create_motor_pair(_modules)
+            _speed = _modules['ev3dev2.motor'].SpeedRPM(60)
+            _motor_pair.on_for_rotations(steering = 100, speed = _speed, rotations = 97.5 * 60 / (56 * 360))
+            _motor_pair.on_for_rotations(steering = 0, speed = _speed, rotations = 180 / (math.pi * 56))
+            self.assertEqual(1, self._world.wall_hit_count)
+            self.assertGreater(self._world.x_mm, 200.0)
+
+    def test_should_serve_simulated_modules_only_within_block(self):
+        _original_module = sys.modules.get('ev3dev2.motor')
+        with simulated_ev3dev2(self._world) as _modules:
+            self.assertIs(_modules['ev3dev2.motor'], sys.modules['ev3dev2.motor'])
+        self.assertIs(_original_module, sys.modules.get('ev3dev2.motor'))
+
+    def test_should_serve_recorded_sensor_readings(self):
+        with tempfile.TemporaryDirectory() as _directory:
+            _path = os.path.join(_directory, 'telemetry.bin')
+            _recorder = TelemetryRecorder(_path)
+            _recorder.record(left = 3.0, front = 255.0, right = 4.0, timestamp = 10.0)
+            _recorder.record(angle = 45.0, timestamp = 10.5)
+            _recorder.record(left = 5.0, front = 1.0, right = 6.0, timestamp = 11.0)
+            _recorder.close()
+            self._world = SimulatedEV3World(create_simple_3_to_3_maze(), sensor_stream = TelemetrySensorStream(_path))
+        self.assertEqual(3.0, self._world.get_distance_cm('in3'))
+        self.assertEqual(255.0, self._world.get_distance_cm('in1'))
+        self.assertEqual(0, self._world.get_gyro_angle())
+        self._world.advance(1.0)
+        self.assertEqual(1.0, self._world.get_distance_cm('in1'))
+        self.assertEqual(6.0, self._world.get_distance_cm('in4'))
+        self.assertEqual(45, self._world.get_gyro_angle())
+
+
+class EV3SimulationSessionTests(unittest.TestCase):
+
+    def test_should_solve_maze_with_ev3_code_faster_than_real_time(self):
+        _world = SimulatedEV3World(create_simple_3_to_3_maze(), random_seed = 1)
+        _session = EV3SimulationSession(_world, max_moves = 30, center_coordinates = [2], random_seed = 1, motors_kwargs = {'heading_control': True})
+        _session.start()
+        self.assertTrue(_world.is_finish())
+        self.assertLess(_session.move_count, 30)
+        self.assertGreater(_session.motion_time_in_seconds, _session.real_time_in_seconds)
+
+    def test_should_not_hit_walls_with_heading_control_in_big_maze_with_noisy_sensors(self):
+        for _random_seed in range(3):
+            _world = SimulatedEV3World(create_a_real_16_to_16_beast(), distance_noise_cm = 0.3, random_seed = _random_seed)
+            _session = EV3SimulationSession(_world, max_moves = 30, random_seed = _random_seed, motors_kwargs = {'heading_control': True})
+            _session.start()
+            self.assertLessEqual(_world.wall_hit_count, 1)
+            # Still heading along the maze, not turned off course by corrections
+            self.assertLessEqual(abs(_world.get_gyro_angle() - 90 * round(_world.get_gyro_angle() / 90)), 5)
+
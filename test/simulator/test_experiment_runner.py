@@ -0,0 +1,56 @@
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+from unittest.mock import patch
+from simulator.experiment_runner import ExperimentRunner, run_simulator_sessions, summarize_session_results
+from simulator.maze_factory import create_6_to_6_maze
+
+
+class ExperimentRunnerTests(unittest.TestCase):
+
+    def setUp(self):
+        self._maze = create_6_to_6_maze()
+
+    def _create_experiment_runner(self, workers: int, random_seed: int = 42) -> ExperimentRunner:
+        return ExperimentRunner(sample_size=20, max_moves_per_session=200, workers=workers, random_seed=random_seed)
+
+    def test_should_give_same_results_when_run_twice_with_same_seed(self):
+        _first_results = self._create_experiment_runner(workers=1).perform_experiment(self._maze, center_coordinates=[4])
+        _second_results = self._create_experiment_runner(workers=1).perform_experiment(self._maze, center_coordinates=[4])
+        self.assertEqual(_first_results, _second_results)
+
+    def test_should_give_bit_identical_results_when_run_in_parallel_and_serially_with_same_seed(self):
+        _serial_results = self._create_experiment_runner(workers=1).perform_experiment(self._maze, center_coordinates=[4])
+        _parallel_results = self._create_experiment_runner(workers=3).perform_experiment(self._maze, center_coordinates=[4])
+        self.assertEqual(_serial_results, _parallel_results)
+
+    def test_should_run_one_session_per_seed_in_seed_order(self):
+        _experiment_runner = self._create_experiment_runner(workers=2)
+        _results = _experiment_runner.run_sessions(self._maze, center_coordinates=[4])
+        _expected_results = run_simulator_sessions(
+            self._maze, 
+            _experiment_runner.get_session_seeds(), 
+            {'center_coordinates': [4], 'max_moves': 200}
+        )
+        self.assertEqual(20, len(_results))
+        self.assertEqual(_expected_results, _results)
+
+    def test_should_reuse_process_pool_for_all_runs_until_closed(self):
+        with patch('simulator.experiment_runner.ProcessPoolExecutor', wraps=ProcessPoolExecutor) as _pool_class:
+            with self._create_experiment_runner(workers=2) as _experiment_runner:
+                _first_results = _experiment_runner.run_sessions(self._maze, center_coordinates=[4])
+                _second_results = _experiment_runner.run_sessions(self._maze, center_coordinates=[4])
+        _pool_class.assert_called_once_with(max_workers=2)
+        self.assertEqual(_first_results, _second_results)
+
+    def test_should_not_shut_down_given_process_pool_on_close(self):
+        with ProcessPoolExecutor(max_workers=2) as _executor:
+            _experiment_runner = ExperimentRunner(sample_size=4, max_moves_per_session=200, workers=2, random_seed=42, executor=_executor)
+            _experiment_runner.run_sessions(self._maze, center_coordinates=[4])
+            _experiment_runner.close()
+            self.assertEqual(4, len(_experiment_runner.run_sessions(self._maze, center_coordinates=[4])))
+
+    def test_should_count_probability_of_solving_within_time_limit(self):
+        _summary = summarize_session_results('test', [10, 20, 30, 40], [100.0, 200.0, 300.0, 400.0], 300)
+        self.assertEqual(50.0, _summary['probability_of_solving_within_time_limit'])
+        self.assertEqual(10, _summary['move_count_min'])
+        self.assertEqual(400.0, _summary['motion_time_max'])
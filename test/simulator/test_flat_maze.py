@@ -0,0 +1,48 @@
+import unittest
+from simulator.maze import FlatMaze, MazePassages
+from simulator.maze_factory import create_simple_3_to_3_maze, create_robotex_cyprus_2017_maze
+
+
+class FlatMazeTests(unittest.TestCase):
+
+    def setUp(self):
+        self._maze = create_simple_3_to_3_maze()
+        self._flat_maze = FlatMaze.from_maze(self._maze)
+
+    def test_should_have_same_size_as_original_maze(self):
+        self.assertEqual(3, self._flat_maze.width)
+        self.assertEqual(3, self._flat_maze.height)
+
+    def test_should_find_correct_start_square(self):
+        _start_square = self._flat_maze.get_start_square()
+        self.assertEqual(1, _start_square.x)
+        self.assertEqual(1, _start_square.y)
+        self.assertTrue(_start_square.is_start)
+
+    def test_should_have_same_squares_as_original_maze(self):
+        _maze = create_robotex_cyprus_2017_maze()
+        _flat_maze = FlatMaze.from_maze(_maze)
+        for _square in _maze.squares:
+            _flat_square = _flat_maze.get_square(_square.x, _square.y)
+            self.assertEqual(
+                (_square.x_plus, _square.x_minus, _square.y_plus, _square.y_minus, _square.is_start, _square.is_finish),
+                (_flat_square.x_plus, _flat_square.x_minus, _flat_square.y_plus, _flat_square.y_minus, _flat_square.is_start, _flat_square.is_finish)
+            )
+
+    def test_should_pack_neighbour_squares_without_overwriting_each_other(self):
+        _flat_maze = FlatMaze(2, 1)
+        _flat_maze.set_passages(1, 1, MazePassages.X_PLUS)
+        _flat_maze.set_passages(2, 1, MazePassages.X_MINUS | MazePassages.Y_PLUS)
+        _flat_maze.set_passages(1, 1, MazePassages.X_PLUS | MazePassages.Y_MINUS)
+        self.assertEqual(MazePassages.X_PLUS | MazePassages.Y_MINUS, _flat_maze.get_passages(1, 1))
+        self.assertEqual(MazePassages.X_MINUS | MazePassages.Y_PLUS, _flat_maze.get_passages(2, 1))
+
+    def test_should_know_finish_squares(self):
+        _flat_maze = FlatMaze(4, 4, finish_squares=[(2, 2), (3, 3)])
+        self.assertTrue(_flat_maze.is_finish(2, 2))
+        self.assertFalse(_flat_maze.is_finish(2, 3))
+        self.assertEqual([(2, 2), (3, 3)], _flat_maze.get_finish_squares())
+
+    def test_should_raise_key_error_when_square_is_outside_of_maze(self):
+        with self.assertRaises(KeyError):
+            self._flat_maze.get_square(4, 1)
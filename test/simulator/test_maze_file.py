@@ -0,0 +1,111 @@
+import io
+import os
+import tempfile
+import unittest
+from simulator.maze import FlatMaze, MazePassages
+from simulator.maze_factory import create_robotex_cyprus_2017_maze, create_6_to_6_maze
+from simulator.maze_file import format_ascii_maze, read_ascii_mazes, format_binary_maze, read_binary_mazes, parse_micromouse_maze, load_mazes, save_mazes
+from simulator.maze_file_converter import convert_maze_files
+
+_MINIMAL_2_TO_2_MAZE = '''# name: Minimal 2-to-2
++---+---+
+|   | F |
++   +   +
+| S     |
++---+---+
+'''
+
+
+class BaseMazeFileTest(unittest.TestCase):
+
+    def _assert_same_mazes(self, expected: FlatMaze, actual: FlatMaze):
+        self.assertEqual(expected.name, actual.name)
+        self.assertEqual((expected.width, expected.height), (actual.width, actual.height))
+        self.assertEqual((expected.start_x, expected.start_y), (actual.start_x, actual.start_y))
+        self.assertEqual(expected.get_finish_squares(), actual.get_finish_squares())
+        self.assertEqual(expected.get_all_passages(), actual.get_all_passages())
+
+
+class AsciiMazeFileTests(BaseMazeFileTest):
+
+    def test_should_read_ascii_art_maze(self):
+        _maze = next(read_ascii_mazes(io.StringIO(_MINIMAL_2_TO_2_MAZE)))
+        self.assertEqual('Minimal 2-to-2', _maze.name)
+        self.assertEqual((1, 1), (_maze.start_x, _maze.start_y))
+        self.assertEqual([(2, 2)], _maze.get_finish_squares())
+        self.assertEqual(MazePassages.Y_PLUS | MazePassages.X_PLUS, _maze.get_passages(1, 1))
+        self.assertEqual(MazePassages.Y_MINUS, _maze.get_passages(1, 2))
+        self.assertEqual(MazePassages.Y_PLUS | MazePassages.X_MINUS, _maze.get_passages(2, 1))
+
+    def test_should_write_same_ascii_art_as_read(self):
+        _maze = next(read_ascii_mazes(io.StringIO(_MINIMAL_2_TO_2_MAZE)))
+        self.assertEqual(_MINIMAL_2_TO_2_MAZE, format_ascii_maze(_maze))
+
+    def test_should_read_one_way_walls_and_passages_out_of_maze(self):
+        _maze = next(read_ascii_mazes(['+ ^ +---+', '| S >   |', '+---+ v +']))
+        self.assertEqual(MazePassages.Y_PLUS | MazePassages.X_PLUS, _maze.get_passages(1, 1))
+        self.assertEqual(MazePassages.Y_MINUS, _maze.get_passages(2, 1))
+
+    def test_should_accept_lines_with_trailing_spaces_stripped(self):
+        _maze = next(read_ascii_mazes(['+---+---+', '| S', '+---+---+']))
+        self.assertEqual(MazePassages.X_PLUS, _maze.get_passages(1, 1))
+        self.assertEqual(MazePassages.X_MINUS | MazePassages.X_PLUS, _maze.get_passages(2, 1))
+
+    def test_should_read_several_mazes_from_one_file(self):
+        _text = format_ascii_maze(create_6_to_6_maze()) + '\n' + format_ascii_maze(create_robotex_cyprus_2017_maze())
+        _mazes = list(read_ascii_mazes(io.StringIO(_text)))
+        self.assertEqual(['6-to-6', 'Robotex Cyprus 2017'], [_maze.name for _maze in _mazes])
+        self._assert_same_mazes(create_robotex_cyprus_2017_maze(), _mazes[1])
+
+    def test_should_raise_value_error_when_maze_is_not_complete(self):
+        with self.assertRaises(ValueError):
+            list(read_ascii_mazes(['+---+---+', '| S     |']))
+
+
+class BinaryMazeFileTests(BaseMazeFileTest):
+
+    def test_should_read_same_maze_as_written(self):
+        _maze = create_robotex_cyprus_2017_maze()
+        _mazes = list(read_binary_mazes(io.BytesIO(format_binary_maze(_maze))))
+        self.assertEqual(1, len(_mazes))
+        self._assert_same_mazes(_maze, _mazes[0])
+
+    def test_should_store_walls_in_micromouse_layout(self):
+        _maze = create_6_to_6_maze()
+        _record = format_binary_maze(_maze)
+        _walls = _record[-36:]
+        self.assertEqual(0x0F & ~MazePassages.X_PLUS, _walls[0])
+        self.assertEqual(_maze.get_all_passages(), parse_micromouse_maze(_walls).get_all_passages())
+
+    def test_should_stream_many_mazes(self):
+        _record = format_binary_maze(create_robotex_cyprus_2017_maze())
+        _mazes = list(read_binary_mazes(io.BytesIO(_record * 1000)))
+        self.assertEqual(1000, len(_mazes))
+        self._assert_same_mazes(create_robotex_cyprus_2017_maze(), _mazes[-1])
+
+    def test_should_raise_value_error_when_record_is_cut(self):
+        _record = format_binary_maze(create_6_to_6_maze())
+        with self.assertRaises(ValueError):
+            list(read_binary_mazes(io.BytesIO(_record[:-1])))
+
+    def test_should_read_plain_micromouse_maze_with_finish_in_center(self):
+        _walls = bytes([0x0F & ~MazePassages.X_PLUS, 0x0F] * 8 + [0x0F] * 240)
+        _maze = parse_micromouse_maze(_walls)
+        self.assertEqual(16, _maze.width)
+        self.assertEqual(MazePassages.X_PLUS, _maze.get_passages(1, 1))
+        self.assertEqual([(8, 8), (8, 9), (9, 8), (9, 9)], _maze.get_finish_squares())
+
+
+class MazeFileConverterTests(unittest.TestCase):
+
+    def test_should_convert_between_ascii_and_binary_files(self):
+        with tempfile.TemporaryDirectory() as _dir:
+            _ascii_path = os.path.join(_dir, 'mazes.txt')
+            _binary_path = os.path.join(_dir, 'mazes.bin')
+            _ascii_again_path = os.path.join(_dir, 'mazes_again.txt')
+            save_mazes(_ascii_path, [create_6_to_6_maze(), create_robotex_cyprus_2017_maze()])
+            self.assertEqual(2, convert_maze_files([_ascii_path], _binary_path))
+            convert_maze_files([_binary_path], _ascii_again_path)
+            with open(_ascii_path) as _expected, open(_ascii_again_path) as _actual:
+                self.assertEqual(_expected.read(), _actual.read())
+            self.assertEqual(2, len(load_mazes(_binary_path)))
@@ -0,0 +1,102 @@
+import functools
+import unittest
+from maze_solver.flood_fill_maze_solver import FloodFillMazeSolver
+from simulator.maze import FlatMaze, MazePassages
+from simulator.maze_generator import MazeGenerator, MazeGeneratorAlgorithm
+from simulator.maze_solving_session import SimulatorMazeSolvingSession
+
+_ALGORITHMS = [MazeGeneratorAlgorithm.RECURSIVE_BACKTRACKER, MazeGeneratorAlgorithm.KRUSKAL, MazeGeneratorAlgorithm.WILSON]
+_BACK_PASSAGES = {MazePassages.Y_PLUS: MazePassages.Y_MINUS, MazePassages.X_PLUS: MazePassages.X_MINUS}
+
+
+def _get_passage_pairs(maze: FlatMaze) -> list:
+    _pairs = []
+    for _x in range(1, maze.width + 1):
+        for _y in range(1, maze.height + 1):
+            _passages = maze.get_passages(_x, _y)
+            if _passages & MazePassages.Y_PLUS:
+                _pairs.append(((_x, _y), (_x, _y + 1)))
+            if _passages & MazePassages.X_PLUS:
+                _pairs.append(((_x, _y), (_x + 1, _y)))
+    return _pairs
+
+
+class MazeGeneratorTests(unittest.TestCase):
+
+    def _assert_perfect_maze_with_one_goal_entrance(self, maze: FlatMaze):
+        _goal_squares = set(maze.get_finish_squares())
+        _pairs = _get_passage_pairs(maze)
+        _entrances = [_pair for _pair in _pairs if (_pair[0] in _goal_squares) != (_pair[1] in _goal_squares)]
+        self.assertEqual(1, len(_entrances))
+        # A spanning tree has one passage less than squares, the goal region adds its own inner passages
+        _goal_pairs = [_pair for _pair in _pairs if _pair[0] in _goal_squares and _pair[1] in _goal_squares]
+        self.assertEqual(maze.width * maze.height - 1 + len(_goal_pairs) - (len(_goal_squares) - 1), len(_pairs))
+        _reached = {(1, 1)}
+        _queue = [(1, 1)]
+        while _queue:
+            _square = _queue.pop()
+            for _a, _b in _pairs:
+                for _from, _to in ((_a, _b), (_b, _a)):
+                    if _from == _square and _to not in _reached:
+                        _reached.add(_to)
+                        _queue.append(_to)
+        self.assertEqual(maze.width * maze.height, len(_reached))
+
+    def _assert_closed_outer_walls_and_two_way_passages(self, maze: FlatMaze):
+        for _x in range(1, maze.width + 1):
+            for _y in range(1, maze.height + 1):
+                _passages = maze.get_passages(_x, _y)
+                if _passages & MazePassages.Y_PLUS:
+                    self.assertTrue(_y < maze.height and maze.get_passages(_x, _y + 1) & MazePassages.Y_MINUS)
+                if _passages & MazePassages.X_PLUS:
+                    self.assertTrue(_x < maze.width and maze.get_passages(_x + 1, _y) & MazePassages.X_MINUS)
+                if _passages & MazePassages.Y_MINUS:
+                    self.assertTrue(_y > 1 and maze.get_passages(_x, _y - 1) & MazePassages.Y_PLUS)
+                if _passages & MazePassages.X_MINUS:
+                    self.assertTrue(_x > 1 and maze.get_passages(_x - 1, _y) & MazePassages.X_PLUS)
+
+    def test_should_generate_perfect_mazes_with_all_algorithms(self):
+        for _algorithm in _ALGORITHMS:
+            _generator = MazeGenerator(algorithm=_algorithm, random_seed=1)
+            for _maze in _generator.generate_many(5):
+                self._assert_perfect_maze_with_one_goal_entrance(_maze)
+                self._assert_closed_outer_walls_and_two_way_passages(_maze)
+
+    def test_should_generate_mazes_of_any_size(self):
+        _maze = MazeGenerator(width=7, height=5, center_coordinates=[3], random_seed=1).generate()
+        self.assertEqual((7, 5), (_maze.width, _maze.height))
+        self.assertEqual([(3, 3)], _maze.get_finish_squares())
+        self._assert_perfect_maze_with_one_goal_entrance(_maze)
+
+    def test_should_add_loops(self):
+        _perfect_maze = MazeGenerator(algorithm=MazeGeneratorAlgorithm.KRUSKAL, random_seed=1).generate()
+        _maze = MazeGenerator(algorithm=MazeGeneratorAlgorithm.KRUSKAL, loop_ratio=0.2, random_seed=1).generate()
+        self._assert_closed_outer_walls_and_two_way_passages(_maze)
+        # 16x16 has 480 inner walls, 255 are opened in a perfect maze with a 2x2 goal region, 12 walls are around the goal
+        self.assertEqual(len(_get_passage_pairs(_perfect_maze)) + round((480 - 255 - 12) * 0.2), len(_get_passage_pairs(_maze)))
+
+    def test_should_generate_same_mazes_with_same_seed(self):
+        for _algorithm in _ALGORITHMS:
+            _mazes = MazeGenerator(algorithm=_algorithm, random_seed=5).generate_many(3)
+            _same_mazes = MazeGenerator(algorithm=_algorithm, random_seed=5).generate_many(3)
+            self.assertEqual(
+                [_maze.get_all_passages() for _maze in _mazes],
+                [_maze.get_all_passages() for _maze in _same_mazes]
+            )
+
+    def test_should_raise_value_error_on_unknown_algorithm(self):
+        with self.assertRaises(ValueError):
+            MazeGenerator(algorithm='prim')
+
+    def test_should_raise_value_error_when_center_fills_the_maze(self):
+        with self.assertRaises(ValueError):
+            MazeGenerator(width=3, height=1, center_coordinates=[1, 2])
+
+    def test_should_be_solvable_in_simulator(self):
+        _maze = MazeGenerator(width=8, height=8, center_coordinates=[4, 5], loop_ratio=0.1, random_seed=3).generate()
+        _session = SimulatorMazeSolvingSession(
+            _maze,
+            maze_solver_factory=functools.partial(FloodFillMazeSolver, maze_width=8, maze_height=8, center_coordinates=[4, 5])
+        )
+        _session.start()
+        self.assertTrue(_session.maze_solver.finish_square is not None)
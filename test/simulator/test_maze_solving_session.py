@@ -1,8 +1,12 @@
+import functools
 import unittest
 from unittest.mock import MagicMock
+from maze_solver.flood_fill_maze_solver import FloodFillMazeSolver
 from maze_solver.direction import Direction
 from simulator.maze_solving_session import MazeSolvingSession, SimulatorMazeSolvingSession
 from simulator.maze import MazeSquare
+from simulator.maze_factory import create_6_to_6_maze, create_robotex_cyprus_2017_maze
+from simulator.speed_run import simulate_exploration_and_speed_run
 
 
 class MazeSolvingSessionTests(unittest.TestCase):
@@ -91,3 +95,17 @@ class SimulatorMazeSolvingSessionTests(unittest.TestCase):
     def test_should_turn_right_when_front_and_left_are_blocked(self):
         self._simulator_maze_solving_session.move_forward()
         self._maze.get_square.assert_called_with(x=1, y=2)
+
+    def test_should_solve_maze_with_maze_solver_from_given_factory(self):
+        _simulator_maze_solving_session = SimulatorMazeSolvingSession(
+            create_6_to_6_maze(),
+            maze_solver_factory=functools.partial(FloodFillMazeSolver, maze_width=6, maze_height=6, center_coordinates=[4])
+        )
+        _results = _simulator_maze_solving_session.start()
+        self.assertTrue(_simulator_maze_solving_session.current_square.is_finish)
+        self.assertTrue(_results['move_count'] < 999)
+
+    def test_should_be_faster_on_speed_run_than_on_exploration_run(self):
+        _results = simulate_exploration_and_speed_run(create_robotex_cyprus_2017_maze(), 16, 16, [8, 9], random_seed=1)
+        self.assertIsNotNone(_results['speed_run'])
+        self.assertTrue(_results['speed_run']['motion_time'] < _results['exploration']['motion_time'])
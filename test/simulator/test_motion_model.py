@@ -0,0 +1,122 @@
+import functools
+import os
+import tempfile
+import unittest
+from maze_solver.route_planner import MotorCommand
+from maze_solver.route_replay_maze_solver import RouteReplayMazeSolver
+from simulator.maze_factory import create_simple_3_to_3_maze
+from simulator.maze_solving_session import SimulatorMazeSolvingSession
+from simulator.motion_model import (
+    MotionModel, ProfiledMotionModel, get_profile_time, read_logged_moves, fit_motion_model, save_motion_model, load_motion_model
+)
+
+
+def _create_log_lines(moves: list) -> list:
+    # Moves are (start message, seconds, position corrector messages)
+    _lines = []
+    _seconds = 0.0
+    for _message, _duration, _corrector_messages in moves:
+        _lines.append('2022-05-01 10:00:{:06.3f} - ev3.motors - DEBUG - [EV3MotorCommandPipeline] - {}'.format(_seconds, _message).replace('.', ',', 1))
+        for _corrector_message in _corrector_messages:
+            _lines.append('2022-05-01 10:00:{:06.3f} - ev3.position_corrector - DEBUG - {}'.format(_seconds, _corrector_message).replace('.', ',', 1))
+        _lines.append('2022-05-01 10:00:{:06.3f} - ev3.motors - DEBUG - {} done'.format(_seconds + _duration, _message).replace('.', ',', 1))
+        _seconds += _duration + 0.5
+    return _lines
+
+
+class MotionModelTests(unittest.TestCase):
+
+    def test_should_have_fixed_times_by_default(self):
+        _motion_model = MotionModel()
+        self.assertAlmostEqual(3.3, _motion_model.get_forward_time(3))
+        self.assertEqual(0.9, _motion_model.get_turn_time(MotorCommand.TURN_LEFT))
+        self.assertEqual(1.7, _motion_model.get_turn_time(MotorCommand.TURN_BACK))
+        self.assertAlmostEqual(3.1, _motion_model.get_turn_time(MotorCommand.ARC_TURN_RIGHT))
+
+    def test_should_not_reach_max_speed_on_short_moves(self):
+        self.assertAlmostEqual(2.0, get_profile_time(100, max_speed_mm_per_sec = 200, acceleration_mm_per_sec2 = 100))
+        self.assertAlmostEqual(5.0, get_profile_time(600, max_speed_mm_per_sec = 200, acceleration_mm_per_sec2 = 100))
+
+    def test_should_take_less_time_per_square_on_merged_straights(self):
+        _motion_model = ProfiledMotionModel()
+        self.assertLess(_motion_model.get_forward_time(4), 4 * _motion_model.get_forward_time(1))
+
+    def test_should_add_expected_correction_and_recovery_times(self):
+        _motion_model = ProfiledMotionModel(stop_time_sec = 0.0, turn_left_time_sec = 1.0, turn_right_time_sec = 2.0)
+        _forward_time = _motion_model.get_forward_time(2)
+        _motion_model.forward_correction_probability = 0.5
+        _motion_model.forward_correction_time_sec = 2.0
+        _motion_model.hit_wall_probability_per_square = 0.1
+        _motion_model.hit_wall_recovery_time_sec = 5.0
+        _motion_model.turn_correction_probability = 0.25
+        _motion_model.turn_correction_time_sec = 2.0
+        self.assertAlmostEqual(_forward_time + 1.0 + 2 * 0.5, _motion_model.get_forward_time(2))
+        self.assertAlmostEqual(1.5, _motion_model.get_turn_time(MotorCommand.TURN_LEFT))
+        self.assertAlmostEqual(1.5 + 2.5, _motion_model.get_turn_time(MotorCommand.TURN_BACK))
+
+    def test_should_save_and_load_motion_model(self):
+        _motion_model = ProfiledMotionModel(max_speed_mm_per_sec = 250.0, arc_turn_time_sec = 1.2, hit_wall_probability_per_square = 0.01)
+        with tempfile.TemporaryDirectory() as _directory:
+            _path = os.path.join(_directory, 'motion_model.json')
+            save_motion_model(_path, _motion_model)
+            self.assertEqual(_motion_model.to_dict(), load_motion_model(_path).to_dict())
+
+
+class MotionModelFittingTests(unittest.TestCase):
+
+    def test_should_read_moves_and_corrections_from_ev3_log(self):
+        _lines = _create_log_lines([
+            ('Move_forward', 1.25, []),
+            ('turn_left', 0.75, ['correct_after_turn_left', 'Bad gyro angle - too little!']),
+            ('Move_forward_squares 3', 2.5, ['Bad gyro angle. I have hit the wall'])
+        ])
+        _moves = read_logged_moves(['Some other line'] + _lines)
+        self.assertEqual(['Move_forward', 'turn_left', 'Move_forward_squares'], [_move.name for _move in _moves])
+        self.assertEqual([1, 1, 3], [_move.square_count for _move in _moves])
+        self.assertEqual([1.25, 0.75, 2.5], [_move.duration_sec for _move in _moves])
+        self.assertEqual([False, True, False], [_move.corrected for _move in _moves])
+        self.assertEqual([False, False, True], [_move.hit_wall for _move in _moves])
+
+    def test_should_read_back_wall_corrections_logged_by_motors(self):
+        _lines = _create_log_lines([('turn_right', 0.75, [])])
+        _lines.insert(1, '2022-05-01 10:00:00,100 - ev3.motors - DEBUG - I am correcting my angle using the back wall...')
+        self.assertEqual([True], [_move.corrected for _move in read_logged_moves(_lines)])
+
+    def test_should_fit_acceleration_profile_turn_times_and_corrections(self):
+        _expected_model = ProfiledMotionModel(max_speed_mm_per_sec = 200.0, acceleration_mm_per_sec2 = 400.0, stop_time_sec = 0.1)
+        _moves = []
+        for _square_count in (1, 2, 4):
+            _message = 'Move_forward' if _square_count == 1 else 'Move_forward_squares {}'.format(_square_count)
+            _moves.extend([(_message, round(_expected_model.get_forward_time(_square_count), 3), [])] * 3)
+        _moves.append(('Move_forward', round(_expected_model.get_forward_time(1) + 2.0, 3), ['Bad front distance!']))
+        _moves.extend([('turn_left', 0.7, [])] * 3 + [('turn_right', 0.9, [])] * 3)
+        _motion_model = fit_motion_model(read_logged_moves(_create_log_lines(_moves)))
+        self.assertAlmostEqual(200.0, _motion_model.max_speed_mm_per_sec, delta = 2.0)
+        self.assertAlmostEqual(400.0, _motion_model.acceleration_mm_per_sec2, delta = 10.0)
+        self.assertAlmostEqual(0.7, _motion_model.turn_left_time_sec)
+        self.assertAlmostEqual(0.9, _motion_model.turn_right_time_sec)
+        self.assertAlmostEqual(0.1, _motion_model.forward_correction_probability)
+        self.assertAlmostEqual(2.0, _motion_model.forward_correction_time_sec, delta = 0.01)
+        self.assertEqual(0.0, _motion_model.hit_wall_probability_per_square)
+        self.assertIsNone(_motion_model.arc_turn_time_sec)
+
+    def test_should_fit_acceleration_from_single_square_moves(self):
+        _expected_model = ProfiledMotionModel(acceleration_mm_per_sec2 = 300.0)
+        _lines = _create_log_lines([('Move_forward', round(_expected_model.get_forward_time(1), 3), [])] * 2)
+        _motion_model = fit_motion_model(read_logged_moves(_lines))
+        self.assertAlmostEqual(_expected_model.get_forward_time(1), _motion_model.get_forward_time(1), delta = 0.001)
+
+
+class SimulatorMotionModelTests(unittest.TestCase):
+
+    def test_should_charge_merged_straights_and_arc_turns_from_motion_model(self):
+        _motion_model = ProfiledMotionModel(arc_turn_time_sec = 1.0)
+        _route = [MotorCommand.MOVE_FORWARD, MotorCommand.MOVE_FORWARD, MotorCommand.TURN_RIGHT, MotorCommand.MOVE_FORWARD, MotorCommand.MOVE_FORWARD]
+        _session = SimulatorMazeSolvingSession(
+            create_simple_3_to_3_maze(),
+            motion_model = _motion_model,
+            maze_solver_factory = functools.partial(RouteReplayMazeSolver, route = _route, continuous_motion = True, arc_turns = True)
+        )
+        _results = _session.start()
+        self.assertEqual((3, 3), (_session.current_square.x, _session.current_square.y))
+        self.assertAlmostEqual(2 * _motion_model.get_forward_time(1) + 1.0, _results['motion_time'])
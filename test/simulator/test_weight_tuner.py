@@ -0,0 +1,88 @@
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+from unittest.mock import patch
+from simulator.maze_factory import create_6_to_6_maze, create_kasemetsaresortspa_test_maze
+from simulator.weight_tuner import WeightTuner, TuningObjective
+
+
+def fake_session_runner(maze, random_seeds: list, session_kwargs: dict) -> list:
+    # Motion time grows with the weight, and only weight 0 solves the "hard" maze in time
+    _weight = session_kwargs['prefer_no_turns_weight']
+    _motion_time = 100 + _weight * 10 + (0 if maze.name != 'hard' or _weight == 0 else 1000)
+    return [(10, _motion_time + _index % 2) for _index, _ in enumerate(random_seeds)]
+
+
+class FakeMaze(object):
+
+    def __init__(self, name: str):
+        self.name = name
+
+
+class WeightTunerTests(unittest.TestCase):
+
+    def _create_weight_tuner(self, workers: int = 1, **kwargs) -> WeightTuner:
+        return WeightTuner(
+            [(FakeMaze('easy'), [4]), (FakeMaze('hard'), [4]), (FakeMaze('easy too'), [4])],
+            sample_size=20,
+            workers=workers,
+            random_seed=1,
+            session_runner=fake_session_runner,
+            **kwargs
+        )
+
+    def test_should_create_all_grid_configurations(self):
+        _configurations = self._create_weight_tuner().get_grid_configurations({'a': [1, 2], 'b': [3, 4, 5]})
+        self.assertEqual(6, len(_configurations))
+        self.assertIn({'a': 2, 'b': 4}, _configurations)
+
+    def test_should_find_best_weights_with_grid_search(self):
+        _results = self._create_weight_tuner().grid_search({'prefer_no_turns_weight': [2, 0, 1]})
+        self.assertEqual({'prefer_no_turns_weight': 0}, _results[0]['weights'])
+        self.assertEqual(100, _results[0]['score'])
+
+    def test_should_stop_evaluation_early_when_best_score_cannot_be_beaten(self):
+        _results = self._create_weight_tuner().grid_search({'prefer_no_turns_weight': [0, 1]})
+        self.assertTrue(_results[1]['stopped_early'])
+        # Weight 0 solves everything, so nothing can beat it and the first maze is enough to tell
+        self.assertEqual(1, len(_results[1]['maze_results']))
+
+    def test_should_minimize_motion_time(self):
+        _weight_tuner = self._create_weight_tuner(objective=TuningObjective.MOTION_TIME_MEAN)
+        _results = _weight_tuner.random_search({'prefer_no_turns_weight': [0, 1, 2, 3]}, 6)
+        _scores = [_result['score'] for _result in _results if not _result['stopped_early']]
+        self.assertEqual(sorted(_scores, reverse=True), _scores)
+
+    def test_should_keep_best_configurations_on_successive_halving(self):
+        _configurations = [{'prefer_no_turns_weight': _weight} for _weight in range(9)]
+        _results = self._create_weight_tuner().successive_halving(_configurations, min_sample_size=5, reduction_factor=3)
+        self.assertEqual([{'prefer_no_turns_weight': 0}], [_result['weights'] for _result in _results])
+        self.assertEqual(20, _results[0]['sample_size'])
+
+    def test_should_evaluate_with_batch_simulator(self):
+        _weight_tuner = WeightTuner(
+            [(create_6_to_6_maze(), [4]), (create_kasemetsaresortspa_test_maze(), [4])],
+            sample_size=10,
+            workers=1,
+            random_seed=1
+        )
+        _result = _weight_tuner.evaluate({'prefer_closer_to_center_weight': 5, 'prefer_no_turns_weight': 1})
+        self.assertEqual(2, len(_result['maze_results']))
+        self.assertTrue(0 <= _result['score'] <= 100)
+
+    def test_should_evaluate_with_batch_simulator_when_filling_dead_ends(self):
+        _weight_tuner = WeightTuner(
+            [(create_6_to_6_maze(), [4])],
+            sample_size=10,
+            workers=1,
+            random_seed=1,
+            fixed_session_kwargs={'fill_dead_ends': True}
+        )
+        _result = _weight_tuner.evaluate({'prefer_no_turns_weight': 1})
+        self.assertTrue(0 <= _result['score'] <= 100)
+
+    def test_should_share_one_process_pool_between_all_evaluations(self):
+        with patch('simulator.weight_tuner.ProcessPoolExecutor', wraps=ProcessPoolExecutor) as _pool_class:
+            with self._create_weight_tuner(workers=2) as _weight_tuner:
+                _results = _weight_tuner.grid_search({'prefer_no_turns_weight': [2, 0, 1]})
+        _pool_class.assert_called_once_with(max_workers=2)
+        self.assertEqual({'prefer_no_turns_weight': 0}, _results[0]['weights'])